@@ -0,0 +1,37 @@
+"""
+Bridge core shared by the in-process WebBridgeService and the standalone
+dj-r3x-bridge process.
+
+- filters: dashboard topic categories, client filters and throttle limits
+- music_library: the track list served to the dashboard
+- ipc: Unix socket transport for the CantinaOS event bus (msgpack or JSON)
+- remote_service: runs web_bridge, logging_service or debug in its own process
+"""
+
+from .filters import (
+    DEFAULT_TOPIC_CATEGORY,
+    FILTER_LEVEL_EVENTS,
+    THROTTLE_LIMITS,
+    TOPIC_CATEGORIES,
+    client_accepts_topic,
+    topic_category,
+    topic_key,
+)
+from .ipc import DEFAULT_SOCKET_PATH, EventBusIPCServer, RemoteEventBus
+from .music_library import format_duration, format_library_tracks, scan_music_dir
+
+__all__ = [
+    "DEFAULT_SOCKET_PATH",
+    "DEFAULT_TOPIC_CATEGORY",
+    "FILTER_LEVEL_EVENTS",
+    "THROTTLE_LIMITS",
+    "TOPIC_CATEGORIES",
+    "EventBusIPCServer",
+    "RemoteEventBus",
+    "client_accepts_topic",
+    "format_duration",
+    "format_library_tracks",
+    "scan_music_dir",
+    "topic_category",
+    "topic_key",
+]
@@ -0,0 +1,85 @@
+"""
+Dashboard topic categories, client filters and broadcast rate limits.
+
+Shared by the in-process WebBridgeService and the standalone bridge so both
+decide in the same way which events a dashboard client receives, and how
+often.
+"""
+
+from typing import Any, Dict
+
+from ..core.event_topics import EventTopics
+
+# Dashboard category for the first segment of an event topic; clients may
+# subscribe to these categories instead of individual topics
+TOPIC_CATEGORIES = {
+    "voice": "voice",
+    "transcription": "voice",
+    "mic": "voice",
+    "speech": "voice",
+    "llm": "voice",
+    "audio": "voice",
+    "music": "music",
+    "crossfade": "music",
+    "dj": "dj",
+    "gpt": "dj",
+    "led": "leds",
+    "eye": "leds",
+}
+DEFAULT_TOPIC_CATEGORY = "system"
+
+# Topics delivered to clients that subscribe with a restrictive filter level
+FILTER_LEVEL_EVENTS = {
+    "minimal": {
+        EventTopics.SYSTEM_ERROR,
+        EventTopics.SERVICE_STATUS_UPDATE,
+        EventTopics.TRANSCRIPTION_FINAL,
+        EventTopics.DJ_MODE_CHANGED,
+        EventTopics.MUSIC_PLAYBACK_STARTED,
+        EventTopics.MUSIC_PLAYBACK_STOPPED,
+    },
+    "critical": {
+        EventTopics.SYSTEM_ERROR,
+        EventTopics.SERVICE_STATUS_UPDATE,
+        EventTopics.TRANSCRIPTION_FINAL,
+        EventTopics.TRANSCRIPTION_INTERIM,
+        EventTopics.VOICE_LISTENING_STARTED,
+        EventTopics.VOICE_LISTENING_STOPPED,
+        EventTopics.DJ_MODE_CHANGED,
+        EventTopics.MUSIC_PLAYBACK_STARTED,
+        EventTopics.MUSIC_PLAYBACK_STOPPED,
+        EventTopics.LLM_RESPONSE,
+    },
+}
+
+# Broadcasts per second for streams where only the newest value matters;
+# topics not listed here are never throttled
+THROTTLE_LIMITS = {
+    EventTopics.AUDIO_CHUNK: 10,
+    EventTopics.VOICE_AUDIO_LEVEL: 10,
+    EventTopics.SPEECH_SYNTHESIS_AMPLITUDE: 10,
+    EventTopics.TRANSCRIPTION_INTERIM: 30,
+    EventTopics.LLM_RESPONSE_CHUNK: 30,
+}
+
+
+def topic_key(event_topic: Any) -> str:
+    """Plain string form of an event topic (EventTopics member or raw string)."""
+    return str(getattr(event_topic, "value", event_topic))
+
+
+def topic_category(event_topic: Any) -> str:
+    """Dashboard category (voice, music, dj, leds, system) of an event topic."""
+    head = topic_key(event_topic).strip("/").lower().split(".")[0]
+    return TOPIC_CATEGORIES.get(head, DEFAULT_TOPIC_CATEGORY)
+
+
+def client_accepts_topic(client: Dict[str, Any], event_topic: Any) -> bool:
+    """Whether a dashboard client's subscriptions and filter level admit a topic."""
+    topic = topic_key(event_topic)
+    subscriptions = client.get("subscriptions") or []
+    if subscriptions and topic not in subscriptions and topic_category(topic) not in subscriptions:
+        return False
+
+    allowed = FILTER_LEVEL_EVENTS.get(client.get("filter_level", "all"))
+    return allowed is None or topic in allowed  # EventTopics members compare equal to their values
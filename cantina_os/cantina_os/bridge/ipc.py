@@ -0,0 +1,466 @@
+"""
+Out-of-process transport for the CantinaOS event bus.
+
+CantinaOS serves its event bus on a Unix domain socket (EventBusIPCServer);
+another process attaches with RemoteEventBus, an AsyncIOEventEmitter that
+services such as WebBridgeService, LoggingService and DebugService use
+exactly like the in-process bus. Serialization, dashboard fan-out and log
+file I/O then run outside the audio process, which only pays for encoding
+the topics some remote process actually listens to.
+
+Each frame is a 4-byte big-endian body length, a 1-byte codec id and the
+body. Bodies are msgpack when both ends have it installed, JSON otherwise:
+
+    {"op": "hello", "codecs": ["msgpack", "json"]}     first message, both ways
+    {"op": "sub", "topic": "/music/progress"}          remote -> CantinaOS
+    {"op": "unsub", "topic": "/music/progress"}        remote -> CantinaOS
+    {"op": "event", "topic": "...", "args": [...]}     either direction
+
+Bytes in event payloads (TTS audio) are native msgpack binary, or
+{"__bytes__": "<base64>"} in JSON; enums, datetimes and Pydantic models are
+sent as their JSON form.
+"""
+
+import asyncio
+import base64
+import json
+import logging
+import os
+import struct
+import tempfile
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from pyee.asyncio import AsyncIOEventEmitter
+
+from ..core.event_topics import EventTopics
+from .filters import topic_key
+
+try:
+    import msgpack
+except ImportError:  # Optional: JSON framing is used instead
+    msgpack = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOCKET_PATH = os.path.join(tempfile.gettempdir(), "cantina_os_bus.sock")
+
+FRAME_HEADER = struct.Struct(">IB")
+MAX_MESSAGE_BYTES = 16 * 1024 * 1024
+BYTES_KEY = "__bytes__"
+
+CODEC_JSON = 1
+CODEC_MSGPACK = 2
+CODEC_NAMES = {"json": CODEC_JSON, "msgpack": CODEC_MSGPACK}
+SUPPORTED_CODECS = ["msgpack", "json"] if msgpack is not None else ["json"]
+
+# Emitted locally by RemoteEventBus each time CantinaOS answers its hello
+CONNECTED_EVENT = "ipc_connected"
+
+# pyee's own events and the connect notice; never forwarded between processes
+LOCAL_EVENTS = {"new_listener", "error", CONNECTED_EVENT}
+
+LOG_RECORD_TOPIC = EventTopics.LOG_RECORD.value
+
+
+def _encode_default(value: Any) -> Any:
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return {BYTES_KEY: base64.b64encode(bytes(value)).decode("ascii")}
+    return _encode_msgpack_default(value)
+
+
+def _encode_msgpack_default(value: Any) -> Any:
+    if isinstance(value, memoryview):
+        return value.tobytes()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    if hasattr(value, "tolist"):  # numpy arrays and scalars
+        return value.tolist()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    return str(value)
+
+
+def _decode_object(obj: Dict[str, Any]) -> Any:
+    if len(obj) == 1 and BYTES_KEY in obj:
+        return base64.b64decode(obj[BYTES_KEY])
+    return obj
+
+
+def negotiate_codec(peer_codecs: List[str]) -> int:
+    """First codec of ours the peer also supports."""
+    for name in SUPPORTED_CODECS:
+        if name in peer_codecs:
+            return CODEC_NAMES[name]
+    return CODEC_JSON
+
+
+def encode_message(message: Dict[str, Any], codec: int = CODEC_JSON) -> bytes:
+    """Framed message in the given codec."""
+    if codec == CODEC_MSGPACK:
+        body = msgpack.packb(message, default=_encode_msgpack_default, use_bin_type=True)
+    else:
+        body = json.dumps(message, default=_encode_default, separators=(",", ":")).encode("utf-8")
+    return FRAME_HEADER.pack(len(body), codec) + body
+
+
+def decode_body(body: bytes, codec: int) -> Dict[str, Any]:
+    if codec == CODEC_MSGPACK:
+        if msgpack is None:
+            raise ValueError("Peer sent msgpack but msgpack is not installed")
+        return msgpack.unpackb(body, raw=False, strict_map_key=False)
+    if codec == CODEC_JSON:
+        return json.loads(body, object_hook=_decode_object)
+    raise ValueError(f"Unknown IPC codec {codec}")
+
+
+async def read_message(reader: asyncio.StreamReader) -> Dict[str, Any]:
+    """Read one frame; raises IncompleteReadError when the peer goes away."""
+    size, codec = FRAME_HEADER.unpack(await reader.readexactly(FRAME_HEADER.size))
+    if size > MAX_MESSAGE_BYTES:
+        raise ValueError(f"IPC message of {size} bytes exceeds {MAX_MESSAGE_BYTES}")
+    return decode_body(await reader.readexactly(size), codec)
+
+
+def log_record_payload(record: logging.LogRecord) -> Dict[str, Any]:
+    """Plain-data summary of a log record; ``logging.makeLogRecord`` rebuilds it."""
+    payload = {
+        "name": record.name,
+        "levelno": record.levelno,
+        "levelname": record.levelname,
+        "msg": record.getMessage(),
+        "created": record.created,
+        "msecs": record.msecs,
+        "module": record.module,
+        "funcName": record.funcName,
+        "lineno": record.lineno,
+        "process": record.process,
+        "threadName": record.threadName,
+    }
+    if record.exc_info and not record.exc_text:
+        record.exc_text = logging.Formatter().formatException(record.exc_info)
+    if record.exc_text:
+        payload["exc_text"] = record.exc_text
+    return payload
+
+
+class _Peer:
+    """One connected remote process."""
+
+    __slots__ = ("writer", "codec", "topics", "task")
+
+    def __init__(self, writer: asyncio.StreamWriter):
+        self.writer = writer
+        self.codec = CODEC_JSON
+        self.topics: Set[str] = set()
+        self.task = asyncio.current_task()
+
+
+class _LogForwardHandler(logging.Handler):
+    """Publishes log records on LOG_RECORD while a remote LoggingService listens."""
+
+    def __init__(self, server: "EventBusIPCServer", loop: asyncio.AbstractEventLoop, level: int):
+        super().__init__(level)
+        self._server = server
+        self._loop = loop
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if record.name.startswith(__name__) or not self._server.has_subscribers(LOG_RECORD_TOPIC):
+            return
+        try:
+            # Records can come from any thread; the bus belongs to the loop
+            self._loop.call_soon_threadsafe(
+                self._server.publish, LOG_RECORD_TOPIC, log_record_payload(record)
+            )
+        except RuntimeError:
+            pass  # Loop already closed during shutdown
+
+
+class EventBusIPCServer:
+    """Serves a local event bus to other processes over a Unix domain socket.
+
+    Only topics some connected process subscribed to get a listener on the
+    bus, so unused topics cost nothing, and each event is encoded once per
+    codec in use. Writes never block the caller; a peer that stops reading
+    loses events once ``max_buffer_bytes`` are queued for it rather than
+    holding up the emitting service.
+    """
+
+    def __init__(
+        self,
+        event_bus: AsyncIOEventEmitter,
+        path: str = DEFAULT_SOCKET_PATH,
+        max_buffer_bytes: int = 4 * 1024 * 1024,
+    ):
+        self._event_bus = event_bus
+        self.path = path
+        self._max_buffer_bytes = max_buffer_bytes
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._peers: Set[_Peer] = set()
+        self._subscribers: Dict[str, Set[_Peer]] = {}
+        self._forwarders: Dict[str, Callable[..., None]] = {}
+        self._origin: Optional[_Peer] = None  # peer whose event is being emitted
+        self._log_handler: Optional[_LogForwardHandler] = None
+        self.stats = {"forwarded": 0, "received": 0, "dropped": 0}
+
+    @property
+    def peer_count(self) -> int:
+        return len(self._peers)
+
+    @property
+    def topics(self) -> List[str]:
+        return sorted(self._forwarders)
+
+    def has_subscribers(self, topic: str) -> bool:
+        return topic in self._subscribers
+
+    async def start(self) -> None:
+        if os.path.exists(self.path):
+            os.unlink(self.path)  # Stale socket from a previous run
+        self._server = await asyncio.start_unix_server(self._serve_peer, path=self.path)
+        os.chmod(self.path, 0o600)
+        logger.info("Event bus IPC listening on %s (codecs: %s)", self.path, ", ".join(SUPPORTED_CODECS))
+
+    async def stop(self) -> None:
+        self.stop_forwarding_logs()
+        if self._server:
+            self._server.close()
+        # Closing a peer's socket ends its read loop with EOF, which detaches it
+        peer_tasks = [peer.task for peer in self._peers if peer.task]
+        for peer in list(self._peers):
+            peer.writer.close()
+        await asyncio.gather(*peer_tasks, return_exceptions=True)
+        for topic in list(self._forwarders):
+            self._event_bus.remove_listener(topic, self._forwarders.pop(topic))
+        self._subscribers.clear()
+        if self._server:
+            await self._server.wait_closed()
+            self._server = None
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+    def forward_logs(self, level: int = logging.INFO) -> None:
+        """Publish this process's log records for a remote LoggingService."""
+        if self._log_handler is None:
+            self._log_handler = _LogForwardHandler(self, asyncio.get_running_loop(), level)
+            logging.getLogger().addHandler(self._log_handler)
+
+    def stop_forwarding_logs(self) -> None:
+        if self._log_handler is not None:
+            logging.getLogger().removeHandler(self._log_handler)
+            self._log_handler = None
+
+    def publish(self, topic: str, payload: Any) -> None:
+        """Emit on the local bus (and so to subscribed peers)."""
+        self._event_bus.emit(topic, payload)
+
+    async def _serve_peer(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        peer = _Peer(writer)
+        self._peers.add(peer)
+        logger.info("Process attached to event bus (%d connected)", len(self._peers))
+        try:
+            while True:
+                message = await read_message(reader)
+                op, topic = message.get("op"), message.get("topic")
+                if op == "hello":
+                    writer.write(encode_message({"op": "hello", "codecs": SUPPORTED_CODECS}))
+                    peer.codec = negotiate_codec(message.get("codecs") or [])
+                    continue
+                if not isinstance(topic, str) or topic in LOCAL_EVENTS:
+                    continue
+                if op == "sub":
+                    self._subscribe(topic, peer)
+                elif op == "unsub":
+                    self._unsubscribe(topic, peer)
+                elif op == "event":
+                    self._emit_from(peer, topic, message.get("args") or [])
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except ValueError as e:
+            logger.warning("Closing event bus connection: %s", e)
+        finally:
+            for topic in list(peer.topics):
+                self._unsubscribe(topic, peer)
+            self._peers.discard(peer)
+            writer.close()
+            logger.info("Process detached from event bus (%d connected)", len(self._peers))
+
+    def _subscribe(self, topic: str, peer: _Peer) -> None:
+        peer.topics.add(topic)
+        self._subscribers.setdefault(topic, set()).add(peer)
+        if topic not in self._forwarders:
+            self._forwarders[topic] = self._make_forwarder(topic)
+            self._event_bus.on(topic, self._forwarders[topic])
+
+    def _unsubscribe(self, topic: str, peer: _Peer) -> None:
+        peer.topics.discard(topic)
+        subscribers = self._subscribers.get(topic)
+        if subscribers is None:
+            return
+        subscribers.discard(peer)
+        if not subscribers:
+            del self._subscribers[topic]
+            self._event_bus.remove_listener(topic, self._forwarders.pop(topic))
+
+    def _make_forwarder(self, topic: str) -> Callable[..., None]:
+        def forward(*args: Any) -> None:
+            peers = [p for p in self._subscribers.get(topic, ()) if p is not self._origin]
+            if not peers:
+                return
+            message = {"op": "event", "topic": topic, "args": list(args)}
+            frames: Dict[int, bytes] = {}
+            for peer in peers:
+                writer = peer.writer
+                if writer.is_closing():
+                    continue
+                if writer.transport.get_write_buffer_size() > self._max_buffer_bytes:
+                    self.stats["dropped"] += 1
+                    continue
+                frame = frames.get(peer.codec)
+                if frame is None:
+                    try:
+                        frame = frames[peer.codec] = encode_message(message, peer.codec)
+                    except (TypeError, ValueError) as e:
+                        logger.debug("Not forwarding %s: %s", topic, e)
+                        return
+                writer.write(frame)
+                self.stats["forwarded"] += 1
+
+        return forward
+
+    def _emit_from(self, peer: _Peer, topic: str, args: List[Any]) -> None:
+        # Listeners run synchronously inside emit, so forwarders can skip the origin peer
+        self.stats["received"] += 1
+        self._origin = peer
+        try:
+            self._event_bus.emit(topic, *args)
+        finally:
+            self._origin = None
+
+
+class RemoteEventBus(AsyncIOEventEmitter):
+    """Event bus for a process attached to CantinaOS over the IPC socket.
+
+    Adding a listener subscribes to that topic on CantinaOS and removing the
+    last one unsubscribes. Emitting delivers to local listeners and publishes
+    on the CantinaOS bus. The connection is retried until ``close()``; events
+    emitted while it is down only reach local listeners, so state a service
+    needs from CantinaOS should be requested from a CONNECTED_EVENT listener,
+    which runs on every connect and reconnect. ``codecs`` limits the framings offered to
+    CantinaOS (default: msgpack when installed, then JSON).
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_SOCKET_PATH,
+        reconnect_delay: float = 1.0,
+        codecs: Optional[List[str]] = None,
+        loop=None,
+    ):
+        super().__init__(loop=loop)
+        self.path = path
+        self._reconnect_delay = reconnect_delay
+        self._codecs = [name for name in (codecs or SUPPORTED_CODECS) if name in SUPPORTED_CODECS]
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._codec = CODEC_JSON
+        self._task: Optional[asyncio.Task] = None
+        self._topics: Set[str] = set()
+        self.connected = asyncio.Event()
+        self.on("new_listener", self._on_new_listener)
+
+    def start(self) -> asyncio.Task:
+        """Start connecting in the background; await ``connected`` to wait for CantinaOS."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        return self._task
+
+    async def close(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._writer:
+            self._writer.close()
+            self._writer = None
+        self.connected.clear()
+
+    def emit(self, event: Any, *args: Any, **kwargs: Any) -> bool:
+        topic = topic_key(event)
+        if topic not in LOCAL_EVENTS:
+            self._send({"op": "event", "topic": topic, "args": list(args)})
+        return super().emit(event, *args, **kwargs)
+
+    def _on_new_listener(self, event: Any, listener: Callable) -> None:
+        topic = topic_key(event)
+        if topic in LOCAL_EVENTS or topic in self._topics:
+            return
+        self._topics.add(topic)
+        self._send({"op": "sub", "topic": topic})
+
+    def _remove_listener(self, event: Any, f: Callable) -> None:
+        # remove_listener() and once() wrappers both end up here
+        super()._remove_listener(event, f)
+        self._unsubscribe_if_unused(topic_key(event))
+
+    def remove_all_listeners(self, event: Any = None) -> None:
+        super().remove_all_listeners(event)
+        if event is None:
+            self.on("new_listener", self._on_new_listener)
+        for topic in sorted(self._topics):
+            self._unsubscribe_if_unused(topic)
+
+    def _unsubscribe_if_unused(self, topic: str) -> None:
+        if topic not in self._topics:
+            return
+        # Listeners may be registered under both the EventTopics member and its string value
+        if any(handlers and topic_key(event) == topic for event, handlers in self._events.items()):
+            return
+        self._topics.discard(topic)
+        self._send({"op": "unsub", "topic": topic})
+
+    def _send(self, message: Dict[str, Any]) -> bool:
+        if self._writer is None or self._writer.is_closing():
+            return False
+        self._writer.write(encode_message(message, self._codec))
+        return True
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                reader, writer = await asyncio.open_unix_connection(self.path)
+            except OSError as e:
+                logger.debug("CantinaOS event bus not reachable at %s: %s", self.path, e)
+                await asyncio.sleep(self._reconnect_delay)
+                continue
+
+            self._writer, self._codec = writer, CODEC_JSON
+            self._send({"op": "hello", "codecs": self._codecs})
+            for topic in sorted(self._topics):
+                self._send({"op": "sub", "topic": topic})
+            try:
+                while True:
+                    message = await read_message(reader)
+                    op = message.get("op")
+                    if op == "event" and message.get("topic") not in LOCAL_EVENTS:
+                        super().emit(message["topic"], *(message.get("args") or []))
+                    elif op == "hello":
+                        peer_codecs = message.get("codecs") or []
+                        self._codec = negotiate_codec([name for name in self._codecs if name in peer_codecs])
+                        self.connected.set()
+                        logger.info("Connected to CantinaOS event bus at %s", self.path)
+                        self.emit(CONNECTED_EVENT)
+            except (asyncio.IncompleteReadError, ConnectionError, ValueError) as e:
+                logger.warning("Lost CantinaOS event bus connection: %s", e or "closed")
+            finally:
+                self.connected.clear()
+                self._writer = None
+                writer.close()
+            await asyncio.sleep(self._reconnect_delay)
@@ -0,0 +1,166 @@
+"""
+Music library listing for the dashboard.
+
+Turns the track dictionary from MUSIC_LIBRARY_UPDATED into the list served
+by ``GET /api/music/library``. Before the music controller has published a
+library the bridge lists the music directory instead; there is no mock data,
+an empty or missing directory gives an empty list.
+
+LibraryResponse keeps that listing encoded per library version, so polling
+dashboards are answered from memory, or with a bare 304 when their ETag is
+still current.
+"""
+
+import gzip
+import hashlib
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..utils import dashboard_json
+
+AUDIO_EXTENSIONS = (".mp3", ".wav", ".m4a")
+DEFAULT_ARTIST = "Cantina Band"
+
+# Keys of every track in the listing; ``fields`` selects a subset
+TRACK_FIELDS = ("id", "title", "artist", "duration", "file", "path")
+# Listings at least this large are also kept gzip-compressed
+DEFAULT_GZIP_MIN_BYTES = 4096
+
+
+def format_duration(duration_seconds: Optional[float]) -> str:
+    """Format seconds as M:SS, or "Unknown" when there is no usable duration."""
+    if not duration_seconds or duration_seconds <= 0:
+        return "Unknown"
+    minutes = int(duration_seconds // 60)
+    seconds = int(duration_seconds % 60)
+    return f"{minutes}:{seconds:02d}"
+
+
+def split_track_name(name: str) -> Dict[str, str]:
+    """Artist and title from an "Artist - Title" file name."""
+    if " - " in name:
+        artist, title = name.split(" - ", 1)
+    else:
+        artist, title = DEFAULT_ARTIST, name
+    return {"artist": artist.strip(), "title": title.strip()}
+
+
+def format_library_tracks(library: Dict[str, Dict[str, Any]]) -> List[Dict[str, str]]:
+    """Dashboard track list from the music controller's ``{title: track}`` library."""
+    tracks = []
+    for i, (track_name, track_data) in enumerate(library.items()):
+        path = track_data.get("path") or track_data.get("filepath") or ""
+        tracks.append({
+            "id": str(i + 1),
+            "title": track_data.get("title") or track_name,
+            "artist": track_data.get("artist") or DEFAULT_ARTIST,
+            "duration": format_duration(track_data.get("duration")),
+            "file": os.path.basename(path),
+            "path": path,
+        })
+    return tracks
+
+
+def scan_music_dir(music_dir: str) -> List[Dict[str, str]]:
+    """Dashboard track list from the audio files in ``music_dir`` (durations unknown)."""
+    if not os.path.isdir(music_dir):
+        return []
+
+    tracks = []
+    for filename in sorted(os.listdir(music_dir)):
+        name, ext = os.path.splitext(filename)
+        if ext.lower() not in AUDIO_EXTENSIONS:
+            continue
+        tracks.append({
+            "id": str(len(tracks) + 1),
+            **split_track_name(name),
+            "duration": "Unknown",
+            "file": filename,
+            "path": os.path.join(music_dir, filename),
+        })
+    return tracks
+
+
+def parse_library_fields(fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """Validated field selection from a comma-separated ``fields`` parameter."""
+    if not fields:
+        return None
+    selected = tuple(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    unknown = [name for name in selected if name not in TRACK_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown track fields: {', '.join(unknown)} (available: {', '.join(TRACK_FIELDS)})")
+    return selected or None
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header admits ``etag`` (weak comparison)."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in (tag[2:] if tag.startswith("W/") else tag for tag in candidates)
+
+
+@dataclass(frozen=True)
+class LibraryBody:
+    """One encoded library response."""
+
+    etag: str
+    content: bytes
+    gzipped: Optional[bytes] = None
+
+
+class LibraryResponse:
+    """``/api/music/library`` responses, encoded once per library version.
+
+    The version is a hash of the listing, so a library the music controller
+    republishes unchanged keeps its ETag. The full listing is encoded (and
+    gzipped when at least ``gzip_min_bytes``) as soon as it changes; pages
+    and field selections are encoded on first request and kept, up to
+    ``max_variants``, until the next change.
+    """
+
+    def __init__(self, gzip_min_bytes: int = DEFAULT_GZIP_MIN_BYTES, max_variants: int = 32):
+        self.gzip_min_bytes = gzip_min_bytes
+        self.max_variants = max_variants
+        self.tracks: List[Dict[str, str]] = []
+        self.version = ""
+        self._variants: Dict[Tuple[int, Optional[int], Optional[Tuple[str, ...]]], LibraryBody] = {}
+        self.set_tracks([])
+
+    def set_tracks(self, tracks: List[Dict[str, str]]) -> bool:
+        """Replace the listing; returns False if it is unchanged."""
+        content = dashboard_json.encode({"tracks": tracks, "total": len(tracks)}).text.encode("utf-8")
+        version = hashlib.sha1(content).hexdigest()[:16]
+        if version == self.version:
+            return False
+        self.tracks = tracks
+        self.version = version
+        self._variants = {(0, None, None): self._body(self.etag(), content)}
+        return True
+
+    def etag(self, offset: int = 0, limit: Optional[int] = None, fields: Optional[Tuple[str, ...]] = None) -> str:
+        """ETag of a response, known without encoding it."""
+        if (offset, limit, fields) == (0, None, None):
+            return f'"{self.version}"'
+        return f'"{self.version}-{offset}-{"" if limit is None else limit}-{".".join(fields or ())}"'
+
+    def body(self, offset: int = 0, limit: Optional[int] = None, fields: Optional[Tuple[str, ...]] = None) -> LibraryBody:
+        """Encoded response for a page and field selection of the listing."""
+        key = (offset, limit, fields)
+        body = self._variants.get(key)
+        if body is None:
+            page = self.tracks[offset:offset + limit if limit is not None else None]
+            if fields:
+                page = [{name: track.get(name) for name in fields} for track in page]
+            payload = {"tracks": page, "total": len(self.tracks), "offset": offset, "limit": limit}
+            body = self._body(self.etag(*key), dashboard_json.encode(payload).text.encode("utf-8"))
+            if len(self._variants) > self.max_variants:
+                # Drop the oldest variant, never the full listing
+                del self._variants[next(k for k in self._variants if k != (0, None, None))]
+            self._variants[key] = body
+        return body
+
+    def _body(self, etag: str, content: bytes) -> LibraryBody:
+        gzipped = gzip.compress(content, mtime=0) if len(content) >= self.gzip_min_bytes else None
+        return LibraryBody(etag, content, gzipped)
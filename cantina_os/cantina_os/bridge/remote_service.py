@@ -0,0 +1,107 @@
+"""
+Run a CantinaOS service in its own process, attached over the event bus socket.
+
+Start CantinaOS with the service listed in CANTINA_REMOTE_SERVICES (it then
+serves its bus through BridgeIPCService and skips that service), then:
+
+    python -m cantina_os.bridge.remote_service logging_service
+    python -m cantina_os.bridge.remote_service debug
+
+dj-r3x-bridge/main.py does the same for web_bridge with its own options.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import sys
+from typing import Any, Callable, Dict, Optional
+
+from ..core.event_topics import EventTopics
+from .ipc import CONNECTED_EVENT, DEFAULT_SOCKET_PATH, RemoteEventBus
+
+logger = logging.getLogger(__name__)
+
+
+def _web_bridge(event_bus, config):
+    from ..services.web_bridge_service import WebBridgeService
+    bridge = WebBridgeService(event_bus, config)
+    # Status and library requests sent while CantinaOS was unreachable are
+    # lost; repeat them whenever the bus (re)connects
+    event_bus.on(CONNECTED_EVENT, bridge.request_cantina_state)
+    return bridge
+
+
+def _logging_service(event_bus, config):
+    from ..services.logging_service import LoggingService
+    # CantinaOS's own log records arrive on LOG_RECORD; replay them into this
+    # process's logging so the service's root handler captures them too
+    event_bus.on(EventTopics.LOG_RECORD, replay_log_record)
+    return LoggingService(event_bus, config)
+
+
+def _debug(event_bus, config):
+    from ..services.debug_service import DebugService
+    return DebugService(event_bus, config)
+
+
+# Services that can run outside the audio process, by CantinaOS service name
+REMOTE_SERVICE_FACTORIES: Dict[str, Callable[[RemoteEventBus, Dict[str, Any]], Any]] = {
+    "web_bridge": _web_bridge,
+    "logging_service": _logging_service,
+    "debug": _debug,
+}
+
+
+def replay_log_record(payload: Dict[str, Any]) -> None:
+    """Hand a forwarded CantinaOS log record to this process's loggers."""
+    record = logging.makeLogRecord(payload)
+    logging.getLogger(record.name).handle(record)
+
+
+async def run_remote_service(
+    name: str,
+    config: Optional[Dict[str, Any]] = None,
+    socket_path: str = DEFAULT_SOCKET_PATH,
+    connect_timeout: float = 10.0,
+) -> None:
+    """Attach to CantinaOS and run one service until SIGINT/SIGTERM."""
+    event_bus = RemoteEventBus(socket_path)
+    service = REMOTE_SERVICE_FACTORIES[name](event_bus, config or {})
+    event_bus.start()
+    logger.info(f"Waiting for CantinaOS event bus at {socket_path}")
+    try:
+        await asyncio.wait_for(event_bus.connected.wait(), timeout=connect_timeout)
+    except asyncio.TimeoutError:
+        logger.warning(f"CantinaOS not reachable yet; starting {name} and retrying in the background")
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    await service.start()
+    try:
+        await stop.wait()
+    finally:
+        await service.stop()
+        await event_bus.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run a CantinaOS service outside the CantinaOS process")
+    parser.add_argument("service", choices=sorted(REMOTE_SERVICE_FACTORIES))
+    parser.add_argument("--socket", default=os.getenv("CANTINA_BRIDGE_SOCKET") or DEFAULT_SOCKET_PATH,
+                        help="CantinaOS event bus socket")
+    parser.add_argument("--connect-timeout", type=float, default=10.0,
+                        help="Seconds to wait for CantinaOS before starting anyway")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(run_remote_service(args.service, socket_path=args.socket, connect_timeout=args.connect_timeout))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
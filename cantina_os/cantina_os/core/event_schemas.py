@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field
-from typing import Optional, Any
+from pydantic import AliasChoices, BaseModel, Field
+from typing import Optional, Any, Callable
 import uuid
 import time
 # Assuming MusicTrack and MusicLibrary models exist elsewhere or need defining
@@ -25,6 +25,9 @@ class TrackEndingSoonPayload(EventPayload):
     """Payload for the TRACK_ENDING_SOON event."""
     current_track: TrackDataPayload
     time_remaining: float = Field(..., description="Time remaining for the current track in seconds.")
+    crossfade_start_in: Optional[float] = Field(default=None, description="Seconds from now until the planned beat-aligned crossfade should start (analyzed tracks only).")
+    crossfade_duration: Optional[float] = Field(default=None, description="Planned crossfade length in seconds, a whole number of bars.")
+    outro_start_in: Optional[float] = Field(default=None, description="Seconds from now until the current track's outro begins.")
 
 class DjCommandPayload(EventPayload):
     """Payload for incoming DJ commands."""
@@ -48,6 +51,7 @@ class DjCommentaryRequestPayload(EventPayload):
     next_track: Optional[TrackDataPayload] = None
     persona: str = Field(..., description="The name of the persona to use for commentary generation.")
     request_id: str = Field(..., description="Unique identifier for this commentary request.")
+    priority: str = Field(default="background", description="Scheduling class for the GPT call ('interactive' or 'background').")
 
 class GptCommentaryResponsePayload(EventPayload):
     """Payload for the GPT_COMMENTARY_RESPONSE event."""
@@ -118,6 +122,7 @@ class BasePlanStep(BaseModel):
     """Base class for all plan steps."""
     step_type: str
     duration: Optional[float] = None # Expected duration in seconds
+    offset: Optional[float] = None # Start offset in seconds within an enclosing parallel_steps group
 
 class PlayCachedSpeechStep(BasePlanStep):
     """Plan step to play a piece of cached speech."""
@@ -148,6 +153,15 @@ class ParallelSteps(BasePlanStep):
     step_type: str = "parallel_steps"
     steps: list[BasePlanStep] = Field(..., description="List of steps to execute concurrently")
 
+class WaitForEventStep(BasePlanStep):
+    """Plan step that blocks until a matching event arrives on the bus."""
+    step_type: str = "wait_for_event"
+    topic: str = Field(..., validation_alias=AliasChoices("topic", "event"), description="Event topic to wait for (value or EventTopics name).")
+    match: dict[str, Any] = Field(default_factory=dict, description="Payload fields that must equal the given values.")
+    predicate: Optional[Callable[[dict[str, Any]], bool]] = Field(default=None, exclude=True, description="Extra in-process check on the payload.")
+    timeout: Optional[float] = Field(default=None, description="Seconds to wait; defaults to the executor's wait_for_event_timeout.")
+    fail_on_timeout: bool = Field(default=True, description="Fail the step (and plan) if the event does not arrive in time.")
+
 class DjTransitionPlanPayload(BaseModel):
     """Represents a plan for a DJ transition (e.g., between tracks)."""
     plan_id: str = Field(..., description="Unique identifier for this transition plan.")
@@ -31,6 +31,7 @@ class EventTopics(str, Enum):
     MODE_TRANSITION_COMPLETED = "mode.transition.completed"  # Added back
     MODE_TRANSITION_FAILED = "mode.transition.failed"  # Added back
     LOG_MESSAGE = "log.message"
+    LOG_RECORD = "log.record"  # Python log records forwarded to an out-of-process LoggingService
     PERFORMANCE_METRIC = "performance.metric"
     DEBUG_COMMAND = "debug.command"
     DEBUG_CONFIG = "debug.config"
@@ -109,6 +110,7 @@ class EventTopics(str, Enum):
     )
     LLM_PROCESSING_STARTED = "llm.processing.started"  # Added back
     LLM_PROCESSING_ENDED = "llm.processing.ended"  # Added back
+    LLM_QUEUE_STATUS = "llm.queue.status"  # GPT request queue depth per priority class
     INTENT_EXECUTION_RESULT = (
         "intent.execution.result"  # Added back - needed by gpt service
     )
@@ -137,6 +139,7 @@ class EventTopics(str, Enum):
     MUSIC_STOP = "music.stop"  # Added back
     AUDIO_DUCKING_START = "audio.ducking.start"  # Added back
     AUDIO_DUCKING_STOP = "audio.ducking.stop"  # Added back
+    AUDIO_DUCKING_APPLIED = "audio.ducking.applied"  # Ack from MusicController once the volume change is applied
     AUDIO_ERROR = "audio.error"  # Added back
     MODE_CHANGED = "mode.changed"
     MODE_COMMAND = "mode.command"  # Added back
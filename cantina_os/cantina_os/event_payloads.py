@@ -131,6 +131,16 @@ class AudioChunkPayload(BaseEventPayload):
     dtype: str  # NumPy dtype string
 
 
+class VoiceAudioLevelPayload(BaseEventPayload):
+    """Payload for decimated microphone level events."""
+
+    rms: float = Field(..., description="RMS level over the window, 0..1 of full scale")
+    peak: float = Field(..., description="Peak level over the window, 0..1 of full scale")
+    rms_db: float = Field(..., description="RMS level in dBFS")
+    window_ms: float = Field(..., description="Length of the metering window in milliseconds")
+    capture_time: float = Field(..., description="Capture timestamp of the last block in the window")
+
+
 class TranscriptionTextPayload(BaseEventPayload):
     """Payload for transcription text events."""
 
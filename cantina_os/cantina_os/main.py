@@ -49,6 +49,7 @@ from .services.debug_service import DebugService
 
 # Import the web bridge service
 from .services.web_bridge_service import WebBridgeService
+from .services.bridge_ipc_service import BridgeIPCService
 
 # Import the logging service
 from .services.logging_service import LoggingService
@@ -201,6 +202,13 @@ class CantinaOS:
             "OPENAI_MODEL": os.getenv("OPENAI_MODEL", "gpt-4o"),
             "AUDIO_SAMPLE_RATE": int(os.getenv("AUDIO_SAMPLE_RATE", "16000")),
             "AUDIO_CHANNELS": int(os.getenv("AUDIO_CHANNELS", "1")),
+            # "standalone" serves the event bus to an external dj-r3x-bridge process instead
+            "WEB_BRIDGE_MODE": os.getenv("WEB_BRIDGE_MODE", "in_process"),
+            "BRIDGE_SOCKET_PATH": os.getenv("CANTINA_BRIDGE_SOCKET", ""),
+            # Services run by cantina_os.bridge.remote_service instead (web_bridge, logging_service, debug)
+            "REMOTE_SERVICES": [
+                name.strip() for name in os.getenv("CANTINA_REMOTE_SERVICES", "").split(",") if name.strip()
+            ],
         }
         
         # Log loaded configuration (masking API keys for security)
@@ -319,12 +327,24 @@ class CantinaOS:
             "debug",  # Add debug service for LLM response logging
             "cli"
         ]
+        remote_services = self._remote_services()
+        if remote_services:
+            # These run in their own processes; bridge_ipc serves them the event bus
+            self.logger.info(f"Running out of process: {', '.join(sorted(remote_services))}")
+            service_order = ["bridge_ipc"] + [name for name in service_order if name not in remote_services]
         
         try:
+            # Serve the bus to out-of-process services before anything else emits
+            if "bridge_ipc" in service_order:
+                self.logger.info("Starting bridge_ipc service")
+                self._services["bridge_ipc"] = self._create_service("bridge_ipc")
+                await self._services["bridge_ipc"].start()
+
             # Initialize logging service first to capture all startup logs
-            self.logger.info("Starting logging_service")
-            self._services["logging_service"] = self._create_service("logging_service")
-            await self._services["logging_service"].start()
+            if "logging_service" in service_order:
+                self.logger.info("Starting logging_service")
+                self._services["logging_service"] = self._create_service("logging_service")
+                await self._services["logging_service"].start()
             
             # Initialize mode manager next - it's required by most services
             self.logger.info("Starting yoda_mode_manager service")
@@ -334,7 +354,7 @@ class CantinaOS:
             # Initialize the rest of the services in order
             for service_name in service_order:
                 # Skip services that are already started
-                if service_name in ["logging_service", "yoda_mode_manager"]:
+                if service_name in ["bridge_ipc", "logging_service", "yoda_mode_manager"]:
                     continue
                     
                 self.logger.info(f"Starting {service_name} service")
@@ -359,6 +379,13 @@ class CantinaOS:
             await self._cleanup_services()
             raise
             
+    def _remote_services(self) -> set:
+        """Service names configured to run outside this process."""
+        remote_services = set(self._config.get("REMOTE_SERVICES", []))
+        if self._config.get("WEB_BRIDGE_MODE") == "standalone":
+            remote_services.add("web_bridge")
+        return remote_services
+
     async def _cleanup_services(self) -> None:
         """Perform graceful shutdown and cleanup of all services."""
         self.logger.info("Shutting down services...")
@@ -501,6 +528,7 @@ class CantinaOS:
             "memory_service": MemoryService,
             "cached_speech_service": CachedSpeechService,
             "web_bridge": WebBridgeService,
+            "bridge_ipc": BridgeIPCService,
             "debug": DebugService,
             "logging_service": LoggingService
         }
@@ -569,6 +597,12 @@ class CantinaOS:
             else:
                 service_config = {"music_dir": music_dir}
         
+        elif service_name == "bridge_ipc":
+            # Socket remote services connect to (bridge.ipc default when unset)
+            service_config["socket_path"] = self._config.get("BRIDGE_SOCKET_PATH", "")
+            # A remote LoggingService still needs this process's log records
+            service_config["forward_logs"] = "logging_service" in self._remote_services()
+
         # Timeline services configuration
         elif service_name == "brain_service":
             # Configure brain service
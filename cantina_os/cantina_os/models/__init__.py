@@ -4,9 +4,10 @@ Models package for Cantina OS.
 This package contains shared Pydantic data models used across different services.
 """
 
-from .music_models import MusicTrack, MusicLibrary
+from .music_models import MusicTrack, MusicLibrary, TrackFeatures
 
 __all__ = [
     "MusicTrack",
     "MusicLibrary",
+    "TrackFeatures",
 ] 
\ No newline at end of file
@@ -9,6 +9,17 @@ from typing import Dict, List, Optional, Any
 from pydantic import BaseModel, Field
 
 
+class TrackFeatures(BaseModel):
+    """Audio features computed offline and cached in the library index."""
+    tempo: Optional[float] = Field(default=None, description="Estimated tempo in BPM")
+    energy: Optional[float] = Field(default=None, description="Perceived energy, normalized to 0-1")
+    key: Optional[str] = Field(default=None, description="Musical key, Camelot (e.g. '8A') or name (e.g. 'A minor')")
+    loudness: Optional[float] = Field(default=None, description="Integrated loudness in LUFS")
+    spectral_centroid: Optional[float] = Field(default=None, description="Mean spectral centroid in Hz")
+    intro_length: Optional[float] = Field(default=None, description="Seconds before the track reaches full energy")
+    outro_length: Optional[float] = Field(default=None, description="Seconds from the end of full energy to the end of the track")
+
+
 class MusicTrack(BaseModel):
     """Model representing a music track."""
     name: str = Field(description="Name of the track (filename without extension)")
@@ -19,6 +30,7 @@ class MusicTrack(BaseModel):
     artist: Optional[str] = Field(default=None, description="Artist name if available")
     album: Optional[str] = Field(default=None, description="Album name if available")
     genre: Optional[str] = Field(default=None, description="Genre of the track if available")
+    features: Optional[TrackFeatures] = Field(default=None, description="Precomputed audio features, if the track was analyzed")
     
     def __str__(self) -> str:
         """String representation of the track."""
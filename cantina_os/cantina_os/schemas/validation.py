@@ -12,9 +12,10 @@ import asyncio
 import functools
 import logging
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+from enum import Enum
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Type, Union, get_args, get_origin
 
-from pydantic import ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from . import BaseWebCommand, BaseWebResponse, WebCommandError
 from .web_commands import (
@@ -149,6 +150,141 @@ class SocketIOValidationMixin:
         )
 
 
+# Status payload models by status type, shared by every WebBridge instance
+STATUS_MODEL_MAP: Dict[str, Type[BaseModel]] = {
+    "music": WebMusicStatusPayload,
+    "voice": WebVoiceStatusPayload,
+    "system": WebSystemStatusPayload,
+    "dj": WebDJStatusPayload,
+    "service": WebServiceStatusPayload,
+    "progress": WebProgressPayload
+}
+
+# Upper bound on remembered payload shapes per status type
+MAX_KNOWN_SHAPES = 64
+
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def _is_plain_json(value: Any) -> bool:
+    """True if Pydantic's JSON-mode dump would return ``value`` unchanged."""
+    if type(value) in _JSON_SCALARS:
+        return True
+    if type(value) is dict:
+        return all(type(k) is str and _is_plain_json(v) for k, v in value.items())
+    if type(value) is list:
+        return all(_is_plain_json(v) for v in value)
+    return False
+
+
+class _StatusConverter:
+    """
+    Precompiled validator for one status payload model.
+
+    The TypeAdapter is built once at import. A payload's shape (its keys and
+    their value types) is checked by Pydantic the first time it is seen; once
+    the fast converter has produced the same result for that shape, later
+    payloads with the same shape are built directly, checking only what can
+    still vary within a shape (literal values, nested dict contents).
+    Anything unusual falls back to the full Pydantic path.
+    """
+
+    __slots__ = ("model", "adapter", "fields", "known_shapes", "hits", "misses")
+
+    def __init__(self, model: Type[BaseModel]):
+        self.model = model
+        self.adapter = TypeAdapter(model)
+        # (name, required, default, default_factory, allowed values or None, kind)
+        self.fields: List[Tuple[str, bool, Any, Optional[Callable[[], Any]], Optional[Dict[Any, Any]], str]] = []
+        for name, info in model.model_fields.items():
+            allowed, kind = self._classify(info.annotation)
+            self.fields.append((name, info.is_required(), info.default, info.default_factory, allowed, kind))
+        self.known_shapes: set = set()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _classify(annotation: Any) -> Tuple[Optional[Dict[Any, Any]], str]:
+        """Reduce a field annotation to the check the fast path needs."""
+        args = [a for a in get_args(annotation) if a is not type(None)]
+        if get_origin(annotation) is Union and len(args) == 1:
+            annotation = args[0]  # Optional[X]
+        if get_origin(annotation) is Literal:
+            return {value: value for value in get_args(annotation)}, "choice"
+        if isinstance(annotation, type) and issubclass(annotation, Enum):
+            return {member.value: member.value for member in annotation}, "choice"
+        if annotation is float:
+            return None, "float"
+        if get_origin(annotation) is dict or annotation is dict:
+            return None, "json"
+        return None, "plain"
+
+    def validate(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate and serialize like ``model(**data).model_dump(mode='json')``."""
+        shape = (tuple(data), tuple(map(type, data.values())))
+        if shape in self.known_shapes:
+            result = self._convert(data)
+            if result is not None:
+                self.hits += 1
+                return result
+
+        self.misses += 1
+        result = self.adapter.dump_python(self.adapter.validate_python(data), mode="json")
+        if len(self.known_shapes) < MAX_KNOWN_SHAPES and self._matches(self._convert(data), result, data):
+            self.known_shapes.add(shape)
+        return result
+
+    def _convert(self, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Build the serialized payload directly; None when Pydantic has to decide."""
+        result = {}
+        for name, required, default, default_factory, allowed, kind in self.fields:
+            if name not in data:
+                if required:
+                    return None
+                result[name] = default_factory() if default_factory else default
+                continue
+            value = data[name]
+            if value is None:
+                result[name] = None
+            elif kind == "choice":
+                if value not in allowed:
+                    return None
+                result[name] = allowed[value]
+            elif kind == "float":
+                result[name] = float(value)
+            elif kind == "json":
+                if not _is_plain_json(value):
+                    return None
+                result[name] = dict(value)
+            else:
+                result[name] = value
+        return result
+
+    def _matches(self, converted: Optional[Dict[str, Any]], result: Dict[str, Any], data: Dict[str, Any]) -> bool:
+        """Whether the fast path reproduced Pydantic's output, including value types."""
+        if converted is None or converted.keys() != result.keys():
+            return False
+        for name, _, _, default_factory, _, _ in self.fields:
+            if default_factory and name not in data:
+                continue  # Generated per call (timestamps)
+            if converted[name] != result[name] or type(converted[name]) is not type(result[name]):
+                return False
+        return True
+
+
+_STATUS_CONVERTERS: Dict[str, _StatusConverter] = {
+    status_type: _StatusConverter(model) for status_type, model in STATUS_MODEL_MAP.items()
+}
+
+
+def status_validation_stats() -> Dict[str, Dict[str, int]]:
+    """Fast-path hits, full validations and remembered shapes per status type."""
+    return {
+        status_type: {"hits": c.hits, "misses": c.misses, "shapes": len(c.known_shapes)}
+        for status_type, c in _STATUS_CONVERTERS.items()
+    }
+
+
 class StatusPayloadValidationMixin:
     """
     Mixin class for WebBridge service providing status payload validation utilities.
@@ -180,34 +316,23 @@ class StatusPayloadValidationMixin:
         Raises:
             WebCommandError: If validation fails and no fallback provided
         """
+        converter = _STATUS_CONVERTERS.get(status_type)
+        if not converter:
+            logger.warning(f"Unknown status type '{status_type}', using raw data")
+            return self._sanitize_raw_data(data)
+
         try:
-            # Map status types to their respective Pydantic models
-            status_model_map = {
-                "music": WebMusicStatusPayload,
-                "voice": WebVoiceStatusPayload,
-                "system": WebSystemStatusPayload,
-                "dj": WebDJStatusPayload,
-                "service": WebServiceStatusPayload,
-                "progress": WebProgressPayload
-            }
-            
-            # Get the appropriate model for validation
-            model_class = status_model_map.get(status_type)
-            if not model_class:
-                logger.warning(f"Unknown status type '{status_type}', using raw data")
-                return self._sanitize_raw_data(data)
-            
             # Apply field mapping for specific status types
             mapped_data = self._map_status_fields(status_type, data)
             
-            # Attempt validation with the appropriate model
-            logger.debug(f"Validating {status_type} status payload: {mapped_data}")
-            validated_payload = model_class(**mapped_data)
+            # Validate with the precompiled converter; known shapes skip Pydantic.
+            # Lazy %-formatting: this runs for every progress tick.
+            logger.debug("Validating %s status payload: %s", status_type, mapped_data)
             
-            # Return JSON-serialized dictionary with datetime handling
-            # CRITICAL: Use exclude_none=False to preserve Optional fields with actual values
-            result = validated_payload.model_dump(mode='json', exclude_none=False)
-            logger.debug(f"Serialized {status_type} payload: {result}")
+            # Returns a JSON-serialized dictionary with datetime handling and
+            # Optional fields preserved (exclude_none=False)
+            result = converter.validate(mapped_data)
+            logger.debug("Serialized %s payload: %s", status_type, result)
             return result
             
         except ValidationError as e:
@@ -216,9 +341,9 @@ class StatusPayloadValidationMixin:
             # Try fallback data if provided
             if fallback_data:
                 try:
-                    fallback_payload = model_class(**fallback_data)
+                    fallback_payload = converter.adapter.validate_python(fallback_data)
                     logger.info(f"Using fallback data for {status_type} status")
-                    return fallback_payload.model_dump(mode='json', exclude_none=False)
+                    return converter.adapter.dump_python(fallback_payload, mode='json')
                 except ValidationError as fallback_error:
                     logger.error(f"Fallback data also invalid: {fallback_error}")
             
@@ -240,6 +365,18 @@ class StatusPayloadValidationMixin:
         Returns:
             Data with fields mapped to expected web dashboard format
         """
+        # Only service and progress payloads are rewritten; validation never
+        # mutates its input, so other types skip the copy
+        if status_type not in ("service", "progress"):
+            return data
+
+        # Progress ticks from _handle_music_progress are already in dashboard format
+        if status_type == "progress":
+            progress = data.get('progress')
+            if ('operation' in data and 'status' in data and 'details' in data
+                    and type(progress) is float and 0.0 <= progress <= 1.0):
+                return data
+
         mapped_data = data.copy()
         
         # Map service status fields
@@ -9,9 +9,9 @@ including commentary generation and caching.
 """
 SERVICE: BrainService
 PURPOSE: Central orchestration service for DJ mode, track selection, commentary caching, and timeline plan creation
-EVENTS_IN: DJ_COMMAND, DJ_MODE_CHANGED, DJ_NEXT_TRACK, MUSIC_LIBRARY_UPDATED, GPT_COMMENTARY_RESPONSE, TRACK_ENDING_SOON, SPEECH_CACHE_READY, SPEECH_CACHE_ERROR, PLAN_ENDED
-EVENTS_OUT: DJ_MODE_START, DJ_MODE_STOP, DJ_MODE_CHANGED, MUSIC_COMMAND, DJ_COMMENTARY_REQUEST, PLAN_READY, CLI_RESPONSE, MEMORY_SET, SPEECH_CACHE_REQUEST
-KEY_METHODS: handle_dj_start, handle_dj_stop, handle_dj_next, handle_dj_queue, _smart_track_selection, _create_and_emit_transition_plan, _commentary_caching_loop
+EVENTS_IN: DJ_COMMAND, DJ_MODE_CHANGED, DJ_NEXT_TRACK, MUSIC_LIBRARY_UPDATED, GPT_COMMENTARY_RESPONSE, TRACK_PLAYING, TRACK_ENDING_SOON, SPEECH_CACHE_READY, SPEECH_CACHE_ERROR, PLAN_ENDED
+EVENTS_OUT: DJ_MODE_START, DJ_MODE_STOP, DJ_MODE_CHANGED, MUSIC_COMMAND, DJ_COMMENTARY_REQUEST, DJ_NEXT_TRACK_SELECTED, PLAN_READY, CLI_RESPONSE, MEMORY_SET, SPEECH_CACHE_REQUEST, SPEECH_CACHE_CLEANUP, DEBUG_PERFORMANCE
+KEY_METHODS: handle_dj_start, handle_dj_stop, handle_dj_next, handle_dj_queue, _smart_track_selection, _create_and_emit_transition_plan, _schedule_commentary_generation, _fill_commentary_pool, _promote_commentary_candidate
 DEPENDENCIES: Music library, MemoryService coordination, persona files (dj_r3x-transition-persona.txt, dj_r3x-verbal-feedback-persona.txt)
 """
 
@@ -51,16 +51,28 @@ from cantina_os.core.event_schemas import (
     ParallelSteps # Import ParallelSteps for concurrent step execution
 )
 from ..utils.command_decorators import compound_command, register_service_commands, validate_compound_command, command_error_handler
+from ..utils.commentary_pool import CommentaryCandidate, CommentaryCandidatePool
+from ..utils.track_selector import TrackSelector
 
 # Define BrainService configuration model
 class BrainServiceConfig(BaseModel):
     """Configuration for BrainService."""
     max_recent_tracks: int = Field(default=10, description="Maximum number of recently played tracks to remember")
-    commentary_cache_interval: int = Field(default=30, description="Interval in seconds for the commentary caching loop")
+    dj_energy_step: float = Field(default=0.05, description="Energy change per transition the DJ energy curve aims for (tracks with audio features)")
+    dj_energy_min: float = Field(default=0.3, description="Lower energy bound where the DJ energy curve turns back up")
+    dj_energy_max: float = Field(default=0.9, description="Upper energy bound where the DJ energy curve turns back down")
     dj_persona_path: str = Field(default="dj_r3x-transition-persona.txt", description="Path to the DJ R3X transition persona file for commentary generation.")
     verbal_feedback_persona_path: str = Field(default="dj_r3x-verbal-feedback-persona.txt", description="Path to the DJ R3X verbal feedback persona file, relative to execution dir or findable in common locations.")
     tts_voice_id: str = Field(default="YOUR_DEFAULT_VOICE_ID", description="Default voice ID for TTS caching") # Add default voice ID config
     crossfade_duration: float = Field(default=8.0, description="Default duration for music crossfades in seconds") # Add crossfade duration config
+    commentary_pool_size: int = Field(default=3, description="Next-track candidates kept with commentary generated and cached ahead of time")
+    commentary_max_attempts: int = Field(default=2, description="Commentary attempts per candidate before the track is replaced")
+    commentary_max_consecutive_failures: int = Field(default=6, description="Commentary failures in a row, across the pool, before requests are paused")
+    commentary_failure_backoff: float = Field(default=60.0, description="Seconds commentary requests stay paused after repeated failures, unless one succeeds")
+    commentary_ready_grace: float = Field(default=10.0, description="Seconds to wait at TRACK_ENDING_SOON for a pending candidate when none is ready yet")
+    commentary_safety_margin: float = Field(default=10.0, description="Seconds added to the estimated commentary latency when scheduling generation")
+    commentary_default_duration: float = Field(default=6.0, description="Assumed commentary length in seconds when placing it over an outro without a measured duration")
+    duck_fade_sec: float = Field(default=2.0, description="Music duck/unduck fade time in DJ transitions; ducking starts this long before commentary")
 
 
 class BrainService(BaseService):
@@ -83,6 +95,11 @@ class BrainService(BaseService):
         self._dj_mode_active = False
         self._recently_played_tracks: List[str] = [] # Track names
         self._music_library: Dict[str, MusicTrack] = {} # Store music library data
+        # Picks next tracks by transition cost over precomputed audio features
+        self._track_selector = TrackSelector(
+            energy_step=self._config.dj_energy_step,
+            energy_range=(self._config.dj_energy_min, self._config.dj_energy_max),
+        )
         self._tasks: List[asyncio.Task] = [] # List to hold background tasks
         self._next_track_commentary_cached = False # Flag to track if commentary for the next track is cached
         self._current_track: Optional[MusicTrack] = None
@@ -105,6 +122,21 @@ class BrainService(BaseService):
         self._cached_commentary_ready: Dict[str, bool] = {} # Map cache_key to readiness status
         # Map commentary request IDs to the next track they are for
         self._commentary_request_next_track: Dict[str, MusicTrack] = {} # Map request_id to next_track
+        # Rolling pool of next-track candidates with commentary cached ahead of TRACK_ENDING_SOON
+        self._commentary_pool = CommentaryCandidatePool(
+            size=self._config.commentary_pool_size,
+            max_attempts=self._config.commentary_max_attempts,
+            max_consecutive_failures=self._config.commentary_max_consecutive_failures,
+            failure_backoff=self._config.commentary_failure_backoff,
+        )
+        # Refills the pool once a failure backoff runs out
+        self._commentary_resume_job: Optional[asyncio.Task] = None
+        # Commentary generation is started once per track, timed from TRACK_PLAYING
+        self._commentary_job: Optional[asyncio.Task] = None
+        self._commentary_window_open = False
+        # Beat-aligned transition timing from TRACK_ENDING_SOON (monotonic deadlines)
+        self._transition_timing: Optional[Dict[str, float]] = None
+        self._next_commentary_duration: Optional[float] = None
 
     async def _start(self) -> None:
         """Start the service and initialize resources."""
@@ -113,11 +145,6 @@ class BrainService(BaseService):
         # Load personas
         await self._load_personas()
 
-        # Start the continuous commentary caching task
-        commentary_task = asyncio.create_task(self._commentary_caching_loop())
-        self._tasks.append(commentary_task)
-        commentary_task.add_done_callback(self._handle_task_exception)
-        
         # Auto-register compound commands using decorators
         register_service_commands(self, self._event_bus)
         self.logger.info("Auto-registered DJ commands using decorators")
@@ -138,6 +165,10 @@ class BrainService(BaseService):
     async def _stop(self) -> None:
         """Stop the brain service and clean up resources."""
         try:
+            self._cancel_commentary_job()
+            if self._commentary_resume_job and not self._commentary_resume_job.done():
+                self._commentary_resume_job.cancel()
+
             # Cancel background tasks
             for task in self._tasks:
                 if not task.done():
@@ -181,6 +212,10 @@ class BrainService(BaseService):
             EventTopics.TRACK_ENDING_SOON,
             self._handle_track_ending_soon
         )))
+        subscription_tasks.append(asyncio.create_task(self.subscribe(
+            EventTopics.TRACK_PLAYING,
+            self._handle_track_playing
+        )))
         subscription_tasks.append(asyncio.create_task(self.subscribe(
             EventTopics.SPEECH_CACHE_READY,
             self._handle_speech_cache_ready
@@ -314,7 +349,7 @@ class BrainService(BaseService):
                 self._dj_mode_active = True
 
                 # --- Initiate initial DJ mode sequence ---
-                # Select initial track (this happens outside the caching loop)
+                # Select initial track (next-track candidates are picked by the pool)
                 track_name = await self._smart_track_selection()
                 if not track_name:
                     self.logger.warning("No tracks available for DJ mode")
@@ -336,15 +371,7 @@ class BrainService(BaseService):
                 })
                 
                 # Add to recently played
-                self._recently_played_tracks.append(track_name)
-                if len(self._recently_played_tracks) > self._config.max_recent_tracks:
-                    self._recently_played_tracks.pop(0)
-
-                # Update MemoryService with track history
-                await self.emit(EventTopics.MEMORY_SET, {
-                    "key": "dj_track_history",
-                    "value": self._recently_played_tracks.copy()
-                })
+                await self._remember_played_track(track_name)
 
                 # Emit DJ mode start event with initial track - tell MusicController which track to play
                 await self.emit(
@@ -385,16 +412,17 @@ class BrainService(BaseService):
                     current_track=self._create_track_data_payload(self._current_track),
                     next_track=None,  # No next track for intro
                     persona=self._dj_persona,
-                    request_id=request_id
+                    request_id=request_id,
+                    priority="interactive"  # User just started DJ mode and is waiting on the intro
                 )
                 
                 self.logger.info(f"Initial commentary requested with ID: {request_id}, cache_key: {cache_key}")
                 await self.emit(EventTopics.DJ_COMMENTARY_REQUEST, intro_request.model_dump())
 
-                # The commentary caching loop starts and will select the NEXT track and cache its intro/transition commentary.
-                # The loop will update self._next_track and trigger the commentary request.
-                self._next_track = None # Ensure next track is selected by the loop
+                # Start filling the candidate pool; the front runner becomes self._next_track.
+                self._next_track = None
                 self._next_track_commentary_cached = False # Reset cache status
+                await self._fill_commentary_pool()
                 # DON'T clear the cache tracking - we need it for initial commentary
                 # self._commentary_cache_keys.clear() # Clear previous cache key mapping
                 # self._cached_commentary_ready.clear() # Clear previous cache readiness status
@@ -407,6 +435,7 @@ class BrainService(BaseService):
                 self._current_track = None
                 self._next_track = None
                 self._next_track_commentary_cached = False # Reset cache status
+                await self._clear_commentary_pool()
                 self._commentary_cache_keys.clear()
                 self._cached_commentary_ready.clear()
                 self._commentary_request_next_track.clear()
@@ -422,27 +451,31 @@ class BrainService(BaseService):
         except Exception as e:
             self.logger.error(f"Error handling DJ mode change: {e}", exc_info=True)
 
-    async def _smart_track_selection(self, query: str = None) -> Optional[str]:
-        """Smart track selection for both voice commands and DJ mode."""
+    async def _smart_track_selection(self, query: str = None, exclude: Optional[set] = None) -> Optional[str]:
+        """Smart track selection for both voice commands and DJ mode.
+
+        In DJ mode the next track is the one with the smoothest transition from
+        the current track (tempo, key, energy curve), keeping recently played
+        tracks out while possible. Tracks without audio features are picked
+        at random.
+
+        Args:
+            query: Optional search query (unused by feature-based selection)
+            exclude: Track names that must not be picked (e.g. tracks already in the candidate pool)
+        """
         try:
-            # Get all available tracks from the music library attribute
-            available_tracks = list(self._music_library.keys())
-            if not available_tracks:
+            if not self._music_library:
                 self.logger.warning("No tracks available in music library")
                 return None
 
-            # Filter out recently played tracks for DJ mode if active
+            self._track_selector.update_library(self._music_library)
             if self._dj_mode_active:
-                available_tracks = [t for t in available_tracks if t not in self._recently_played_tracks]
-                if not available_tracks:
-                    # If all tracks have been played recently, clear history and try again
-                    self._recently_played_tracks.clear()
-                    available_tracks = list(self._music_library.keys())
+                current = self._current_track.name if self._current_track else None
+                recent = self._recently_played_tracks
+            else:
+                current, recent = None, []
 
-            # Basic random selection for now. Enhance with genre/energy matching later.
-            import random
-            selected_track_name = random.choice(available_tracks)
-            return selected_track_name
+            return self._track_selector.select(current, exclude=exclude or (), recent=recent)
 
         except Exception as e:
             self.logger.error(f"Error during smart track selection: {e}", exc_info=True)
@@ -452,11 +485,11 @@ class BrainService(BaseService):
         """Handle the DJ_NEXT_TRACK command (e.g., via CLI)."""
         self.logger.info("Handling DJ_NEXT_TRACK command")
         # This command should trigger the execution of the *already planned* next transition.
-        # The logic for preparing the next transition is in the _commentary_caching_loop and _handle_track_ending_soon.
+        # The logic for preparing the next transition is in the candidate pool and _handle_track_ending_soon.
         # If a plan is ready, we should activate it via TimelineExecutorService.
         # If not ready, we might need to generate/cache on demand (potentially causing a delay).
 
-        # For now, let's assume _handle_track_ending_soon or the caching loop prepares the plan.
+        # For now, let's assume _handle_track_ending_soon prepares the plan.
         # We need a way to signal TimelineExecutorService to execute the *currently ready* plan.
         # This might require emitting a specific event or calling a TimelineExecutorService method.
         # Let's emit a placeholder event for now, assuming TimelineExecutorService listens for it.
@@ -572,7 +605,11 @@ class BrainService(BaseService):
             # This requires that the incoming payload structure matches what MusicTrack expects
             try:
                 self._music_library = {name: MusicTrack(**data) for name, data in payload['tracks'].items()}
-                self.logger.info(f"Loaded {len(self._music_library)} tracks into the music library.")
+                self._track_selector.update_library(self._music_library)
+                self.logger.info(
+                    f"Loaded {len(self._music_library)} tracks into the music library "
+                    f"({len(self._track_selector)} with audio features)."
+                )
                 # If DJ mode is active and current/next tracks are not set, select one
                 if self._dj_mode_active and not self._current_track:
                      self.logger.info("DJ mode active, selecting initial track after library update.")
@@ -587,87 +624,279 @@ class BrainService(BaseService):
                 self.logger.error(f"Error processing music library update: {e}", exc_info=True)
 
 
-    async def _commentary_caching_loop(self) -> None:
-        """Continuous loop to select the next track and cache its commentary."""
-        self.logger.info("Starting commentary caching loop")
-        while True:
-            try:
-                if self._dj_mode_active and not self._next_track_commentary_cached and self._current_track:
-                    self.logger.debug("Commentary caching loop: Selecting next track and requesting commentary")
+    async def _handle_track_playing(self, payload: Dict[str, Any]) -> None:
+        """Record the track that just started and schedule commentary generation for it."""
+        if not self._dj_mode_active:
+            return
+        try:
+            if payload.get("track_id") in self._music_library:
+                await self._remember_played_track(payload["track_id"])
+            await self._schedule_commentary_generation(
+                duration=payload.get("duration"),
+                start_timestamp=payload.get("start_timestamp"),
+                ending_threshold=payload.get("track_ending_threshold_sec"),
+            )
+        except Exception as e:
+            self.logger.error(f"Error scheduling commentary generation: {e}", exc_info=True)
 
-                    # Select the next track
-                    next_track_name = await self._smart_track_selection()
-                    if not next_track_name:
-                        self.logger.warning("Commentary caching loop: No tracks available to select next.")
-                        # Wait before trying again
-                        await asyncio.sleep(self._config.commentary_cache_interval)
-                        continue
+    async def _remember_played_track(self, track_name: str) -> None:
+        """Add a track to the no-repeat window and share the history with MemoryService."""
+        if self._recently_played_tracks and self._recently_played_tracks[-1] == track_name:
+            return
+        self._recently_played_tracks.append(track_name)
+        if len(self._recently_played_tracks) > self._config.max_recent_tracks:
+            self._recently_played_tracks.pop(0)
 
-                    self._next_track = self._music_library.get(next_track_name)
+        await self.emit(EventTopics.MEMORY_SET, {
+            "key": "dj_track_history",
+            "value": self._recently_played_tracks.copy()
+        })
 
-                    if not self._next_track:
-                        self.logger.error(f"Commentary caching loop: Metadata not found for next track: {next_track_name}")
-                         # Wait before trying again
-                        await asyncio.sleep(self._config.commentary_cache_interval)
-                        continue
-
-                    self.logger.info(f"Commentary caching loop: Selected next track: {self._next_track.title}")
-
-                    # CRITICAL FIX: Emit DJ_NEXT_TRACK_SELECTED event for dashboard queue updates
-                    try:
-                        track_payload = self._create_track_data_payload(self._next_track).model_dump()
-                        self.logger.info(f"CRITICAL FIX: About to emit DJ_NEXT_TRACK_SELECTED for track: {self._next_track.title}")
-                        await self.emit(EventTopics.DJ_NEXT_TRACK_SELECTED, {
-                            "track": track_payload,
-                            "timestamp": time.time(),
-                            "source": "brain_service"
-                        })
-                        self.logger.info(f"CRITICAL FIX: Successfully emitted DJ_NEXT_TRACK_SELECTED event for track: {self._next_track.title}")
-                    except Exception as e:
-                        self.logger.error(f"CRITICAL FIX: Failed to emit DJ_NEXT_TRACK_SELECTED event: {e}", exc_info=True)
-
-                    # Generate a unique request ID for this commentary request
-                    request_id = str(uuid.uuid4())
-                    # Store the linkage between the request ID and the selected next track
-                    self._commentary_request_next_track[request_id] = self._next_track
-
-                    # Request commentary from GPTService
-                    # Use the DJ transition persona
-                    # Pass current and next track metadata for contextual commentary
-                    commentary_request_payload = DjCommentaryRequestPayload(
-                        timestamp=time.time(),
-                        context="transition",
-                        current_track=TrackDataPayload(**self._current_track.model_dump()),
-                        next_track=TrackDataPayload(**self._next_track.model_dump()),
-                        persona=self._dj_persona, # Use the loaded DJ persona
-                        request_id=request_id
-                    )
+    async def _schedule_commentary_generation(
+        self,
+        duration: Optional[float],
+        start_timestamp: Optional[float] = None,
+        ending_threshold: Optional[float] = None,
+    ) -> None:
+        """Start commentary generation at the latest time it is still safe.
+
+        Commentary must be cached by the time TRACK_ENDING_SOON fires
+        (``duration - ending_threshold`` into the track). Generation is started
+        the estimated commentary latency plus ``commentary_safety_margin``
+        before that. The latency estimate is a high quantile of recent
+        request-to-cached-audio times. Unknown timing starts generation now.
+        """
+        self._cancel_commentary_job()
+        self._commentary_window_open = False
+
+        delay = 0.0
+        lead = self._commentary_pool.latency.estimate() + self._config.commentary_safety_margin
+        if duration:
+            elapsed = max(0.0, time.time() - start_timestamp) if start_timestamp else 0.0
+            ending_soon_in = duration - (ending_threshold or 0.0) - elapsed
+            delay = max(0.0, ending_soon_in - lead)
+
+        self.logger.info(f"Commentary generation scheduled in {delay:.1f}s (lead {lead:.1f}s)")
+        await self.debug_performance_metric(
+            "commentary_schedule",
+            delay,
+            "s",
+            {
+                "lead_s": lead,
+                "latency_estimate_s": self._commentary_pool.latency.estimate(),
+                "latency_samples": len(self._commentary_pool.latency),
+                "track_duration_s": duration,
+            }
+        )
+        self._commentary_job = asyncio.create_task(self._run_commentary_job(delay))
+        self._commentary_job.add_done_callback(self._handle_task_exception)
 
-                    self.logger.info(f"Commentary caching loop: Emitting DJ_COMMENTARY_REQUEST with request_id: {request_id}")
-                    await self.emit(
-                        EventTopics.DJ_COMMENTARY_REQUEST,
-                        commentary_request_payload.model_dump()
-                    )
+    async def _run_commentary_job(self, delay: float) -> None:
+        """Wait until the scheduled time, then generate commentary for the pool."""
+        try:
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._commentary_window_open = True
+            await self._fill_commentary_pool()
+        except asyncio.CancelledError:
+            pass
+
+    def _cancel_commentary_job(self) -> None:
+        if self._commentary_job and not self._commentary_job.done():
+            self._commentary_job.cancel()
+        self._commentary_job = None
+
+    # =================== NEXT-TRACK CANDIDATE POOL ===================
+
+    async def _fill_commentary_pool(self) -> None:
+        """Top the candidate pool up to ``commentary_pool_size`` tracks.
+
+        Once the scheduled commentary job has fired for the current track,
+        commentary for every selected candidate is requested at once so GPT
+        and TTS work for the whole pool runs concurrently. Failed candidates
+        are retried under a new request id until they run out of attempts,
+        then replaced with a freshly selected track. Before the job fires,
+        tracks are only picked. After ``commentary_max_consecutive_failures``
+        failures in a row no commentary is requested until one succeeds or
+        ``commentary_failure_backoff`` runs out; failed candidates keep their
+        tracks meanwhile.
+        """
+        if not self._dj_mode_active or not self._current_track:
+            return
+
+        pool = self._commentary_pool
+        exclude = {self._current_track.name}
+        suspended = pool.suspended_for
+        if suspended:
+            self._schedule_commentary_resume(suspended)
+        for candidate in pool.failed():
+            await self._forget_candidate_commentary(candidate)
+            if suspended:
+                pool.recycle(candidate)
+            elif candidate.attempts < pool.max_attempts:
+                self.logger.info(f"Retrying commentary for candidate '{candidate.track.title}' (attempt {candidate.attempts + 1})")
+                pool.retry(candidate, str(uuid.uuid4()))
+                await self._request_candidate_commentary(candidate)
+            else:
+                self.logger.warning(f"Dropping candidate '{candidate.track.title}' after {candidate.attempts} failed attempts")
+                pool.remove(candidate)
+                exclude.add(candidate.name)  # Don't pick it straight back
+
+        exclude.update(pool.track_names)
+        for _ in range(pool.missing):
+            track_name = await self._smart_track_selection(exclude=exclude)
+            track = self._music_library.get(track_name) if track_name else None
+            if not track:
+                break
+            exclude.add(track_name)
+            pool.add(track)
+            self.logger.info(f"Added next-track candidate: {track.title} ({len(pool)}/{pool.size})")
 
-                    # Mark that we have requested commentary for this next track
-                    # We will set _next_track_commentary_cached to True when we receive SPEECH_CACHE_READY for this request.
-                    # Store the linkage between the request_id and the expected cache_key (which will be generated in _handle_gpt_commentary_response)
-                    # For simplicity now, let's assume the cache_key will be the request_id + ".mp3" or similar.
-                    # A more robust approach would be to get the cache_key back from the SpeechCacheRequestPayload emission or the Ready event.
-                    # Let's update _handle_gpt_commentary_response to generate the cache key and store the mapping.
-                    # For now, mark the commentary request as pending caching.
-                    self._next_track_commentary_cached = False # Still False until cache ready
-
-                # Wait for the configured interval before checking again
-                await asyncio.sleep(self._config.commentary_cache_interval)
-
-            except asyncio.CancelledError:
-                self.logger.info("Commentary caching loop cancelled")
-                break # Exit loop when cancelled
+        if self._commentary_window_open and not suspended:
+            for candidate in pool.selected():
+                pool.request(candidate, str(uuid.uuid4()))
+                await self._request_candidate_commentary(candidate)
+
+        await self._update_next_track_from_pool()
+
+    def _schedule_commentary_resume(self, delay: float) -> None:
+        """Refill the pool once a failure backoff has run out."""
+        job = self._commentary_resume_job
+        if job and not job.done() and job is not asyncio.current_task():
+            return
+        self.logger.error(
+            f"Commentary failed {self._commentary_pool.consecutive_failures} times in a row; "
+            f"pausing commentary requests for {delay:.0f}s"
+        )
+
+        async def resume() -> None:
+            await asyncio.sleep(delay)
+            self.logger.info("Resuming commentary requests after failure backoff")
+            await self._fill_commentary_pool()
+
+        self._commentary_resume_job = asyncio.create_task(resume())
+        self._commentary_resume_job.add_done_callback(self._handle_task_exception)
+
+    async def _request_candidate_commentary(self, candidate: CommentaryCandidate) -> None:
+        """Emit DJ_COMMENTARY_REQUEST for a pool candidate."""
+        self._commentary_request_next_track[candidate.request_id] = candidate.track
+
+        commentary_request_payload = DjCommentaryRequestPayload(
+            timestamp=time.time(),
+            context="transition",
+            current_track=self._create_track_data_payload(self._current_track),
+            next_track=self._create_track_data_payload(candidate.track),
+            persona=self._dj_persona,
+            request_id=candidate.request_id
+        )
+
+        self.logger.debug(f"Requesting commentary for candidate '{candidate.track.title}' with request_id: {candidate.request_id}")
+        await self.emit(
+            EventTopics.DJ_COMMENTARY_REQUEST,
+            commentary_request_payload.model_dump()
+        )
+
+    async def _update_next_track_from_pool(self) -> None:
+        """Point self._next_track at the pool's front runner and announce changes."""
+        front_runner = self._commentary_pool.front_runner()
+        track = front_runner.track if front_runner else None
+        changed = (track.name if track else None) != (self._next_track.name if self._next_track else None)
+
+        self._next_track = track
+        self._next_track_commentary_cached = bool(front_runner and front_runner.is_ready)
+
+        if changed and track:
+            # Dashboard queue shows the track that would play next
+            try:
+                await self.emit(EventTopics.DJ_NEXT_TRACK_SELECTED, {
+                    "track": self._create_track_data_payload(track).model_dump(),
+                    "timestamp": time.time(),
+                    "source": "brain_service"
+                })
             except Exception as e:
-                self.logger.error(f"Error in commentary caching loop: {e}", exc_info=True)
-                # Wait a bit before retrying after an error
-                await asyncio.sleep(self._config.commentary_cache_interval)
+                self.logger.error(f"Failed to emit DJ_NEXT_TRACK_SELECTED event: {e}", exc_info=True)
+
+    async def _promote_commentary_candidate(self, grace: float = 0.0) -> Optional[CommentaryCandidate]:
+        """Take the next track from the pool.
+
+        The first candidate whose commentary finished caching wins. If none is
+        ready, wait up to ``grace`` seconds for one, then fall back to the front
+        runner so the transition still goes to a pre-selected track.
+        """
+        start = time.monotonic()
+        pool = self._commentary_pool
+        await pool.wait_for_ready(grace)
+
+        candidate = pool.promote()
+        if candidate is None:
+            return None
+
+        if not candidate.is_ready:
+            # Its commentary will not be played; drop it so a late SPEECH_CACHE_READY is ignored
+            await self._forget_candidate_commentary(candidate)
+
+        self._next_track = candidate.track
+        self._next_track_commentary_cached = candidate.is_ready
+        self._next_commentary_duration = candidate.duration
+        waited_ms = (time.monotonic() - start) * 1000.0
+
+        self.logger.info(
+            f"Promoted candidate '{candidate.track.title}' "
+            f"({'with' if candidate.is_ready else 'without'} commentary, waited {waited_ms:.0f}ms)"
+        )
+        await self.debug_performance_metric(
+            "commentary_candidate_promotion",
+            waited_ms,
+            "ms",
+            {
+                "track": candidate.name,
+                "ready": candidate.is_ready,
+                "attempts": candidate.attempts,
+                "pool_ready": sum(1 for c in pool if c.is_ready),
+                "pool_size": len(pool),
+                "stats": dict(pool.stats),
+            }
+        )
+        return candidate
+
+    async def _recycle_commentary_pool(self) -> None:
+        """Re-target unused candidates at the new current track, then refill.
+
+        Their commentary introduced them after the previous track, so it is
+        discarded; the track picks themselves are kept. Fresh commentary is
+        generated when the new track's scheduled job fires.
+        """
+        self._cancel_commentary_job()
+        self._commentary_window_open = False
+
+        pool = self._commentary_pool
+        for candidate in pool:
+            await self._forget_candidate_commentary(candidate)
+            if not self._current_track or candidate.name == self._current_track.name:
+                pool.remove(candidate)
+                continue
+            pool.recycle(candidate)
+
+        await self._fill_commentary_pool()
+
+    async def _clear_commentary_pool(self) -> None:
+        """Drop every candidate and its cached commentary."""
+        self._cancel_commentary_job()
+        if self._commentary_resume_job and not self._commentary_resume_job.done():
+            self._commentary_resume_job.cancel()
+        self._commentary_resume_job = None
+        self._commentary_window_open = False
+        for candidate in self._commentary_pool.clear():
+            await self._forget_candidate_commentary(candidate)
+
+    async def _forget_candidate_commentary(self, candidate: CommentaryCandidate) -> None:
+        """Release a candidate's commentary request and any cached audio."""
+        if candidate.request_id:
+            self._commentary_request_next_track.pop(candidate.request_id, None)
+            self._commentary_cache_keys.pop(candidate.request_id, None)
+        if candidate.cache_key:
+            self._cached_commentary_ready.pop(candidate.cache_key, None)
+            await self.emit(EventTopics.SPEECH_CACHE_CLEANUP, {"keys": [candidate.cache_key]})
 
     async def _handle_gpt_commentary_response(self, payload: Dict[str, Any]) -> None:
         """Handle the GPT_COMMENTARY_RESPONSE event and trigger speech caching."""
@@ -690,6 +919,8 @@ class BrainService(BaseService):
 
             if not commentary_text:
                 self.logger.warning(f"Received empty commentary text for request_id: {request_id}")
+                if self._commentary_pool.mark_failed(request_id=request_id):
+                    await self._fill_commentary_pool()
                 return
 
             # Route based on context: intro uses timeline plan with speak step, transitions use caching
@@ -700,6 +931,11 @@ class BrainService(BaseService):
                 await self._create_initial_commentary_timeline_plan(commentary_text, request_id)
                     
             elif context == "transition":
+                if self._commentary_pool.by_request(request_id) is None:
+                    # Candidate was promoted without it, recycled or DJ mode stopped
+                    self.logger.debug(f"Ignoring transition commentary for stale request_id: {request_id}")
+                    return
+
                 self.logger.info(f"Processing TRANSITION commentary as cached speech for request_id: {request_id}")
                 
                 # Generate a cache key based on the request ID or use existing mapping
@@ -735,6 +971,7 @@ class BrainService(BaseService):
                     return
 
                 self.logger.info(f"Emitting SPEECH_CACHE_REQUEST for cache_key: {cache_key}")
+                self._commentary_pool.mark_commentary(request_id, cache_key)
                 await self.emit(
                     EventTopics.SPEECH_CACHE_REQUEST,
                     cache_request_payload.model_dump()
@@ -768,10 +1005,17 @@ class BrainService(BaseService):
             duration = ready_payload.duration_ms / 1000.0  # Convert to seconds
             metadata = ready_payload.metadata
 
+            # Look-ahead renders requested by the timeline executor are not commentary
+            if metadata.get("source") == "timeline_prefetch":
+                return
+
             self.logger.info(f"Speech cache ready for cache_key: {cache_key} (Duration: {duration:.2f}s)")
 
             # Mark the cache entry as ready using MemoryService
             await self._set_commentary_cache_ready(cache_key, True, duration)
+
+            if self._commentary_pool.mark_ready(cache_key, duration):
+                await self._update_next_track_from_pool()
             
             # Legacy fallback during transition
             if cache_key in self._cached_commentary_ready:
@@ -816,6 +1060,10 @@ class BrainService(BaseService):
 
             self.logger.error(f"Speech cache error for cache_key {cache_key}: {error_message}")
 
+            # Retry or replace the candidate so the pool stays full
+            if self._commentary_pool.mark_failed(metadata.get("commentary_request_id"), cache_key):
+                await self._fill_commentary_pool()
+
             # Mark the cache entry as not ready (or failed)
             if cache_key in self._cached_commentary_ready:
                 self._cached_commentary_ready[cache_key] = False
@@ -830,8 +1078,6 @@ class BrainService(BaseService):
                     if self._next_track and associated_next_track and associated_next_track.track_id == self._next_track.track_id:
                         self.logger.warning("Resetting _next_track_commentary_cached due to error for current next track.")
                         self._next_track_commentary_cached = False
-                        # TODO: Consider triggering a new commentary request immediately for the same next track
-                        # asyncio.create_task(self._select_and_cache_next_track_commentary())
                     else:
                         self.logger.warning(f"Speech cache error for cache_key {cache_key} (request_id: {commentary_request_id}) but it does not match the current next track ('{self._next_track.title if self._next_track else 'None'}').")
                 elif commentary_request_id:
@@ -871,20 +1117,70 @@ class BrainService(BaseService):
                     self.logger.error(f"Current track from event not found in music library: {current_track_data.title}")
                     return
 
-            # Check if we have a next track selected and attempt to create transition plan
-            if self._next_track:
-                self.logger.info(f"Next track '{self._next_track.title}' selected. Creating transition plan.")
-                await self._create_and_emit_transition_plan()
+            # MusicController planned a beat-aligned crossfade for analyzed tracks
+            self._transition_timing = self._timing_from_ending_soon(ending_soon_payload)
+
+            # Promote the first candidate with cached commentary. If none is ready yet,
+            # wait briefly as long as the wait still leaves room for the crossfade.
+            if self._transition_timing:
+                room = max(0.0, ending_soon_payload.crossfade_start_in)
             else:
-                # No next track selected - attempt immediate selection and create simple crossfade
-                self.logger.warning("No next track selected for ending track. Attempting immediate selection.")
-                await self._handle_emergency_track_selection()
+                room = max(0.0, time_remaining - self._config.crossfade_duration)
+            grace = min(self._config.commentary_ready_grace, room)
+            await self._promote_commentary_candidate(grace)
+
+            try:
+                if self._next_track:
+                    self.logger.info(f"Next track '{self._next_track.title}' selected. Creating transition plan.")
+                    await self._create_and_emit_transition_plan()
+                else:
+                    # Pool is empty - attempt immediate selection and create simple crossfade
+                    self.logger.warning("No next track selected for ending track. Attempting immediate selection.")
+                    await self._handle_emergency_track_selection()
+            finally:
+                self._transition_timing = None
+
+            await self._recycle_commentary_pool()
 
         except Exception as e:
             self.logger.error(f"Error handling TRACK_ENDING_SOON: {e}", exc_info=True)
             # Emergency fallback - try to continue playing current track or stop gracefully
             await self._handle_transition_failure()
 
+    @staticmethod
+    def _timing_from_ending_soon(payload: TrackEndingSoonPayload) -> Optional[Dict[str, float]]:
+        """Turn the relative crossfade timing in TRACK_ENDING_SOON into monotonic deadlines."""
+        if payload.crossfade_start_in is None or not payload.crossfade_duration:
+            return None
+        now = time.monotonic()
+        outro_in = payload.outro_start_in if payload.outro_start_in is not None else payload.crossfade_start_in
+        return {
+            "crossfade_at": now + payload.crossfade_start_in,
+            "crossfade_duration": payload.crossfade_duration,
+            "outro_at": now + min(outro_in, payload.crossfade_start_in),
+        }
+
+    def _transition_offsets(self, speech_duration: Optional[float] = None) -> Optional[Dict[str, float]]:
+        """Offsets (s from now) that put the crossfade on its downbeat and commentary over the outro.
+
+        Commentary starts with the outro, or earlier if it would otherwise run
+        past the end of the crossfade; ducking leads it by ``duck_fade_sec``.
+        """
+        timing = self._transition_timing
+        if not timing:
+            return None
+        now = time.monotonic()
+        crossfade = max(0.0, timing["crossfade_at"] - now)
+        fade_end = crossfade + timing["crossfade_duration"]
+        speech_len = speech_duration or self._config.commentary_default_duration
+        speech = max(0.0, min(timing["outro_at"] - now, fade_end - speech_len))
+        return {
+            "duck": max(0.0, speech - self._config.duck_fade_sec),
+            "speech": speech,
+            "crossfade": crossfade,
+            "crossfade_duration": timing["crossfade_duration"],
+        }
+
     async def _handle_emergency_track_selection(self) -> None:
         """Handle emergency track selection when no next track is prepared."""
         try:
@@ -981,57 +1277,11 @@ class BrainService(BaseService):
     # Helper method to trigger next track selection and commentary caching
     # This is called from _music_library_updated and potentially needed elsewhere
     async def _select_and_cache_next_track_commentary(self):
-         """Helper to select the next track and trigger commentary caching."""
-         if self._dj_mode_active and not self._next_track:
-              self.logger.info("Selecting and caching commentary for the next track.")
-              # Trigger the logic that normally runs in the caching loop for selecting the next track
-              # and requesting commentary. This avoids duplicating the selection/request logic.
-              # The caching loop checks `not self._next_track_commentary_cached` and `self._current_track`.
-              # If _next_track is None, the loop needs to select it FIRST, then request commentary.
-              # We need to signal the loop or duplicate the initial steps of the loop here.
-
-              # Let's duplicate the initial steps of the caching loop for immediate selection and request.
-              # This is not ideal and suggests the caching loop logic might need restructuring
-              # to be easily triggered on demand or by specific state changes.
-
-              # For now, duplicate:
-              next_track_name = await self._smart_track_selection()
-              if not next_track_name:
-                   self.logger.warning("Could not select next track for immediate caching.")
-                   return
-
-              self._next_track = self._music_library.get(next_track_name)
-              if not self._next_track:
-                   self.logger.error(f"Metadata not found for immediately selected next track: {next_track_name}")
-                   return
-
-              self.logger.info(f"Immediately selected next track: {self._next_track.title}. Requesting commentary.")
-
-              request_id = str(uuid.uuid4())
-              # Store the linkage between the request ID and the selected next track
-              self._commentary_request_next_track[request_id] = self._next_track
-
-              commentary_request_payload = DjCommentaryRequestPayload(
-                   timestamp=time.time(),
-                   context="transition",
-                   current_track=TrackDataPayload(**self._current_track.model_dump()) if self._current_track else None,
-                   next_track=TrackDataPayload(**self._next_track.model_dump()),
-                   persona=self._dj_persona,
-                   request_id=request_id
-              )
-
-              self.logger.info(f"Emitting DJ_COMMENTARY_REQUEST for immediately selected next track with request_id: {request_id}")
-              await self.emit(
-                   EventTopics.DJ_COMMENTARY_REQUEST,
-                   commentary_request_payload.model_dump()
-              )
-              # Cache readiness will be set by _handle_speech_cache_ready
-              # Store linkage: _commentary_cache_keys will be updated in _handle_gpt_commentary_response
-
-         elif self._dj_mode_active and self._next_track_commentary_cached:
-              self.logger.info("Commentary for next track is already cached.")
-         elif self._dj_mode_active and self._next_track and not self._next_track_commentary_cached:
-              self.logger.info("Commentary for next track is being cached or generation is pending.")
+        """Helper to select next-track candidates and trigger commentary caching."""
+        if not self._dj_mode_active:
+            return
+        self.logger.info("Filling next-track candidate pool.")
+        await self._fill_commentary_pool()
 
     # Add compound command methods using decorators
     @compound_command("dj start")
@@ -1083,6 +1333,9 @@ class BrainService(BaseService):
             await self._send_error("Cannot skip track, DJ mode is not active")
             return
             
+        # Take the first candidate with cached commentary (no waiting - the user asked to skip now)
+        await self._promote_commentary_candidate()
+
         # Check if next track and commentary are ready
         if self._next_track and self._next_track_commentary_cached:
             self.logger.info(f"Manual skip with cached commentary for '{self._next_track.title}'")
@@ -1133,7 +1386,9 @@ class BrainService(BaseService):
                 await self._send_success("Skipping to next track...")
             else:
                 await self._send_error("Cannot skip - no next track available")
-                
+
+        await self._recycle_commentary_pool()
+
     async def _create_and_emit_transition_plan(self):
         """Create and emit transition plan with cached commentary and comprehensive error recovery."""
         if not self._next_track:
@@ -1217,6 +1472,10 @@ class BrainService(BaseService):
     async def _create_commentary_transition_steps(self, commentary_cache_key: str) -> List:
         """Create transition steps with commentary, ducking, and crossfade."""
         try:
+            offsets = self._transition_offsets(self._next_commentary_duration)
+            if offsets:
+                return self._create_beat_aligned_commentary_steps(commentary_cache_key, offsets)
+
             duck_step = self._create_dj_plan_step("music_duck", {
                 "duck_level": 0.5,  # Lower music to 50% for commentary - consistent with other ducking
                 "fade_duration_ms": 2000,  # Longer, professional ducking speed
@@ -1249,6 +1508,34 @@ class BrainService(BaseService):
             # Fallback to simple crossfade
             return await self._create_simple_crossfade_steps()
 
+    def _create_beat_aligned_commentary_steps(self, commentary_cache_key: str, offsets: Dict[str, float]) -> List:
+        """Duck, commentary and crossfade on the precomputed timeline, then unduck."""
+        duck_step = self._create_dj_plan_step("music_duck", {
+            "duck_level": 0.5,
+            "fade_duration_ms": int(self._config.duck_fade_sec * 1000),
+            "offset": offsets["duck"],
+        })
+        play_speech_step = self._create_dj_plan_step("play_cached_speech", {
+            "cache_key": commentary_cache_key,
+            "offset": offsets["speech"],
+        })
+        crossfade_step = self._create_dj_plan_step("music_crossfade", {
+            "next_track_id": self._next_track.track_id,
+            "crossfade_duration": offsets["crossfade_duration"],
+            "offset": offsets["crossfade"],
+        })
+        parallel_step = self._create_dj_plan_step("parallel_steps", {
+            "steps": [duck_step, play_speech_step, crossfade_step],
+        })
+        unduck_step = self._create_dj_plan_step("music_unduck", {
+            "fade_duration_ms": int(self._config.duck_fade_sec * 1000),
+        })
+        self.logger.debug(
+            f"Beat-aligned transition: commentary at +{offsets['speech']:.2f}s, "
+            f"crossfade at +{offsets['crossfade']:.2f}s for {offsets['crossfade_duration']:.2f}s"
+        )
+        return [parallel_step, unduck_step]
+
     def _create_dj_plan_step(self, step_type: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """Create a DJ plan step with consistent format and validation.
         
@@ -1282,6 +1569,16 @@ class BrainService(BaseService):
     async def _create_simple_crossfade_steps(self) -> List:
         """Create simple crossfade steps without commentary."""
         try:
+            offsets = self._transition_offsets()
+            if offsets:
+                # Wait for the planned downbeat inside a parallel group, which honors offsets
+                crossfade_step = self._create_dj_plan_step("music_crossfade", {
+                    "next_track_id": self._next_track.track_id,
+                    "crossfade_duration": offsets["crossfade_duration"],
+                    "offset": offsets["crossfade"],
+                })
+                return [self._create_dj_plan_step("parallel_steps", {"steps": [crossfade_step]})]
+
             crossfade_step = self._create_dj_plan_step("music_crossfade", {
                 "next_track_id": self._next_track.track_id,
                 "crossfade_duration": self._config.crossfade_duration,
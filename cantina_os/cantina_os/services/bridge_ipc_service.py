@@ -0,0 +1,56 @@
+"""
+Bridge IPC Service
+
+Serves the CantinaOS event bus on a local Unix domain socket so the web
+bridge, logging and debug services can run as their own processes instead
+of inside CantinaOS.
+"""
+
+"""
+SERVICE: BridgeIPCService
+PURPOSE: Expose the event bus to out-of-process services so serialization, dashboard fan-out and log I/O run outside the audio process
+EVENTS_IN: Any topic a connected process subscribes to (forwarded over the socket)
+EVENTS_OUT: Any topic a connected process emits (MUSIC_COMMAND, DASHBOARD_LOG, SERVICE_STATUS_UPDATE, ...), LOG_RECORD when forward_logs is set
+KEY_METHODS: _start, _stop, get_stats
+DEPENDENCIES: Unix domain sockets (macOS/Linux), bridge.ipc.EventBusIPCServer, msgpack (optional)
+"""
+
+import logging
+from typing import Any, Dict, Optional
+
+from ..base_service import BaseService
+from ..bridge.ipc import DEFAULT_SOCKET_PATH, EventBusIPCServer
+
+
+class BridgeIPCService(BaseService):
+    """Runs an EventBusIPCServer for the lifetime of CantinaOS."""
+
+    def __init__(self, event_bus, config: Optional[Dict[str, Any]] = None, name: str = "bridge_ipc"):
+        super().__init__(service_name=name, event_bus=event_bus, logger=logging.getLogger(__name__))
+        self._config = config or {}
+        self._ipc_server = EventBusIPCServer(
+            event_bus,
+            self._config.get("socket_path") or DEFAULT_SOCKET_PATH,
+            self._config.get("max_buffer_bytes", 4 * 1024 * 1024),
+        )
+
+    async def _start(self) -> None:
+        await self._ipc_server.start()
+        if self._config.get("forward_logs"):
+            self._ipc_server.forward_logs(getattr(logging, self._config.get("log_level", "INFO")))
+        self._logger.info(f"Waiting for remote services on {self._ipc_server.path}")
+
+    async def _stop(self) -> None:
+        stats = self._ipc_server.stats
+        await self._ipc_server.stop()
+        self._logger.info(
+            f"Bridge IPC stopped: {stats['forwarded']} forwarded, {stats['received']} received, {stats['dropped']} dropped"
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "socket_path": self._ipc_server.path,
+            "peers": self._ipc_server.peer_count,
+            "topics": len(self._ipc_server.topics),
+            **self._ipc_server.stats,
+        }
@@ -10,8 +10,8 @@ lookahead caching capabilities.
 SERVICE: CachedSpeechService
 PURPOSE: Pre-rendering and caching of speech audio for precise timing control in DJ mode transitions
 EVENTS_IN: SPEECH_CACHE_REQUEST, SPEECH_CACHE_CLEANUP, SPEECH_CACHE_PLAYBACK_REQUEST, TTS_AUDIO_DATA, CLEAR_SPEECH_CACHE
-EVENTS_OUT: SPEECH_CACHE_UPDATED, SPEECH_CACHE_MISS, SPEECH_CACHE_HIT, SPEECH_CACHE_CLEARED, SPEECH_CACHE_READY, SPEECH_CACHE_ERROR, SPEECH_CACHE_PLAYBACK_STARTED, SPEECH_CACHE_PLAYBACK_COMPLETED, TTS_REQUEST
-KEY_METHODS: _cache_speech, _generate_speech_audio, _play_audio, _cleanup_expired_entries, _emit_cache_ready
+EVENTS_OUT: SPEECH_CACHE_UPDATED, SPEECH_CACHE_MISS, SPEECH_CACHE_HIT, SPEECH_CACHE_CLEARED, SPEECH_CACHE_READY, SPEECH_CACHE_ERROR, SPEECH_CACHE_PLAYBACK_STARTED, SPEECH_CACHE_PLAYBACK_COMPLETED, SPEECH_AMPLITUDE, TTS_REQUEST
+KEY_METHODS: _cache_speech, _generate_speech_audio, _play_audio, _stream_speech_amplitude, _cleanup_expired_entries, _emit_cache_ready
 DEPENDENCIES: ElevenLabs TTS service integration, sounddevice for audio playback, numpy for audio processing
 """
 
@@ -38,8 +38,10 @@ from ..event_payloads import (
     SpeechCacheUpdatedPayload,
     SpeechCacheHitPayload,
     SpeechCacheClearedPayload,
-    SpeechCachePlaybackCompletedPayload
+    SpeechCachePlaybackCompletedPayload,
+    SpeechAmplitudePayload,
 )
+from ..utils.audio_metering import rms_envelope
 
 class CacheEntry:
     """Represents a cached speech entry with metadata."""
@@ -66,6 +68,7 @@ class CachedSpeechServiceConfig(BaseModel):
     cache_cleanup_interval: int = Field(default=60, description="Cache cleanup interval in seconds")
     audio_device: Optional[str] = Field(default=None, description="Audio device to use")
     sample_rate: int = Field(default=44100, description="Audio sample rate")
+    amplitude_update_hz: float = Field(default=15.0, description="SPEECH_AMPLITUDE events per second during playback (0 disables)")
 
 class CachedSpeechService(BaseService):
     """Service for caching and managing speech audio data."""
@@ -618,16 +621,16 @@ class CachedSpeechService(BaseService):
                 }
             )
             
+            # Apply volume boost for better mixing with ducked music
+            # Boost DJ R3X commentary by 1.8x for better presence
+            audio_data = entry.audio_data * 1.8
+            
+            # Ensure we don't clip the audio (prevent values > 1.0 or < -1.0)
+            audio_data = np.clip(audio_data, -1.0, 1.0)
+            
             # Define the blocking playback function to run in the executor
             def blocking_playback():
                 try:
-                    # Apply volume boost for better mixing with ducked music
-                    # Boost DJ R3X commentary by 1.8x for better presence
-                    audio_data = entry.audio_data * 1.8
-                    
-                    # Ensure we don't clip the audio (prevent values > 1.0 or < -1.0)
-                    audio_data = np.clip(audio_data, -1.0, 1.0)
-                    
                     sd.play(audio_data, entry.sample_rate)
                     sd.wait()  # Wait for playback to complete
                 except Exception as e:
@@ -636,8 +639,20 @@ class CachedSpeechService(BaseService):
                     # Re-raise the exception so run_in_executor can propagate it
                     raise
             
-            # Run the blocking playback function in the thread pool
-            await self._event_loop.run_in_executor(None, blocking_playback)
+            # Run the blocking playback function in the thread pool,
+            # replaying the clip's level for meters and lights alongside it
+            amplitude_task = None
+            if self._config.amplitude_update_hz > 0:
+                amplitude_task = asyncio.create_task(self._stream_speech_amplitude(audio_data, entry.sample_rate))
+            try:
+                await self._event_loop.run_in_executor(None, blocking_playback)
+            finally:
+                if amplitude_task:
+                    amplitude_task.cancel()
+                    await self.emit(
+                        EventTopics.SPEECH_AMPLITUDE,
+                        SpeechAmplitudePayload(amplitude=0.0, timestamp_offset=entry.duration_ms / 1000.0).model_dump()
+                    )
             
             # Emit playback completed event after successful playback in the thread
             # CRITICAL FIX: Use the same playback_id that was in the original request
@@ -668,6 +683,24 @@ class CachedSpeechService(BaseService):
                 ).model_dump()
             )
 
+    async def _stream_speech_amplitude(self, audio_data: np.ndarray, sample_rate: int) -> None:
+        """Emit SPEECH_AMPLITUDE for each window of a clip as it plays.
+
+        The RMS envelope is computed once up front; each value is emitted
+        against an absolute deadline so the levels stay in step with sd.play.
+        """
+        interval = 1.0 / self._config.amplitude_update_hz
+        envelope = rms_envelope(audio_data, sample_rate, self._config.amplitude_update_hz)
+        start = time.monotonic()
+        for i, amplitude in enumerate(envelope):
+            delay = start + i * interval - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await self.emit(
+                EventTopics.SPEECH_AMPLITUDE,
+                SpeechAmplitudePayload(amplitude=float(amplitude), timestamp_offset=i * interval).model_dump()
+            )
+
     def _handle_task_exception(self, task: asyncio.Task) -> None:
         """Handle exceptions raised by background tasks."""
         try:
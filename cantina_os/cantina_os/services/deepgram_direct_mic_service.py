@@ -9,13 +9,14 @@ eliminating the need for intermediate audio handling and reducing complexity.
 SERVICE: DeepgramDirectMicService
 PURPOSE: Real-time speech-to-text transcription using Deepgram API with direct microphone integration
 EVENTS_IN: VOICE_LISTENING_STARTED, VOICE_LISTENING_STOPPED, MIC_RECORDING_START, MIC_RECORDING_STOP
-EVENTS_OUT: TRANSCRIPTION_FINAL, TRANSCRIPTION_INTERIM, TRANSCRIPTION_ERROR, TRANSCRIPTION_METRICS, SERVICE_STATUS_UPDATE
-KEY_METHODS: _start_listening, _stop_listening, _on_transcript, _on_error, _collect_metrics
-DEPENDENCIES: Deepgram API key, microphone hardware, Deepgram SDK
+EVENTS_OUT: TRANSCRIPTION_FINAL, TRANSCRIPTION_INTERIM, TRANSCRIPTION_ERROR, TRANSCRIPTION_METRICS, MIC_RECORDING_STOP, SERVICE_STATUS_UPDATE
+KEY_METHODS: _start_listening, _stop_listening, _on_mic_audio, _on_transcript, parse_transcript_result, request_word_timings, _on_error, _collect_metrics
+DEPENDENCIES: Deepgram API key, microphone hardware, Deepgram SDK, numpy (local VAD)
 """
 
 import logging
-from typing import Optional, Dict, Any
+from collections import deque
+from typing import Optional, Dict, Any, Deque, List
 import asyncio
 import time
 import os
@@ -33,6 +34,7 @@ from cantina_os.event_payloads import (
     ServiceStatus,
     PerformanceMetricPayload
 )
+from cantina_os.utils.voice_activity import VoiceActivityDetector
 
 # Replace string constants with EventTopics enum references
 # from cantina_os.core.events import (
@@ -44,6 +46,77 @@ from cantina_os.event_payloads import (
 #     TRANSCRIPTION_METRICS
 # )
 
+class ParsedTranscript:
+    """Fields extracted from a Deepgram transcript result."""
+    
+    __slots__ = ("text", "is_final", "confidence", "words", "duration")
+    
+    def __init__(self, text: str, is_final: bool, confidence: float, words: Optional[List[Dict[str, Any]]], duration: float):
+        self.text = text
+        self.is_final = is_final
+        self.confidence = confidence
+        self.words = words
+        self.duration = duration
+
+
+def parse_transcript_result(result: Any, include_words: bool = False) -> Optional[ParsedTranscript]:
+    """Extract the transcript fields we use from a Deepgram result.
+    
+    Handles the SDK's LiveResultResponse, plain dicts and strings. Word-level
+    data is only built when include_words is set.
+    
+    Returns:
+        ParsedTranscript, or None if the result has no usable transcript
+    """
+    if isinstance(result, str):
+        return ParsedTranscript(result, True, 1.0, None, 0.0)
+        
+    if isinstance(result, dict):
+        alternatives = (result.get("channel") or {}).get("alternatives") or ()
+        if not alternatives:
+            return None
+        first = alternatives[0]
+        return ParsedTranscript(
+            first.get("transcript") or "",
+            bool(result.get("is_final", False)),
+            first.get("confidence", 0.0),
+            (first.get("words") or None) if include_words else None,
+            float(result.get("duration") or 0.0)
+        )
+        
+    channel = getattr(result, "channel", None)
+    if channel is None:
+        return None
+        
+    alternatives = getattr(channel, "alternatives", None) or ()
+    text = ""
+    confidence = 0.0
+    words = None
+    if alternatives:
+        first = alternatives[0]
+        text = first.transcript or ""
+        confidence = first.confidence or 0.0
+        if include_words and first.words:
+            words = [
+                {
+                    "word": w.word,
+                    "start": w.start,
+                    "end": w.end,
+                    "confidence": w.confidence,
+                    "punctuated_word": getattr(w, "punctuated_word", None) or w.word
+                }
+                for w in first.words
+            ]
+            
+    return ParsedTranscript(
+        text,
+        bool(getattr(result, "is_final", False)),
+        confidence,
+        words,
+        float(getattr(result, "duration", 0.0) or 0.0)
+    )
+
+
 class DeepgramDirectMicService(BaseService):
     """
     Service that directly captures and streams microphone audio to Deepgram.
@@ -54,6 +127,8 @@ class DeepgramDirectMicService(BaseService):
     - Configurable Deepgram model and language options
     - Compatible with existing event system for GPT and ElevenLabs integration
     - Performance metrics collection and reporting
+    - Local voice activity detection: silent frames are not uploaded (keep-alives
+      hold the connection open instead) and utterances can auto-end on trailing silence
     """
     
     def __init__(
@@ -87,6 +162,12 @@ class DeepgramDirectMicService(BaseService):
         self._is_listening = False
         self._current_transcription = ""
         
+        # Transcript fast path: latest interim waiting for the next loop tick,
+        # and how many consumers asked for word-level timings
+        self._pending_interim: Optional[ParsedTranscript] = None
+        self._interim_flush_scheduled = False
+        self._word_timing_requests = 1 if self._config.get("INCLUDE_WORD_TIMINGS", False) else 0
+        
         # Thread-safe queue for audio data
         self._audio_queue = asyncio.Queue(maxsize=100)
         
@@ -114,7 +195,35 @@ class DeepgramDirectMicService(BaseService):
         
         # Start metrics collection task
         self._metrics_task = None
-        self._metrics_interval = config.get("METRICS_INTERVAL", 1.0)
+        self._metrics_interval = self._config.get("METRICS_INTERVAL", 1.0)
+        
+        # Local VAD gating. Runs in the microphone thread, so all state below is
+        # only touched from _on_mic_audio except for the reset in _start_listening.
+        self._sample_rate = self._config.get("SAMPLE_RATE", 16000)
+        self._mic_chunk = self._config.get("MIC_CHUNK_FRAMES", 1600)  # 100ms frames at 16kHz
+        self._vad_enabled = self._config.get("VAD_ENABLED", True)
+        self._vad_preroll_ms = self._config.get("VAD_PREROLL_MS", 300)
+        self._vad_auto_end_ms = self._config.get("VAD_AUTO_END_MS", 0)  # 0 disables auto end
+        self._keepalive_interval = self._config.get("KEEPALIVE_INTERVAL", 5.0)
+        self._vad = VoiceActivityDetector(
+            sample_rate=self._sample_rate,
+            energy_margin_db=self._config.get("VAD_ENERGY_MARGIN_DB", 10.0),
+            min_energy_db=self._config.get("VAD_MIN_ENERGY_DB", -55.0),
+            flatness_threshold=self._config.get("VAD_FLATNESS_THRESHOLD", 0.5),
+            hangover_ms=self._config.get("VAD_HANGOVER_MS", 300),
+            sustained_speech_ms=self._config.get("VAD_SUSTAINED_SPEECH_MS", 3000.0),
+        )
+        preroll_frames = max(1, int(self._vad_preroll_ms * self._sample_rate / 1000 / self._mic_chunk))
+        self._preroll: Deque[bytes] = deque(maxlen=preroll_frames)
+        self._in_speech = False
+        self._auto_end_triggered = False
+        self._last_send_time = 0.0
+        self._vad_stats = {
+            "frames_sent": 0,
+            "frames_suppressed": 0,
+            "keepalives_sent": 0,
+            "auto_ends": 0
+        }
 
     async def _setup_subscriptions(self) -> None:
         """Set up event subscriptions following architecture standards."""
@@ -242,6 +351,16 @@ class DeepgramDirectMicService(BaseService):
                         value=self._metrics["transcripts_processed"] / max(1, uptime),
                         unit="transcripts/second",
                         component="deepgram_direct_mic"  # Use static service name
+                    ).model_dump(),
+                    
+                    PerformanceMetricPayload(
+                        metric_name="vad_suppression_ratio",
+                        value=self._vad_stats["frames_suppressed"] / max(
+                            1, self._vad_stats["frames_sent"] + self._vad_stats["frames_suppressed"]
+                        ),
+                        unit="ratio",
+                        component="deepgram_direct_mic",  # Use static service name
+                        details=dict(self._vad_stats)
                     ).model_dump()
                 ]
                 
@@ -278,6 +397,73 @@ class DeepgramDirectMicService(BaseService):
         self._dg_connection.on(LiveTranscriptionEvents.Error, self._on_error)
         self._dg_connection.on(LiveTranscriptionEvents.UtteranceEnd, self._on_utterance_end)
 
+    def _on_mic_audio(self, data: bytes) -> None:
+        """Gate microphone audio through the local VAD before sending to Deepgram.
+        
+        Called from the microphone thread for every captured chunk, so this must
+        stay cheap and must not block. Silent chunks are held in a short pre-roll
+        buffer (sent when speech starts so word onsets are not clipped) and the
+        connection is kept open with keep-alive messages instead.
+        """
+        connection = self._dg_connection
+        if connection is None:
+            return
+            
+        if not self._vad_enabled:
+            connection.send(data)
+            return
+            
+        now = time.monotonic()
+        if self._vad.process(data):
+            # Flush pre-roll first so Deepgram hears the start of the word
+            while self._preroll:
+                connection.send(self._preroll.popleft())
+                self._vad_stats["frames_sent"] += 1
+            connection.send(data)
+            self._vad_stats["frames_sent"] += 1
+            self._last_send_time = now
+            self._in_speech = True
+            return
+            
+        self._preroll.append(data)
+        self._vad_stats["frames_suppressed"] += 1
+        
+        if self._in_speech:
+            # Speech segment just ended - ask Deepgram to flush its final result now
+            self._in_speech = False
+            if hasattr(connection, "finalize"):
+                connection.finalize()
+                self._last_send_time = now
+                
+        if now - self._last_send_time >= self._keepalive_interval:
+            if hasattr(connection, "keep_alive"):
+                connection.keep_alive()
+            else:
+                connection.send('{"type": "KeepAlive"}')
+            self._vad_stats["keepalives_sent"] += 1
+            self._last_send_time = now
+            
+        if (
+            self._vad_auto_end_ms
+            and self._vad.speech_detected
+            and not self._auto_end_triggered
+            and self._vad.trailing_silence_ms >= self._vad_auto_end_ms
+        ):
+            self._auto_end_triggered = True
+            self._vad_stats["auto_ends"] += 1
+            self._event_loop.call_soon_threadsafe(self._schedule_auto_end)
+            
+    def _schedule_auto_end(self) -> None:
+        """End the utterance on trailing silence (runs in the event loop)."""
+        if not self._is_listening:
+            return
+        if self._logger:
+            self._logger.info(
+                f"Trailing silence of {self._vad_auto_end_ms}ms detected - ending utterance"
+            )
+        # Go through MIC_RECORDING_STOP so other services (mouse input, eyes) stay in sync
+        asyncio.create_task(self.emit(EventTopics.MIC_RECORDING_STOP, {"reason": "vad_auto_end"}))
+
     def _on_connection_open(self, client, *args) -> None:
         """Handle websocket connection opening."""
         if self._logger:
@@ -292,156 +478,101 @@ class DeepgramDirectMicService(BaseService):
     def _on_transcript(self, client, result) -> None:
         """Handle incoming transcripts from Deepgram.
         
+        Runs on the Deepgram SDK thread for every interim and final result, so it
+        only parses the fields we need and hands off to the event loop. Interim
+        results are coalesced to the latest one per loop tick.
+        
         Args:
             client: The Deepgram websocket client instance
             result: The transcript result from Deepgram (can be various types)
         """
-        if self._logger:
-            self._logger.debug(f"Deepgram _on_transcript raw result type: {type(result)}, content: {str(result)[:500]}...")
-
+        debug = self._logger is not None and self._logger.isEnabledFor(logging.DEBUG)
+        
         try:
-            text = ""
-            is_final = False
-            confidence = 0.0
-            processed_words = [] # Changed variable name for clarity
-            duration = 0.0 # For metrics
-            source_type = "unknown"
-            
-            # Check if it's the Deepgram SDK's LiveResultResponse object
-            if type(result).__name__ == 'LiveResultResponse':
-                source_type = "LiveResultResponse"
-                if hasattr(result, 'channel') and result.channel and \
-                   hasattr(result.channel, 'alternatives') and result.channel.alternatives:
-                    alternatives_list = result.channel.alternatives
-                    if alternatives_list and len(alternatives_list) > 0:
-                        first_alternative = alternatives_list[0]
-                        text = getattr(first_alternative, 'transcript', "")
-                        confidence = getattr(first_alternative, 'confidence', 0.0)
-                        
-                        # Process words
-                        raw_words = getattr(first_alternative, 'words', [])
-                        if raw_words:
-                            for word_obj in raw_words:
-                                # Check if word_obj is an object with attributes, not already a dict
-                                if hasattr(word_obj, 'word'): 
-                                    processed_words.append({
-                                        "word": getattr(word_obj, 'word', None),
-                                        "start": getattr(word_obj, 'start', None),
-                                        "end": getattr(word_obj, 'end', None),
-                                        "confidence": getattr(word_obj, 'confidence', None),
-                                        "punctuated_word": getattr(word_obj, 'punctuated_word', getattr(word_obj, 'word', None))
-                                    })
-                                elif isinstance(word_obj, dict): # If it somehow already is a dict
-                                    processed_words.append(word_obj)
-                else:
-                    if self._logger:
-                        self._logger.warning(f"LiveResultResponse missing expected channel/alternatives: {str(result)[:500]}...")
-                
-                is_final = getattr(result, 'is_final', False)
-                if hasattr(result, 'duration'):
-                    duration = float(getattr(result, 'duration', 0.0))
-
-            elif isinstance(result, dict):
-                source_type = "dict"
-                if "channel" not in result:
-                    if self._logger:
-                        self._logger.warning(f"Deepgram transcript dict missing 'channel': {result}")
-                    return
-                alternatives_list = result.get("channel", {}).get("alternatives", [])
-                if not alternatives_list:
-                    if self._logger:
-                        self._logger.warning(f"Deepgram transcript dict missing 'alternatives': {result}")
-                    return
-                
-                first_alternative = alternatives_list[0]
-                text = first_alternative.get("transcript", "")
-                confidence = first_alternative.get("confidence", 0.0)
-                # Assuming words from dict are already in correct dict format
-                processed_words = first_alternative.get("words", []) 
-                is_final = result.get("is_final", False)
-                if "duration" in result:
-                     duration = float(result.get("duration", 0.0))
-
-            elif isinstance(result, str):
-                source_type = "str"
+            parsed = parse_transcript_result(result, include_words=self._word_timing_requests > 0)
+            if parsed is None:
                 if self._logger:
-                    self._logger.debug(f"Result was a plain string, treating as final transcript: {result}")
-                text = result
-                is_final = True
-                confidence = 1.0
-            
-            else:
-                if self._logger:
-                    self._logger.error(f"Unhandled Deepgram transcript result type: {type(result)}, content: {str(result)[:500]}...")
+                    self._logger.warning(f"Could not parse Deepgram transcript result of type {type(result).__name__}")
                 return
-
-            text = str(text) if text is not None else ""
-
+                
             self._metrics["transcripts_processed"] += 1
-            if duration > 0:
-                self._metrics["total_latency"] += duration
+            if parsed.duration > 0:
+                self._metrics["total_latency"] += parsed.duration
                 self._metrics["transcripts_for_latency"] += 1
-            
-            event_topic = EventTopics.TRANSCRIPTION_FINAL if is_final else EventTopics.TRANSCRIPTION_INTERIM
-            
-            payload = TranscriptionTextPayload(
-                text=text,
-                source="deepgram",
-                is_final=is_final,
-                confidence=confidence,
-                words=processed_words or None  # Use processed_words
-            ).model_dump()
-            
-            if self._logger:
-                self._logger.debug(f"Emitting {event_topic} from {source_type}: {str(payload)[:200]}...")
-                # Enhanced event topic logging for debugging
-                self._logger.info(f"EMIT DEBUG: Using event topic '{str(event_topic)}', type: {type(event_topic)}, id: {id(event_topic)}")
-                self._logger.info(f"EMIT DEBUG: EventTopics.TRANSCRIPTION_FINAL value: '{str(EventTopics.TRANSCRIPTION_FINAL)}', id: {id(EventTopics.TRANSCRIPTION_FINAL)}")
                 
-                # Log the actual string value of the event_topic
-                self._logger.debug(f"DeepgramDirectMicService emitting on actual topic string: '{str(event_topic)}'")
-
+            if not parsed.is_final:
+                # Keep only the newest interim; one flush per loop tick emits it
+                self._pending_interim = parsed
+                if not self._interim_flush_scheduled:
+                    self._interim_flush_scheduled = True
+                    self._event_loop.call_soon_threadsafe(self._flush_interim)
+                return
+                
+            # A final supersedes any interim that has not been emitted yet
+            self._pending_interim = None
             self._event_loop.call_soon_threadsafe(
-                lambda data=payload, topic=event_topic: asyncio.create_task(
-                    self.emit(topic, data)
-                )
+                self._emit_transcript, EventTopics.TRANSCRIPTION_FINAL, parsed
             )
             
-            # Update the current transcription for both interim and final results
-            # This ensures we have the latest transcription when the mouse click stop event comes
-            if is_final:
+            # Accumulate final segments - this is what gets sent to GPT when recording stops
+            text = parsed.text.strip()
+            if text:
+                if self._current_transcription:
+                    self._current_transcription += " " + text
+                else:
+                    self._current_transcription = text
                 if self._logger:
                     self._logger.info(f"Final transcript segment: {text}")
-                if text:  # Only append if there's actual text
-                    if self._current_transcription: # If not empty, add a space before appending
-                        self._current_transcription += " " + text.strip()
-                    else:
-                        self._current_transcription = text.strip()
-                    if self._logger: # Log the fully accumulated transcript so far
-                        self._logger.info(f"Updated accumulated transcript: {self._current_transcription}")
-            # Interim results are emitted as events but do not update self._current_transcription
-            # which is meant to hold the full final utterance for GPT.
-            # else:
-            #     if text: # For debugging, you might want to see interim segments
-            #         if self._logger:
-            #             self._logger.debug(f"Interim transcript segment (not accumulated): {text}")
+                    if debug:
+                        self._logger.debug(f"Updated accumulated transcript: {self._current_transcription}")
                 
         except Exception as e:
-            error_msg = f"Error processing transcript: {str(e)}. Original result type: {type(result)}, content: {str(result)[:500]}..."
+            error_msg = f"Error processing transcript: {str(e)}. Original result type: {type(result).__name__}"
             if self._logger:
                 self._logger.error(error_msg)
             self._metrics["errors_count"] += 1
             
-            error_payload_dict = {
-                "error": error_msg,
-                "source": "deepgram_transcript_processing"
-            }
-            
             self._event_loop.call_soon_threadsafe(
-                lambda msg=error_payload_dict: asyncio.create_task(
-                    self.emit(EventTopics.TRANSCRIPTION_ERROR, msg)
-                )
+                self._event_bus.emit,
+                EventTopics.TRANSCRIPTION_ERROR,
+                {"error": error_msg, "source": "deepgram_transcript_processing"}
             )
+            
+    def _flush_interim(self) -> None:
+        """Emit the latest pending interim transcript (runs in the event loop)."""
+        self._interim_flush_scheduled = False
+        parsed = self._pending_interim
+        self._pending_interim = None
+        if parsed is not None:
+            self._emit_transcript(EventTopics.TRANSCRIPTION_INTERIM, parsed)
+            
+    def _emit_transcript(self, topic: EventTopics, parsed: "ParsedTranscript") -> None:
+        """Build the transcription payload and emit it (runs in the event loop)."""
+        payload = TranscriptionTextPayload(
+            text=parsed.text,
+            source="deepgram",
+            is_final=parsed.is_final,
+            confidence=parsed.confidence,
+            words=parsed.words
+        ).model_dump()
+        
+        if self._logger and self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(f"Emitting {topic}: {parsed.text[:200]}")
+            
+        # BaseService.emit only forwards to the bus; call it directly to avoid a task per result
+        self._event_bus.emit(topic, payload)
+        
+    def request_word_timings(self, enabled: bool = True) -> None:
+        """Ask for word-level data on transcription events.
+        
+        Word timings are skipped by default because building them for every
+        interim result is wasted work when nobody reads them. Calls are
+        reference counted - pass enabled=False to release a request.
+        """
+        if enabled:
+            self._word_timing_requests += 1
+        else:
+            self._word_timing_requests = max(0, self._word_timing_requests - 1)
 
     def _on_error(self, client, error: Dict[str, Any], *args) -> None:
         """Handle Deepgram errors.
@@ -468,9 +599,7 @@ class DeepgramDirectMicService(BaseService):
         
         # Emit using thread-safe method
         self._event_loop.call_soon_threadsafe(
-            lambda data=status_payload: asyncio.create_task(
-                self.emit(EventTopics.SERVICE_STATUS_UPDATE, data)
-            )
+            self._event_bus.emit, EventTopics.SERVICE_STATUS_UPDATE, status_payload
         )
         
         # Also emit transcription error for handlers that expect that
@@ -481,9 +610,7 @@ class DeepgramDirectMicService(BaseService):
         }
         
         self._event_loop.call_soon_threadsafe(
-            lambda data=error_payload: asyncio.create_task(
-                self.emit(EventTopics.TRANSCRIPTION_ERROR, data)
-            )
+            self._event_bus.emit, EventTopics.TRANSCRIPTION_ERROR, error_payload
         )
 
     def _on_utterance_end(self, client, utterance_end: Optional[Dict[str, Any]] = None, *args) -> None:
@@ -587,8 +714,13 @@ class DeepgramDirectMicService(BaseService):
     async def _start_listening(self) -> None:
         """Start the microphone and begin streaming to Deepgram."""
         try:
-            # Reset transcription for the new session
+            # Reset transcription and VAD state for the new session
             self._current_transcription = ""
+            self._vad.reset()
+            self._preroll.clear()
+            self._in_speech = False
+            self._auto_end_triggered = False
+            self._last_send_time = time.monotonic()
             if self._logger:
                 self._logger.info("Reset _current_transcription for new listening session.")
 
@@ -606,8 +738,12 @@ class DeepgramDirectMicService(BaseService):
             # Start Deepgram connection with options
             self._dg_connection.start(self._dg_options)  # Not awaitable
             
-            # Create and start microphone
-            self._microphone = Microphone(self._dg_connection.send)
+            # Create and start microphone - audio goes through the local VAD gate
+            self._microphone = Microphone(
+                self._on_mic_audio,
+                rate=self._sample_rate,
+                chunk=self._mic_chunk
+            )
             self._microphone.start()
             
             self._is_listening = True
@@ -524,7 +524,10 @@ class ElevenLabsService(BaseService):
                         text=payload.text,
                         audio_length_seconds=0.0,
                         success=False,
-                        error=error_msg
+                        error=error_msg,
+                        clip_id=payload.clip_id,
+                        step_id=payload.step_id,
+                        plan_id=payload.plan_id
                     )
                     await self.emit(EventTopics.SPEECH_GENERATION_COMPLETE, complete_payload.model_dump())
                     return
@@ -547,7 +550,10 @@ class ElevenLabsService(BaseService):
                     conversation_id=payload.conversation_id,
                     text=payload.text,
                     audio_length_seconds=0.0,  # TODO: Calculate actual length
-                    success=True
+                    success=True,
+                    clip_id=payload.clip_id,
+                    step_id=payload.step_id,
+                    plan_id=payload.plan_id
                 )
                 await self.emit(EventTopics.SPEECH_GENERATION_COMPLETE, complete_payload.model_dump())
             
@@ -562,7 +568,10 @@ class ElevenLabsService(BaseService):
                     text=payload.text if 'payload' in locals() else "",
                     audio_length_seconds=0.0,
                     success=False,
-                    error=error_msg
+                    error=error_msg,
+                    clip_id=payload.clip_id if 'payload' in locals() else None,
+                    step_id=payload.step_id if 'payload' in locals() else None,
+                    plan_id=payload.plan_id if 'payload' in locals() else None
                 )
                 await self.emit(EventTopics.SPEECH_GENERATION_COMPLETE, error_payload.model_dump())
             except Exception as emit_error:
@@ -9,9 +9,9 @@ and emits response events. It also manages conversation context and session memo
 """
 SERVICE: GPTService
 PURPOSE: Natural language processing via OpenAI GPT models, conversation management, and tool calling for intent detection
-EVENTS_IN: TRANSCRIPTION_FINAL, VOICE_LISTENING_STOPPED, INTENT_EXECUTION_RESULT, DJ_COMMENTARY_REQUEST
-EVENTS_OUT: LLM_RESPONSE, LLM_RESPONSE_CHUNK, INTENT_DETECTED, GPT_COMMENTARY_RESPONSE, SERVICE_STATUS_UPDATE
-KEY_METHODS: _process_with_gpt, _stream_gpt_response, _get_gpt_response, _process_tool_calls, reset_conversation, register_tool
+EVENTS_IN: TRANSCRIPTION_FINAL, VOICE_LISTENING_STOPPED, INTENT_EXECUTION_RESULT, DJ_COMMENTARY_REQUEST, DJ_MODE_CHANGED
+EVENTS_OUT: LLM_RESPONSE, LLM_RESPONSE_CHUNK, INTENT_DETECTED, GPT_COMMENTARY_RESPONSE, LLM_QUEUE_STATUS, SERVICE_STATUS_UPDATE
+KEY_METHODS: _process_with_gpt, _stream_gpt_response, _get_gpt_response, _process_tool_calls, _request_chat_completion, reset_conversation, register_tool
 DEPENDENCIES: OpenAI API key, persona files (dj_r3x-persona.txt, dj_r3x-verbal-feedback-persona.txt), registered tool functions
 """
 
@@ -36,6 +36,7 @@ from ..event_payloads import (
     LogLevel
 )
 from ..llm.command_functions import get_all_function_definitions, function_name_to_model_map
+from ..utils.request_scheduler import PriorityRequestScheduler, RequestPriority
 
 class Message(BaseModel):
     """Model for a conversation message."""
@@ -119,6 +120,7 @@ class GPTService(BaseService):
     - Streaming responses
     - Conversation persistence
     - Intent detection through function calling
+    - Priority scheduling of API calls (interactive replies preempt DJ commentary)
     """
     
     def __init__(
@@ -149,6 +151,19 @@ class GPTService(BaseService):
         self._rate_limit_window = 60  # 1 minute
         self._max_requests_per_window = 50  # Default OpenAI limit
         
+        # Priority scheduling of API calls. Interactive requests (voice replies,
+        # verbal feedback) always run ahead of background DJ commentary.
+        self._request_scheduler = PriorityRequestScheduler(
+            concurrency={
+                RequestPriority.INTERACTIVE: self._config["INTERACTIVE_CONCURRENCY"],
+                RequestPriority.BACKGROUND: self._config["BACKGROUND_CONCURRENCY"],
+            },
+            preempt_background=self._config["PREEMPT_BACKGROUND"],
+            max_preemptions=self._config["MAX_PREEMPTIONS"],
+            on_change=self._on_request_queue_changed,
+        )
+        self._queue_status_pending = False
+        
         # Conversation state
         self._current_conversation_id: Optional[str] = None
         
@@ -195,7 +210,11 @@ class GPTService(BaseService):
             "SYSTEM_PROMPT": system_prompt,
             "TIMEOUT": config.get("TIMEOUT", 30),  # seconds
             "RATE_LIMIT_REQUESTS": config.get("RATE_LIMIT_REQUESTS", 50),
-            "STREAMING": config.get("STREAMING", True)
+            "STREAMING": config.get("STREAMING", True),
+            "INTERACTIVE_CONCURRENCY": config.get("INTERACTIVE_CONCURRENCY", 2),
+            "BACKGROUND_CONCURRENCY": config.get("BACKGROUND_CONCURRENCY", 1),
+            "PREEMPT_BACKGROUND": config.get("PREEMPT_BACKGROUND", True),
+            "MAX_PREEMPTIONS": config.get("MAX_PREEMPTIONS", 3)
         }
         
     async def _initialize(self) -> None:
@@ -253,6 +272,12 @@ class GPTService(BaseService):
             )
             raise
             
+    async def _stop(self) -> None:
+        """Stop the GPT service, cancelling any scheduled API requests."""
+        for priority in RequestPriority:
+            self._request_scheduler.cancel_all(priority)
+        await self._cleanup()
+            
     async def _cleanup(self) -> None:
         """Clean up GPT service resources."""
         try:
@@ -312,6 +337,36 @@ class GPTService(BaseService):
             self._handle_dj_commentary_request
         ))
         self.logger.info("GPTService: Subscription task created for DJ_COMMENTARY_REQUEST.")
+        
+        # Drop queued/in-flight background commentary when DJ mode stops
+        asyncio.create_task(self.subscribe(
+            EventTopics.DJ_MODE_CHANGED,
+            self._handle_dj_mode_changed
+        ))
+        
+    def _on_request_queue_changed(self) -> None:
+        """Scheduler callback - coalesce queue changes into one status event per loop tick."""
+        if self._queue_status_pending or not self._event_bus:
+            return
+        self._queue_status_pending = True
+        asyncio.create_task(self._emit_queue_status())
+        
+    async def _emit_queue_status(self) -> None:
+        """Emit LLM_QUEUE_STATUS with queue depth and counters per priority class."""
+        self._queue_status_pending = False
+        try:
+            status = self._request_scheduler.get_status()
+            status["timestamp"] = time.time()
+            await self.emit(EventTopics.LLM_QUEUE_STATUS, status)
+        except Exception as e:
+            self.logger.error(f"Error emitting LLM queue status: {e}")
+            
+    async def _handle_dj_mode_changed(self, payload: Dict[str, Any]) -> None:
+        """Cancel pending background commentary when DJ mode is deactivated."""
+        if payload and not payload.get("is_active", True):
+            cancelled = self._request_scheduler.cancel_all(RequestPriority.BACKGROUND)
+            if cancelled:
+                self.logger.info(f"DJ mode stopped - cancelled {cancelled} background GPT requests")
 
     async def _handle_voice_transcript(self, payload: Dict[str, Any]) -> None:
         """Handle text transcript from the VOICE_LISTENING_STOPPED event when recording ends."""
@@ -411,9 +466,15 @@ class GPTService(BaseService):
         try:
             self.logger.info("Making API call to OpenAI...")
             if self._config["STREAMING"]:
-                await self._stream_gpt_response(api_url, request_data)
+                await self._request_scheduler.run(
+                    RequestPriority.INTERACTIVE,
+                    lambda: self._stream_gpt_response(api_url, request_data)
+                )
             else:
-                await self._get_gpt_response(api_url, request_data)
+                await self._request_scheduler.run(
+                    RequestPriority.INTERACTIVE,
+                    lambda: self._get_gpt_response(api_url, request_data)
+                )
             self.logger.info("API call completed successfully")
         except Exception as e:
             error_msg = f"Error processing with GPT: {str(e)}"
@@ -992,29 +1053,17 @@ class GPTService(BaseService):
             
             self.logger.info(f"Making verbal response API call for {intent_name}")
             
-            if not self._session:
-                raise RuntimeError("No active session for API request")
-    
-            headers = {
-                "Authorization": f"Bearer {self._config['OPENAI_API_KEY']}",
-                "Content-Type": "application/json"
-            }
+            response_data = await self._request_scheduler.run(
+                RequestPriority.INTERACTIVE,
+                lambda: self._request_chat_completion(api_url, request_data)
+            )
             
-            async with self._session.post(api_url, json=request_data, headers=headers) as response:
-                if response.status != 200:
-                    response_text = await response.text()
-                    error_msg = f"API request failed with status {response.status}: {response_text[:200]}"
-                    self.logger.error(error_msg)
-                    raise Exception(error_msg)
-    
-                response_data = await response.json()
-                
-                # Extract the text response
-                verbal_response = response_data["choices"][0]["message"]["content"]
-                self.logger.info(f"Generated verbal response: {verbal_response}")
-                
-                # Emit the verbal response
-                await self._emit_llm_response(verbal_response)
+            # Extract the text response
+            verbal_response = response_data["choices"][0]["message"]["content"]
+            self.logger.info(f"Generated verbal response: {verbal_response}")
+            
+            # Emit the verbal response
+            await self._emit_llm_response(verbal_response)
                 
         except Exception as e:
             self.logger.error(f"Error generating verbal response: {e}", exc_info=True)
@@ -1022,6 +1071,25 @@ class GPTService(BaseService):
             fallback_msg = f"Action completed successfully."
             await self._emit_llm_response(fallback_msg) 
 
+    async def _request_chat_completion(self, api_url: str, request_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Make a single non-streaming chat completion request and return the JSON body."""
+        if not self._session:
+            raise RuntimeError("No active session for API request")
+
+        headers = {
+            "Authorization": f"Bearer {self._config['OPENAI_API_KEY']}",
+            "Content-Type": "application/json"
+        }
+        
+        async with self._session.post(api_url, json=request_data, headers=headers) as response:
+            if response.status != 200:
+                response_text = await response.text()
+                error_msg = f"API request failed with status {response.status}: {response_text[:200]}"
+                self.logger.error(error_msg)
+                raise Exception(error_msg)
+
+            return await response.json()
+
     async def _handle_dj_commentary_request(self, payload: Dict[str, Any]) -> None:
         """Handle DJ commentary generation requests from BrainService."""
         try:
@@ -1037,8 +1105,9 @@ class GPTService(BaseService):
             next_track = request_payload.next_track
             persona = request_payload.persona
             request_id = request_payload.request_id
+            priority = RequestPriority.from_value(request_payload.priority)
             
-            self.logger.info(f"Generating commentary for request_id: {request_id}")
+            self.logger.info(f"Generating commentary for request_id: {request_id} (priority: {priority.name.lower()})")
             self.logger.info(f"Context: {context}, Next track: {next_track.title if next_track else 'None'}")
             
             # Create commentary prompt based on context and track information
@@ -1091,44 +1160,38 @@ Generate a brief DJ commentary for the music. Keep it energetic and in character
                 "stream": False      # No streaming for commentary generation
             }
             
-            if not self._session:
-                raise RuntimeError("No active session for API request")
-    
-            headers = {
-                "Authorization": f"Bearer {self._config['OPENAI_API_KEY']}",
-                "Content-Type": "application/json"
-            }
+            # Background commentary may be preempted by interactive requests, in which
+            # case the scheduler re-runs it from scratch once the interactive work is done
+            response_data = await self._request_scheduler.run(
+                priority,
+                lambda: self._request_chat_completion(api_url, request_data),
+                request_id=request_id
+            )
+            commentary_text = response_data["choices"][0]["message"]["content"].strip()
             
-            async with self._session.post(api_url, json=request_data, headers=headers) as response:
-                if response.status != 200:
-                    response_text = await response.text()
-                    error_msg = f"Commentary generation failed with status {response.status}: {response_text[:200]}"
-                    self.logger.error(error_msg)
-                    raise Exception(error_msg)
-    
-                response_data = await response.json()
-                commentary_text = response_data["choices"][0]["message"]["content"].strip()
-                
-                self.logger.info(f"Generated commentary: {commentary_text}")
-                
-                # Emit the commentary response
-                from cantina_os.core.event_schemas import GptCommentaryResponsePayload
-                
-                commentary_response = GptCommentaryResponsePayload(
-                    timestamp=time.time(),
-                    request_id=request_id,
-                    commentary_text=commentary_text,
-                    is_partial=False,
-                    context=context
-                )
-                
-                await self.emit(
-                    EventTopics.GPT_COMMENTARY_RESPONSE,
-                    commentary_response.model_dump()
-                )
-                
-                self.logger.info(f"Emitted GPT_COMMENTARY_RESPONSE for request_id: {request_id}")
-                
+            self.logger.info(f"Generated commentary: {commentary_text}")
+            
+            # Emit the commentary response
+            from cantina_os.core.event_schemas import GptCommentaryResponsePayload
+            
+            commentary_response = GptCommentaryResponsePayload(
+                timestamp=time.time(),
+                request_id=request_id,
+                commentary_text=commentary_text,
+                is_partial=False,
+                context=context
+            )
+            
+            await self.emit(
+                EventTopics.GPT_COMMENTARY_RESPONSE,
+                commentary_response.model_dump()
+            )
+            
+            self.logger.info(f"Emitted GPT_COMMENTARY_RESPONSE for request_id: {request_id}")
+            
+        except asyncio.CancelledError:
+            # Cancelled via the scheduler (e.g. DJ mode stopped) - nobody is waiting on it
+            self.logger.info(f"Commentary request {payload.get('request_id', 'unknown')} cancelled")
         except Exception as e:
             self.logger.error(f"Error handling DJ commentary request: {e}", exc_info=True)
             
@@ -9,19 +9,18 @@ and emitting it as events on the bus. It supports both continuous and push-to-ta
 SERVICE: MicInputService
 PURPOSE: Captures raw audio input from system microphone and emits audio chunk events for transcription services
 EVENTS_IN: VOICE_LISTENING_STARTED, VOICE_LISTENING_STOPPED, MIC_RECORDING_START, MIC_RECORDING_STOP
-EVENTS_OUT: AUDIO_RAW_CHUNK, SERVICE_STATUS_UPDATE
-KEY_METHODS: start_capture, stop_capture, _process_audio_queue, _audio_callback, _process_audio_chunk
+EVENTS_OUT: AUDIO_RAW_CHUNK, VOICE_AUDIO_LEVEL, SERVICE_STATUS_UPDATE
+KEY_METHODS: start_capture, stop_capture, add_chunk_listener, _process_audio_queue, _process_audio_batch, _audio_callback, _process_audio_chunk, get_audio_stats
 DEPENDENCIES: sounddevice for audio capture, numpy for audio processing, system microphone hardware
 """
 
 import asyncio
 import logging
-import queue
 import sounddevice as sd
 import numpy as np
 import threading
 import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, List
 from dataclasses import dataclass
 
 from ..base_service import BaseService
@@ -29,8 +28,15 @@ from ..core.event_topics import EventTopics
 from ..event_payloads import (
     BaseEventPayload,
     ServiceStatus,
-    AudioChunkPayload
+    AudioChunkPayload,
+    VoiceAudioLevelPayload
 )
+from ..utils.audio_metering import AudioLevelMeter
+from ..utils.audio_ring_buffer import AudioRingBuffer
+
+# Called with a zero-copy view of one block and its capture timestamp.
+# The view is only valid for the duration of the call.
+ChunkListener = Callable[[memoryview, float], None]
 
 @dataclass
 class AudioConfig:
@@ -41,6 +47,10 @@ class AudioConfig:
     dtype: np.dtype = np.int16
     blocksize: int = 1024  # Samples per block
     latency: float = 0.1   # Device latency in seconds
+    buffer_blocks: int = 64  # Ring buffer capacity in blocks (~4s at 16kHz/1024)
+    drain_interval: float = 0.02  # Seconds between ring buffer drains
+    level_rate: float = 15.0  # VOICE_AUDIO_LEVEL events per second
+    emit_raw_chunks: bool = True  # Emit AUDIO_RAW_CHUNK (bytes copy) when the bus has subscribers
 
 
 class MicInputService(BaseService):
@@ -51,6 +61,9 @@ class MicInputService(BaseService):
     - Configurable audio parameters (sample rate, channels, etc.)
     - Push-to-talk and continuous modes
     - Non-blocking audio capture using sounddevice
+    - Lock-free ring buffer hand-off from the audio thread with overrun counters
+    - Batched RMS/peak metering published as a decimated VOICE_AUDIO_LEVEL stream
+    - Zero-copy chunk listeners for in-process raw audio consumers
     - Automatic resource cleanup
     """
     
@@ -68,13 +81,34 @@ class MicInputService(BaseService):
         
         # Audio capture state
         self._stream: Optional[sd.InputStream] = None
-        self._audio_queue = asyncio.Queue(maxsize=100)
         self._stop_flag = threading.Event()
         self._is_capturing = False
         self._processing_task: Optional[asyncio.Task] = None
         
-        # Store the event loop for thread-safe operations
-        self._event_loop = asyncio.get_event_loop()
+        # Preallocated SPSC ring buffer - the audio callback writes into it
+        # without touching the event loop, _process_audio_queue drains it
+        self._ring_buffer = AudioRingBuffer(
+            capacity=self._config.buffer_blocks,
+            frames_per_block=self._config.blocksize,
+            channels=self._config.channels,
+            dtype=self._config.dtype
+        )
+        
+        # Vectorised level metering over each drained batch
+        self._level_meter = AudioLevelMeter(
+            sample_rate=self._config.sample_rate,
+            update_rate_hz=self._config.level_rate,
+            dtype=self._config.dtype
+        )
+        
+        # In-process raw audio consumers (see add_chunk_listener)
+        self._chunk_listeners: List[ChunkListener] = []
+        
+        # PortAudio status flags seen by the callback (counted, logged from the loop)
+        self._input_overflows = 0
+        self._callback_errors = 0
+        self._reported_overruns = 0
+        self._reported_overflows = 0
         
         # Error tracking
         self._errors = 0
@@ -92,7 +126,11 @@ class MicInputService(BaseService):
             sample_rate=config.get("AUDIO_SAMPLE_RATE", 16000),
             channels=config.get("AUDIO_CHANNELS", 1),
             blocksize=config.get("AUDIO_BLOCKSIZE", 1024),
-            latency=config.get("AUDIO_LATENCY", 0.1)
+            latency=config.get("AUDIO_LATENCY", 0.1),
+            buffer_blocks=config.get("AUDIO_BUFFER_BLOCKS", 64),
+            drain_interval=config.get("AUDIO_DRAIN_INTERVAL", 0.02),
+            level_rate=config.get("AUDIO_LEVEL_RATE", 15.0),
+            emit_raw_chunks=config.get("EMIT_RAW_CHUNK_EVENTS", True)
         )
         
     async def _start(self) -> None:
@@ -172,41 +210,25 @@ class MicInputService(BaseService):
             
     def _audio_callback(self, indata, frames, time_info, status):
         """Handle incoming audio data from sounddevice.
-        This runs in a separate thread - keep it minimal and thread-safe."""
-        if status:
-            self._event_loop.call_soon_threadsafe(
-                lambda: self.logger.warning(f"Audio callback status: {status}")
-            )
-            return
-            
+        This runs in the PortAudio thread - it only copies into the ring buffer
+        and never touches the event loop or blocks."""
         try:
+            if status:
+                # Counted here, reported from the event loop by _report_overruns
+                if getattr(status, "input_overflow", False):
+                    self._input_overflows += 1
+                    
             if self._is_capturing and not self._paused_due_to_errors:
-                # Create a copy of the data and get timestamp
-                data_copy = indata.copy()
                 current_time = getattr(time_info, 'inputBufferAdcTime', 
                                      getattr(time_info, 'currentTime', time.time()))
+                # Drops the block and bumps the overrun counter if the loop fell behind
+                self._ring_buffer.write(indata, current_time)
                 
-                # Single thread crossing with timeout
-                if self._event_loop and not self._event_loop.is_closed():
-                    future = asyncio.run_coroutine_threadsafe(
-                        self._audio_queue.put((data_copy, current_time)),
-                        self._event_loop
-                    )
-                    # Wait with timeout to avoid blocking
-                    try:
-                        future.result(timeout=0.1)
-                    except Exception as e:
-                        self._event_loop.call_soon_threadsafe(
-                            lambda: self.logger.error(f"Queue put failed: {e}")
-                        )
-                        
-        except Exception as e:
-            self._event_loop.call_soon_threadsafe(
-                lambda: self.logger.error(f"Error in audio callback: {e}")
-            )
+        except Exception:
+            self._callback_errors += 1
 
     async def _process_audio_queue(self):
-        """Process audio data in the event loop context."""
+        """Drain the ring buffer in batches in the event loop context."""
         self.logger.info("Starting audio queue processing")
         self._chunks_processed = 0
         self._processing_start_time = time.time()
@@ -214,18 +236,20 @@ class MicInputService(BaseService):
         try:
             while self._is_capturing and not self._paused_due_to_errors:
                 try:
-                    # Get data from queue with timeout
-                    data, timestamp = await asyncio.wait_for(
-                        self._audio_queue.get(),
-                        timeout=0.1
-                    )
-                    
-                    # Process in event loop context
-                    await self._process_audio_chunk(data, timestamp)
-                    self._audio_queue.task_done()
+                    segments = self._ring_buffer.peek_segments()
+                    if not segments:
+                        await asyncio.sleep(self._config.drain_interval)
+                        continue
+                        
+                    # Process the whole batch, then hand the slots back to the producer
+                    try:
+                        for data, lengths, timestamps in segments:
+                            await self._process_audio_batch(data, lengths, timestamps)
+                    finally:
+                        self._ring_buffer.release(sum(len(data) for data, _, _ in segments))
+                        
+                    self._report_overruns()
                     
-                except asyncio.TimeoutError:
-                    continue
                 except asyncio.CancelledError:
                     raise
                 except Exception as e:
@@ -239,38 +263,120 @@ class MicInputService(BaseService):
             # Log statistics
             elapsed = time.time() - self._processing_start_time
             rate = self._chunks_processed / elapsed if elapsed > 0 else 0
+            stats = self.get_audio_stats()
             self.logger.info(f"Audio processing stopped after {self._chunks_processed} chunks "
-                           f"({rate:.2f} chunks/sec)")
+                           f"({rate:.2f} chunks/sec, overruns={stats['overruns']}, "
+                           f"input_overflows={stats['input_overflows']})")
+                           
+    def _report_overruns(self) -> None:
+        """Log ring buffer overruns and PortAudio overflows seen since the last check."""
+        overruns = self._ring_buffer.stats.overruns
+        if overruns != self._reported_overruns:
+            self.logger.warning(
+                f"Audio ring buffer overrun: {overruns - self._reported_overruns} block(s) dropped "
+                f"(total {overruns}, capacity {self._ring_buffer.capacity} blocks)"
+            )
+            self._reported_overruns = overruns
+            
+        if self._input_overflows != self._reported_overflows:
+            self.logger.warning(
+                f"Audio input overflow reported by device: "
+                f"{self._input_overflows - self._reported_overflows} new (total {self._input_overflows})"
+            )
+            self._reported_overflows = self._input_overflows
+            
+    def get_audio_stats(self) -> Dict[str, Any]:
+        """Get capture statistics including ring buffer overrun counters."""
+        ring_stats = self._ring_buffer.stats
+        return {
+            "chunks_processed": self._chunks_processed,
+            "blocks_written": ring_stats.blocks_written,
+            "blocks_read": ring_stats.blocks_read,
+            "overruns": ring_stats.overruns,
+            "dropped_frames": ring_stats.dropped_frames,
+            "max_fill": ring_stats.max_fill,
+            "buffer_capacity": self._ring_buffer.capacity,
+            "input_overflows": self._input_overflows,
+            "callback_errors": self._callback_errors,
+        }
 
-    async def _process_audio_chunk(self, data: np.ndarray, timestamp: float):
-        """Process a single audio chunk in the event loop context."""
-        try:
-            # Convert to bytes
-            samples_bytes = data.tobytes()
+    async def _process_audio_batch(
+        self,
+        data: np.ndarray,
+        lengths: np.ndarray,
+        timestamps: np.ndarray
+    ) -> None:
+        """Meter a contiguous batch of ring buffer blocks and fan out the raw audio."""
+        # One vectorised pass over the whole batch, decimated to level_rate
+        for level in self._level_meter.process(data, lengths, timestamps):
+            await self.emit(
+                EventTopics.VOICE_AUDIO_LEVEL,
+                VoiceAudioLevelPayload(
+                    rms=level.rms,
+                    peak=level.peak,
+                    rms_db=level.rms_db,
+                    window_ms=level.window_ms,
+                    capture_time=level.timestamp
+                )
+            )
             
-            # Calculate audio levels for monitoring
-            max_amp = np.max(np.abs(data))
-            rms = np.sqrt(np.mean(data**2)) if np.mean(data**2) > 0 else 0
+        emit_raw = self._config.emit_raw_chunks and self._has_raw_chunk_subscribers()
+        for i in range(len(data)):
+            await self._process_audio_chunk(data[i, :lengths[i]], float(timestamps[i]), emit_raw)
             
-            # Log occasionally
-            if self._chunks_processed % 50 == 0:
-                self.logger.debug(f"Audio chunk {self._chunks_processed}: "
-                                f"max_amp={max_amp:.4f}, rms={rms:.4f}")
+    def _has_raw_chunk_subscribers(self) -> bool:
+        """Only pay for the per-block bytes copy when something listens on the bus."""
+        listeners = getattr(self._event_bus, "listeners", None)
+        if listeners is None:
+            return True
+        try:
+            return bool(listeners(EventTopics.AUDIO_RAW_CHUNK))
+        except Exception:
+            return True
+
+    async def _process_audio_chunk(self, data: np.ndarray, timestamp: float, emit_raw: bool = True):
+        """Hand a single audio block to raw-audio consumers in the event loop context."""
+        try:
+            # Zero-copy channel - listeners get a view of the ring buffer slot
+            if self._chunk_listeners:
+                view = memoryview(data).cast("B")
+                for listener in list(self._chunk_listeners):
+                    try:
+                        listener(view, timestamp)
+                    except Exception as e:
+                        self.logger.error(f"Error in audio chunk listener: {e}")
+                view.release()
             
-            # Emit audio chunk event
-            await self.emit(EventTopics.AUDIO_RAW_CHUNK, {
-                "samples": samples_bytes,
-                "timestamp": timestamp,
-                "sample_rate": self._config.sample_rate,
-                "channels": self._config.channels,
-                "dtype": str(self._config.dtype)
-            })
+            if emit_raw:
+                # Event bus handlers run later, so they need their own copy
+                await self.emit(EventTopics.AUDIO_RAW_CHUNK, {
+                    "samples": data.tobytes(),
+                    "timestamp": timestamp,
+                    "sample_rate": self._config.sample_rate,
+                    "channels": self._config.channels,
+                    "dtype": str(self._config.dtype)
+                })
             
             self._chunks_processed += 1
             
         except Exception as e:
             self.logger.error(f"Error processing audio chunk: {e}")
             raise
+            
+    def add_chunk_listener(self, listener: ChunkListener) -> None:
+        """Register an in-process consumer for raw audio blocks.
+        
+        The listener is called synchronously from the event loop with a
+        memoryview of the block (no copy) and its capture timestamp. The view
+        is only valid during the call - copy it if you need to keep it.
+        """
+        if listener not in self._chunk_listeners:
+            self._chunk_listeners.append(listener)
+            
+    def remove_chunk_listener(self, listener: ChunkListener) -> None:
+        """Unregister a raw audio consumer."""
+        if listener in self._chunk_listeners:
+            self._chunk_listeners.remove(listener)
 
     async def start_capture(self):
         """Start audio capture."""
@@ -327,13 +433,9 @@ class MicInputService(BaseService):
                     pass
                 self._processing_task = None
             
-            # Clear queue
-            while not self._audio_queue.empty():
-                try:
-                    self._audio_queue.get_nowait()
-                    self._audio_queue.task_done()
-                except asyncio.QueueEmpty:
-                    break
+            # Drop anything still buffered
+            self._ring_buffer.clear()
+            self._level_meter.reset()
             
             self.logger.info("Audio capture stopped")
             await self._emit_status(ServiceStatus.STOPPED, "Audio capture stopped")
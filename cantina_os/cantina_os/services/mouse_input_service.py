@@ -10,7 +10,7 @@ to prevent input conflicts when the web dashboard is active.
 """
 SERVICE: MouseInputService
 PURPOSE: Manages mouse click input for microphone recording control with dashboard context awareness
-EVENTS_IN: SYSTEM_MODE_CHANGE, SERVICE_STATUS_UPDATE
+EVENTS_IN: SYSTEM_MODE_CHANGE, SERVICE_STATUS_UPDATE, MIC_RECORDING_STOP
 EVENTS_OUT: MIC_RECORDING_START, MIC_RECORDING_STOP, MOUSE_RECORDING_STOPPED, SERVICE_STATUS_UPDATE
 KEY_METHODS: _handle_mouse_click, _setup_mouse_listener, _handle_mode_change, _is_dashboard_context_active, get_context_status
 DEPENDENCIES: pynput for mouse input detection, YodaModeManagerService integration
@@ -148,6 +148,12 @@ class MouseInputService(BaseService):
             self._handle_mode_change
         ))
         
+        # Keep click toggle in sync when recording is stopped elsewhere (e.g. VAD auto end)
+        asyncio.create_task(self.subscribe(
+            EventTopics.MIC_RECORDING_STOP,
+            self._handle_recording_stopped
+        ))
+        
         # Subscribe to service status updates to track web bridge connectivity
         if self._config.dashboard_aware:
             asyncio.create_task(self.subscribe(
@@ -182,6 +188,12 @@ class MouseInputService(BaseService):
             self.logger.error(error_msg)
             raise
     
+    async def _handle_recording_stopped(self, payload: Dict[str, Any]) -> None:
+        """Reset the recording toggle when recording stops without a click."""
+        if self._is_recording:
+            self.logger.info(f"Recording stopped externally ({(payload or {}).get('reason', 'unknown')}), resetting click state")
+            self._is_recording = False
+            
     async def _handle_mode_change(self, payload: Dict[str, Any]) -> None:
         """Handle system mode change events.
         
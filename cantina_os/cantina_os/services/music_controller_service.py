@@ -8,7 +8,7 @@ This service manages music playback with mode-aware behavior and audio ducking d
 SERVICE: MusicControllerService
 PURPOSE: Music playback management with VLC backend, audio ducking, crossfading, and DJ mode support
 EVENTS_IN: MUSIC_COMMAND, SYSTEM_MODE_CHANGE, SPEECH_SYNTHESIS_STARTED, SPEECH_SYNTHESIS_ENDED, AUDIO_DUCKING_START, AUDIO_DUCKING_STOP, DJ_MODE_CHANGED, DJ_NEXT_TRACK
-EVENTS_OUT: MUSIC_PLAYBACK_STARTED, MUSIC_PLAYBACK_STOPPED, MUSIC_PLAYBACK_PAUSED, MUSIC_PLAYBACK_RESUMED, MUSIC_LIBRARY_UPDATED, TRACK_ENDING_SOON, CROSSFADE_STARTED, CROSSFADE_COMPLETE, CLI_RESPONSE
+EVENTS_OUT: MUSIC_PLAYBACK_STARTED, MUSIC_PLAYBACK_STOPPED, MUSIC_PLAYBACK_PAUSED, MUSIC_PLAYBACK_RESUMED, MUSIC_LIBRARY_UPDATED, TRACK_ENDING_SOON, CROSSFADE_STARTED, CROSSFADE_COMPLETE, AUDIO_DUCKING_APPLIED, CLI_RESPONSE
 KEY_METHODS: handle_play_music, handle_stop_music, handle_list_music, _crossfade_to_track, _smart_play_track, get_track_progress, _setup_track_end_timer
 DEPENDENCIES: VLC media player, music directory (configurable path), audio hardware
 """
@@ -16,7 +16,7 @@ DEPENDENCIES: VLC media player, music directory (configurable path), audio hardw
 import os
 import asyncio
 import logging
-from typing import Dict, Optional, List, Any
+from typing import Dict, Optional, List, Any, Tuple
 import vlc
 from pydantic import BaseModel, Field
 from pyee.asyncio import AsyncIOEventEmitter
@@ -43,6 +43,8 @@ from ..event_payloads import (
     DJModeChangedPayload
 )
 from ..models.music_models import MusicTrack, MusicLibrary
+from ..utils.beat_grid import BeatGrid, CrossfadeTiming, plan_crossfade
+from ..utils.library_index import load_beat_grids, load_track_features
 from ..utils.command_decorators import compound_command, register_service_commands, validate_compound_command, command_error_handler
 
 # Import necessary Pydantic models from event_schemas
@@ -67,6 +69,10 @@ class MusicControllerConfig(BaseModel):
     crossfade_duration_ms: int = Field(default=3000, description="Duration of crossfade between tracks in milliseconds")
     crossfade_steps: int = Field(default=50, description="Number of volume adjustment steps during crossfade")
     track_ending_threshold_sec: int = Field(default=30, description="Seconds before track end to emit TRACK_ENDING_SOON event")
+    beat_align_crossfades: bool = Field(default=True, description="Start crossfades on a downbeat and fade for whole bars when a track has an analyzed beat grid")
+    max_crossfade_duration_sec: float = Field(default=16.0, description="Longest crossfade used to cover an analyzed outro")
+    beat_align_max_wait_sec: float = Field(default=2.0, description="Longest wait for the next downbeat before an on-demand crossfade starts")
+    beat_align_tolerance_sec: float = Field(default=0.08, description="How late after a downbeat a crossfade still starts at once instead of waiting for the next bar")
 
 class MusicControllerService(BaseService):
     """
@@ -105,6 +111,8 @@ class MusicControllerService(BaseService):
         # REMOVED: self._progress_task (Phase 3.1 - Progress tracking now client-side)
         self.is_paused = False  # Track pause state
         self.play_queue: List[MusicTrack] = []  # Simple play queue
+        self._beat_grids: Dict[str, BeatGrid] = {}  # Analyzed beat grids by track name
+        self._transition_timing: Optional[CrossfadeTiming] = None  # Planned crossfade out of the current track
         
         # Timer-based progress tracking (replaces unreliable VLC timing)
         self._playback_start_time: Optional[float] = None  # System time when playback started
@@ -389,6 +397,11 @@ class MusicControllerService(BaseService):
             
             # Clear existing tracks
             self.tracks.clear()
+
+            # Audio features and beat grids precomputed offline, keyed by file name
+            track_features = load_track_features(self.music_dir)
+            beat_grids = load_beat_grids(self.music_dir)
+            self._beat_grids.clear()
             
             # Process .mp3, .wav, and .m4a files
             for ext in ['.mp3', '.wav', '.m4a']:
@@ -443,11 +456,14 @@ class MusicControllerService(BaseService):
                             duration=duration,
                             track_id=title,  # Use title as track_id for consistency
                             title=title,  # Add title field for BrainService
-                            artist=artist  # Add artist field from parsing
+                            artist=artist,  # Add artist field from parsing
+                            features=track_features.get(filename)
                         )
                         
                         # Use title as key for consistent lookup
                         self.tracks[title] = track
+                        if filename in beat_grids:
+                            self._beat_grids[title] = BeatGrid(beat_grids[filename])
                         music_files_count += 1
                         
                         self.logger.debug(f"Loaded track: {title} by {artist} ({abs_path}), duration: {duration}s")
@@ -455,6 +471,9 @@ class MusicControllerService(BaseService):
                         self.logger.error(f"Error loading music track {filepath}: {e}")
             
             self.logger.info(f"Loaded {music_files_count} music tracks from {self.music_dir}")
+            analyzed_count = sum(1 for track in self.tracks.values() if track.features is not None)
+            if music_files_count and analyzed_count < music_files_count:
+                self.logger.info(f"{music_files_count - analyzed_count} tracks have no cached audio features")
             
             # Alert if no music found
             if music_files_count == 0:
@@ -844,8 +863,9 @@ class MusicControllerService(BaseService):
             await self.emit(EventTopics.MUSIC_PLAYBACK_STARTED, payload)
             self.logger.info("[MusicController] Used await self.emit() for MUSIC_PLAYBACK_STARTED")
             
-            # Emit simple coordination event for timeline services
-            await self.emit(EventTopics.TRACK_PLAYING, {})
+            # Emit simple coordination event for timeline services; timing lets
+            # BrainService schedule commentary against TRACK_ENDING_SOON
+            await self.emit(EventTopics.TRACK_PLAYING, self._track_playing_payload(track))
             
             # Update MemoryService with currently playing track for coordination
             if self.dj_mode_active:
@@ -1414,17 +1434,35 @@ class MusicControllerService(BaseService):
 
     async def _handle_audio_ducking_start(self, payload: BaseEventPayload):
         """Handle audio ducking start - reduce music volume."""
+        applied = False
         if self.player and (self.current_mode == "INTERACTIVE" or self.dj_mode_active):
             self.is_ducking = True
             self.player.audio_set_volume(self.ducking_volume)
+            applied = True
             self.logger.debug(f"Music ducked to volume {self.ducking_volume}")
+        await self._ack_ducking(payload, applied)
             
     async def _handle_audio_ducking_stop(self, payload: BaseEventPayload):
         """Handle audio ducking stop - restore music volume."""
+        applied = False
         if self.player and (self.current_mode == "INTERACTIVE" or self.dj_mode_active):
             self.is_ducking = False
             self.player.audio_set_volume(self.normal_volume)
+            applied = True
             self.logger.debug(f"Music volume restored to {self.normal_volume}")
+        await self._ack_ducking(payload, applied)
+
+    async def _ack_ducking(self, payload: Any, applied: bool) -> None:
+        """Acknowledge a ducking request so callers can wait on it instead of sleeping."""
+        duck_id = payload.get("duck_id") if isinstance(payload, dict) else getattr(payload, "duck_id", None)
+        if not duck_id:
+            return
+        await self.emit(EventTopics.AUDIO_DUCKING_APPLIED, {
+            "duck_id": duck_id,
+            "ducked": self.is_ducking,
+            "applied": applied,
+            "volume": self.ducking_volume if self.is_ducking else self.normal_volume,
+        })
 
     async def _handle_dj_mode_changed(self, payload: Dict[str, Any]) -> None:
         """Handle DJ mode activation/deactivation."""
@@ -1483,14 +1521,18 @@ class MusicControllerService(BaseService):
         if track_duration_sec is None or track_duration_sec <= threshold_sec:
             self.logger.debug(f"Track duration ({track_duration_sec}s) not long enough or invalid for TRACK_ENDING_SOON threshold ({threshold_sec}s). Not setting timer.")
             self.track_end_timer = None
+            self._transition_timing = None
             return
 
-        # Calculate delay until the threshold is reached
-        # We want to trigger the event *at* the threshold time remaining
-        delay_sec = track_duration_sec - threshold_sec
+        # Calculate delay until the threshold is reached. With a planned
+        # beat-aligned crossfade the threshold counts back from its start,
+        # otherwise from the end of the track.
+        self._transition_timing = self._plan_transition(self.current_track, track_duration_sec)
+        delay_sec = self._ending_soon_offset(self.current_track, track_duration_sec, self._transition_timing)
 
-        if delay_sec > 0:
-            self.logger.info(f"Setting TRACK_ENDING_SOON timer for {delay_sec:.2f} seconds (track ending in {threshold_sec}s).")
+        if delay_sec > 0 or self._transition_timing:
+            anchor = "beat-aligned crossfade" if self._transition_timing else "track end"
+            self.logger.info(f"Setting TRACK_ENDING_SOON timer for {delay_sec:.2f} seconds ({threshold_sec}s before {anchor}).")
             # Create and store the timer task
             self.track_end_timer = asyncio.create_task(
                 self._delayed_track_ending_event(delay_sec),
@@ -1536,6 +1578,69 @@ class MusicControllerService(BaseService):
             filepath=track.path
         )
 
+    def _track_playing_payload(self, track: MusicTrack) -> Dict[str, Any]:
+        """Timing of the track that just started, for TRACK_PLAYING."""
+        threshold = self._config.track_ending_threshold_sec
+        if track.duration:
+            # Seconds before the end of the track that TRACK_ENDING_SOON fires
+            threshold = track.duration - self._ending_soon_offset(track, track.duration)
+        return {
+            "track_id": track.track_id,
+            "duration": track.duration,
+            "start_timestamp": self._playback_start_time,
+            "track_ending_threshold_sec": threshold,
+        }
+
+    def _plan_transition(self, track: Optional[MusicTrack], duration: float) -> Optional[CrossfadeTiming]:
+        """Plan the crossfade out of a track from its beat grid and outro, if analyzed."""
+        if not self._config.beat_align_crossfades or not track or not duration:
+            return None
+        grid = self._beat_grids.get(track.name)
+        outro = track.features.outro_length if track.features else None
+        if not grid and not outro:
+            return None
+        return plan_crossfade(
+            duration,
+            grid,
+            outro_length=outro,
+            default_duration=self._config.crossfade_duration_ms / 1000.0,
+            max_duration=self._config.max_crossfade_duration_sec,
+        )
+
+    def _ending_soon_offset(self, track: Optional[MusicTrack], duration: float, timing: Optional[CrossfadeTiming] = None) -> float:
+        """Seconds into the track at which TRACK_ENDING_SOON fires."""
+        timing = timing or self._plan_transition(track, duration)
+        if timing:
+            # Crossfades planned early in short tracks are announced right away
+            return max(0.0, timing.start - self._config.track_ending_threshold_sec)
+        return duration - self._config.track_ending_threshold_sec
+
+    def _playback_position(self) -> float:
+        """Current position (s) in the current track from the playback timer."""
+        if not self._playback_start_time:
+            return 0.0
+        if self.is_paused:
+            return self._last_known_position
+        return max(0.0, time.time() - self._playback_start_time - self._total_pause_duration)
+
+    def _align_crossfade(self, duration_sec: float) -> Tuple[float, float]:
+        """Wait (s) until the next downbeat of the current track and the fade length in whole bars.
+
+        Planned transitions already arrive on the downbeat, give or take a few
+        milliseconds; up to ``beat_align_tolerance_sec`` late they start at
+        once rather than waiting a bar. On-demand crossfades wait at most
+        ``beat_align_max_wait_sec``; beyond that they start immediately.
+        """
+        grid = self._beat_grids.get(self.current_track.name) if self.current_track else None
+        if not self._config.beat_align_crossfades or not grid:
+            return 0.0, duration_sec
+        wait = grid.downbeat_wait(
+            self._playback_position(),
+            self._config.beat_align_max_wait_sec,
+            self._config.beat_align_tolerance_sec,
+        )
+        return wait, grid.whole_bars(duration_sec)
+
     async def _emit_track_ending_soon(self) -> None:
         """Emits the TRACK_ENDING_SOON event with current track data."""
         if self.current_track:
@@ -1543,11 +1648,24 @@ class MusicControllerService(BaseService):
             try:
                 # Create the payload using the Pydantic model and helper method
                 track_data = self._create_track_data_payload(self.current_track)
-                payload = TrackEndingSoonPayload(
-                    timestamp=time.time(),
-                    current_track=track_data,
-                    time_remaining=self._config.track_ending_threshold_sec
-                )
+                timing = self._transition_timing
+                if timing:
+                    # Planned crossfade: report its timing relative to now
+                    position = self._playback_position()
+                    payload = TrackEndingSoonPayload(
+                        timestamp=time.time(),
+                        current_track=track_data,
+                        time_remaining=max(0.0, (self.current_track.duration or 0.0) - position),
+                        crossfade_start_in=max(0.0, timing.start - position),
+                        crossfade_duration=timing.duration,
+                        outro_start_in=max(0.0, timing.outro_start - position),
+                    )
+                else:
+                    payload = TrackEndingSoonPayload(
+                        timestamp=time.time(),
+                        current_track=track_data,
+                        time_remaining=self._config.track_ending_threshold_sec
+                    )
                 
                 # Emit the event
                 await self.emit(
@@ -1595,6 +1713,14 @@ class MusicControllerService(BaseService):
             current_track_data = self._create_track_data_payload(self.current_track)
             next_track_data = self._create_track_data_payload(next_track)
 
+            # Start on the outgoing track's next downbeat and fade for whole bars
+            fade_sec = duration_sec if duration_sec else self._config.crossfade_duration_ms / 1000.0
+            align_wait, fade_sec = self._align_crossfade(fade_sec)
+            if align_wait > 0:
+                self.logger.debug(f"Waiting {align_wait:.3f}s for downbeat before crossfade")
+                await asyncio.sleep(align_wait)
+            duration_ms = int(fade_sec * 1000)
+
             # Emit crossfade started event with proper track data
             await self.emit(
                 EventTopics.CROSSFADE_STARTED,
@@ -1602,7 +1728,7 @@ class MusicControllerService(BaseService):
                     "crossfade_id": crossfade_id,
                     "from_track": current_track_data.dict(),
                     "to_track": next_track_data.dict(),
-                    "duration_ms": self._config.crossfade_duration_ms
+                    "duration_ms": duration_ms
                 }
             )
 
@@ -1623,7 +1749,6 @@ class MusicControllerService(BaseService):
             self.secondary_player.set_media(media)
             
             # Calculate crossfade parameters
-            duration_ms = int(duration_sec * 1000) if duration_sec else self._config.crossfade_duration_ms
             step_duration = duration_ms / self._config.crossfade_steps
             
             # IMPORTANT FIX: Use current volume as target, not normal_volume
@@ -1685,7 +1810,7 @@ class MusicControllerService(BaseService):
             )
             
             # Emit simple coordination event for timeline services (new track is now playing)
-            await self.emit(EventTopics.TRACK_PLAYING, {})
+            await self.emit(EventTopics.TRACK_PLAYING, self._track_playing_payload(next_track))
             
             # Set up track end timer for the new track
             if self.dj_mode_active and next_track.duration:
@@ -0,0 +1,176 @@
+"""
+Event waiters for the Timeline Executor Service
+===============================================
+A table of pending "wait until this event arrives" requests. Waiters that
+match on a payload field (a correlation ID such as ``clip_id`` or
+``duck_id``) are indexed by ``(topic, field, value)`` so dispatch is a dict
+lookup instead of a scan; waiters with only a predicate are checked in order.
+
+Events are fed in with ``dispatch(topic, payload)``, normally from a plain
+(synchronous) bus handler so futures resolve in the same loop iteration the
+event is emitted.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+Predicate = Callable[[Dict[str, Any]], bool]
+
+
+class EventWaiter:
+    """A single pending wait."""
+
+    __slots__ = ("topic", "match", "predicate", "future", "index_key")
+
+    def __init__(
+        self,
+        topic: Any,
+        match: Dict[str, Any],
+        predicate: Optional[Predicate],
+        future: asyncio.Future,
+        index_key: Optional[Tuple[Any, str, Any]],
+    ):
+        self.topic = topic
+        self.match = match
+        self.predicate = predicate
+        self.future = future
+        self.index_key = index_key
+
+    def accepts(self, payload: Dict[str, Any]) -> bool:
+        """Whether the payload satisfies every match field and the predicate."""
+        for field, expected in self.match.items():
+            if payload.get(field) != expected:
+                return False
+        if self.predicate is not None:
+            try:
+                return bool(self.predicate(payload))
+            except Exception:
+                return False
+        return True
+
+
+class EventWaiterTable:
+    """Correlation-indexed table of pending event waiters."""
+
+    def __init__(self):
+        self._indexed: Dict[Tuple[Any, str, Any], List[EventWaiter]] = {}
+        self._index_fields: Dict[Any, Dict[str, int]] = {}  # topic -> field -> live waiter count
+        self._unindexed: Dict[Any, List[EventWaiter]] = {}
+
+    def add(
+        self,
+        topic: Any,
+        match: Optional[Dict[str, Any]] = None,
+        predicate: Optional[Predicate] = None,
+    ) -> EventWaiter:
+        """Register a waiter. Register *before* emitting the event that triggers the reply.
+
+        Args:
+            topic: Event topic to wait on, as passed to the bus (EventTopics member or str)
+            match: Payload fields that must equal the given values; the first
+                hashable entry is used as the correlation index
+            predicate: Extra check on the payload
+
+        Returns:
+            The waiter; await ``waiter.future`` for the matching payload
+        """
+        match = dict(match or {})
+        future = asyncio.get_running_loop().create_future()
+
+        index_key = None
+        for field, value in match.items():
+            try:
+                hash(value)
+            except TypeError:
+                continue  # Unhashable values are only checked by accepts()
+            index_key = (topic, field, value)
+            break
+
+        waiter = EventWaiter(topic, match, predicate, future, index_key)
+        if index_key is not None:
+            self._indexed.setdefault(index_key, []).append(waiter)
+            fields = self._index_fields.setdefault(topic, {})
+            fields[index_key[1]] = fields.get(index_key[1], 0) + 1
+        else:
+            self._unindexed.setdefault(topic, []).append(waiter)
+        return waiter
+
+    def discard(self, waiter: EventWaiter) -> None:
+        """Remove a waiter (after timeout or cancellation). Safe to call twice."""
+        if waiter.index_key is not None:
+            waiters = self._indexed.get(waiter.index_key)
+            if waiters and waiter in waiters:
+                waiters.remove(waiter)
+                if not waiters:
+                    del self._indexed[waiter.index_key]
+                self._release_field(waiter.topic, waiter.index_key[1])
+        else:
+            waiters = self._unindexed.get(waiter.topic)
+            if waiters and waiter in waiters:
+                waiters.remove(waiter)
+                if not waiters:
+                    del self._unindexed[waiter.topic]
+        if not waiter.future.done():
+            waiter.future.cancel()
+
+    def dispatch(self, topic: Any, payload: Any) -> int:
+        """Resolve every waiter on ``topic`` that accepts ``payload``.
+
+        Returns:
+            Number of waiters resolved
+        """
+        if not isinstance(payload, dict):
+            payload = payload.model_dump() if hasattr(payload, "model_dump") else {}
+        resolved = 0
+
+        for field in tuple(self._index_fields.get(topic, ())):
+            key = (topic, field, payload.get(field))
+            waiters = self._indexed.get(key)
+            if waiters:
+                resolved += self._resolve(waiters, payload, key)
+
+        waiters = self._unindexed.get(topic)
+        if waiters:
+            resolved += self._resolve(waiters, payload, None)
+            if not waiters:
+                self._unindexed.pop(topic, None)
+        return resolved
+
+    def _resolve(self, waiters: List[EventWaiter], payload: Dict[str, Any], key) -> int:
+        resolved = 0
+        for waiter in list(waiters):
+            if waiter.future.done() or waiter.accepts(payload):
+                waiters.remove(waiter)
+                if key is not None:
+                    self._release_field(waiter.topic, key[1])
+                if not waiter.future.done():
+                    waiter.future.set_result(payload)
+                    resolved += 1
+        if key is not None and not waiters:
+            self._indexed.pop(key, None)
+        return resolved
+
+    def _release_field(self, topic: Any, field: str) -> None:
+        fields = self._index_fields.get(topic)
+        if not fields:
+            return
+        fields[field] -= 1
+        if fields[field] <= 0:
+            del fields[field]
+            if not fields:
+                del self._index_fields[topic]
+
+    def cancel_all(self) -> None:
+        """Cancel every pending waiter."""
+        for waiters in list(self._indexed.values()) + list(self._unindexed.values()):
+            for waiter in waiters:
+                if not waiter.future.done():
+                    waiter.future.cancel()
+        self._indexed.clear()
+        self._index_fields.clear()
+        self._unindexed.clear()
+
+    def __len__(self) -> int:
+        return sum(len(w) for w in self._indexed.values()) + sum(len(w) for w in self._unindexed.values())
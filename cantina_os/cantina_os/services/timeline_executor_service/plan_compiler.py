@@ -0,0 +1,267 @@
+"""
+Plan compilation for the Timeline Executor Service
+==================================================
+Plans arrive on PLAN_READY as a mix of step dicts and Pydantic step models.
+They are compiled once into a flat list of slotted ``CompiledStep`` objects
+with the step type, id, post-step delay and handler already resolved, so the
+executor never re-derives step types while a plan is running and invalid
+plans are rejected before anything is played.
+
+New step types plug in through ``StepRegistry.register`` instead of editing
+a dispatch ladder.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, Type
+
+from pydantic import BaseModel, ValidationError
+
+StepResult = Tuple[bool, Optional[Dict[str, Any]]]
+StepHandler = Callable[[Any, str], Awaitable[StepResult]]
+
+
+class PlanValidationError(ValueError):
+    """Raised when a plan contains steps that cannot be executed."""
+
+    def __init__(self, plan_id: str, errors: List[str]):
+        self.plan_id = plan_id
+        self.errors = errors
+        super().__init__(f"Plan {plan_id} failed validation: {'; '.join(errors)}")
+
+
+class StepType:
+    """Registry entry describing how to validate and execute one step type."""
+
+    __slots__ = ("name", "handler", "model", "required_fields", "container")
+
+    def __init__(
+        self,
+        name: str,
+        handler: StepHandler,
+        model: Optional[Type[BaseModel]] = None,
+        required_fields: Sequence[str] = (),
+        container: bool = False,
+    ):
+        self.name = name
+        self.handler = handler
+        self.model = model  # Dict steps are converted to this model at compile time
+        self.required_fields = tuple(required_fields)  # Checked on steps left as dicts
+        self.container = container  # Step holds nested ``steps`` that are compiled too
+
+
+class CompiledStep:
+    """A validated step with its handler resolved."""
+
+    __slots__ = ("index", "step_id", "step_type", "step", "handler", "post_delay", "children", "offset")
+
+    def __init__(
+        self,
+        index: int,
+        step_id: str,
+        step_type: str,
+        step: Any,
+        handler: StepHandler,
+        post_delay: Optional[float] = None,
+        children: Optional[Tuple["CompiledStep", ...]] = None,
+        offset: Optional[float] = None,
+    ):
+        self.index = index
+        self.step_id = step_id
+        self.step_type = step_type
+        self.step = step  # Normalised step (model, or dict for dict-based types)
+        self.handler = handler
+        self.post_delay = post_delay  # Seconds to wait after the step completes
+        self.children = children  # Compiled nested steps for container types
+        self.offset = offset  # Start offset (s) relative to the enclosing parallel group
+
+    @property
+    def handler_arg(self) -> Any:
+        """Argument passed to the handler: the step itself, or this object for containers."""
+        return self if self.children is not None else self.step
+
+
+class CompiledPlan:
+    """A plan ready for execution."""
+
+    __slots__ = ("plan_id", "steps", "layer", "received_at", "compile_ms")
+
+    def __init__(
+        self,
+        plan_id: str,
+        steps: Tuple[CompiledStep, ...],
+        layer: str = "foreground",
+        received_at: Optional[float] = None,
+        compile_ms: float = 0.0,
+    ):
+        self.plan_id = plan_id
+        self.steps = steps
+        self.layer = layer
+        self.received_at = received_at  # time.perf_counter() when PLAN_READY arrived
+        self.compile_ms = compile_ms
+
+
+def resolve_step_type(step: Any) -> Optional[str]:
+    """Return the step type of a dict or model step (``step_type`` or legacy ``type``)."""
+    if isinstance(step, dict):
+        return step.get("step_type") or step.get("type")
+    return getattr(step, "step_type", None) or getattr(step, "type", None)
+
+
+def _field(step: Any, name: str) -> Any:
+    if isinstance(step, dict):
+        return step.get(name)
+    return getattr(step, name, None)
+
+
+def resolve_step_id(step: Any, step_type: str) -> str:
+    """Pick a human-meaningful id for STEP_READY/STEP_EXECUTED events."""
+    for name in ("id", "cache_key", "next_track_id"):
+        value = _field(step, name)
+        if value:
+            return str(value)
+    return step_type
+
+
+class StepRegistry:
+    """Maps step type names to handlers and compiles plans against them."""
+
+    def __init__(self):
+        self._types: Dict[str, StepType] = {}
+
+    def register(
+        self,
+        step_type: str,
+        handler: StepHandler,
+        model: Optional[Type[BaseModel]] = None,
+        required_fields: Sequence[str] = (),
+        container: bool = False,
+    ) -> None:
+        """Register (or replace) a step type.
+
+        Args:
+            step_type: Value of the step's ``step_type``/``type`` field
+            handler: Coroutine ``handler(step, plan_id) -> (success, details)``
+            model: Pydantic model dict steps are validated into, if any
+            required_fields: Fields that must be present on dict steps
+            container: Whether the step's ``steps`` are nested steps to compile
+        """
+        self._types[step_type] = StepType(step_type, handler, model, required_fields, container)
+
+    def unregister(self, step_type: str) -> None:
+        """Remove a step type."""
+        self._types.pop(step_type, None)
+
+    def get(self, step_type: str) -> Optional[StepType]:
+        return self._types.get(step_type)
+
+    def __contains__(self, step_type: str) -> bool:
+        return step_type in self._types
+
+    @property
+    def step_types(self) -> List[str]:
+        return list(self._types)
+
+    def compile_plan(
+        self,
+        plan_id: str,
+        raw_steps: Sequence[Any],
+        layer: str = "foreground",
+        received_at: Optional[float] = None,
+    ) -> CompiledPlan:
+        """Compile a plan's steps.
+
+        Raises:
+            PlanValidationError: With every problem found, if any step is invalid
+        """
+        start = time.perf_counter()
+        errors: List[str] = []
+        if not raw_steps:
+            errors.append("plan has no steps")
+        steps = self._compile_steps(raw_steps or [], "", errors)
+        if errors:
+            raise PlanValidationError(plan_id, errors)
+        return CompiledPlan(
+            plan_id=plan_id,
+            steps=steps,
+            layer=layer,
+            received_at=received_at,
+            compile_ms=(time.perf_counter() - start) * 1000.0,
+        )
+
+    def compile_step(self, raw: Any, index: int = 0) -> CompiledStep:
+        """Compile a single step outside of a plan.
+
+        Raises:
+            PlanValidationError: If the step is invalid
+        """
+        errors: List[str] = []
+        compiled = self._compile_one(raw, index, f"step {index}", errors)
+        if errors or compiled is None:
+            raise PlanValidationError("<step>", errors)
+        return compiled
+
+    def _compile_steps(self, raw_steps: Sequence[Any], prefix: str, errors: List[str]) -> Tuple[CompiledStep, ...]:
+        compiled = []
+        for index, raw in enumerate(raw_steps):
+            step = self._compile_one(raw, index, f"{prefix}step {index}", errors)
+            if step is not None:
+                compiled.append(step)
+        return tuple(compiled)
+
+    def _compile_one(self, raw: Any, index: int, where: str, errors: List[str]) -> Optional[CompiledStep]:
+        step_type = resolve_step_type(raw)
+        if not step_type:
+            errors.append(f"{where}: missing step_type")
+            return None
+
+        spec = self._types.get(step_type)
+        if spec is None:
+            errors.append(f"{where}: unknown step type '{step_type}'")
+            return None
+
+        step = raw
+        if spec.model is not None and not isinstance(raw, spec.model):
+            try:
+                data = raw if isinstance(raw, dict) else raw.model_dump()
+                step = spec.model(**data)
+            except ValidationError as e:
+                details = ", ".join(
+                    f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}" for err in e.errors()
+                )
+                errors.append(f"{where} ({step_type}): {details}")
+                return None
+        elif isinstance(step, dict):
+            missing = [name for name in spec.required_fields if not step.get(name)]
+            if missing:
+                errors.append(f"{where} ({step_type}): missing {', '.join(missing)}")
+                return None
+
+        children = None
+        if spec.container:
+            nested = _field(raw, "steps")
+            if not nested:
+                errors.append(f"{where} ({step_type}): no nested steps")
+                return None
+            children = self._compile_steps(nested, f"{where} > ", errors)
+
+        offset = _field(step, "offset")
+        if offset is not None and (not isinstance(offset, (int, float)) or offset < 0):
+            errors.append(f"{where} ({step_type}): offset must be a non-negative number")
+            return None
+
+        post_delay = None
+        if not isinstance(step, dict) and step_type != "delay":  # Delay steps wait in their handler
+            post_delay = getattr(step, "delay", None) or getattr(step, "duration", None)
+
+        return CompiledStep(
+            index=index,
+            step_id=resolve_step_id(step, step_type),
+            step_type=step_type,
+            step=step,
+            handler=spec.handler,
+            post_delay=post_delay,
+            children=children,
+            offset=offset,
+        )
@@ -0,0 +1,113 @@
+"""
+Test cases for event waiters, wait_for_event steps and the event-driven speak path
+"""
+
+import asyncio
+import time
+
+import pytest
+from pyee.asyncio import AsyncIOEventEmitter
+
+from cantina_os.core.event_topics import EventTopics
+from cantina_os.services.timeline_executor_service.event_waiters import EventWaiterTable
+from cantina_os.services.timeline_executor_service.timeline_executor_service import TimelineExecutorService
+
+
+class TestEventWaiterTable:
+    """Tests for EventWaiterTable."""
+
+    async def test_correlated_waiter_resolves_only_on_match(self):
+        """Indexed waiters resolve on their correlation value only."""
+        table = EventWaiterTable()
+        first = table.add("topic", {"clip_id": "a"})
+        second = table.add("topic", {"clip_id": "b"})
+
+        assert table.dispatch("topic", {"clip_id": "b", "n": 1}) == 1
+        assert second.future.result() == {"clip_id": "b", "n": 1}
+        assert not first.future.done()
+        assert len(table) == 1
+
+    async def test_predicate_and_extra_match_fields(self):
+        """Every match field and the predicate must hold."""
+        table = EventWaiterTable()
+        waiter = table.add("topic", {"id": 1, "status": "done"}, predicate=lambda p: p["n"] > 2)
+
+        table.dispatch("topic", {"id": 1, "status": "running", "n": 5})
+        table.dispatch("topic", {"id": 1, "status": "done", "n": 1})
+        assert not waiter.future.done()
+
+        table.dispatch("topic", {"id": 1, "status": "done", "n": 3})
+        assert waiter.future.done()
+        assert len(table) == 0
+
+    async def test_discard_cancels_and_cleans_index(self):
+        """Discarded waiters stop receiving events and leave no index behind."""
+        table = EventWaiterTable()
+        waiter = table.add("topic", {"id": 1})
+        table.discard(waiter)
+        table.discard(waiter)
+
+        assert waiter.future.cancelled()
+        assert table.dispatch("topic", {"id": 1}) == 0
+        assert table._index_fields == {}
+
+
+class TestWaitForEventStep:
+    """Tests for wait_for_event steps and the speak path."""
+
+    @pytest.fixture
+    async def service(self):
+        service = TimelineExecutorService(AsyncIOEventEmitter(), {"ducking_ack_timeout": 0.2})
+        service._loop = asyncio.get_running_loop()
+        await service._setup_subscriptions()
+        return service
+
+    async def test_wait_for_event_step_matches_payload(self, service):
+        """The step completes when a matching event is emitted."""
+        task = asyncio.create_task(service._execute_step({
+            "step_type": "wait_for_event",
+            "topic": "SPEECH_CACHE_PLAYBACK_COMPLETED",
+            "match": {"playback_id": "p2"},
+            "timeout": 1.0,
+        }, "plan"))
+        await asyncio.sleep(0)
+
+        service._event_bus.emit(EventTopics.SPEECH_CACHE_PLAYBACK_COMPLETED, {"playback_id": "p1"})
+        await asyncio.sleep(0)
+        assert not task.done()
+
+        service._event_bus.emit(EventTopics.SPEECH_CACHE_PLAYBACK_COMPLETED, {"playback_id": "p2"})
+        success, details = await asyncio.wait_for(task, 1.0)
+        assert success
+        assert details["topic"] == "SPEECH_CACHE_PLAYBACK_COMPLETED"
+
+    async def test_wait_for_event_step_timeout(self, service):
+        """Timeouts fail the step unless fail_on_timeout is off."""
+        step = {"step_type": "wait_for_event", "topic": "custom.topic", "timeout": 0.01}
+        success, details = await service._execute_step(step, "plan")
+        assert not success
+        assert details["error"] == "Timeout waiting for event"
+
+        success, details = await service._execute_step({**step, "fail_on_timeout": False}, "plan")
+        assert success and details["timed_out"]
+        assert len(service._waiters) == 0
+
+    async def test_speak_step_waits_on_ack_and_completion(self, service):
+        """The speak path proceeds on the ducking ack and playback-finished events, not fixed sleeps."""
+        bus = service._event_bus
+        service._current_music_playing = True
+        bus.on(EventTopics.AUDIO_DUCKING_START, lambda p: bus.emit(
+            EventTopics.AUDIO_DUCKING_APPLIED, {"duck_id": p["duck_id"], "ducked": True}
+        ))
+        bus.on(EventTopics.TTS_GENERATE_REQUEST, lambda p: bus.emit(
+            EventTopics.SPEECH_GENERATION_COMPLETE,
+            {"text": p["text"], "success": True, "clip_id": p["clip_id"], "audio_length_seconds": 0.0}
+        ))
+
+        start = time.perf_counter()
+        success, details = await service._execute_step({"step_type": "speak", "id": "s1", "text": "Hello"}, "plan")
+
+        assert success
+        assert details["speech_id"] == "s1"
+        assert time.perf_counter() - start < 0.1
+        assert len(service._waiters) == 0
@@ -0,0 +1,150 @@
+"""
+Test cases for plan compilation and registry dispatch in TimelineExecutorService
+"""
+
+import asyncio
+import uuid
+
+import pytest
+from pyee.asyncio import AsyncIOEventEmitter
+
+from cantina_os.core.event_schemas import MusicDuckStep, PlayCachedSpeechStep
+from cantina_os.core.event_topics import EventTopics
+from cantina_os.event_payloads import PlanStep
+from cantina_os.services.timeline_executor_service.plan_compiler import PlanValidationError, StepRegistry
+from cantina_os.services.timeline_executor_service.timeline_executor_service import TimelineExecutorService
+
+
+async def ok_handler(step, plan_id):
+    return True, {}
+
+
+class TestStepRegistry:
+    """Tests for StepRegistry.compile_plan."""
+
+    def test_dict_steps_become_models(self):
+        """Dict steps are validated into their registered models once."""
+        registry = StepRegistry()
+        registry.register("play_cached_speech", ok_handler, model=PlayCachedSpeechStep)
+        registry.register("music_duck", ok_handler, model=MusicDuckStep)
+
+        plan = registry.compile_plan("p1", [
+            {"step_type": "music_duck", "duck_level": 0.2},
+            {"step_type": "play_cached_speech", "cache_key": "abc"},
+        ])
+
+        assert isinstance(plan.steps[0].step, MusicDuckStep)
+        assert plan.steps[0].step.duck_level == 0.2
+        assert plan.steps[1].step_id == "abc"
+        assert all(s.handler is ok_handler for s in plan.steps)
+
+    def test_collects_all_errors(self):
+        """Every invalid step is reported before execution."""
+        registry = StepRegistry()
+        registry.register("speak", ok_handler, required_fields=("text",))
+        registry.register("play_cached_speech", ok_handler, model=PlayCachedSpeechStep)
+
+        with pytest.raises(PlanValidationError) as exc:
+            registry.compile_plan("p1", [
+                {"step_type": "speak"},
+                {"step_type": "play_cached_speech"},
+                {"step_type": "teleport"},
+                {"text": "no type"},
+            ])
+
+        assert len(exc.value.errors) == 4
+        assert "unknown step type 'teleport'" in exc.value.errors[2]
+
+    def test_container_children_are_compiled(self):
+        """Nested steps of container types are compiled and validated too."""
+        registry = StepRegistry()
+        registry.register("speak", ok_handler, required_fields=("text",))
+        registry.register("parallel_steps", ok_handler, container=True)
+
+        plan = registry.compile_plan("p1", [
+            {"step_type": "parallel_steps", "steps": [{"step_type": "speak", "text": "hi"}]},
+        ])
+        parallel = plan.steps[0]
+        assert parallel.children[0].step["text"] == "hi"
+        assert parallel.handler_arg is parallel
+
+        with pytest.raises(PlanValidationError):
+            registry.compile_plan("p2", [
+                {"step_type": "parallel_steps", "steps": [{"step_type": "speak"}]},
+            ])
+
+
+    def test_delay_steps_have_no_post_delay(self):
+        """Delay steps wait in their handler only; other steps keep their post-step delay."""
+        registry = StepRegistry()
+        registry.register("delay", ok_handler)
+        registry.register("speak", ok_handler)
+
+        plan = registry.compile_plan("p1", [
+            PlanStep(id="d", type="delay", delay=0.5),
+            PlanStep(id="s", type="speak", text="hi", delay=0.25),
+        ])
+        assert plan.steps[0].post_delay is None
+        assert plan.steps[1].post_delay == 0.25
+
+
+class TestTimelineExecutorDispatch:
+    """Tests for compiled dispatch in TimelineExecutorService."""
+
+    @pytest.fixture
+    async def service(self):
+        bus = AsyncIOEventEmitter()
+        service = TimelineExecutorService(bus)
+        service._loop = asyncio.get_running_loop()
+        return service
+
+    async def test_custom_step_type_runs_from_plan_ready(self, service):
+        """A registered step type executes without touching the dispatcher."""
+        calls = []
+        ended = asyncio.Event()
+
+        async def wave(step, plan_id):
+            calls.append((step["arm"], plan_id))
+            return True, {"waved": True}
+
+        service.register_step_type("wave", wave, required_fields=("arm",))
+        service._event_bus.on(EventTopics.PLAN_ENDED, lambda p: ended.set())
+
+        plan_id = str(uuid.uuid4())
+        await service._handle_plan_ready({
+            "plan_id": plan_id,
+            "plan": {"plan_id": plan_id, "steps": [{"step_type": "wave", "arm": "left"}]},
+        })
+        await asyncio.wait_for(ended.wait(), 1.0)
+
+        assert calls == [("left", plan_id)]
+        metrics = service.get_plan_metrics()
+        assert metrics["plans_executed"] == 1
+        assert metrics["last_start_latency_ms"] >= 0.0
+
+    async def test_invalid_plan_does_not_interrupt_running_plan(self, service):
+        """An invalid plan is rejected before the current layer task is cancelled."""
+        statuses = []
+        service._event_bus.on(EventTopics.PLAN_ENDED, lambda p: statuses.append(p["status"]))
+        running = asyncio.create_task(asyncio.sleep(10))
+        service._layer_tasks["foreground"] = running
+
+        await service._handle_plan_ready({
+            "plan_id": "bad",
+            "plan": {"plan_id": "bad", "steps": [{"step_type": "play_cached_speech"}]},
+        })
+        await asyncio.sleep(0)
+
+        assert not running.cancelled()
+        assert statuses == ["failed"]
+        assert service.get_plan_metrics()["plans_rejected"] == 1
+        running.cancel()
+
+    async def test_execute_step_accepts_raw_steps(self, service):
+        """Raw dict steps passed to _execute_step are compiled on the fly."""
+        success, details = await service._execute_step({"step_type": "delay", "duration": 0}, "p1")
+        assert success
+
+        success, details = await service._execute_step({"step_type": "nope"}, "p1")
+        assert not success
+        assert "unknown step type" in details["error"]
@@ -0,0 +1,99 @@
+"""
+Test cases for look-ahead speech prefetch in TimelineExecutorService
+"""
+
+import asyncio
+
+import pytest
+from pyee.asyncio import AsyncIOEventEmitter
+
+from cantina_os.core.event_topics import EventTopics
+from cantina_os.services.timeline_executor_service.timeline_executor_service import TimelineExecutorService
+
+
+class StubSpeechServices:
+    """Answers TTS and speech cache requests the way ElevenLabs/CachedSpeechService do."""
+
+    def __init__(self, bus, render_delay=0.01):
+        self.bus = bus
+        self.render_delay = render_delay
+        self.live_tts = []
+        self.cached_playbacks = []
+        self.cleaned = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        bus.on(EventTopics.TTS_GENERATE_REQUEST, self._tts)
+        bus.on(EventTopics.SPEECH_CACHE_REQUEST, self._render)
+        bus.on(EventTopics.SPEECH_CACHE_PLAYBACK_REQUEST, self._play)
+        bus.on(EventTopics.SPEECH_CACHE_CLEANUP, lambda p: self.cleaned.extend(p["keys"]))
+
+    def _tts(self, payload):
+        self.live_tts.append(payload["text"])
+        self.bus.emit(EventTopics.SPEECH_GENERATION_COMPLETE, {
+            "text": payload["text"], "success": True, "clip_id": payload["clip_id"], "audio_length_seconds": 0.0,
+        })
+
+    async def _render(self, payload):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.render_delay)
+        self.in_flight -= 1
+        self.bus.emit(EventTopics.SPEECH_CACHE_READY, {
+            "cache_key": payload["cache_key"], "duration_ms": 1000, "size_bytes": 10, "metadata": payload["metadata"],
+        })
+
+    def _play(self, payload):
+        self.cached_playbacks.append(payload["cache_key"])
+        self.bus.emit(EventTopics.SPEECH_CACHE_PLAYBACK_COMPLETED, {
+            "cache_key": payload["cache_key"], "playback_id": payload["playback_id"],
+        })
+
+
+class TestSpeechPrefetch:
+    """Tests for look-ahead prefetch of speak steps."""
+
+    @pytest.fixture
+    async def service(self):
+        service = TimelineExecutorService(AsyncIOEventEmitter(), {"speech_prefetch_concurrency": 1})
+        service._loop = asyncio.get_running_loop()
+        await service._setup_subscriptions()
+        return service
+
+    async def run_plan(self, service, steps):
+        ended = asyncio.Event()
+        service._event_bus.on(EventTopics.PLAN_ENDED, lambda p: ended.set())
+        await service._handle_plan_ready({"plan_id": "p", "plan": {"plan_id": "p", "steps": steps}})
+        await asyncio.wait_for(ended.wait(), 2.0)
+
+    async def test_upcoming_speak_steps_play_from_cache(self, service):
+        """The first line streams live; later lines are pre-rendered and played from cache."""
+        stubs = StubSpeechServices(service._event_bus)
+
+        await self.run_plan(service, [
+            {"step_type": "speak", "id": "a", "text": "one"},
+            {"step_type": "speak", "id": "b", "text": "two"},
+            {"step_type": "speak", "id": "c", "text": "three"},
+        ])
+
+        assert stubs.live_tts == ["one"]
+        assert len(stubs.cached_playbacks) == 2
+        assert sorted(stubs.cleaned) == sorted(stubs.cached_playbacks)
+        assert stubs.max_in_flight == 1
+        assert service.get_plan_metrics()["speech_prefetch_hits"] == 2
+
+    async def test_failed_render_falls_back_to_live_tts(self, service):
+        """A render error leaves the step on the live TTS path."""
+        stubs = StubSpeechServices(service._event_bus)
+        service._event_bus.remove_all_listeners(EventTopics.SPEECH_CACHE_REQUEST)
+        service._event_bus.on(EventTopics.SPEECH_CACHE_REQUEST, lambda p: service._event_bus.emit(
+            EventTopics.SPEECH_CACHE_ERROR, {"cache_key": p["cache_key"], "error": "boom"}
+        ))
+
+        await self.run_plan(service, [
+            {"step_type": "music_unduck", "fade_duration_ms": 0},
+            {"step_type": "speak", "id": "b", "text": "two"},
+        ])
+
+        assert stubs.live_tts == ["two"]
+        assert stubs.cached_playbacks == []
+        assert service.get_plan_metrics()["speech_prefetch_misses"] == 1
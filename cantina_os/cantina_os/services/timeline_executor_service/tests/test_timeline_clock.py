@@ -0,0 +1,103 @@
+"""
+Test cases for the timeline clock and deadline-scheduled plan steps
+"""
+
+import asyncio
+
+import pytest
+from pyee.asyncio import AsyncIOEventEmitter
+
+from cantina_os.core.event_topics import EventTopics
+from cantina_os.services.timeline_executor_service.timeline_clock import TimelineClock, summarize_errors
+from cantina_os.services.timeline_executor_service.timeline_executor_service import TimelineExecutorService
+
+
+class TestTimelineClock:
+    """Tests for TimelineClock."""
+
+    async def test_absolute_deadlines_do_not_drift(self):
+        """Lateness on one wake-up is not carried into the next deadline."""
+        clock = TimelineClock()
+        anchor = clock.now()
+
+        for i in range(1, 21):
+            error = await clock.sleep_until(anchor + i * 0.005)
+            assert error >= 0
+
+        assert clock.now() - (anchor + 0.1) < 0.01
+
+    async def test_past_deadline_returns_immediately(self):
+        """A deadline already passed reports its lateness without sleeping."""
+        clock = TimelineClock(time_fn=lambda: 10.0)
+        assert await clock.sleep_until(9.5) == pytest.approx(0.5)
+
+    async def test_spin_is_capped_at_spin_window(self, monkeypatch):
+        """A large learned wake bias moves the coarse sleep earlier but never lengthens the spin."""
+        now = [0.0]
+        yields = []
+
+        async def fake_sleep(delay):
+            # Yields cost 0.1 ms; real sleeps oversleep by 20 ms
+            now[0] += 0.0001 if delay == 0 else delay + 0.02
+            if delay == 0:
+                yields.append(now[0])
+
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+        clock = TimelineClock(time_fn=lambda: now[0], spin_window=0.002)
+        clock.wake_bias = 0.02
+
+        for deadline in (1.0, 1.021, 2.0):
+            yields.clear()
+            await clock.sleep_until(deadline)
+            assert len(yields) <= 21  # spin_window / 0.1 ms
+            assert not yields or yields[0] >= deadline - 0.002
+
+    def test_summarize_errors(self):
+        """Errors are summarized in milliseconds."""
+        summary = summarize_errors([0.001, 0.002, 0.003, 0.010])
+        assert summary["count"] == 4
+        assert summary["mean_ms"] == pytest.approx(4.0)
+        assert summary["max_ms"] == pytest.approx(10.0)
+        assert summarize_errors([])["count"] == 0
+
+
+class TestScheduledSteps:
+    """Tests for offsets and delays scheduled on the timeline clock."""
+
+    @pytest.fixture
+    async def service(self):
+        service = TimelineExecutorService(AsyncIOEventEmitter())
+        service._loop = asyncio.get_running_loop()
+        return service
+
+    async def test_parallel_offsets_start_from_shared_anchor(self, service):
+        """Sub-steps start at anchor + offset and their lateness is recorded."""
+        starts = {}
+
+        async def mark(step, plan_id):
+            starts[step["name"]] = service._clock.now()
+            return True, {}
+
+        service.register_step_type("mark", mark)
+        ended = asyncio.Event()
+        service._event_bus.on(EventTopics.PLAN_ENDED, lambda p: ended.set())
+
+        await service._handle_plan_ready({"plan_id": "p", "plan": {"plan_id": "p", "steps": [
+            {"step_type": "parallel_steps", "steps": [
+                {"step_type": "mark", "name": "now"},
+                {"step_type": "mark", "name": "later", "offset": 0.05},
+            ]},
+            {"step_type": "delay", "duration": 0.02},
+        ]}})
+        await asyncio.wait_for(ended.wait(), 1.0)
+
+        assert starts["later"] - starts["now"] == pytest.approx(0.05, abs=0.015)
+        metrics = service.get_plan_metrics()
+        assert metrics["max_schedule_error_ms"] < 15.0
+        assert "p" not in service._schedule_errors
+
+    async def test_negative_offset_is_rejected(self, service):
+        """Invalid offsets fail plan validation."""
+        with pytest.raises(Exception) as exc:
+            service._step_registry.compile_plan("p", [{"step_type": "delay", "duration": 0, "offset": -1}])
+        assert "offset" in str(exc.value)
@@ -0,0 +1,96 @@
+"""
+Timeline clock for the Timeline Executor Service
+================================================
+Schedules timed steps against absolute deadlines on a monotonic clock rather
+than chaining relative ``asyncio.sleep`` calls, so lateness on one step is
+not carried into the next. Wake-ups are compensated: the clock sleeps
+coarsely until shortly before the deadline (minus the oversleep it has
+observed recently) and yields to the loop for the last couple of
+milliseconds. The yielding never covers more than ``spin_window``, since
+it runs on the loop every service shares.
+
+The time source is pluggable so an audio-device clock can be used instead of
+``time.monotonic``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from typing import Callable, Dict, List
+
+
+class TimelineClock:
+    """Monotonic clock with absolute-deadline sleeps."""
+
+    def __init__(
+        self,
+        time_fn: Callable[[], float] = time.monotonic,
+        spin_window: float = 0.002,
+        max_wake_bias: float = 0.02,
+        bias_adapt_rate: float = 0.2,
+    ):
+        """Initialize the clock.
+
+        Args:
+            time_fn: Time source in seconds (monotonic, or an audio stream clock)
+            spin_window: Final stretch (s) covered by yielding instead of sleeping
+            max_wake_bias: Cap on the learned oversleep compensation (s)
+            bias_adapt_rate: EMA rate for the learned oversleep
+        """
+        self._time_fn = time_fn
+        self._spin_window = spin_window
+        self._max_wake_bias = max_wake_bias
+        self._bias_adapt_rate = bias_adapt_rate
+        self.wake_bias = 0.0  # Typical oversleep of asyncio.sleep on this loop
+
+    def now(self) -> float:
+        """Current clock time in seconds."""
+        return self._time_fn()
+
+    async def sleep_until(self, deadline: float) -> float:
+        """Sleep until ``deadline`` (clock time).
+
+        Returns:
+            Scheduling error in seconds: how late the wake-up was (>= 0)
+        """
+        while True:
+            remaining = deadline - self._time_fn()
+            if remaining <= 0:
+                break
+            if remaining <= self._spin_window:
+                await asyncio.sleep(0)
+                continue
+            coarse = remaining - self._spin_window - self.wake_bias
+            if coarse > 0:
+                before = self._time_fn()
+                await asyncio.sleep(coarse)
+                oversleep = (self._time_fn() - before) - coarse
+                self._learn_bias(oversleep)
+            else:
+                # Inside the bias margin: a short real sleep, not a longer spin
+                await asyncio.sleep(remaining - self._spin_window)
+        return self._time_fn() - deadline
+
+    async def sleep_for(self, duration: float) -> float:
+        """Sleep for ``duration`` seconds from now; returns the scheduling error."""
+        return await self.sleep_until(self._time_fn() + max(0.0, duration))
+
+    def _learn_bias(self, oversleep: float) -> None:
+        bias = self.wake_bias + self._bias_adapt_rate * (oversleep - self.wake_bias)
+        self.wake_bias = min(max(bias, 0.0), self._max_wake_bias)
+
+
+def summarize_errors(errors: List[float]) -> Dict[str, float]:
+    """Summarize scheduling errors (seconds) in milliseconds."""
+    if not errors:
+        return {"count": 0, "mean_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+    ordered = sorted(errors)
+    p95 = ordered[min(len(ordered) - 1, math.ceil(0.95 * len(ordered)) - 1)]
+    return {
+        "count": len(ordered),
+        "mean_ms": sum(ordered) * 1000.0 / len(ordered),
+        "p95_ms": p95 * 1000.0,
+        "max_ms": ordered[-1] * 1000.0,
+    }
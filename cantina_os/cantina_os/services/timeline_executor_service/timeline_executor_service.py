@@ -9,6 +9,8 @@ ambient, foreground, and override.
 from __future__ import annotations
 
 import asyncio
+import functools
+import logging
 import time
 import uuid
 from typing import Any, Callable, Dict, List, Optional, Set, Union
@@ -25,6 +27,7 @@ from cantina_os.core.event_schemas import (
     MusicDuckStep, # Add import for music duck step
     MusicUnduckStep, # Add import for music unduck step
     ParallelSteps, # Add import for parallel steps
+    WaitForEventStep,
     SpeechCachePlaybackRequestPayload, # For playing cached speech
     BasePlanStep, # Base for new step types
     EventPayload, # Base for PlanReadyPayload
@@ -42,9 +45,20 @@ from cantina_os.event_payloads import (
     SpeechGenerationCompletePayload, # Keep for legacy speak step
     BaseEventPayload, # Base for old payloads
     SpeechCachePlaybackCompletedPayload, # Added for new completion event
+    SpeechCacheRequestPayload, # For look-ahead speech prefetch
 )
 from cantina_os.models.music_models import MusicTrack, MusicLibrary
 
+from .event_waiters import EventWaiter, EventWaiterTable
+from .timeline_clock import TimelineClock, summarize_errors
+from .plan_compiler import (
+    CompiledPlan,
+    CompiledStep,
+    PlanValidationError,
+    StepHandler,
+    StepRegistry,
+)
+
 # ---------------------------------------------------------------------------
 # Configuration model
 # ---------------------------------------------------------------------------
@@ -53,6 +67,12 @@ class _Config(BaseModel):
     default_ducking_level: float = 0.5  # Default ducking level (0.0-1.0) - Updated to 50%
     ducking_fade_ms: int = 500  # Fade time in ms for ducking - Updated for longer transitions
     speech_wait_timeout: float = 25.0  # Timeout for waiting for speech to complete (increased from 10.0 to handle long commentary)
+    ducking_ack_timeout: float = 0.5  # Max wait for MusicController to acknowledge a ducking change
+    wait_for_event_timeout: float = 30.0  # Default timeout for wait_for_event steps
+    speech_prefetch_enabled: bool = True  # Pre-render upcoming speak steps through CachedSpeechService
+    speech_prefetch_lookahead: int = 2  # Number of upcoming plan steps scanned for speak steps
+    speech_prefetch_concurrency: int = 2  # Max prefetch renders in flight
+    schedule_spin_ms: float = 2.0  # Final stretch before a deadline covered by yielding instead of sleeping
     layer_priorities: Dict[str, int] = {
         "ambient": 0,     # Lowest priority
         "foreground": 1,  # User-initiated content
@@ -81,7 +101,7 @@ class TimelineExecutorService(BaseService):
         
         # ----- timeline state -----
         self._layer_tasks: Dict[str, asyncio.Task] = {}  # Tasks running plans on each layer
-        self._active_plans: Dict[str, DjTransitionPlanPayload] = {}  # Currently active plans by ID
+        self._active_plans: Dict[str, CompiledPlan] = {}  # Currently active plans by ID
         self._timeline_layers: Dict[str, str] = {}  # Maps plan_id -> layer (Legacy? Or needed for paused plans?)
         self._paused_timelines: Dict[str, DjTransitionPlanPayload] = {}  # For resuming after interrupts
         
@@ -100,6 +120,33 @@ class TimelineExecutorService(BaseService):
         self._current_music_playing: bool = False
         self._active_speech_playbacks: Set[str] = set() # Track active cached speech playback IDs
 
+        # ----- event waiters (wait_for_event steps, ducking acks, speech completion) -----
+        self._waiters = EventWaiterTable()
+        self._waiter_topics: Set[Any] = set()
+
+        # ----- look-ahead speech prefetch -----
+        self._speech_prefetches: Dict[str, Dict[int, asyncio.Task]] = {}  # plan_id -> id(step) -> task resolving to cache_key
+        self._prefetch_semaphore = asyncio.Semaphore(max(1, self._config.speech_prefetch_concurrency))
+
+        # ----- timing -----
+        self._clock = TimelineClock(spin_window=self._config.schedule_spin_ms / 1000.0)
+        self._schedule_errors: Dict[str, List[float]] = {}  # plan_id -> wake-up lateness (s) of timed waits
+
+        # ----- step dispatch -----
+        self._step_registry = StepRegistry()
+        self._register_builtin_step_types()
+        self._plan_metrics: Dict[str, Any] = {
+            "plans_executed": 0,
+            "plans_rejected": 0,
+            "last_start_latency_ms": 0.0,
+            "last_step_overhead_ms": 0.0,
+            "max_step_overhead_ms": 0.0,
+            "speech_prefetch_hits": 0,
+            "speech_prefetch_misses": 0,
+            "last_schedule_error_ms": 0.0,
+            "max_schedule_error_ms": 0.0,
+        }
+
     # ------------------------------------------------------------------
     # Helper methods
     # ------------------------------------------------------------------
@@ -162,6 +209,10 @@ class TimelineExecutorService(BaseService):
         self._cached_speech_playback_events.clear()
         self._crossfade_complete_events.clear()
         self._active_speech_playbacks.clear()
+        self._waiters.cancel_all()
+        self._waiter_topics.clear()
+        self._speech_prefetches.clear()
+        self._schedule_errors.clear()
 
         await self._emit_status(ServiceStatus.STOPPED, "Timeline execution service stopped")
 
@@ -199,14 +250,105 @@ class TimelineExecutorService(BaseService):
         # Subscribe to MusicController crossfade complete event
         await self.subscribe(EventTopics.CROSSFADE_COMPLETE, self._handle_crossfade_complete)
 
+        # Waiter-backed topics used by the speak path
+        await self._ensure_waiter_subscription(EventTopics.AUDIO_DUCKING_APPLIED)
+        await self._ensure_waiter_subscription(EventTopics.SPEECH_GENERATION_COMPLETE)
+
+    # ------------------------------------------------------------------
+    # Event waiters
+    # ------------------------------------------------------------------
+    async def _ensure_waiter_subscription(self, topic: Any) -> None:
+        """Feed a topic into the waiter table (subscribed once per topic)."""
+        if topic in self._waiter_topics:
+            return
+        self._waiter_topics.add(topic)
+        # Plain function handler: pyee calls it synchronously, so waiters resolve
+        # in the same loop iteration the event is emitted
+        await self.subscribe(topic, functools.partial(self._waiters.dispatch, topic))
+
+    async def _add_waiter(
+        self,
+        topic: Any,
+        match: Optional[Dict[str, Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> EventWaiter:
+        """Register a waiter. Call before emitting the event that triggers the reply."""
+        await self._ensure_waiter_subscription(topic)
+        return self._waiters.add(topic, match, predicate)
+
+    async def _await_waiter(self, waiter: EventWaiter, timeout: Optional[float]) -> Dict[str, Any]:
+        """Wait for a registered waiter to resolve.
+
+        Raises:
+            asyncio.TimeoutError: If no matching event arrives in time
+        """
+        try:
+            return await asyncio.wait_for(waiter.future, timeout=timeout)
+        finally:
+            self._waiters.discard(waiter)
+
+    async def wait_for_event(
+        self,
+        topic: Any,
+        match: Optional[Dict[str, Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Wait for the next event on ``topic`` matching ``match``/``predicate``.
+
+        Raises:
+            asyncio.TimeoutError: If no matching event arrives in time
+        """
+        waiter = await self._add_waiter(topic, match, predicate)
+        return await self._await_waiter(waiter, timeout)
+
+    @staticmethod
+    def _resolve_topic(topic: str) -> Any:
+        """Map a topic value or EventTopics name to its EventTopics member (custom topics pass through)."""
+        try:
+            return EventTopics(topic)
+        except ValueError:
+            pass
+        try:
+            return EventTopics[topic]
+        except KeyError:
+            return topic
+
+    async def _set_ducking(self, ducked: bool, level: Optional[float] = None, fade_ms: Optional[int] = None) -> bool:
+        """Duck or unduck the music and wait for MusicController to acknowledge it.
+
+        Returns:
+            True if the change was acknowledged within ``ducking_ack_timeout``
+        """
+        duck_id = str(uuid.uuid4())
+        fade_ms = self._config.ducking_fade_ms if fade_ms is None else fade_ms
+        waiter = await self._add_waiter(EventTopics.AUDIO_DUCKING_APPLIED, {"duck_id": duck_id})
+
+        if ducked:
+            level = self._config.default_ducking_level if level is None else level
+            await self.emit(EventTopics.AUDIO_DUCKING_START, {"level": level, "fade_ms": fade_ms, "duck_id": duck_id})
+        else:
+            await self.emit(EventTopics.AUDIO_DUCKING_STOP, {"fade_ms": fade_ms, "duck_id": duck_id})
+        self._audio_ducked = ducked
+
+        try:
+            await self._await_waiter(waiter, self._config.ducking_ack_timeout)
+            return True
+        except asyncio.TimeoutError:
+            self.logger.debug(f"No ducking acknowledgement for {duck_id} within {self._config.ducking_ack_timeout}s")
+            return False
+
     # ------------------------------------------------------------------
     # Plan handling
     # ------------------------------------------------------------------
     async def _handle_plan_ready(self, payload: Dict[str, Any]) -> None:
         """Handle PLAN_READY events from Brain service.
         
-        This is the entry point for executing plans on different layers.
+        This is the entry point for executing plans on different layers. The plan
+        is compiled and validated here, before any running plan is cancelled, so
+        an invalid plan never interrupts the current one.
         """
+        received_at = time.perf_counter()
         self.logger.info(f"Received PLAN_READY event with payload keys: {list(payload.keys())}")
         
         try:
@@ -215,59 +357,10 @@ class TimelineExecutorService(BaseService):
             
             # Extract the nested plan data
             plan_data = plan_ready.plan
-            plan_id = plan_ready.plan_id
+            plan_id = plan_data.get('plan_id') or plan_ready.plan_id
             
             self.logger.info(f"Processing plan {plan_id} with {len(plan_data.get('steps', []))} steps")
             
-            # The plan_data is a dict containing the DjTransitionPlanPayload structure
-            # We need to convert the steps back to proper Pydantic models
-            raw_steps = plan_data.get('steps', [])
-            converted_steps = []
-            
-            for step_dict in raw_steps:
-                step_type = step_dict.get('step_type')
-                self.logger.debug(f"Converting step of type: {step_type}")
-                
-                if step_type == 'speak':
-                    # Leave speak steps as dictionaries - _execute_speak_step handles this format
-                    step_obj = step_dict
-                elif step_type == 'play_cached_speech':
-                    step_obj = PlayCachedSpeechStep(**step_dict)
-                elif step_type == 'music_crossfade':
-                    step_obj = MusicCrossfadeStep(**step_dict)
-                elif step_type == 'music_duck':
-                    step_obj = MusicDuckStep(**step_dict)
-                elif step_type == 'music_unduck':
-                    step_obj = MusicUnduckStep(**step_dict)
-                elif step_type == 'parallel_steps':
-                    # Convert nested steps recursively
-                    nested_steps = []
-                    for nested_dict in step_dict.get('steps', []):
-                        nested_type = nested_dict.get('step_type')
-                        if nested_type == 'speak':
-                            nested_steps.append(nested_dict)  # Leave as dict
-                        elif nested_type == 'play_cached_speech':
-                            nested_steps.append(PlayCachedSpeechStep(**nested_dict))
-                        elif nested_type == 'music_crossfade':
-                            nested_steps.append(MusicCrossfadeStep(**nested_dict))
-                        elif nested_type == 'music_duck':
-                            nested_steps.append(MusicDuckStep(**nested_dict))
-                        elif nested_type == 'music_unduck':
-                            nested_steps.append(MusicUnduckStep(**nested_dict))
-                        else:
-                            nested_steps.append(nested_dict)  # Leave unknown as dict
-                    step_obj = ParallelSteps(step_type='parallel_steps', steps=nested_steps)
-                else:
-                    # For unknown step types, leave as dictionary 
-                    step_obj = step_dict
-                converted_steps.append(step_obj)
-            
-            # Create DjTransitionPlanPayload with converted steps
-            dj_plan = DjTransitionPlanPayload(
-                plan_id=plan_data['plan_id'],
-                steps=converted_steps
-            )
-            
             # Default to foreground layer for DJ plans
             layer = "foreground"
             
@@ -275,6 +368,15 @@ class TimelineExecutorService(BaseService):
             if layer not in self._config.layer_priorities:
                 raise ValueError(f"Unknown layer: {layer}")
             
+            # Compile once: normalise steps, resolve handlers, reject invalid plans
+            try:
+                plan = self._step_registry.compile_plan(
+                    plan_id, plan_data.get('steps', []), layer=layer, received_at=received_at
+                )
+            except PlanValidationError as e:
+                await self._reject_plan(plan_id, layer, e)
+                return
+            
             self.logger.info(f"Starting plan {plan_id} on layer {layer}")
             
             # Check for existing plan on this layer and manage layer priorities
@@ -293,22 +395,13 @@ class TimelineExecutorService(BaseService):
             elif layer == "foreground":
                 await self._pause_lower_priority_layers(layer)
             
-            # Start the new plan
-            self._active_plans[dj_plan.plan_id] = dj_plan
-            task = asyncio.create_task(self._run_plan(dj_plan, layer))
+            # Start the new plan (PLAN_STARTED is emitted by _run_plan)
+            self._active_plans[plan.plan_id] = plan
+            task = asyncio.create_task(self._run_plan(plan, layer))
             self._layer_tasks[layer] = task
             self._tasks.append(task)
             
             self.logger.info(f"Successfully started plan {plan_id} execution task")
-            
-            # Emit plan started event
-            await self._emit_dict(
-                EventTopics.PLAN_STARTED,
-                PlanStartedPayload(
-                    plan_id=dj_plan.plan_id,
-                    layer=layer
-                )
-            )
         except ValidationError as e:
             self.logger.error(f"Validation error parsing PLAN_READY payload: {e}")
             await self._emit_status(
@@ -324,53 +417,80 @@ class TimelineExecutorService(BaseService):
                 LogLevel.ERROR
             )
 
-    async def _run_plan(self, plan: DjTransitionPlanPayload, layer: str) -> None:
+    async def _reject_plan(self, plan_id: str, layer: str, error: PlanValidationError) -> None:
+        """Report a plan that failed validation without starting it."""
+        self._plan_metrics["plans_rejected"] += 1
+        self.logger.error(f"Rejected plan {plan_id}: {error}")
+        await self._emit_status(
+            ServiceStatus.ERROR,
+            f"Invalid plan {plan_id}: {'; '.join(error.errors)}",
+            LogLevel.ERROR
+        )
+        await self._emit_dict(
+            EventTopics.PLAN_ENDED,
+            PlanEndedPayload(plan_id=plan_id, layer=layer, status="failed")
+        )
+
+    def _compile(self, plan: Union[CompiledPlan, DjTransitionPlanPayload], layer: str) -> CompiledPlan:
+        """Return a compiled plan, compiling uncompiled plans on the spot."""
+        if isinstance(plan, CompiledPlan):
+            return plan
+        return self._step_registry.compile_plan(
+            plan.plan_id, plan.steps, layer=layer, received_at=time.perf_counter()
+        )
+
+    async def _run_plan(self, plan: Union[CompiledPlan, DjTransitionPlanPayload], layer: str) -> None:
         """Executes a given timeline plan.
 
         Args:
-            plan: The DjTransitionPlanPayload containing the steps to execute.
+            plan: The compiled plan (or a DjTransitionPlanPayload, compiled here).
             layer: The layer this plan is running on.
         """
+        try:
+            plan = self._compile(plan, layer)
+        except PlanValidationError as e:
+            await self._reject_plan(plan.plan_id, layer, e)
+            return
+
         self.logger.info(f"Running plan {plan.plan_id} on layer {layer}")
         self._active_plans[plan.plan_id] = plan
 
         await self._emit_dict(EventTopics.PLAN_STARTED, PlanStartedPayload(plan_id=plan.plan_id, layer=layer))
 
+        # Executor time spent around handlers (events, dispatch, bookkeeping)
+        overheads: List[float] = []
+
         try:
             # Wait for the layer to be ready (not paused)
             await self._layer_events[layer].wait()
 
+            start_latency_ms = (time.perf_counter() - plan.received_at) * 1000.0
+            self._plan_metrics["last_start_latency_ms"] = start_latency_ms
+            await self.debug_performance_metric(
+                "plan_start_latency",
+                start_latency_ms,
+                "ms",
+                {"plan_id": plan.plan_id, "compile_ms": plan.compile_ms, "steps": len(plan.steps)}
+            )
+
             # Execute steps sequentially
-            for step in plan.steps:
-                # Get proper step ID and type
-                if hasattr(step, 'step_type'):
-                    step_type = step.step_type
-                    step_id = getattr(step, 'id', step_type)  # Use step ID if available, fallback to type
-                elif isinstance(step, PlayCachedSpeechStep):
-                    step_type = "play_cached_speech"
-                    step_id = getattr(step, 'cache_key', step_type)  # Use cache_key as unique ID
-                elif isinstance(step, MusicCrossfadeStep):
-                    step_type = "music_crossfade"
-                    step_id = getattr(step, 'next_track_id', step_type)  # Use track ID as unique ID
-                elif isinstance(step, MusicDuckStep):
-                    step_type = "music_duck"
-                elif isinstance(step, MusicUnduckStep):
-                    step_type = "music_unduck"
-                elif isinstance(step, ParallelSteps):
-                    step_type = "parallel_steps"
-                else:
-                    step_type = getattr(step, 'step_type', 'unknown')
-                    step_id = getattr(step, 'id', step_type)
-                
-                self.logger.debug(f"Executing step {step_id} ({step_type}) for plan {plan.plan_id}")
+            for index, compiled in enumerate(plan.steps):
+                step_start = time.perf_counter()
+                step_id = compiled.step_id
+                self._schedule_speech_prefetch(plan, index)
+
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"Executing step {step_id} ({compiled.step_type}) for plan {plan.plan_id}")
                 await self._emit_dict(
                     EventTopics.STEP_READY,
                     StepReadyPayload(plan_id=plan.plan_id, step_id=step_id)
                 )
 
-                # Execute the step based on its parsed type
-                # The execute methods will now handle waiting for completion if necessary
-                step_success, step_details = await self._execute_step(step, plan.plan_id)
+                # The handlers handle waiting for completion if necessary
+                handler_start = time.perf_counter()
+                step_success, step_details = await self._execute_step(compiled, plan.plan_id)
+                handler_elapsed = time.perf_counter() - handler_start
+                finished_at = self._clock.now()
 
                 await self._emit_dict(
                     EventTopics.STEP_EXECUTED,
@@ -381,6 +501,7 @@ class TimelineExecutorService(BaseService):
                         details=step_details or {}
                     )
                 )
+                overheads.append(time.perf_counter() - step_start - handler_elapsed)
 
                 if not step_success:
                     self.logger.error(f"Step {step_id} failed for plan {plan.plan_id}.")
@@ -392,10 +513,12 @@ class TimelineExecutorService(BaseService):
                     )
                     return
 
-                # Handle delays within steps (if applicable) or explicit delay steps
-                delay = getattr(step, 'delay', None) or getattr(step, 'duration', None)
-                if delay and delay > 0:
-                    await asyncio.sleep(delay)
+                # Handle delays within steps (if applicable) or explicit delay steps.
+                # The deadline is anchored to when the step finished, so event
+                # emission above does not stretch the delay.
+                if compiled.post_delay and compiled.post_delay > 0:
+                    error = await self._clock.sleep_until(finished_at + compiled.post_delay)
+                    self._record_schedule_error(plan.plan_id, error)
 
             # Plan completed successfully
             self.logger.info(f"Plan {plan.plan_id} completed successfully on layer {layer}")
@@ -419,98 +542,150 @@ class TimelineExecutorService(BaseService):
         finally:
             # Clean up active plan entry
             self._active_plans.pop(plan.plan_id, None)
+            await self._release_speech_prefetches(plan.plan_id)
+            if overheads:
+                await self._report_step_overhead(plan, overheads)
+            await self._report_schedule_errors(plan.plan_id)
+
+    async def _report_step_overhead(self, plan: CompiledPlan, overheads: List[float]) -> None:
+        """Record and publish per-step executor overhead for a finished plan."""
+        avg_ms = sum(overheads) * 1000.0 / len(overheads)
+        max_ms = max(overheads) * 1000.0
+        self._plan_metrics["plans_executed"] += 1
+        self._plan_metrics["last_step_overhead_ms"] = avg_ms
+        self._plan_metrics["max_step_overhead_ms"] = max(self._plan_metrics["max_step_overhead_ms"], max_ms)
+        try:
+            await self.debug_performance_metric(
+                "plan_step_overhead",
+                avg_ms,
+                "ms",
+                {"plan_id": plan.plan_id, "max_ms": max_ms, "steps": len(overheads)}
+            )
+        except Exception as e:
+            self.logger.debug(f"Could not report step overhead: {e}")
+
+    def _record_schedule_error(self, plan_id: Optional[str], error: float) -> None:
+        """Record how late a timed wait woke up for a plan."""
+        self._schedule_errors.setdefault(plan_id or "", []).append(error)
+
+    async def _report_schedule_errors(self, plan_id: str) -> None:
+        """Publish scheduling error statistics for a finished plan."""
+        errors = self._schedule_errors.pop(plan_id, None)
+        if not errors:
+            return
+        summary = summarize_errors(errors)
+        self._plan_metrics["last_schedule_error_ms"] = summary["mean_ms"]
+        self._plan_metrics["max_schedule_error_ms"] = max(self._plan_metrics["max_schedule_error_ms"], summary["max_ms"])
+        try:
+            await self.debug_performance_metric(
+                "plan_schedule_error",
+                summary["mean_ms"],
+                "ms",
+                {"plan_id": plan_id, "p95_ms": summary["p95_ms"], "max_ms": summary["max_ms"],
+                 "waits": summary["count"], "wake_bias_ms": self._clock.wake_bias * 1000.0}
+            )
+        except Exception as e:
+            self.logger.debug(f"Could not report schedule error: {e}")
+
+    def get_plan_metrics(self) -> Dict[str, Any]:
+        """Return plan start latency / step overhead statistics."""
+        return dict(self._plan_metrics)
+
+    # ------------------------------------------------------------------
+    # Step registry
+    # ------------------------------------------------------------------
+    def _register_builtin_step_types(self) -> None:
+        """Register the step types this service executes out of the box."""
+        register = self._step_registry.register
+        register("speak", self._execute_speak_step, required_fields=("text",))
+        register("play_music", self._execute_play_music_step)
+        register("eye_pattern", self._execute_eye_pattern_step)
+        register("move", self._execute_move_step)
+        register("delay", self._execute_delay_step)
+        register("wait_for_event", self._execute_wait_for_event_step, model=WaitForEventStep)
+        register("play_cached_speech", self._execute_play_cached_speech_step, model=PlayCachedSpeechStep)
+        register("music_crossfade", self._execute_music_crossfade_step, model=MusicCrossfadeStep)
+        register("music_duck", self._execute_music_duck_step, model=MusicDuckStep)
+        register("music_unduck", self._execute_music_unduck_step, model=MusicUnduckStep)
+        register("parallel_steps", self._execute_parallel_steps, container=True)
+
+    def register_step_type(
+        self,
+        step_type: str,
+        handler: StepHandler,
+        model: Optional[type[BaseModel]] = None,
+        required_fields: tuple[str, ...] = (),
+        container: bool = False,
+    ) -> None:
+        """Register a custom step type.
+
+        Args:
+            step_type: Value of the step's ``step_type`` field
+            handler: Coroutine ``handler(step, plan_id) -> (success, details)``
+            model: Pydantic model dict steps are validated into, if any
+            required_fields: Fields that must be present on dict steps
+            container: Whether the step carries nested ``steps``
+        """
+        self._step_registry.register(step_type, handler, model, required_fields, container)
 
     # ------------------------------------------------------------------
     # Step execution
     # ------------------------------------------------------------------
-    async def _execute_step(self, step: BasePlanStep, plan_id: str) -> tuple[bool, Optional[Dict[str, Any]]]:
+    async def _execute_step(self, step: Union[CompiledStep, BasePlanStep, Dict[str, Any]], plan_id: str) -> tuple[bool, Optional[Dict[str, Any]]]:
         """Executes a single step within a plan.
 
         Args:
-            step: The BasePlanStep to execute (can be dict or Pydantic model).
+            step: A compiled step, or a raw dict/Pydantic step which is compiled first.
             plan_id: The ID of the plan this step belongs to.
 
         Returns:
             A tuple of (success: bool, details: Optional[Dict[str, Any]]).
         """
-        try:
-            # Handle both dictionary and Pydantic model formats
-            if isinstance(step, dict):
-                # Dictionary format (from new helper method)
-                step_type = step.get('step_type')
-                if not step_type:
-                    self.logger.error(f"Step dictionary missing step_type field: {list(step.keys())}")
-                    return False, {"error": "Missing step_type field"}
-                    
-                self.logger.debug(f"Executing dict step type: {step_type} with fields: {list(step.keys())}")
-            else:
-                # Pydantic model format - determine step type
-                if hasattr(step, 'step_type'):
-                    step_type = step.step_type
-                elif hasattr(step, 'type'):
-                    # Handle PlanStep which uses 'type' field instead of 'step_type'
-                    step_type = step.type
-                elif isinstance(step, PlayCachedSpeechStep):
-                    step_type = "play_cached_speech"
-                elif isinstance(step, MusicCrossfadeStep):
-                    step_type = "music_crossfade"
-                elif isinstance(step, MusicDuckStep):
-                    step_type = "music_duck"
-                elif isinstance(step, MusicUnduckStep):
-                    step_type = "music_unduck"
-                elif isinstance(step, ParallelSteps):
-                    step_type = "parallel_steps"
-                else:
-                    # Fallback: try to get from model fields
-                    step_type = getattr(step, 'step_type', getattr(step, 'type', 'unknown'))
-                
-                self.logger.debug(f"Executing Pydantic step type: {step_type} for plan {plan_id}")
-            
-            if step_type == "play_music":
-                return await self._execute_play_music_step(step)
-            elif step_type == "speak":
-                return await self._execute_speak_step(step, plan_id)
-            elif step_type == "eye_pattern":
-                return await self._execute_eye_pattern_step(step)
-            elif step_type == "move":
-                return await self._execute_move_step(step)
-            elif step_type == "play_cached_speech":
-                # Handle DJ mode cached speech step
-                return await self._execute_play_cached_speech_step(step)
-            elif step_type == "music_crossfade":
-                # Handle DJ mode crossfade step
-                return await self._execute_music_crossfade_step(step)
-            elif step_type == "music_duck":
-                # Handle DJ mode music ducking step
-                return await self._execute_music_duck_step(step)
-            elif step_type == "music_unduck":
-                # Handle DJ mode music unducking step
-                return await self._execute_music_unduck_step(step)
-            elif step_type == "parallel_steps":
-                # Handle parallel execution of multiple steps
-                return await self._execute_parallel_steps(step, plan_id)
-            elif step_type == "wait_for_event":
-                # TODO: Implement wait_for_event step logic
-                self.logger.warning(f"wait_for_event step type not yet implemented. Step: {step_type}")
-                return False, {"error": "Not implemented"}
-            elif step_type == "delay":
-                delay = getattr(step, 'duration', 0) if not isinstance(step, dict) else step.get('duration', 0)
-                await asyncio.sleep(delay or 0)
-                return True, {}
-            else:
-                self.logger.error(f"Unknown step type: {step_type} for step in plan {plan_id}")
-                return False, {"error": f"Unknown step type: {step_type}"}
+        if not isinstance(step, CompiledStep):
+            try:
+                step = self._step_registry.compile_step(step)
+            except PlanValidationError as e:
+                self.logger.error(f"Invalid step in plan {plan_id}: {e.errors}")
+                return False, {"error": "; ".join(e.errors)}
 
+        try:
+            return await step.handler(step.handler_arg, plan_id)
         except asyncio.CancelledError:
             raise # Propagate cancellation
         except Exception as e:
-            if isinstance(step, dict):
-                step_type = step.get('step_type', 'unknown')
-            else:
-                step_type = getattr(step, 'step_type', getattr(step, 'type', 'unknown'))
-            self.logger.error(f"Error executing step {step_type} for plan {plan_id}: {e}", exc_info=True)
+            self.logger.error(f"Error executing step {step.step_type} for plan {plan_id}: {e}", exc_info=True)
             return False, {"error": str(e)}
 
+    async def _execute_delay_step(self, step, plan_id: Optional[str] = None) -> tuple[bool, Dict[str, Any]]:
+        """Execute a delay step against the timeline clock (its only wait; no post-step delay is compiled)."""
+        if isinstance(step, dict):
+            delay = step.get('duration') or step.get('delay')
+        else:
+            delay = getattr(step, 'duration', None) or getattr(step, 'delay', None)
+        error = await self._clock.sleep_for(delay or 0)
+        self._record_schedule_error(plan_id, error)
+        return True, {"schedule_error_ms": error * 1000.0}
+
+    async def _execute_wait_for_event_step(self, step: WaitForEventStep, plan_id: Optional[str] = None) -> tuple[bool, Dict[str, Any]]:
+        """Execute a wait_for_event step: block until a matching event arrives or the timeout expires."""
+        topic = self._resolve_topic(step.topic)
+        timeout = step.timeout if step.timeout is not None else self._config.wait_for_event_timeout
+        start = time.perf_counter()
+        try:
+            payload = await self.wait_for_event(topic, step.match, step.predicate, timeout)
+        except asyncio.TimeoutError:
+            waited_ms = (time.perf_counter() - start) * 1000.0
+            self.logger.warning(f"wait_for_event timed out after {timeout}s waiting for {step.topic} in plan {plan_id}")
+            if step.fail_on_timeout:
+                return False, {"topic": step.topic, "waited_ms": waited_ms, "error": "Timeout waiting for event"}
+            return True, {"topic": step.topic, "waited_ms": waited_ms, "timed_out": True}
+
+        return True, {
+            "topic": step.topic,
+            "waited_ms": (time.perf_counter() - start) * 1000.0,
+            "event_id": payload.get("event_id"),
+        }
+
     async def _execute_speak_step(self, step, plan_id: str) -> tuple[bool, Dict[str, Any]]:
         """Execute a speak step with audio ducking.
         
@@ -530,24 +705,22 @@ class TimelineExecutorService(BaseService):
         else:
             text = step.text
             step_id = step.id if step.id else str(uuid.uuid4())
+
+        # Play a pre-rendered copy if the look-ahead prefetch got to this step first
+        cache_key = await self._claim_speech_prefetch(plan_id, step)
+        if cache_key:
+            return await self._execute_prefetched_speak_step(text, step_id, cache_key)
             
-        # Create an event for speech completion
-        speech_event = asyncio.Event()
         speech_id = step_id
-        self._speech_end_events[speech_id] = speech_event
+        # Registered before the request so a fast completion cannot be missed;
+        # SPEECH_GENERATION_COMPLETE is emitted by ElevenLabsService once playback has finished
+        speech_waiter = await self._add_waiter(EventTopics.SPEECH_GENERATION_COMPLETE, {"clip_id": speech_id})
         
         try:
-            # Start audio ducking if music is playing
+            # Start audio ducking if music is playing and wait for it to be applied
             if self._current_music_playing:
                 self.logger.info(f"Ducking audio for speech step '{step_id}'")
-                await self.emit(
-                    EventTopics.AUDIO_DUCKING_START,
-                    {"level": self._config.default_ducking_level, "fade_ms": self._config.ducking_fade_ms}
-                )
-                self._audio_ducked = True
-                
-                # Small delay to ensure ducking has started
-                await asyncio.sleep(0.15)
+                await self._set_ducking(True)
             
             # Request TTS generation
             self.logger.info(f"Generating speech for step '{step_id}': '{text[:30]}...'")
@@ -562,30 +735,23 @@ class TimelineExecutorService(BaseService):
                 ).model_dump()
             )
             
-            # Wait for speech synthesis to complete with timeout
+            # Wait for speech playback to finish with timeout
             try:
-                self.logger.info(f"Waiting for speech synthesis to complete (timeout: {self._config.speech_wait_timeout}s)")
-                await asyncio.wait_for(
-                    speech_event.wait(),
-                    timeout=self._config.speech_wait_timeout
-                )
+                self.logger.info(f"Waiting for speech playback to complete (timeout: {self._config.speech_wait_timeout}s)")
+                await self._await_waiter(speech_waiter, self._config.speech_wait_timeout)
                 speech_success = True
-                self.logger.info(f"Speech synthesis completed successfully for step '{step_id}'")
+                self.logger.info(f"Speech playback completed for step '{step_id}'")
             except asyncio.TimeoutError:
-                speech_success = False
-                self.logger.error(f"Timeout waiting for speech synthesis to complete for step {step_id}")
+                self.logger.error(f"Timeout waiting for speech playback to complete for step {step_id}")
                 await self._emit_status(
                     ServiceStatus.ERROR,
-                    f"Timeout waiting for speech synthesis to complete for step {step_id}",
+                    f"Timeout waiting for speech playback to complete for step {step_id}",
                     LogLevel.ERROR
                 )
                 # Force progress even on timeout
                 speech_success = True  # We'll continue with the plan despite the timeout
             
-            # Add a small delay to ensure speech playback has finished
-            await asyncio.sleep(0.25)
-            
-            # Note: We don't unduck audio here - that's now handled by the _handle_speech_generation_complete method
+            # Note: We don't unduck audio here - that's handled by _handle_speech_generation_complete
             # which responds to the SPEECH_GENERATION_COMPLETE event from ElevenLabsService
             
             return speech_success, {"text": text, "speech_id": speech_id}
@@ -607,11 +773,135 @@ class TimelineExecutorService(BaseService):
             return False, {"error": str(e)}
             
         finally:
-            # Clean up the speech event
-            if speech_id in self._speech_end_events:
-                del self._speech_end_events[speech_id]
+            self._waiters.discard(speech_waiter)
+
+    # ------------------------------------------------------------------
+    # Look-ahead speech prefetch
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _iter_speak_steps(steps):
+        """Yield compiled speak steps, descending into container steps."""
+        for compiled in steps:
+            if compiled.children is not None:
+                yield from TimelineExecutorService._iter_speak_steps(compiled.children)
+            elif compiled.step_type == "speak":
+                yield compiled
+
+    def _schedule_speech_prefetch(self, plan: CompiledPlan, index: int) -> None:
+        """Start rendering speak steps in the look-ahead window after step ``index``.
+
+        The step about to run is never prefetched: live streaming TTS gives it
+        audio sooner than render-then-play would.
+        """
+        if not self._config.speech_prefetch_enabled or self._config.speech_prefetch_lookahead <= 0:
+            return
+        window = plan.steps[index + 1:index + 1 + self._config.speech_prefetch_lookahead]
+        if not window:
+            return
+
+        prefetches = self._speech_prefetches.setdefault(plan.plan_id, {})
+        for compiled in self._iter_speak_steps(window):
+            key = id(compiled.step)
+            if key not in prefetches:
+                task = asyncio.create_task(self._prefetch_speech(plan.plan_id, compiled))
+                prefetches[key] = task
+                self._tasks.append(task)
+
+    async def _prefetch_speech(self, plan_id: str, compiled: CompiledStep) -> Optional[str]:
+        """Render one speak step into CachedSpeechService.
+
+        Returns:
+            The cache key once the audio is ready, or None if rendering failed
+        """
+        step = compiled.step
+        text = step.get('text') if isinstance(step, dict) else getattr(step, 'text', None)
+        if not text:
+            return None
+
+        cache_key = f"timeline_prefetch_{plan_id}_{compiled.index}_{uuid.uuid4().hex[:8]}"
+        async with self._prefetch_semaphore:
+            ready = await self._add_waiter(EventTopics.SPEECH_CACHE_READY, {"cache_key": cache_key})
+            failed = await self._add_waiter(EventTopics.SPEECH_CACHE_ERROR, {"cache_key": cache_key})
+            try:
+                await self._emit_dict(
+                    EventTopics.SPEECH_CACHE_REQUEST,
+                    SpeechCacheRequestPayload(
+                        text=text,
+                        cache_key=cache_key,
+                        metadata={"source": "timeline_prefetch", "plan_id": plan_id, "step_id": compiled.step_id}
+                    )
+                )
+                await asyncio.wait(
+                    {ready.future, failed.future},
+                    timeout=self._config.speech_wait_timeout,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                if ready.future.done() and not ready.future.cancelled():
+                    self.logger.debug(f"Prefetched speech for step {compiled.step_id} ({cache_key})")
+                    return cache_key
+                self.logger.info(f"Speech prefetch failed for step {compiled.step_id}; will use live TTS")
+                return None
+            finally:
+                self._waiters.discard(ready)
+                self._waiters.discard(failed)
+
+    async def _claim_speech_prefetch(self, plan_id: Optional[str], step: Any) -> Optional[str]:
+        """Take the prefetch for ``step`` (waiting for it if still rendering)."""
+        task = self._speech_prefetches.get(plan_id, {}).pop(id(step), None)
+        if task is None:
+            return None
+
+        try:
+            done, _ = await asyncio.wait({task}, timeout=self._config.speech_wait_timeout)
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        cache_key = None
+        if task in done and not task.cancelled() and task.exception() is None:
+            cache_key = task.result()
+        elif not task.done():
+            task.cancel()
+
+        self._plan_metrics["speech_prefetch_hits" if cache_key else "speech_prefetch_misses"] += 1
+        return cache_key
+
+    async def _execute_prefetched_speak_step(self, text: str, step_id: str, cache_key: str) -> tuple[bool, Dict[str, Any]]:
+        """Speak a pre-rendered line: duck → cached playback → unduck."""
+        ducked = False
+        if self._current_music_playing:
+            self.logger.info(f"Ducking audio for prefetched speech step '{step_id}'")
+            await self._set_ducking(True)
+            ducked = True
+
+        try:
+            success, details = await self._execute_play_cached_speech_step({"cache_key": cache_key})
+        finally:
+            if ducked and self._audio_ducked:
+                await self._set_ducking(False)
+            await self.emit(EventTopics.SPEECH_CACHE_CLEANUP, {"keys": [cache_key]})
+
+        result = {"text": text, "speech_id": step_id, "cache_key": cache_key, "prefetched": True}
+        if not success:
+            result["error"] = (details or {}).get("error", "Cached playback failed")
+        return success, result
+
+    async def _release_speech_prefetches(self, plan_id: str) -> None:
+        """Cancel outstanding prefetches for a finished plan and drop unused renders."""
+        prefetches = self._speech_prefetches.pop(plan_id, None)
+        if not prefetches:
+            return
+
+        unused_keys = []
+        for task in prefetches.values():
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled() and task.exception() is None and task.result():
+                unused_keys.append(task.result())
 
-    async def _execute_play_music_step(self, step: PlanStep) -> tuple[bool, Dict[str, Any]]:
+        if unused_keys:
+            await self.emit(EventTopics.SPEECH_CACHE_CLEANUP, {"keys": unused_keys})
+
+    async def _execute_play_music_step(self, step: PlanStep, plan_id: Optional[str] = None) -> tuple[bool, Dict[str, Any]]:
         """Execute a play_music step."""
         # Route through CommandDispatcher instead of direct service emission
         if step.genre == "stop":
@@ -632,11 +922,12 @@ class TimelineExecutorService(BaseService):
         )
         return True, {"genre": step.genre}
 
-    async def _execute_eye_pattern_step(self, step: PlanStep) -> tuple[bool, Dict[str, Any]]:
+    async def _execute_eye_pattern_step(self, step: PlanStep, plan_id: Optional[str] = None) -> tuple[bool, Dict[str, Any]]:
         """Execute an eye_pattern step."""
         # Route through CommandDispatcher instead of direct service emission
         command = "eye pattern"
-        args = [step.pattern] if step.pattern else ["default"]
+        pattern = step.get('pattern') if isinstance(step, dict) else getattr(step, 'pattern', None)
+        args = [pattern] if pattern else ["default"]
         
         await self.emit(
             EventTopics.CLI_COMMAND,
@@ -646,13 +937,14 @@ class TimelineExecutorService(BaseService):
                 "raw_input": f"{command} {' '.join(args)}".strip()
             }
         )
-        return True, {"pattern": step.pattern}
+        return True, {"pattern": pattern}
 
-    async def _execute_move_step(self, step: PlanStep) -> tuple[bool, Dict[str, Any]]:
+    async def _execute_move_step(self, step: PlanStep, plan_id: Optional[str] = None) -> tuple[bool, Dict[str, Any]]:
         """Execute a move step."""
         # Would normally trigger motion service
         # Placeholder implementation
-        return True, {"motion": step.motion}
+        motion = step.get('motion') if isinstance(step, dict) else getattr(step, 'motion', None)
+        return True, {"motion": motion}
 
     # ------------------------------------------------------------------
     # Event handlers
@@ -723,14 +1015,7 @@ class TimelineExecutorService(BaseService):
             if complete_payload.success:
                 self.logger.info(f"Speech generation complete for text: {complete_payload.text[:50]}...")
                 
-                # Signal the waiting speak step using clip_id, step_id, or conversation_id
-                speech_id = complete_payload.clip_id or complete_payload.step_id or complete_payload.conversation_id
-                
-                if speech_id and speech_id in self._speech_end_events:
-                    self.logger.debug(f"Setting speech completion event for speech_id: {speech_id}")
-                    self._speech_end_events[speech_id].set()
-                else:
-                    self.logger.warning(f"No waiting event found for speech_id: {speech_id}")
+                # Waiting speak steps are resolved by the waiter table (matched on clip_id)
                 
                 # Handle unducking if music is playing and ducked
                 if self._current_music_playing and self._audio_ducked:
@@ -745,11 +1030,7 @@ class TimelineExecutorService(BaseService):
                 error_msg = complete_payload.error or "Unknown error"
                 self.logger.error(f"Speech generation failed: {error_msg}")
                 
-                # Still signal completion even on failure so the plan can continue
-                speech_id = complete_payload.clip_id or complete_payload.step_id or complete_payload.conversation_id
-                if speech_id and speech_id in self._speech_end_events:
-                    self.logger.debug(f"Setting speech completion event (failed) for speech_id: {speech_id}")
-                    self._speech_end_events[speech_id].set()
+                # The failed completion still resolves the speak step's waiter so the plan can continue
                 
                 # Unduck music even on failure
                 if self._current_music_playing and self._audio_ducked:
@@ -861,7 +1142,7 @@ class TimelineExecutorService(BaseService):
 
     # --- New Handlers for DJ Mode --- #
 
-    async def _execute_play_cached_speech_step(self, step) -> tuple[bool, Optional[Dict[str, Any]]]:
+    async def _execute_play_cached_speech_step(self, step, plan_id: Optional[str] = None) -> tuple[bool, Optional[Dict[str, Any]]]:
         """Executes a PlayCachedSpeechStep.
 
         Requests CachedSpeechService to play a cached audio entry.
@@ -927,7 +1208,7 @@ class TimelineExecutorService(BaseService):
             self._active_speech_playbacks.discard(playback_id)
 
 
-    async def _execute_music_crossfade_step(self, step) -> tuple[bool, Optional[Dict[str, Any]]]:
+    async def _execute_music_crossfade_step(self, step, plan_id: Optional[str] = None) -> tuple[bool, Optional[Dict[str, Any]]]:
         """Executes a MusicCrossfadeStep.
 
         Requests MusicControllerService to perform a crossfade.
@@ -986,7 +1267,7 @@ class TimelineExecutorService(BaseService):
             # Clean up the event
             self._crossfade_complete_events.pop(event_key, None)
 
-    async def _execute_music_duck_step(self, step) -> tuple[bool, Optional[Dict[str, Any]]]:
+    async def _execute_music_duck_step(self, step, plan_id: Optional[str] = None) -> tuple[bool, Optional[Dict[str, Any]]]:
         """Executes a MusicDuckStep to lower music volume during speech.
         
         Args:
@@ -1018,8 +1299,9 @@ class TimelineExecutorService(BaseService):
             # Mark that audio is ducked for tracking
             self._audio_ducked = True
             
-            # Small delay to ensure ducking has started
-            await asyncio.sleep(fade_duration_ms / 1000.0)
+            # Hold for the fade so speech starts once the music is down
+            error = await self._clock.sleep_for(fade_duration_ms / 1000.0)
+            self._record_schedule_error(plan_id, error)
             
             return True, {"duck_level": duck_level, "fade_duration_ms": fade_duration_ms}
             
@@ -1027,7 +1309,7 @@ class TimelineExecutorService(BaseService):
             self.logger.error(f"Error executing MusicDuckStep: {e}", exc_info=True)
             return False, {"error": str(e)}
 
-    async def _execute_music_unduck_step(self, step) -> tuple[bool, Optional[Dict[str, Any]]]:
+    async def _execute_music_unduck_step(self, step, plan_id: Optional[str] = None) -> tuple[bool, Optional[Dict[str, Any]]]:
         """Executes a MusicUnduckStep to restore music volume after speech.
         
         Args:
@@ -1056,8 +1338,9 @@ class TimelineExecutorService(BaseService):
             # Mark that audio is no longer ducked
             self._audio_ducked = False
             
-            # Small delay to ensure unducking has started
-            await asyncio.sleep(fade_duration_ms / 1000.0)
+            # Hold for the fade so the next step starts at full volume
+            error = await self._clock.sleep_for(fade_duration_ms / 1000.0)
+            self._record_schedule_error(plan_id, error)
             
             return True, {"fade_duration_ms": fade_duration_ms}
             
@@ -1130,21 +1413,23 @@ class TimelineExecutorService(BaseService):
          except Exception as e:
               self.logger.error(f"Error handling CROSSFADE_COMPLETE: {e}", exc_info=True)
 
-    async def _execute_parallel_steps(self, step: ParallelSteps, plan_id: str) -> tuple[bool, Optional[Dict[str, Any]]]:
+    async def _execute_parallel_steps(self, step: Union[CompiledStep, ParallelSteps], plan_id: str) -> tuple[bool, Optional[Dict[str, Any]]]:
         """Execute multiple steps concurrently using asyncio.gather().
         
         Args:
-            step: The ParallelSteps containing sub-steps to execute concurrently
+            step: The compiled parallel step (or a raw ParallelSteps) containing sub-steps
             plan_id: The ID of the plan this step belongs to
             
         Returns:
             Tuple of (success, details) - success is True only if ALL sub-steps succeed
         """
-        self.logger.info(f"Executing ParallelSteps with {len(step.steps)} concurrent sub-steps for plan {plan_id}")
+        sub_steps = step.children if isinstance(step, CompiledStep) else step.steps
+        self.logger.info(f"Executing ParallelSteps with {len(sub_steps)} concurrent sub-steps for plan {plan_id}")
         
         try:
-            # Execute all sub-steps concurrently
-            tasks = [self._execute_step(sub_step, plan_id) for sub_step in step.steps]
+            # Execute all sub-steps concurrently; offsets are absolute deadlines from a shared anchor
+            anchor = self._clock.now()
+            tasks = [self._execute_step_at(sub_step, plan_id, anchor) for sub_step in sub_steps]
             results = await asyncio.gather(*tasks, return_exceptions=True)
             
             # Check results - success only if all steps succeeded
@@ -1168,7 +1453,7 @@ class TimelineExecutorService(BaseService):
             overall_success = all(successes)
             details["overall_success"] = overall_success
             details["successful_steps"] = sum(successes)
-            details["total_steps"] = len(step.steps)
+            details["total_steps"] = len(sub_steps)
             
             self.logger.info(f"ParallelSteps completed: {details['successful_steps']}/{details['total_steps']} steps succeeded")
             
@@ -1178,6 +1463,20 @@ class TimelineExecutorService(BaseService):
             self.logger.error(f"Error executing ParallelSteps: {e}", exc_info=True)
             return False, {"error": str(e)}
 
+    async def _execute_step_at(self, step: Any, plan_id: str, anchor: float) -> tuple[bool, Optional[Dict[str, Any]]]:
+        """Execute a parallel sub-step at ``anchor`` + its start offset."""
+        if isinstance(step, CompiledStep):
+            offset = step.offset
+        elif isinstance(step, dict):
+            offset = step.get('offset')
+        else:
+            offset = getattr(step, 'offset', None)
+
+        if offset:
+            error = await self._clock.sleep_until(anchor + offset)
+            self._record_schedule_error(plan_id, error)
+        return await self._execute_step(step, plan_id)
+
     # ------------------------------------------------------------------
     # Audio ducking methods
     # ------------------------------------------------------------------
@@ -1185,22 +1484,10 @@ class TimelineExecutorService(BaseService):
         """Duck music volume during voice activity."""
         if self._current_music_playing:
             self.logger.info("Ducking music volume for voice activity")
-            await self.emit(
-                EventTopics.AUDIO_DUCKING_START,
-                {"level": self._config.default_ducking_level, "fade_ms": self._config.ducking_fade_ms}
-            )
-            self._audio_ducked = True
-            # Small delay to ensure ducking has started
-            await asyncio.sleep(0.15)
+            await self._set_ducking(True)
 
     async def _unduck_music(self) -> None:
         """Restore music volume after voice activity."""
         if self._current_music_playing and self._audio_ducked:
             self.logger.info("Restoring music volume after voice activity")
-            await self.emit(
-                EventTopics.AUDIO_DUCKING_STOP,
-                {"fade_ms": self._config.ducking_fade_ms}
-            )
-            self._audio_ducked = False
-            # Small delay to ensure unducking has started
-            await asyncio.sleep(0.15) 
\ No newline at end of file
+            await self._set_ducking(False) 
\ No newline at end of file
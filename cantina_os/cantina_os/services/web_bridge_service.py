@@ -8,9 +8,9 @@ Bridges the web dashboard with CantinaOS event bus for real-time monitoring and
 """
 SERVICE: WebBridgeService
 PURPOSE: Web dashboard connectivity bridge with FastAPI REST API and Socket.IO real-time communication
-EVENTS_IN: SERVICE_STATUS_UPDATE, TRANSCRIPTION_FINAL, VOICE_LISTENING_STARTED, VOICE_LISTENING_STOPPED, MIC_RECORDING_START, MIC_RECORDING_STOP, MUSIC_PLAYBACK_STARTED, MUSIC_PLAYBACK_STOPPED, MUSIC_LIBRARY_UPDATED, DJ_MODE_CHANGED, LLM_RESPONSE, SYSTEM_MODE_CHANGE, DASHBOARD_LOG
+EVENTS_IN: SERVICE_STATUS_UPDATE, TRANSCRIPTION_FINAL, VOICE_LISTENING_STARTED, VOICE_LISTENING_STOPPED, MIC_RECORDING_START, MIC_RECORDING_STOP, MUSIC_PLAYBACK_STARTED, MUSIC_PLAYBACK_STOPPED, MUSIC_PROGRESS, MUSIC_LIBRARY_UPDATED, DJ_MODE_CHANGED, LLM_RESPONSE, LLM_QUEUE_STATUS, SYSTEM_MODE_CHANGE, DASHBOARD_LOG, VOICE_AUDIO_LEVEL, SPEECH_AMPLITUDE, TTS_AUDIO_DATA, CROSSFADE_COMPLETE
 EVENTS_OUT: MUSIC_COMMAND, SYSTEM_SET_MODE_REQUEST, USER_INPUT, SERVICE_STATUS_REQUEST
-KEY_METHODS: _handle_music_command, _handle_voice_command, _handle_system_command, _broadcast_event_to_dashboard, broadcast_validated_status
+KEY_METHODS: request_cantina_state, _handle_music_command, _handle_voice_command, _handle_system_command, _broadcast_event_to_dashboard, _sync_client_rooms, _publish_state, _send_audio_frame, broadcast_validated_status
 DEPENDENCIES: FastAPI, Socket.IO, uvicorn web server, CORS middleware for web dashboard connectivity
 """
 
@@ -21,15 +21,33 @@ import os
 import time
 from collections import defaultdict, deque
 from datetime import datetime
-from typing import Any, Dict, Optional, Set
+from typing import Any, Dict, Optional, Set, Tuple
 
+import numpy as np
 import socketio
 import uvicorn
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
 from ..base_service import BaseService
+from ..bridge.filters import (  # noqa: F401 - topic helpers re-exported for existing imports
+    DEFAULT_TOPIC_CATEGORY,
+    FILTER_LEVEL_EVENTS,
+    THROTTLE_LIMITS,
+    TOPIC_CATEGORIES,
+    client_accepts_topic,
+    topic_category,
+    topic_key,
+)
+from ..bridge.music_library import (
+    LibraryResponse,
+    etag_matches,
+    format_duration,
+    format_library_tracks,
+    parse_library_fields,
+    scan_music_dir,
+)
 from ..core.event_topics import EventTopics
 from ..event_payloads import ServiceStatus
 from ..schemas.validation import SocketIOValidationMixin, StatusPayloadValidationMixin, validate_socketio_command
@@ -41,11 +59,38 @@ from ..schemas.web_commands import (
     validate_command_data
 )
 from ..schemas import BaseWebResponse, WebCommandError
+from ..utils import dashboard_json
+from ..utils.audio_frames import SOURCE_MUSIC, SOURCE_SPEECH, AudioFrameState
+from ..utils.event_replay import EventReplayBuffer
+from ..utils.library_index import load_energy_envelope
+from ..utils.state_store import StateStore
+from ..utils.topic_throttle import TopicThrottle
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
+# Dashboard state kept by the bridge and synced to clients as snapshot + deltas
+STATE_SECTIONS = ("services", "music", "dj", "voice", "mode")
+# Socket.IO events whose payload is the latest value of a state section
+STATE_SECTIONS_BY_EVENT = {
+    "music_status": "music",
+    "dj_status": "dj",
+    "voice_status": "voice",
+    "system_mode_change": "mode",
+}
+
+# Sending the key topic drops any throttled value still waiting for the other one
+COALESCE_CANCELLED_BY = {
+    EventTopics.TRANSCRIPTION_FINAL.value: EventTopics.TRANSCRIPTION_INTERIM.value,
+    EventTopics.LLM_RESPONSE.value: EventTopics.LLM_RESPONSE_CHUNK.value,
+}
+
+# Socket.IO room for clients receiving binary "audio_frame" messages (see utils.audio_frames)
+AUDIO_FRAME_ROOM = "audio_frames"
+
+
+
 class WebBridgeService(BaseService, SocketIOValidationMixin, StatusPayloadValidationMixin):
     """
     Web Bridge Service for DJ R3X Dashboard
@@ -74,33 +119,40 @@ class WebBridgeService(BaseService, SocketIOValidationMixin, StatusPayloadValida
 
         # Dashboard state
         self._dashboard_clients: Dict[str, Any] = {}
-        self._event_buffer = []
+        self._topic_rooms: Dict[str, Set[str]] = {}  # topic -> sids in its Socket.IO room
         self._service_status = {}
-        self._cached_service_status = {}  # Cache for intelligent status caching
-        self._last_status_update = 0  # Timestamp of last status update
+        self._state_store = StateStore(STATE_SECTIONS)
+        # Recent broadcasts per topic for reconnecting clients; shares the state epoch
+        self._event_replay = EventReplayBuffer(
+            self._state_store.epoch, self._config.get("replay_capacity_per_topic", 20)
+        )
+        self._state_store.update("services", self._get_service_status())
+        self._state_snapshot_packet: Optional[Tuple[int, dashboard_json.EncodedPayload]] = None  # (seq, encoding)
         self._music_library_cache = {}  # Cache for music library data with durations
-
-        # Event filtering and throttling
-        self._event_throttle_state = defaultdict(lambda: {"last_sent": 0, "count": 0})
-        self._high_frequency_events = {
-            EventTopics.AUDIO_CHUNK,
-            EventTopics.VOICE_AUDIO_LEVEL,
-            EventTopics.SPEECH_SYNTHESIS_AMPLITUDE,
-        }
-        self._throttle_limits = {
-            "high_frequency": {
-                "max_per_second": 10,
-                "events": self._high_frequency_events,
-            },
-            "medium_frequency": {
-                "max_per_second": 30,
-                "events": {
-                    EventTopics.TRANSCRIPTION_INTERIM,
-                    EventTopics.LLM_RESPONSE_CHUNK,
-                },
-            },
-            "low_frequency": {"max_per_second": 0, "events": set()},
-        }
+        self._music_dir = self._config.get(
+            "music_dir", os.path.join(os.path.dirname(__file__), "..", "assets", "music")
+        )
+        # Encoded /api/music/library responses for the current library version
+        self._library_response = LibraryResponse(self._config.get("library_gzip_min_bytes", 4096))
+        self._music_dir_mtime: Optional[float] = -1.0  # mtime of the listed music dir; -1 = not listed
+
+        # Newest value wins for throttled topics; other topics pass straight through
+        self._event_throttle = TopicThrottle(self._send_dashboard_event)
+        for topic, max_per_second in THROTTLE_LIMITS.items():
+            self._event_throttle.configure(topic_key(topic), max_per_second)
+        # Routine logs per service; errors, warnings and key DJ logs are never limited
+        self._dashboard_log_interval = self._config.get("dashboard_log_interval_sec", 10.0)
+
+        # Binary level meters and waveform previews, sent only to clients that opt in
+        self._audio_frames = AudioFrameState(time.monotonic())
+        self._audio_frame_clients: Set[str] = set()
+        self._waveform_frames: Dict[int, bytes] = {}  # source -> latest preview, sent on subscribe
+        self._audio_frame_throttle = TopicThrottle(self._send_audio_frame)
+        self._audio_frame_throttle.configure("levels", self._config.get("audio_frame_fps", 30))
+        for source in (SOURCE_MUSIC, SOURCE_SPEECH):
+            self._audio_frame_throttle.configure(
+                f"waveform:{source}", self._config.get("waveform_frames_per_second", 2)
+            )
 
     async def _start(self) -> None:
         """Start the web bridge service."""
@@ -138,22 +190,8 @@ class WebBridgeService(BaseService, SocketIOValidationMixin, StatusPayloadValida
 
             # Request status from all services that may have started before us
             self._logger.critical("[WebBridge] Step 7: Requesting status from existing services")
-            self._event_bus.emit(
-                EventTopics.SERVICE_STATUS_REQUEST,
-                {"source": "web_bridge", "timestamp": datetime.now().isoformat()},
-            )
+            self.request_cantina_state()
             self._logger.critical("[WebBridge] Step 7: Status request sent")
-            
-            # Request music library update if music controller is already running
-            self._logger.info("[WebBridge] Requesting music library update from music controller")
-            self._event_bus.emit(
-                EventTopics.MUSIC_COMMAND,
-                {
-                    "command": "refresh_music_library",
-                    "source": "web_bridge",
-                    "timestamp": datetime.now().isoformat()
-                }
-            )
 
             self._logger.critical("[WebBridge] Step 8: ALL INITIALIZATION COMPLETE - WebBridge fully operational")
             
@@ -168,6 +206,13 @@ class WebBridgeService(BaseService, SocketIOValidationMixin, StatusPayloadValida
         """Stop the web bridge service."""
         self._logger.info("Stopping DJ R3X Web Bridge Service")
 
+        await self._event_throttle.close()
+        await self._audio_frame_throttle.close()
+        totals = self._event_throttle.totals()
+        self._logger.info(
+            f"Dashboard throttling: {totals['sent']} sent, {totals['coalesced']} coalesced, {totals['dropped']} dropped"
+        )
+
         if self._server:
             self._server.should_exit = True
             await asyncio.sleep(1)  # Give server time to cleanup
@@ -178,6 +223,27 @@ class WebBridgeService(BaseService, SocketIOValidationMixin, StatusPayloadValida
         )
         self._logger.info("Web Bridge Service stopped")
 
+    def request_cantina_state(self) -> None:
+        """Ask CantinaOS services to republish their status and the music library.
+
+        Called on start, and by the standalone bridge each time it (re)connects
+        to the CantinaOS event bus, since requests made while it was down are lost.
+        """
+        self._event_bus.emit(
+            EventTopics.SERVICE_STATUS_REQUEST,
+            {"source": "web_bridge", "timestamp": datetime.now().isoformat()},
+        )
+        # Music library update if the music controller is already running
+        self._logger.info("[WebBridge] Requesting music library update from music controller")
+        self._event_bus.emit(
+            EventTopics.MUSIC_COMMAND,
+            {
+                "command": "refresh_music_library",
+                "source": "web_bridge",
+                "timestamp": datetime.now().isoformat()
+            }
+        )
+
     def _create_fastapi_app(self) -> None:
         """Create the FastAPI application with all endpoints."""
         self._app = FastAPI(
@@ -205,6 +271,7 @@ class WebBridgeService(BaseService, SocketIOValidationMixin, StatusPayloadValida
             cors_allowed_origins=["http://localhost:3000"],
             logger=False,  # DISABLE SocketIO debug logging to prevent terminal spam
             engineio_logger=False,  # DISABLE EngineIO debug logging to prevent terminal spam
+            json=dashboard_json,  # orjson when available; pre-encoded payloads pass straight through
         )
 
         # Add Socket.IO event handlers
@@ -224,6 +291,8 @@ class WebBridgeService(BaseService, SocketIOValidationMixin, StatusPayloadValida
                 "status": "running",
                 "cantina_os_connected": True,
                 "dashboard_clients": len(self._dashboard_clients),
+                "throttle": self._event_throttle.totals(),
+                "audio_frames": self._audio_frame_throttle.totals(),
                 "timestamp": datetime.now().isoformat(),
             }
 
@@ -239,61 +308,38 @@ class WebBridgeService(BaseService, SocketIOValidationMixin, StatusPayloadValida
             }
 
         @self._app.get("/api/music/library")
-        async def get_music_library():
-            """Get music library from CantinaOS"""
+        async def get_music_library(
+            request: Request,
+            offset: int = Query(0, ge=0),
+            limit: Optional[int] = Query(None, ge=1),
+            fields: Optional[str] = None,
+        ):
+            """Get music library from CantinaOS
+
+            Answered from a response encoded once per library version, with a
+            304 when If-None-Match still matches. ``offset``/``limit`` select a
+            page and ``fields`` (comma-separated) a subset of track keys.
+            """
             try:
-                tracks = []
-                
-                # First, try to use cached data with actual durations
-                if self._music_library_cache:
-                    logger.info(f"[WebBridge] Serving {len(self._music_library_cache)} tracks from cache")
-                    
-                    for i, (track_name, track_data) in enumerate(self._music_library_cache.items()):
-                        # Format duration properly
-                        duration_seconds = track_data.get("duration")
-                        if duration_seconds is not None:
-                            # Convert seconds to MM:SS format
-                            minutes = int(duration_seconds // 60)
-                            seconds = int(duration_seconds % 60)
-                            duration_str = f"{minutes}:{seconds:02d}"
-                        else:
-                            duration_str = "Unknown"
-                        
-                        tracks.append({
-                            "id": str(i + 1),
-                            "title": track_data.get("title", track_name),
-                            "artist": track_data.get("artist", "Cantina Band"),
-                            "duration": duration_str,
-                            "file": os.path.basename(track_data.get("path", "")),
-                            "path": track_data.get("path", "")
-                        })
-                else:
-                    # Fallback to filesystem if no cached data available
-                    logger.info("[WebBridge] No cached music library, falling back to filesystem")
-                    music_dir = os.path.join(
-                        os.path.dirname(__file__), "..", "assets", "music"
-                    )
-                    
-                    if os.path.exists(music_dir):
-                        for i, filename in enumerate(os.listdir(music_dir)):
-                            if filename.endswith((".mp3", ".wav", ".m4a")):
-                                name, _ = os.path.splitext(filename)
-                                if " - " in name:
-                                    artist, title = name.split(" - ", 1)
-                                else:
-                                    artist = "Cantina Band"
-                                    title = name
-
-                                tracks.append({
-                                    "id": str(i + 1),
-                                    "title": title.strip(),
-                                    "artist": artist.strip(),
-                                    "duration": "Unknown",  # Changed from hardcoded "3:00"
-                                    "file": filename,
-                                    "path": os.path.join(music_dir, filename),
-                                })
-
-                return {"tracks": tracks}
+                selected = parse_library_fields(fields)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+
+            try:
+                if not self._music_library_cache:
+                    self._refresh_library_from_music_dir()
+
+                headers = {"Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+                etag = self._library_response.etag(offset, limit, selected)
+                if etag_matches(request.headers.get("if-none-match"), etag):
+                    return Response(status_code=304, headers={**headers, "ETag": etag})
+
+                body = self._library_response.body(offset, limit, selected)
+                headers["ETag"] = body.etag
+                if body.gzipped is not None and "gzip" in request.headers.get("accept-encoding", ""):
+                    headers["Content-Encoding"] = "gzip"
+                    return Response(body.gzipped, media_type="application/json", headers=headers)
+                return Response(body.content, media_type="application/json", headers=headers)
             except Exception as e:
                 logger.error(f"Error fetching music library: {e}")
                 return {"tracks": [], "error": str(e)}
@@ -308,22 +354,14 @@ class WebBridgeService(BaseService, SocketIOValidationMixin, StatusPayloadValida
             self._dashboard_clients[sid] = {
                 "connected_at": datetime.now(),
                 "subscriptions": [],
+                "filter_level": "all",
+                # Events after this were delivered live; replay stops here
+                "connected_event_seq": self._event_replay.seq,
             }
+            await self._sync_client_rooms(sid)
 
-            # Send current system status
-            await self._sio.emit(
-                "system_status",
-                {
-                    "cantina_os_connected": True,
-                    "services": self._get_service_status(),
-                    "timestamp": datetime.now().isoformat(),
-                },
-                room=sid,
-            )
-
-            # Send buffered events
-            for event in self._event_buffer[-10:]:
-                await self._sio.emit("event_replay", event, room=sid)
+            # Send the current state; deltas follow as it changes
+            await self._sio.emit("state_snapshot", self._state_snapshot_payload(), room=sid)
 
         @self._sio.event
         async def disconnect(sid):
@@ -331,18 +369,88 @@ class WebBridgeService(BaseService, SocketIOValidationMixin, StatusPayloadValida
             logger.info(f"Dashboard client disconnected: {sid}")
             if sid in self._dashboard_clients:
                 del self._dashboard_clients[sid]
+            # Socket.IO drops the sid from its rooms; keep our membership in step
+            for members in self._topic_rooms.values():
+                members.discard(sid)
+            self._audio_frame_clients.discard(sid)
+
+        @self._sio.event
+        async def state_resync(sid, data):
+            """Send a client the deltas it missed, or a snapshot if it is too far behind"""
+            data = data or {}
+            try:
+                seq = int(data.get("seq", -1))
+            except (TypeError, ValueError):
+                seq = -1
+            deltas = self._state_store.deltas_since(data.get("epoch"), seq)
+            if deltas is None:
+                await self._sio.emit("state_snapshot", self._state_snapshot_payload(), room=sid)
+                return
+            for delta in deltas:
+                await self._sio.emit("state_delta", dashboard_json.encode(delta), room=sid)
+
+        @self._sio.event
+        async def replay_events(sid, data):
+            """Replay the events a reconnecting client missed since its last-seen event_seq"""
+            client = self._dashboard_clients.get(sid)
+            if client is None:
+                return
+            data = data or {}
+            try:
+                seq = int(data.get("seq", -1))
+            except (TypeError, ValueError):
+                seq = -1
+            missed = self._event_replay.since(
+                data.get("epoch"),
+                seq,
+                until=client["connected_event_seq"],
+                accepts=lambda topic: client_accepts_topic(client, topic),
+            )
+            if missed is None:
+                # Too far behind (or the bridge restarted): start over from the current state
+                await self._sio.emit("state_snapshot", self._state_snapshot_payload(), room=sid)
+            else:
+                for entry in missed:
+                    await self._sio.emit(entry.event_name, entry.payload, room=sid)
+            await self._sio.emit(
+                "replay_complete",
+                {
+                    "epoch": self._event_replay.epoch,
+                    "event_seq": client["connected_event_seq"],
+                    "replayed": len(missed or []),
+                    "snapshot": missed is None,
+                },
+                room=sid,
+            )
 
         @self._sio.event
         async def subscribe_events(sid, data):
             """Handle event subscription requests"""
-            event_types = data.get("events", [])
+            event_types = data.get("events") or []
+            if isinstance(event_types, str):
+                event_types = [event_types]
             if sid in self._dashboard_clients:
-                self._dashboard_clients[sid]["subscriptions"] = event_types
+                self._dashboard_clients[sid]["subscriptions"] = list(event_types)
                 self._dashboard_clients[sid]["filter_level"] = data.get(
                     "filter_level", "all"
                 )
+                await self._sync_client_rooms(sid)
                 logger.info(f"Client {sid} subscribed to: {event_types}")
 
+        @self._sio.event
+        async def subscribe_audio_frames(sid, data=None):
+            """Opt in to (or out of) binary level meter and waveform frames"""
+            enabled = (data or {}).get("enabled", True)
+            if enabled and sid in self._dashboard_clients:
+                self._audio_frame_clients.add(sid)
+                await self._sio.enter_room(sid, AUDIO_FRAME_ROOM)
+                # Late joiners get the current waveform previews straight away
+                for frame in self._waveform_frames.values():
+                    await self._sio.emit("audio_frame", frame, room=sid)
+            else:
+                self._audio_frame_clients.discard(sid)
+                await self._sio.leave_room(sid, AUDIO_FRAME_ROOM)
+
         # Register validated command handlers
         self._sio.on("voice_command", self._handle_voice_command)
         self._sio.on("music_command", self._handle_music_command)
@@ -406,6 +514,9 @@ class WebBridgeService(BaseService, SocketIOValidationMixin, StatusPayloadValida
             self.subscribe(EventTopics.MUSIC_PLAYBACK_PAUSED, self._handle_music_playback_paused),
             self.subscribe(EventTopics.MUSIC_PLAYBACK_RESUMED, self._handle_music_playback_resumed),
             self.subscribe(EventTopics.MUSIC_PROGRESS, self._handle_music_progress),
+            self.subscribe(EventTopics.VOICE_AUDIO_LEVEL, self._handle_voice_audio_level),
+            self.subscribe(EventTopics.SPEECH_AMPLITUDE, self._handle_speech_amplitude),
+            self.subscribe(EventTopics.TTS_AUDIO_DATA, self._handle_tts_audio_data),
             self.subscribe(EventTopics.MUSIC_QUEUE_UPDATED, self._handle_music_queue_updated),
             self.subscribe(EventTopics.MUSIC_LIBRARY_UPDATED, self._handle_music_library_updated),
             
@@ -413,10 +524,12 @@ class WebBridgeService(BaseService, SocketIOValidationMixin, StatusPayloadValida
             self.subscribe(EventTopics.DJ_MODE_CHANGED, self._handle_dj_mode_changed),
             self.subscribe(EventTopics.GPT_COMMENTARY_RESPONSE, self._handle_gpt_commentary_response),
             self.subscribe(EventTopics.CROSSFADE_STARTED, self._handle_crossfade_started),
+            self.subscribe(EventTopics.CROSSFADE_COMPLETE, self._handle_crossfade_complete),
             self.subscribe(EventTopics.DJ_NEXT_TRACK_SELECTED, self._handle_dj_next_track_selected),
             
             # Other events
             self.subscribe(EventTopics.LLM_RESPONSE, self._handle_llm_response),
+            self.subscribe(EventTopics.LLM_QUEUE_STATUS, self._handle_llm_queue_status),
             self.subscribe(EventTopics.SYSTEM_ERROR, self._handle_system_error),
             self.subscribe(EventTopics.DASHBOARD_LOG, self._handle_dashboard_log),
             
@@ -473,43 +586,66 @@ class WebBridgeService(BaseService, SocketIOValidationMixin, StatusPayloadValida
 
         return merged_status
 
+    def _state_snapshot_payload(self) -> dashboard_json.EncodedPayload:
+        """Encoded state snapshot, re-encoded only after the state changes."""
+        seq = self._state_store.seq
+        if self._state_snapshot_packet is None or self._state_snapshot_packet[0] != seq:
+            snapshot = self._state_store.snapshot()
+            snapshot["cantina_os_connected"] = True
+            snapshot["timestamp"] = datetime.now().isoformat()
+            self._state_snapshot_packet = (seq, dashboard_json.encode(snapshot))
+        return self._state_snapshot_packet[1]
+
+    async def _publish_state(self, section: str, value: Dict[str, Any]) -> None:
+        """Update a state section and send connected clients the delta, if anything changed."""
+        delta = self._state_store.update(section, value)
+        if delta is None or not self._dashboard_clients or not self._sio:
+            return
+        try:
+            await self._sio.emit("state_delta", dashboard_json.encode(delta))
+        except Exception as e:
+            logger.error(f"Error broadcasting {section} state delta: {e}")
+
     async def _periodic_status_broadcast(self) -> None:
-        """Periodically broadcast status to all connected clients with intelligent caching."""
+        """Periodically tell clients the current state sequence so they can spot missed deltas."""
         while self._status == ServiceStatus.RUNNING:
             if self._dashboard_clients:
-                current_time = time.time()
-
-                # Get current service status
-                current_status = self._get_service_status()
-
-                # Only broadcast if status has changed or if it's been more than 60 seconds
-                should_broadcast = (
-                    current_status != self._cached_service_status
-                    or current_time - self._last_status_update > 60
+                # A few bytes instead of the full status; clients that are behind ask for a resync
+                await self._sio.emit(
+                    "state_heartbeat",
+                    {"epoch": self._state_store.epoch, "seq": self._state_store.seq},
                 )
 
-                if should_broadcast:
-                    status_data = {
-                        "cantina_os_connected": True,
-                        "services": current_status,
-                        "timestamp": datetime.now().isoformat(),
-                    }
-                    await self._sio.emit("system_status", status_data)
-
-                    # Update cache and timestamp
-                    self._cached_service_status = current_status.copy()
-                    self._last_status_update = current_time
-
             # Reduced frequency from 5s to 30s for polling
             await asyncio.sleep(30)
 
     async def _broadcast_event_to_dashboard(
         self, event_topic: str, data: Dict[str, Any], event_name: str = None, skip_validation: bool = False
     ):
-        """Broadcast an event to all connected dashboard clients."""
-        if not self._dashboard_clients or not self._sio:
+        """Broadcast an event to the dashboard clients subscribed to its topic."""
+        section = STATE_SECTIONS_BY_EVENT.get(event_name)
+        if section and isinstance(data, dict):
+            await self._publish_state(section, {k: v for k, v in data.items() if k != "timestamp"})
+
+        if not self._sio:
             return
 
+        # Events are sequenced and kept for replay even while nobody is
+        # subscribed, so a dashboard that reconnects can catch up
+        topic = topic_key(event_topic)
+        await self._ensure_topic_room(topic)
+
+        if topic in COALESCE_CANCELLED_BY:
+            # A final result makes the newest throttled interim value stale
+            self._event_throttle.discard(COALESCE_CANCELLED_BY[topic])
+
+        # Rate-limited topics are held back and coalesced; the rest go out now
+        await self._event_throttle.submit(topic, (data, event_name, skip_validation))
+
+    async def _send_dashboard_event(self, topic: str, item) -> None:
+        """Encode an event once and emit it to its topic room."""
+        data, event_name, skip_validation = item
+
         # The `skip_validation` parameter indicates the data is already validated
         # and serialized by `validate_and_serialize_status`.
         # The logic here should simply be to wrap and emit.
@@ -518,21 +654,57 @@ class WebBridgeService(BaseService, SocketIOValidationMixin, StatusPayloadValida
         # redundant and causing serialization issues. The `StatusPayloadValidationMixin`
         # is now the single source of truth for status validation.
 
-        event_data = {
-            "topic": event_topic,
+        # Encoded once here; Socket.IO splices the text into the single room packet
+        seq = self._event_replay.next_seq()
+        event_data = dashboard_json.encode({
+            "topic": topic,
             "data": data, # `data` is now assumed to be the validated payload
             "timestamp": datetime.now().isoformat(),
-            "validated": skip_validation # Use skip_validation flag to indicate status
-        }
+            "validated": skip_validation, # Use skip_validation flag to indicate status
+            "event_seq": seq,
+        })
+        self._event_replay.append(seq, topic, event_name or "cantina_event", event_data)
 
-        # Broadcast to all connected clients
-        for sid in self._dashboard_clients.keys():
-            try:
-                await self._sio.emit(
-                    event_name or "cantina_event", event_data, room=sid
-                )
-            except Exception as e:
-                logger.error(f"Error broadcasting event to client {sid}: {e}")
+        if not self._topic_rooms.get(topic):
+            return  # Nobody subscribed to this topic right now
+
+        # One emit to the topic's room reaches every client that asked for it
+        try:
+            await self._sio.emit(
+                event_name or "cantina_event", event_data, room=self._topic_room(topic)
+            )
+        except Exception as e:
+            logger.error(f"Error broadcasting {topic} to dashboard: {e}")
+
+    @staticmethod
+    def _topic_room(topic: str) -> str:
+        """Socket.IO room name for an event topic."""
+        return f"topic:{topic}"
+
+    async def _ensure_topic_room(self, topic: str) -> Set[str]:
+        """Create the room for a topic on first broadcast, admitting every interested client."""
+        members = self._topic_rooms.get(topic)
+        if members is None:
+            members = self._topic_rooms[topic] = set()
+            for sid, client in self._dashboard_clients.items():
+                if client_accepts_topic(client, topic):
+                    await self._sio.enter_room(sid, self._topic_room(topic))
+                    members.add(sid)
+        return members
+
+    async def _sync_client_rooms(self, sid: str) -> None:
+        """Move a client into the topic rooms its subscriptions and filter level admit."""
+        client = self._dashboard_clients.get(sid)
+        if client is None or not self._sio:
+            return
+        for topic, members in self._topic_rooms.items():
+            wanted = client_accepts_topic(client, topic)
+            if wanted and sid not in members:
+                await self._sio.enter_room(sid, self._topic_room(topic))
+                members.add(sid)
+            elif not wanted and sid in members:
+                await self._sio.leave_room(sid, self._topic_room(topic))
+                members.discard(sid)
 
     # Event handlers
     async def _handle_service_status_update(self, data):
@@ -555,6 +727,7 @@ class WebBridgeService(BaseService, SocketIOValidationMixin, StatusPayloadValida
             "uptime": data.get("uptime", "0:00:00"),
             "last_update": datetime.now().isoformat(),
         }
+        await self._publish_state("services", self._get_service_status())
 
         await self._broadcast_event_to_dashboard(
             EventTopics.SERVICE_STATUS_UPDATE,
@@ -919,6 +1092,7 @@ class WebBridgeService(BaseService, SocketIOValidationMixin, StatusPayloadValida
         
         track_data = data.get("track", {})
         logger.info(f"[WebBridge] Music playback started - track data: {track_data}")
+        await self._queue_track_waveform(track_data or {}, data.get("duration"))
         
         # Use enhanced validation for music status payload
         raw_payload = {
@@ -967,6 +1141,10 @@ class WebBridgeService(BaseService, SocketIOValidationMixin, StatusPayloadValida
 
     async def _handle_music_playback_stopped(self, data):
         """Handle music playback stopped event with enhanced validation"""
+        self._audio_frames.set_level("music_progress", None)
+        self._waveform_frames.pop(SOURCE_MUSIC, None)
+        await self._queue_levels_frame()
+
         # Use enhanced validation for music status payload
         raw_payload = {
             "action": "stopped",
@@ -1076,11 +1254,16 @@ class WebBridgeService(BaseService, SocketIOValidationMixin, StatusPayloadValida
 
     async def _handle_music_progress(self, data):
         """Handle music progress updates with enhanced validation"""
-        logger.info(f"[WebBridge] [PROGRESS_DEBUG] Received music progress data: {data}")
+        # Progress arrives several times a second: keep per-tick logging at DEBUG
+        # and lazily formatted so it costs nothing when DEBUG is off
+        logger.debug("[WebBridge] Received music progress data: %s", data)
         
         # Convert progress from 0-100 to 0.0-1.0 for Pydantic validation
         progress_percent = data.get("progress_percent", 0.0)
         progress_normalized = progress_percent / 100.0 if progress_percent > 1.0 else progress_percent
+        timestamp = data.get("timestamp") or datetime.now().isoformat()
+        self._audio_frames.set_level("music_progress", progress_normalized)
+        await self._queue_levels_frame()
         
         # Build payload that matches WebProgressPayload structure
         pydantic_payload = {
@@ -1088,26 +1271,9 @@ class WebBridgeService(BaseService, SocketIOValidationMixin, StatusPayloadValida
             "progress": progress_normalized,  # 0.0-1.0 range expected by Pydantic
             "status": data.get("status", "playing"),
             "details": f"Position: {data.get('position_sec', 0.0):.1f}s / {data.get('duration_sec', 0.0):.1f}s",
-            "timestamp": data.get("timestamp", datetime.now().isoformat())
-        }
-        
-        # Build frontend payload with all the data the dashboard needs
-        frontend_payload = {
-            "action": "progress",  # Required by frontend for progress identification
-            "operation": "music_playback",
-            "progress": progress_normalized,
-            "status": data.get("status", "playing"),
-            "track": data.get("track"),
-            "position_sec": data.get("position_sec", 0.0),
-            "duration_sec": data.get("duration_sec", 0.0),
-            "time_remaining_sec": data.get("time_remaining_sec", 0.0),
-            "progress_percent": progress_percent,  # Keep original for frontend compatibility
-            "timestamp": data.get("timestamp", datetime.now().isoformat())
+            "timestamp": timestamp
         }
         
-        logger.info(f"[WebBridge] [PROGRESS_DEBUG] Built Pydantic payload: {pydantic_payload}")
-        logger.info(f"[WebBridge] [PROGRESS_DEBUG] Built frontend payload: {frontend_payload}")
-        
         # Create fallback payload matching WebProgressPayload structure
         fallback_payload = {
             "operation": "music_playback",
@@ -1127,21 +1293,85 @@ class WebBridgeService(BaseService, SocketIOValidationMixin, StatusPayloadValida
             )
             
             if success:
-                logger.info(f"[WebBridge] [PROGRESS_DEBUG] Successfully validated and broadcast progress data")
                 return
-            else:
-                logger.warning(f"[WebBridge] [PROGRESS_DEBUG] Pydantic validation failed, trying direct broadcast")
+            logger.warning("[WebBridge] Progress validation failed, trying direct broadcast")
         except Exception as e:
-            logger.error(f"[WebBridge] [PROGRESS_DEBUG] Error in enhanced validation: {e}")
+            logger.error(f"[WebBridge] Error in progress validation: {e}")
         
-        # Fallback: Direct broadcast without Pydantic validation but with frontend-compatible data
-        logger.info(f"[WebBridge] [PROGRESS_DEBUG] Using direct broadcast with frontend payload")
+        # Fallback: Direct broadcast without Pydantic validation but with
+        # everything the dashboard needs (only built when actually used)
+        frontend_payload = {
+            "action": "progress",  # Required by frontend for progress identification
+            "operation": "music_playback",
+            "progress": progress_normalized,
+            "status": data.get("status", "playing"),
+            "track": data.get("track"),
+            "position_sec": data.get("position_sec", 0.0),
+            "duration_sec": data.get("duration_sec", 0.0),
+            "time_remaining_sec": data.get("time_remaining_sec", 0.0),
+            "progress_percent": progress_percent,  # Keep original for frontend compatibility
+            "timestamp": timestamp
+        }
         await self._broadcast_event_to_dashboard(
             EventTopics.MUSIC_PROGRESS,
             frontend_payload,  # Send the full frontend-compatible payload
             "music_progress",
         )
 
+    async def _handle_voice_audio_level(self, data):
+        """Feed microphone RMS/peak into the binary level meter stream"""
+        self._audio_frames.set_level("mic_rms", data.get("rms"))
+        self._audio_frames.set_level("mic_peak", data.get("peak"))
+        await self._queue_levels_frame()
+
+    async def _handle_speech_amplitude(self, data):
+        """Feed DJ R3X speech amplitude (from CachedSpeechService playback) into the binary level meter stream"""
+        self._audio_frames.set_level("speech_amplitude", data.get("amplitude"))
+        await self._queue_levels_frame()
+
+    async def _handle_tts_audio_data(self, data):
+        """Send a waveform preview of synthesized speech"""
+        audio = data.get("audio_data")
+        sample_rate = data.get("sample_rate")
+        if not data.get("success", True) or not audio or not sample_rate:
+            return
+        samples = np.frombuffer(audio, dtype=np.float32)
+        await self._queue_waveform(SOURCE_SPEECH, samples, len(samples) / sample_rate)
+
+    async def _queue_track_waveform(self, track: Dict[str, Any], duration: Optional[float]) -> None:
+        """Send a waveform preview of the track that started, from its analyzed energy envelope."""
+        path = track.get("filepath") or track.get("path")
+        if not path:
+            return
+        # The offline analyzer stores the envelope in the library index; no decoding here
+        envelope = await asyncio.get_running_loop().run_in_executor(
+            None, load_energy_envelope, os.path.dirname(path), os.path.basename(path)
+        )
+        if envelope is None:
+            self._waveform_frames.pop(SOURCE_MUSIC, None)
+            return
+        hop_sec, values = envelope
+        await self._queue_waveform(SOURCE_MUSIC, values, duration or hop_sec * len(values))
+
+    async def _queue_waveform(self, source: int, values, duration_sec: float) -> None:
+        frame = self._audio_frames.waveform_frame(source, values, duration_sec)
+        self._waveform_frames[source] = frame
+        if self._audio_frame_clients:
+            await self._audio_frame_throttle.submit(f"waveform:{source}", frame)
+
+    async def _queue_levels_frame(self) -> None:
+        """Schedule a level frame; the throttle coalesces to the newest levels at audio_frame_fps."""
+        if self._audio_frame_clients:
+            await self._audio_frame_throttle.submit("levels", None)
+
+    async def _send_audio_frame(self, key: str, frame: Optional[bytes]) -> None:
+        """Emit one binary frame to every client that opted in."""
+        if not self._sio or not self._audio_frame_clients:
+            return
+        if frame is None:  # Levels are packed when sent, so they are never stale
+            frame = self._audio_frames.levels_frame(time.monotonic())
+        await self._sio.emit("audio_frame", frame, room=AUDIO_FRAME_ROOM)
+
     async def _handle_music_queue_updated(self, data):
         """Handle music queue updates"""
         await self._broadcast_event_to_dashboard(
@@ -1159,19 +1389,32 @@ class WebBridgeService(BaseService, SocketIOValidationMixin, StatusPayloadValida
         # Cache the music library data for API endpoint
         tracks = data.get("tracks", {})
         self._music_library_cache = tracks
-        
-        logger.info(f"[WebBridge] Updated music library cache with {len(tracks)} tracks")
+        self._music_dir_mtime = -1.0  # An empty library falls back to a fresh directory listing
+        if self._library_response.set_tracks(format_library_tracks(tracks)):
+            logger.info(f"[WebBridge] Updated music library cache with {len(tracks)} tracks")
         
         # Broadcast the update to connected dashboard clients
         await self._broadcast_event_to_dashboard(
             EventTopics.MUSIC_LIBRARY_UPDATED,
             {
                 "track_count": data.get("track_count", 0),
-                "tracks": tracks
+                "tracks": tracks,
+                "version": self._library_response.version,
             },
             "music_library_updated",
         )
 
+    def _refresh_library_from_music_dir(self) -> None:
+        """List the music directory while CantinaOS has not published a library."""
+        try:
+            mtime = os.stat(self._music_dir).st_mtime
+        except OSError:
+            mtime = None
+        if mtime != self._music_dir_mtime:
+            logger.info("[WebBridge] No cached music library, falling back to filesystem")
+            self._music_dir_mtime = mtime
+            self._library_response.set_tracks(scan_music_dir(self._music_dir))
+
     async def _handle_dj_mode_changed(self, data):
         """Handle DJ mode status changes"""
         is_active = data.get("is_active", False)
@@ -1206,6 +1449,17 @@ class WebBridgeService(BaseService, SocketIOValidationMixin, StatusPayloadValida
         )
         self.logger.critical(f"[WebBridge] CRITICAL DEBUG: Successfully broadcast llm_response event")
 
+    async def _handle_llm_queue_status(self, data):
+        """Handle GPT request queue status - queue depth per priority class for SystemTab"""
+        await self._broadcast_event_to_dashboard(
+            EventTopics.LLM_QUEUE_STATUS,
+            {
+                "priorities": data.get("priorities", {}),
+                "timestamp": data.get("timestamp"),
+            },
+            "llm_queue_status",
+        )
+
     async def _handle_crossfade_started(self, data):
         """Handle crossfade started events"""
         self.logger.info(f"[WebBridge] Forwarding crossfade started to dashboard")
@@ -1222,6 +1476,12 @@ class WebBridgeService(BaseService, SocketIOValidationMixin, StatusPayloadValida
             "crossfade_started",  # DJTab listens for this event name
         )
 
+    async def _handle_crossfade_complete(self, data):
+        """Refresh the music waveform preview; crossfades do not emit MUSIC_PLAYBACK_STARTED"""
+        track = data.get("current_track")
+        if data.get("status") == "success" and track:
+            await self._queue_track_waveform(track, track.get("duration"))
+
     async def _handle_dj_next_track_selected(self, data):
         """Handle DJ next track selection - updates upcoming queue"""
         self.logger.critical(f"[WebBridge] CRITICAL DEBUG: _handle_dj_next_track_selected called with data: {data}")
@@ -1236,7 +1496,7 @@ class WebBridgeService(BaseService, SocketIOValidationMixin, StatusPayloadValida
         queue_track = {
             "title": track_info.get("title", "Unknown Track"),
             "artist": track_info.get("artist", "Unknown Artist"),
-            "duration": self._format_duration(track_info.get("duration", 0)),
+            "duration": format_duration(track_info.get("duration", 0)),
             "track_id": track_info.get("track_id", track_info.get("title", ""))
         }
         
@@ -1254,15 +1514,6 @@ class WebBridgeService(BaseService, SocketIOValidationMixin, StatusPayloadValida
         )
         self.logger.critical(f"[WebBridge] CRITICAL DEBUG: Successfully broadcast dj_queue_update event")
     
-    def _format_duration(self, duration_seconds):
-        """Format duration from seconds to MM:SS format"""
-        if not duration_seconds or duration_seconds <= 0:
-            return "Unknown"
-        
-        minutes = int(duration_seconds // 60)
-        seconds = int(duration_seconds % 60)
-        return f"{minutes}:{seconds:02d}"
-
     async def _handle_llm_response(self, data):
         """Handle LLM response events"""
         await self._broadcast_event_to_dashboard(
@@ -1351,21 +1602,17 @@ class WebBridgeService(BaseService, SocketIOValidationMixin, StatusPayloadValida
             
             is_important_dj_log = any(pattern in log_message for pattern in important_dj_patterns)
             
-            # Rate limiting: Only send system logs every 10 seconds instead of continuously
-            current_time = time.time()
-            throttle_key = f"dashboard_log_{data.get('service', 'unknown')}"
-            last_sent = self._event_throttle_state[throttle_key]["last_sent"]
-            
             # Allow ERROR, WARNING, CRITICAL, and important DJ logs to pass through immediately
-            # Throttle other INFO and other levels to once per 10 seconds per service
+            # Rate limit other INFO and other levels per service; log lines are dropped, never coalesced
             if log_level not in ["ERROR", "WARNING", "CRITICAL"] and not is_important_dj_log:
-                if current_time - last_sent < 10.0:  # 10 second throttle for non-important INFO logs
+                throttle_key = f"dashboard_log:{data.get('service', 'unknown')}"
+                if not self._event_throttle.is_limited(throttle_key) and self._dashboard_log_interval > 0:
+                    self._event_throttle.configure(
+                        throttle_key, 1.0 / self._dashboard_log_interval, coalesce=False
+                    )
+                if not self._event_throttle.allow(throttle_key):
                     return
             
-            # Update throttle state only for non-important logs to avoid throttling important ones
-            if not is_important_dj_log:
-                self._event_throttle_state[throttle_key]["last_sent"] = current_time
-            
             # Validate the log payload
             log_data = {
                 "timestamp": data.get("timestamp", datetime.now().isoformat()),
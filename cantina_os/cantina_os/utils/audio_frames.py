@@ -0,0 +1,114 @@
+"""
+Binary audio level and waveform frames for the dashboard.
+
+Level meters and waveform previews go to the dashboard as small packed
+binary Socket.IO messages instead of JSON events, so a 30 fps meter costs
+a few bytes of struct packing per frame rather than a JSON encode.
+
+Every frame starts with a 12-byte little-endian header:
+
+    offset  size  field
+    0       1     version (1)
+    1       1     kind: 1 = levels, 2 = waveform
+    2       1     source: 0 = levels, 1 = music track, 2 = speech (TTS)
+    3       1     encoding: 1 = float16, 2 = uint8
+    4       2     sequence number (wraps at 65536)
+    6       2     value count
+    8       4     float32: levels - seconds since the bridge started,
+                  waveform - seconds the preview spans
+
+followed by ``count`` values. Level frames carry one float16 per entry of
+``LEVEL_CHANNELS`` (NaN when a channel has no data yet); waveform frames
+carry a peak-decimated preview as uint8 (0-255 of the loudest point).
+"""
+
+import math
+import struct
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+FRAME_VERSION = 1
+HEADER = struct.Struct("<BBBBHHf")
+
+KIND_LEVELS = 1
+KIND_WAVEFORM = 2
+
+SOURCE_LEVELS = 0
+SOURCE_MUSIC = 1
+SOURCE_SPEECH = 2
+
+ENCODING_FLOAT16 = 1
+ENCODING_UINT8 = 2
+
+# Order of the values in a level frame
+LEVEL_CHANNELS = ("mic_rms", "mic_peak", "speech_amplitude", "music_progress")
+
+DEFAULT_WAVEFORM_POINTS = 256
+
+
+def pack_levels(seq: int, levels: Sequence[float], time_sec: float) -> bytes:
+    """Pack one value per ``LEVEL_CHANNELS`` entry as float16."""
+    values = np.asarray(levels, dtype="<f2")
+    return HEADER.pack(
+        FRAME_VERSION, KIND_LEVELS, SOURCE_LEVELS, ENCODING_FLOAT16, seq & 0xFFFF, len(values), time_sec
+    ) + values.tobytes()
+
+
+def decimate_peaks(values: Sequence[float], points: int = DEFAULT_WAVEFORM_POINTS) -> np.ndarray:
+    """Reduce ``values`` to at most ``points`` buckets, keeping each bucket's peak magnitude."""
+    data = np.abs(np.asarray(values, dtype=np.float32).ravel())
+    if len(data) <= points:
+        return data
+    edges = np.linspace(0, len(data), points + 1).astype(np.int64)
+    return np.maximum.reduceat(data, edges[:-1])
+
+
+def pack_waveform(
+    seq: int, source: int, values: Sequence[float], duration_sec: float, points: int = DEFAULT_WAVEFORM_POINTS
+) -> bytes:
+    """Pack a peak-decimated waveform preview as uint8, scaled to its loudest point."""
+    peaks = decimate_peaks(values, points)
+    top = float(peaks.max()) if len(peaks) else 0.0
+    if top > 0 and math.isfinite(top):
+        scaled = np.nan_to_num(peaks / top * 255.0)
+    else:
+        scaled = np.zeros(len(peaks))
+    data = np.round(scaled).astype(np.uint8)
+    return HEADER.pack(
+        FRAME_VERSION, KIND_WAVEFORM, source, ENCODING_UINT8, seq & 0xFFFF, len(data), duration_sec
+    ) + data.tobytes()
+
+
+def unpack_frame(frame: bytes) -> Tuple[Dict[str, float], np.ndarray]:
+    """Split a frame into its header fields and values (float32 or uint8)."""
+    version, kind, source, encoding, seq, count, time_value = HEADER.unpack_from(frame)
+    dtype = "<f2" if encoding == ENCODING_FLOAT16 else np.uint8
+    values = np.frombuffer(frame, dtype=dtype, count=count, offset=HEADER.size)
+    header = {
+        "version": version, "kind": kind, "source": source, "encoding": encoding,
+        "seq": seq, "count": count, "time": time_value,
+    }
+    return header, values.astype(np.float32) if encoding == ENCODING_FLOAT16 else values
+
+
+class AudioFrameState:
+    """Latest value of every level channel and the sequence counter shared by all frames."""
+
+    def __init__(self, clock_start: float):
+        self._clock_start = clock_start
+        self.levels = [math.nan] * len(LEVEL_CHANNELS)
+        self.seq = 0
+
+    def set_level(self, channel: str, value: Optional[float]) -> None:
+        self.levels[LEVEL_CHANNELS.index(channel)] = math.nan if value is None else float(value)
+
+    def next_seq(self) -> int:
+        self.seq = (self.seq + 1) & 0xFFFF
+        return self.seq
+
+    def levels_frame(self, now: float) -> bytes:
+        return pack_levels(self.next_seq(), self.levels, now - self._clock_start)
+
+    def waveform_frame(self, source: int, values: Sequence[float], duration_sec: float) -> bytes:
+        return pack_waveform(self.next_seq(), source, values, duration_sec)
@@ -0,0 +1,162 @@
+"""
+Audio level metering for CantinaOS.
+
+Vectorised RMS/peak metering over batches of audio blocks. Levels are computed
+for a whole batch in one NumPy pass and accumulated into fixed-length windows,
+so callers can publish a decimated level stream (e.g. 15 Hz) regardless of the
+capture block size.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import List, Optional
+
+import numpy as np
+
+
+def rms_envelope(samples: np.ndarray, sample_rate: int, update_rate_hz: float = 15.0) -> np.ndarray:
+    """RMS of each ``1 / update_rate_hz`` window of a float clip, for replaying its level during playback.
+
+    Args:
+        samples: Float samples in -1..1, shaped (frames,) or (frames, channels)
+        sample_rate: Sample rate in Hz
+        update_rate_hz: Windows per second
+
+    Returns:
+        One RMS value (0..1 of full scale) per window; the last may be partial
+    """
+    data = np.asarray(samples, dtype=np.float32)
+    if data.ndim > 1:
+        data = data.reshape(len(data), -1)
+    else:
+        data = data[:, None]
+    if not len(data):
+        return np.zeros(0, dtype=np.float32)
+    window = max(1, int(sample_rate / update_rate_hz))
+    edges = np.arange(0, len(data), window)
+    sum_squares = np.add.reduceat(np.einsum("ij,ij->i", data, data), edges)
+    counts = np.diff(np.append(edges, len(data))) * data.shape[1]
+    return np.sqrt(sum_squares / counts).astype(np.float32)
+
+
+@dataclass
+class AudioLevel:
+    """One metering window."""
+
+    rms: float  # Normalised to 0..1 of full scale
+    peak: float  # Normalised to 0..1 of full scale
+    rms_db: float  # dBFS, floored at -120
+    timestamp: float  # Capture time of the last block in the window
+    window_ms: float
+
+
+def block_levels(data: np.ndarray, lengths: Optional[np.ndarray] = None):
+    """Compute per-block sum of squares and peak in one vectorised pass.
+
+    Args:
+        data: Array shaped (blocks, frames, channels)
+        lengths: Valid frames per block, None if every block is full
+
+    Returns:
+        Tuple of (sum_squares, peak, frames) arrays with one entry per block
+    """
+    samples = data.astype(np.float32, copy=False)
+    frames = np.full(len(data), data.shape[1], dtype=np.int64)
+
+    if lengths is not None and np.any(lengths != data.shape[1]):
+        # Ignore stale samples past the end of short blocks
+        mask = np.arange(data.shape[1])[None, :, None] < lengths[:, None, None]
+        samples = np.where(mask, samples, 0.0)
+        frames = lengths.astype(np.int64)
+
+    flat = samples.reshape(len(samples), -1)
+    sum_squares = np.einsum("ij,ij->i", flat, flat, dtype=np.float64)
+    peak = np.abs(flat).max(axis=1) if flat.shape[1] else np.zeros(len(flat))
+    return sum_squares, peak, frames * data.shape[2]
+
+
+class AudioLevelMeter:
+    """
+    Accumulates per-block levels into fixed-duration windows.
+
+    Call ``process`` with each drained batch; it returns the windows that
+    completed during the batch (usually zero or one).
+    """
+
+    def __init__(self, sample_rate: int, update_rate_hz: float = 15.0, dtype=np.int16):
+        """Initialize the meter.
+
+        Args:
+            sample_rate: Capture sample rate in Hz
+            update_rate_hz: Level windows per second
+            dtype: Sample dtype, used to normalise to full scale
+        """
+        if update_rate_hz <= 0:
+            raise ValueError("update_rate_hz must be positive")
+
+        self._sample_rate = sample_rate
+        self._window_frames = max(1, int(sample_rate / update_rate_hz))
+        if np.issubdtype(np.dtype(dtype), np.integer):
+            self._full_scale = float(np.iinfo(dtype).max) + 1.0
+        else:
+            self._full_scale = 1.0
+
+        self._sum_squares = 0.0
+        self._samples = 0
+        self._frames = 0
+        self._peak = 0.0
+
+    def reset(self) -> None:
+        """Discard the partially accumulated window."""
+        self._sum_squares = 0.0
+        self._samples = 0
+        self._frames = 0
+        self._peak = 0.0
+
+    def process(
+        self,
+        data: np.ndarray,
+        lengths: Optional[np.ndarray] = None,
+        timestamps: Optional[np.ndarray] = None,
+    ) -> List[AudioLevel]:
+        """Meter a batch of blocks.
+
+        Args:
+            data: Array shaped (blocks, frames, channels)
+            lengths: Valid frames per block, None if every block is full
+            timestamps: Capture time per block
+
+        Returns:
+            Completed metering windows, oldest first
+        """
+        if len(data) == 0:
+            return []
+
+        sum_squares, peaks, samples = block_levels(data, lengths)
+        frames = lengths if lengths is not None else np.full(len(data), data.shape[1])
+
+        levels = []
+        for i in range(len(data)):
+            self._sum_squares += float(sum_squares[i])
+            self._samples += int(samples[i])
+            self._frames += int(frames[i])
+            if peaks[i] > self._peak:
+                self._peak = float(peaks[i])
+
+            if self._frames >= self._window_frames:
+                timestamp = float(timestamps[i]) if timestamps is not None else 0.0
+                levels.append(self._close_window(timestamp))
+        return levels
+
+    def _close_window(self, timestamp: float) -> AudioLevel:
+        """Turn the accumulated window into an AudioLevel and start a new one."""
+        rms = math.sqrt(self._sum_squares / self._samples) / self._full_scale if self._samples else 0.0
+        level = AudioLevel(
+            rms=rms,
+            peak=self._peak / self._full_scale,
+            rms_db=20.0 * math.log10(rms) if rms > 1e-6 else -120.0,
+            timestamp=timestamp,
+            window_ms=self._frames * 1000.0 / self._sample_rate,
+        )
+        self.reset()
+        return level
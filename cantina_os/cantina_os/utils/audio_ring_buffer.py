@@ -0,0 +1,197 @@
+"""
+Audio ring buffer for CantinaOS.
+
+Preallocated, single-producer/single-consumer ring buffer used to hand audio
+blocks from the PortAudio callback thread to the asyncio event loop without
+touching the loop (no locks, no futures, no allocations on the write path).
+"""
+
+from dataclasses import dataclass
+from typing import List, Tuple
+
+import numpy as np
+
+
+@dataclass
+class RingBufferStats:
+    """Counters describing ring buffer health."""
+
+    blocks_written: int = 0
+    blocks_read: int = 0
+    overruns: int = 0  # Blocks dropped because the consumer fell behind
+    dropped_frames: int = 0
+    max_fill: int = 0  # High-water mark in blocks
+
+
+class AudioRingBuffer:
+    """
+    Fixed-capacity ring of audio blocks.
+
+    The producer (audio callback thread) only advances the write index and the
+    consumer (event loop) only advances the read index, so under the GIL the
+    two sides never need a lock. Each slot holds up to ``frames_per_block``
+    frames plus the frame count and capture timestamp of the block.
+
+    When the buffer is full the incoming block is dropped and counted as an
+    overrun - the realtime thread never waits.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        frames_per_block: int,
+        channels: int = 1,
+        dtype=np.int16,
+    ):
+        """Initialize the ring buffer.
+
+        Args:
+            capacity: Number of blocks the buffer can hold
+            frames_per_block: Max frames per block (the stream blocksize)
+            channels: Channels per frame
+            dtype: Sample dtype
+        """
+        if capacity < 1 or frames_per_block < 1:
+            raise ValueError("capacity and frames_per_block must be positive")
+
+        self._capacity = capacity
+        self._frames_per_block = frames_per_block
+        self._data = np.zeros((capacity, frames_per_block, channels), dtype=dtype)
+        self._lengths = np.zeros(capacity, dtype=np.int64)
+        self._timestamps = np.zeros(capacity, dtype=np.float64)
+
+        # Monotonic counters, slot = index % capacity.
+        # Only the producer writes _write_index, only the consumer writes _read_index.
+        self._write_index = 0
+        self._read_index = 0
+
+        self.stats = RingBufferStats()
+
+    @property
+    def capacity(self) -> int:
+        """Number of blocks the buffer can hold."""
+        return self._capacity
+
+    @property
+    def frames_per_block(self) -> int:
+        """Max frames per block."""
+        return self._frames_per_block
+
+    def __len__(self) -> int:
+        """Number of blocks ready to be read."""
+        return self._write_index - self._read_index
+
+    # ------------------------------------------------------------------
+    # Producer side (audio thread)
+    # ------------------------------------------------------------------
+
+    def write(self, block: np.ndarray, timestamp: float) -> bool:
+        """Copy a block into the next free slot.
+
+        Args:
+            block: Array shaped (frames, channels) or (frames,)
+            timestamp: Capture time of the first frame
+
+        Returns:
+            False if the block was dropped because the buffer is full
+        """
+        frames = min(len(block), self._frames_per_block)
+        fill = self._write_index - self._read_index
+        if fill >= self._capacity:
+            self.stats.overruns += 1
+            self.stats.dropped_frames += len(block)
+            return False
+
+        slot = self._write_index % self._capacity
+        self._data[slot, :frames] = block[:frames].reshape(frames, -1)
+        self._lengths[slot] = frames
+        self._timestamps[slot] = timestamp
+        if len(block) > frames:
+            self.stats.dropped_frames += len(block) - frames
+
+        # Publish only after the slot is fully written
+        self._write_index += 1
+        self.stats.blocks_written += 1
+        if fill + 1 > self.stats.max_fill:
+            self.stats.max_fill = fill + 1
+        return True
+
+    # ------------------------------------------------------------------
+    # Consumer side (event loop)
+    # ------------------------------------------------------------------
+
+    def peek(self, max_blocks: int = 0) -> List[Tuple[np.ndarray, float]]:
+        """Return views of the readable blocks without releasing them.
+
+        The views stay valid until ``release`` is called for them.
+
+        Args:
+            max_blocks: Max blocks to return, 0 for all available
+
+        Returns:
+            List of (frames view, timestamp) tuples in capture order
+        """
+        available = self._write_index - self._read_index
+        if max_blocks > 0:
+            available = min(available, max_blocks)
+
+        blocks = []
+        for i in range(available):
+            slot = (self._read_index + i) % self._capacity
+            blocks.append((self._data[slot, : self._lengths[slot]], float(self._timestamps[slot])))
+        return blocks
+
+    def peek_segments(self, max_blocks: int = 0) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Return the readable blocks as at most two contiguous array views.
+
+        Each segment is ``(data, lengths, timestamps)`` where ``data`` has shape
+        (blocks, frames_per_block, channels). Two segments are returned when the
+        readable region wraps around the end of the buffer. Used for vectorised
+        processing of a whole batch in one pass.
+
+        Args:
+            max_blocks: Max blocks to return, 0 for all available
+
+        Returns:
+            List of (data, lengths, timestamps) views in capture order
+        """
+        available = self._write_index - self._read_index
+        if max_blocks > 0:
+            available = min(available, max_blocks)
+        if available <= 0:
+            return []
+
+        start = self._read_index % self._capacity
+        first = min(available, self._capacity - start)
+        segments = [(
+            self._data[start:start + first],
+            self._lengths[start:start + first],
+            self._timestamps[start:start + first],
+        )]
+        if available > first:
+            rest = available - first
+            segments.append((self._data[:rest], self._lengths[:rest], self._timestamps[:rest]))
+        return segments
+
+    def release(self, count: int) -> None:
+        """Hand ``count`` blocks back to the producer."""
+        count = min(count, self._write_index - self._read_index)
+        self._read_index += count
+        self.stats.blocks_read += count
+
+    def read(self, max_blocks: int = 0) -> List[Tuple[np.ndarray, float]]:
+        """Copy out and release the readable blocks.
+
+        Args:
+            max_blocks: Max blocks to read, 0 for all available
+
+        Returns:
+            List of (frames copy, timestamp) tuples in capture order
+        """
+        blocks = [(data.copy(), timestamp) for data, timestamp in self.peek(max_blocks)]
+        self.release(len(blocks))
+        return blocks
+
+    def clear(self) -> None:
+        """Drop all readable blocks (consumer side)."""
+        self._read_index = self._write_index
@@ -0,0 +1,121 @@
+"""
+Beat grid helpers for beat-aligned DJ transitions.
+
+Beat times come from the offline analyzer's library index (see
+``utils.music_analysis``). The analyzer only tracks beats, not bar lines, so
+every ``beats_per_bar``-th beat counting from the first one is treated as a
+downbeat - right for the 4/4 cantina catalogue, where tracks start on the one.
+
+Transition timing is worked out once per track when playback starts, so the
+music controller never has to poll the playhead to find a good crossfade
+point.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+DEFAULT_BEATS_PER_BAR = 4
+# A crossfade this late for a downbeat still counts as on it
+DEFAULT_DOWNBEAT_TOLERANCE = 0.08
+
+
+@dataclass
+class CrossfadeTiming:
+    """When the crossfade out of a track starts and how long it lasts, in track time."""
+
+    start: float  # Seconds into the outgoing track
+    duration: float  # Seconds, a whole number of bars when a beat grid is known
+    outro_start: float  # Seconds into the outgoing track where its outro begins
+    beat_aligned: bool
+
+
+class BeatGrid:
+    """Beat and downbeat times (seconds) of one track."""
+
+    def __init__(self, beats: Sequence[float], beats_per_bar: int = DEFAULT_BEATS_PER_BAR):
+        self.beats: List[float] = sorted(float(b) for b in beats)
+        self.beats_per_bar = max(1, beats_per_bar)
+        self.downbeats: List[float] = self.beats[::self.beats_per_bar]
+        intervals = sorted(b - a for a, b in zip(self.beats, self.beats[1:]) if b > a)
+        # Median beat interval is robust to the odd missed or doubled beat
+        self.beat_length: Optional[float] = intervals[len(intervals) // 2] if intervals else None
+
+    def __bool__(self) -> bool:
+        return self.beat_length is not None and len(self.downbeats) > 1
+
+    @property
+    def bar_length(self) -> Optional[float]:
+        return self.beat_length * self.beats_per_bar if self.beat_length else None
+
+    def whole_bars(self, seconds: float, min_bars: int = 1) -> float:
+        """Round a duration to the nearest whole number of bars (at least ``min_bars``)."""
+        if not self:
+            return seconds
+        bars = max(min_bars, int(round(seconds / self.bar_length)))
+        return bars * self.bar_length
+
+    def next_downbeat(self, position: float, tolerance: float = 0.0) -> Optional[float]:
+        """First downbeat at or after ``position``, extrapolating past the last detected one.
+
+        A downbeat up to ``tolerance`` seconds before ``position`` is returned
+        instead of the next one, so arriving a few ms late does not cost a bar.
+        """
+        if not self:
+            return None
+        position -= tolerance
+        for downbeat in self.downbeats:
+            if downbeat >= position:
+                return downbeat
+        bars_past = int((position - self.downbeats[-1]) / self.bar_length) + 1
+        return self.downbeats[-1] + bars_past * self.bar_length
+
+    def downbeat_wait(self, position: float, max_wait: float, tolerance: float = DEFAULT_DOWNBEAT_TOLERANCE) -> float:
+        """Seconds from ``position`` to the downbeat a crossfade should start on.
+
+        0 when ``position`` is within ``tolerance`` after a downbeat, or when
+        the next one is more than ``max_wait`` away.
+        """
+        if not self:
+            return 0.0
+        wait = self.next_downbeat(position, tolerance) - position
+        return wait if 0.0 < wait <= max_wait else 0.0
+
+    def last_downbeat_before(self, position: float) -> Optional[float]:
+        """Last detected downbeat at or before ``position``."""
+        previous = None
+        for downbeat in self.downbeats:
+            if downbeat > position:
+                break
+            previous = downbeat
+        return previous
+
+
+def plan_crossfade(
+    duration: float,
+    grid: Optional[BeatGrid] = None,
+    outro_length: Optional[float] = None,
+    default_duration: float = 3.0,
+    max_duration: float = 16.0,
+) -> CrossfadeTiming:
+    """Pick the crossfade out of a track.
+
+    The crossfade covers the outro (capped at ``max_duration``, or
+    ``default_duration`` when the outro is unknown), lasts a whole number of
+    bars and starts on a downbeat early enough to finish before the track
+    ends. Without a beat grid it simply ends at the end of the track.
+    """
+    fade = min(outro_length, max_duration) if outro_length else default_duration
+    fade = max(0.0, min(fade, duration))
+    outro_start = duration - outro_length if outro_length else duration - fade
+
+    if not grid:
+        start = max(0.0, duration - fade)
+        return CrossfadeTiming(start=start, duration=fade, outro_start=max(0.0, outro_start), beat_aligned=False)
+
+    fade = grid.whole_bars(fade)
+    latest_start = duration - fade
+    start = grid.last_downbeat_before(min(max(outro_start, duration - max_duration), latest_start))
+    if start is None:
+        return CrossfadeTiming(start=max(0.0, latest_start), duration=min(fade, duration),
+                               outro_start=max(0.0, outro_start), beat_aligned=False)
+    return CrossfadeTiming(start=start, duration=fade, outro_start=max(0.0, outro_start), beat_aligned=True)
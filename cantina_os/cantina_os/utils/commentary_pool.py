@@ -0,0 +1,304 @@
+"""
+Rolling pool of next-track candidates for DJ mode.
+
+BrainService keeps a small pool of pre-selected next tracks, each with its
+transition commentary generated and cached concurrently. When the current
+track is ending, the first candidate whose commentary finished caching is
+promoted; the rest are recycled for the following transition. This module
+only holds the book-keeping - requesting commentary, caching speech and
+building plans stays in BrainService.
+
+The pool also measures how long commentary takes from request to cached
+audio, so BrainService can start generation as late as is still safe, and
+counts failures across candidates so a GPT or TTS outage pauses requests
+instead of cycling through the library.
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+
+class CandidateState(str, Enum):
+    """Lifecycle of a candidate's commentary."""
+
+    SELECTED = "selected"  # Track picked, commentary not requested yet
+    PENDING_COMMENTARY = "pending_commentary"  # Waiting on GPT_COMMENTARY_RESPONSE
+    PENDING_SPEECH = "pending_speech"  # Waiting on SPEECH_CACHE_READY
+    READY = "ready"  # Commentary audio cached and playable
+    FAILED = "failed"  # GPT or speech caching failed
+
+
+@dataclass(eq=False)
+class CommentaryCandidate:
+    """A pre-selected next track and the state of its commentary."""
+
+    track: Any  # MusicTrack
+    request_id: Optional[str] = None
+    cache_key: Optional[str] = None
+    state: CandidateState = CandidateState.SELECTED
+    requested_at: Optional[float] = None
+    ready_at: Optional[float] = None
+    duration: Optional[float] = None  # Commentary length in seconds
+    attempts: int = 1
+
+    @property
+    def name(self) -> str:
+        """Music library key of the candidate track."""
+        return self.track.name
+
+    @property
+    def is_ready(self) -> bool:
+        return self.state == CandidateState.READY
+
+
+class CommentaryLatencyEstimator:
+    """Rolling estimate of commentary latency (request to cached audio)."""
+
+    def __init__(self, window: int = 20, quantile: float = 0.9, prior: float = 15.0, min_samples: int = 3):
+        """Initialize the estimator.
+
+        Args:
+            window: Number of recent measurements kept
+            quantile: Quantile of the measurements used as the estimate
+            prior: Estimate (s) used until ``min_samples`` measurements exist
+            min_samples: Measurements needed before the prior is dropped
+        """
+        self._samples: Deque[float] = deque(maxlen=window)
+        self.quantile = quantile
+        self.prior = prior
+        self.min_samples = min_samples
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, seconds: float) -> None:
+        if seconds >= 0:
+            self._samples.append(seconds)
+
+    def estimate(self) -> float:
+        """Latency (s) that the given quantile of recent requests stayed under."""
+        if len(self._samples) < self.min_samples:
+            return self.prior
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, math.ceil(self.quantile * len(ordered)) - 1))
+        return ordered[index]
+
+
+class CommentaryCandidatePool:
+    """Fixed-size set of next-track candidates, kept in selection order."""
+
+    def __init__(
+        self,
+        size: int = 3,
+        max_attempts: int = 2,
+        max_consecutive_failures: int = 6,
+        failure_backoff: float = 60.0,
+    ):
+        """Initialize the pool.
+
+        Args:
+            size: Number of candidates to keep in flight
+            max_attempts: Commentary attempts per candidate before it is replaced
+            max_consecutive_failures: Failures in a row, across candidates, that suspend requests
+            failure_backoff: Seconds requests stay suspended unless a candidate succeeds
+        """
+        self.size = max(1, size)
+        self.max_attempts = max(1, max_attempts)
+        self.max_consecutive_failures = max(1, max_consecutive_failures)
+        self.failure_backoff = failure_backoff
+        self.consecutive_failures = 0
+        self._suspended_until: Optional[float] = None
+        self._candidates: List[CommentaryCandidate] = []
+        self._ready_event = asyncio.Event()
+        self.latency = CommentaryLatencyEstimator()  # Kept across clear()
+        self.stats: Dict[str, int] = {
+            "requested": 0,
+            "ready": 0,
+            "failed": 0,
+            "promoted_ready": 0,
+            "promoted_pending": 0,
+            "recycled": 0,
+            "suspended": 0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._candidates)
+
+    def __iter__(self) -> Iterator[CommentaryCandidate]:
+        return iter(list(self._candidates))
+
+    @property
+    def missing(self) -> int:
+        """Number of slots that need a new candidate."""
+        return self.size - len(self._candidates)
+
+    @property
+    def suspended_for(self) -> float:
+        """Seconds left before commentary may be requested again after repeated failures."""
+        if self._suspended_until is None:
+            return 0.0
+        remaining = self._suspended_until - time.monotonic()
+        if remaining <= 0:
+            self._suspended_until = None
+            self.consecutive_failures = 0
+            return 0.0
+        return remaining
+
+    @property
+    def track_names(self) -> List[str]:
+        return [c.name for c in self._candidates]
+
+    def add(self, track: Any, request_id: Optional[str] = None) -> CommentaryCandidate:
+        """Add a candidate, optionally with its commentary already requested."""
+        candidate = CommentaryCandidate(track=track)
+        self._candidates.append(candidate)
+        if request_id:
+            self.request(candidate, request_id)
+        return candidate
+
+    def request(self, candidate: CommentaryCandidate, request_id: str) -> None:
+        """Record that commentary was requested for a selected candidate."""
+        candidate.request_id = request_id
+        candidate.state = CandidateState.PENDING_COMMENTARY
+        candidate.requested_at = time.monotonic()
+        self.stats["requested"] += 1
+
+    def by_request(self, request_id: str) -> Optional[CommentaryCandidate]:
+        if not request_id:
+            return None
+        for candidate in self._candidates:
+            if candidate.request_id == request_id:
+                return candidate
+        return None
+
+    def by_cache_key(self, cache_key: str) -> Optional[CommentaryCandidate]:
+        if not cache_key:
+            return None
+        for candidate in self._candidates:
+            if candidate.cache_key == cache_key:
+                return candidate
+        return None
+
+    def mark_commentary(self, request_id: str, cache_key: str) -> Optional[CommentaryCandidate]:
+        """Record that commentary text arrived and speech caching was requested."""
+        candidate = self.by_request(request_id)
+        if candidate and candidate.state == CandidateState.PENDING_COMMENTARY:
+            candidate.cache_key = cache_key
+            candidate.state = CandidateState.PENDING_SPEECH
+        return candidate
+
+    def mark_ready(self, cache_key: str, duration: Optional[float] = None) -> Optional[CommentaryCandidate]:
+        """Record that a candidate's commentary audio is cached."""
+        candidate = self.by_cache_key(cache_key)
+        if candidate and candidate.state == CandidateState.PENDING_SPEECH:
+            candidate.state = CandidateState.READY
+            candidate.ready_at = time.monotonic()
+            candidate.duration = duration
+            if candidate.requested_at is not None:
+                self.latency.record(candidate.ready_at - candidate.requested_at)
+            self.stats["ready"] += 1
+            self.consecutive_failures = 0
+            self._suspended_until = None
+            self._ready_event.set()
+        return candidate
+
+    def mark_failed(self, request_id: Optional[str] = None, cache_key: Optional[str] = None) -> Optional[CommentaryCandidate]:
+        """Record a GPT or speech caching failure for a candidate."""
+        candidate = None
+        if request_id:
+            candidate = self.by_request(request_id)
+        if candidate is None and cache_key:
+            candidate = self.by_cache_key(cache_key)
+        if candidate and candidate.state != CandidateState.READY:
+            candidate.state = CandidateState.FAILED
+            self.stats["failed"] += 1
+            self.consecutive_failures += 1
+            if self.consecutive_failures >= self.max_consecutive_failures and self._suspended_until is None:
+                self._suspended_until = time.monotonic() + self.failure_backoff
+                self.stats["suspended"] += 1
+        return candidate
+
+    def retry(self, candidate: CommentaryCandidate, request_id: str) -> None:
+        """Re-request commentary for a failed candidate under a new request id."""
+        self._reset(candidate)
+        candidate.attempts += 1
+        self.request(candidate, request_id)
+
+    def recycle(self, candidate: CommentaryCandidate) -> None:
+        """Keep an unused candidate's track but drop its commentary for regeneration."""
+        self._reset(candidate)
+        candidate.attempts = 1
+        self.stats["recycled"] += 1
+
+    @staticmethod
+    def _reset(candidate: CommentaryCandidate) -> None:
+        candidate.request_id = None
+        candidate.cache_key = None
+        candidate.state = CandidateState.SELECTED
+        candidate.requested_at = None
+        candidate.ready_at = None
+        candidate.duration = None
+
+    def failed(self) -> List[CommentaryCandidate]:
+        return [c for c in self._candidates if c.state == CandidateState.FAILED]
+
+    def selected(self) -> List[CommentaryCandidate]:
+        """Candidates whose commentary has not been requested yet."""
+        return [c for c in self._candidates if c.state == CandidateState.SELECTED]
+
+    def first_ready(self) -> Optional[CommentaryCandidate]:
+        """The candidate whose commentary became ready first."""
+        ready = [c for c in self._candidates if c.is_ready]
+        return min(ready, key=lambda c: c.ready_at) if ready else None
+
+    def front_runner(self) -> Optional[CommentaryCandidate]:
+        """The candidate that would be promoted right now, ready or not."""
+        ready = self.first_ready()
+        if ready:
+            return ready
+        for candidate in self._candidates:
+            if candidate.state != CandidateState.FAILED:
+                return candidate
+        return None
+
+    def has_pending(self) -> bool:
+        return any(
+            c.state in (CandidateState.PENDING_COMMENTARY, CandidateState.PENDING_SPEECH)
+            for c in self._candidates
+        )
+
+    async def wait_for_ready(self, timeout: float) -> Optional[CommentaryCandidate]:
+        """Wait up to ``timeout`` seconds for any candidate to become ready."""
+        ready = self.first_ready()
+        if ready or timeout <= 0 or not self.has_pending():
+            return ready
+        self._ready_event.clear()
+        try:
+            await asyncio.wait_for(self._ready_event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return self.first_ready()
+
+    def promote(self) -> Optional[CommentaryCandidate]:
+        """Remove and return the front runner, preferring ready commentary."""
+        candidate = self.front_runner()
+        if candidate is None:
+            return None
+        self._candidates.remove(candidate)
+        self.stats["promoted_ready" if candidate.is_ready else "promoted_pending"] += 1
+        return candidate
+
+    def remove(self, candidate: CommentaryCandidate) -> None:
+        if candidate in self._candidates:
+            self._candidates.remove(candidate)
+
+    def clear(self) -> List[CommentaryCandidate]:
+        """Empty the pool, returning the candidates that were in it."""
+        removed, self._candidates = self._candidates, []
+        self._ready_event.clear()
+        return removed
@@ -0,0 +1,76 @@
+"""
+JSON encoding for dashboard Socket.IO traffic.
+
+Passed to ``socketio.AsyncServer(json=...)`` so outbound packets are encoded
+with orjson when it is installed (standard library ``json`` otherwise).
+Payloads can also be encoded ahead of time with :func:`encode`; the
+resulting :class:`EncodedPayload` is spliced into the Socket.IO packet
+as-is. WebBridgeService encodes each broadcast payload once, so the single
+room emit and any later replay of it reuse the same text, and each
+StateStore delta once for all clients; the state snapshot keeps its
+encoding until the state sequence moves on.
+"""
+
+import json
+import logging
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+class EncodedPayload:
+    """A payload that has already been encoded to JSON text."""
+
+    __slots__ = ("text",)
+
+    def __init__(self, text: str):
+        self.text = text
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    def __repr__(self) -> str:
+        return f"EncodedPayload({self.text[:60]!r})"
+
+
+def _dumps(obj: Any) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError as e:
+            # Types orjson refuses (e.g. ints over 64 bits) get the stdlib's say
+            logger.debug(f"orjson could not encode payload, using json: {e}")
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def encode(obj: Any) -> EncodedPayload:
+    """Encode a payload once for reuse across emits."""
+    return EncodedPayload(_dumps(obj))
+
+
+def dumps(obj: Any, **kwargs) -> str:
+    """``json.dumps`` replacement for Socket.IO packets.
+
+    Socket.IO hands over ``[event_name, *args]``; any pre-encoded argument is
+    inserted verbatim instead of being encoded again. Output is always
+    compact, which is what Socket.IO asks for anyway.
+    """
+    if isinstance(obj, list) and any(isinstance(item, EncodedPayload) for item in obj):
+        return "[" + ",".join(
+            item.text if isinstance(item, EncodedPayload) else _dumps(item) for item in obj
+        ) + "]"
+    if isinstance(obj, EncodedPayload):
+        return obj.text
+    return _dumps(obj)
+
+
+def loads(text: Any, **kwargs) -> Any:
+    """``json.loads`` replacement for Socket.IO packets."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text, **kwargs)
@@ -0,0 +1,80 @@
+"""
+Bounded replay buffer for dashboard events.
+
+Every event the web bridge broadcasts gets a sequence number and is kept,
+already encoded, in a fixed-size ring per topic - so a chatty topic (music
+progress, interim transcripts) cannot push the last few log lines or
+transcripts out, and memory stays constant however long the bridge runs.
+
+A reconnecting dashboard reports the last sequence number it saw and is sent
+the events it missed. If a ring has already overwritten one of those events
+the client is too far behind, and gets a state snapshot instead.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+DEFAULT_CAPACITY_PER_TOPIC = 20
+
+
+@dataclass
+class ReplayEntry:
+    seq: int
+    topic: str
+    event_name: str
+    payload: Any  # Encoded once when broadcast, reused for every replay
+
+
+class EventReplayBuffer:
+    """Fixed-capacity ring buffer per topic with a shared sequence counter."""
+
+    def __init__(self, epoch: str, capacity_per_topic: int = DEFAULT_CAPACITY_PER_TOPIC):
+        self.epoch = epoch
+        self.capacity_per_topic = max(1, capacity_per_topic)
+        self.seq = 0
+        self._rings: Dict[str, Deque[ReplayEntry]] = {}
+        self._evicted_through: Dict[str, int] = {}  # Highest sequence number dropped per topic
+
+    def next_seq(self) -> int:
+        """Reserve the sequence number for the next event."""
+        self.seq += 1
+        return self.seq
+
+    def append(self, seq: int, topic: str, event_name: str, payload: Any) -> None:
+        ring = self._rings.get(topic)
+        if ring is None:
+            ring = self._rings[topic] = deque(maxlen=self.capacity_per_topic)
+        if len(ring) == ring.maxlen:
+            self._evicted_through[topic] = ring[0].seq
+        ring.append(ReplayEntry(seq, topic, event_name, payload))
+
+    def since(
+        self,
+        epoch: Optional[str],
+        seq: int,
+        until: Optional[int] = None,
+        accepts: Callable[[str], bool] = lambda topic: True,
+    ) -> Optional[List[ReplayEntry]]:
+        """Events after ``seq`` (up to ``until``) on accepted topics, oldest first.
+
+        Returns None when the client has to start from a snapshot instead:
+        the bridge restarted (different epoch), the sequence number is from
+        the future, or an event it missed has been overwritten.
+        """
+        until = self.seq if until is None else until
+        if epoch != self.epoch or seq < 0 or seq > until:
+            return None
+
+        missed: List[ReplayEntry] = []
+        for topic, ring in self._rings.items():
+            if not accepts(topic):
+                continue
+            if self._evicted_through.get(topic, 0) > seq:
+                return None
+            missed.extend(entry for entry in ring if seq < entry.seq <= until)
+        missed.sort(key=lambda entry: entry.seq)
+        return missed
+
+    def __len__(self) -> int:
+        return sum(len(ring) for ring in self._rings.values())
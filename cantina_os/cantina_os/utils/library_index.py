@@ -0,0 +1,119 @@
+"""
+Music library index.
+
+Per-track audio features are computed offline and cached in a JSON index
+that lives next to the music files, so services get them without any
+runtime analysis cost. The index is keyed by file name:
+
+    {
+        "version": 1,
+        "tracks": {
+            "Doolstan.mp3": {
+                "features": {"tempo": 122.0, "energy": 0.71, "key": "8A",
+                             "loudness": -11.2, "spectral_centroid": 2150.0}
+            }
+        }
+    }
+
+The index is written by the offline analyzer (``utils.music_analysis``),
+which also stores the content hash each entry was computed from plus the
+beat grid and energy envelope. Tracks missing from the index (or with
+unreadable entries) simply have no features; consumers fall back to
+feature-less behaviour for them.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..models.music_models import TrackFeatures
+
+LIBRARY_INDEX_FILENAME = "library_index.json"
+LIBRARY_INDEX_VERSION = 1
+
+logger = logging.getLogger(__name__)
+
+
+def library_index_path(music_dir: str) -> str:
+    """Path of the library index for a music directory."""
+    return os.path.join(music_dir, LIBRARY_INDEX_FILENAME)
+
+
+def read_library_index(music_dir: str) -> Dict[str, Any]:
+    """Read the raw library index, returning an empty index if it is missing or invalid."""
+    path = library_index_path(music_dir)
+    empty = {"version": LIBRARY_INDEX_VERSION, "tracks": {}}
+    if not os.path.exists(path):
+        return empty
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not read library index {path}: {e}")
+        return empty
+    if not isinstance(index, dict) or not isinstance(index.get("tracks"), dict):
+        logger.warning(f"Ignoring malformed library index {path}")
+        return empty
+    return index
+
+
+def load_track_features(music_dir: str) -> Dict[str, TrackFeatures]:
+    """Load cached track features from the library index, keyed by file name."""
+    features: Dict[str, TrackFeatures] = {}
+    for filename, entry in read_library_index(music_dir)["tracks"].items():
+        data = entry.get("features") if isinstance(entry, dict) else None
+        if not data:
+            continue
+        try:
+            features[filename] = TrackFeatures(**data)
+        except Exception as e:
+            logger.debug(f"Skipping invalid features for {filename}: {e}")
+    return features
+
+
+def write_library_index(music_dir: str, index: Dict[str, Any]) -> None:
+    """Write the library index atomically so an interrupted run never leaves it truncated."""
+    path = library_index_path(music_dir)
+    fd, tmp_path = tempfile.mkstemp(prefix=".library_index.", suffix=".tmp", dir=music_dir)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def content_hash(path: str, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 of a file's contents, used to skip tracks that were already analyzed."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_beat_grids(music_dir: str) -> Dict[str, List[float]]:
+    """Load analyzed beat times (seconds) from the library index, keyed by file name."""
+    grids: Dict[str, List[float]] = {}
+    for filename, entry in read_library_index(music_dir)["tracks"].items():
+        beats = entry.get("beat_grid") if isinstance(entry, dict) else None
+        if isinstance(beats, list) and len(beats) > 1:
+            grids[filename] = [float(b) for b in beats]
+    return grids
+
+
+def load_energy_envelope(music_dir: str, filename: str) -> Optional[Tuple[float, List[float]]]:
+    """Load one track's analyzed energy envelope as (hop_sec, values), or None."""
+    entry = read_library_index(music_dir)["tracks"].get(filename)
+    envelope = entry.get("energy_envelope") if isinstance(entry, dict) else None
+    if not isinstance(envelope, dict) or not isinstance(envelope.get("values"), list) or not envelope["values"]:
+        return None
+    try:
+        return float(envelope.get("hop_sec", 1.0)), [float(v) for v in envelope["values"]]
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,291 @@
+"""
+Offline audio feature extraction for the music library.
+
+Computes tempo, beat grid, integrated loudness, key, spectral centroid,
+intro/outro lengths and a per-second energy envelope for every track in a
+music directory, and stores them in the library index next to the files
+(see ``utils.library_index``). Services only read the index, so crossfade
+timing, ducking and DJ track selection get these features with no runtime
+analysis cost.
+
+Runs are resumable: each track's content hash is stored with its entry,
+tracks whose hash is already in the index are skipped (renamed files reuse
+their old entry, removed files are dropped), and the index is rewritten
+atomically as tracks finish.
+Tracks are analyzed in a process pool.
+
+Decoding, beat tracking and chroma use librosa (optional dependency, only
+needed to run the analyzer). Loudness uses pyloudnorm when it is installed
+and otherwise an unweighted BS.1770-style gated measurement.
+"""
+
+import glob
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .library_index import LIBRARY_INDEX_VERSION, content_hash, read_library_index, write_library_index
+
+ANALYZER_VERSION = 1
+AUDIO_EXTENSIONS = (".mp3", ".wav", ".m4a")
+
+SAMPLE_RATE = 22050
+HOP_LENGTH = 512
+ENVELOPE_HOP_SEC = 1.0
+FULL_ENERGY_RATIO = 0.7  # Intro/outro end/start where the envelope crosses this share of its median
+
+# Krumhansl-Schmuckler key profiles, starting at C
+_MAJOR_PROFILE = np.array([6.35, 2.23, 3.48, 2.33, 4.38, 4.09, 2.52, 5.19, 2.39, 3.66, 2.29, 2.88])
+_MINOR_PROFILE = np.array([6.33, 2.68, 3.52, 5.38, 2.60, 3.53, 2.54, 4.75, 3.98, 2.69, 3.34, 3.17])
+_NOTE_NAMES = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_key(chroma: Sequence[float]) -> Optional[str]:
+    """Estimate the key (e.g. 'A minor') from a 12-bin mean chroma vector."""
+    chroma = np.asarray(chroma, dtype=float)
+    if chroma.shape != (12,) or not np.any(chroma > 0):
+        return None
+    best, best_score = None, -np.inf
+    for tonic in range(12):
+        for mode, profile in (("major", _MAJOR_PROFILE), ("minor", _MINOR_PROFILE)):
+            score = np.corrcoef(chroma, np.roll(profile, tonic))[0, 1]
+            if score > best_score:
+                best, best_score = f"{_NOTE_NAMES[tonic]} {mode}", score
+    return best
+
+
+def gated_loudness(samples: np.ndarray, sample_rate: int) -> Optional[float]:
+    """Integrated loudness in LUFS with BS.1770 gating (no K-weighting filter).
+
+    Used when pyloudnorm is not installed; typically within a couple of LU of
+    the weighted measurement for full-range music.
+    """
+    block = int(0.4 * sample_rate)
+    step = block // 4
+    if len(samples) < block:
+        return None
+    starts = np.arange(0, len(samples) - block + 1, step)
+    power = np.array([np.mean(samples[s:s + block] ** 2) for s in starts])
+    power = power[power > 0]
+    if not len(power):
+        return None
+    loudness = -0.691 + 10 * np.log10(power)
+
+    gated = power[loudness > -70.0]
+    if not len(gated):
+        return None
+    relative_gate = -0.691 + 10 * np.log10(np.mean(gated)) - 10.0
+    gated = power[loudness > max(-70.0, relative_gate)]
+    return float(-0.691 + 10 * np.log10(np.mean(gated)))
+
+
+def energy_envelope(rms: np.ndarray, frame_rate: float, hop_sec: float = ENVELOPE_HOP_SEC) -> List[float]:
+    """Downsample an RMS curve to one value per ``hop_sec``, normalized to the track's peak."""
+    per_hop = max(1, int(round(frame_rate * hop_sec)))
+    count = int(np.ceil(len(rms) / per_hop))
+    if not count:
+        return []
+    values = np.array([np.mean(rms[i * per_hop:(i + 1) * per_hop]) for i in range(count)])
+    peak = values.max()
+    if peak > 0:
+        values = values / peak
+    return [round(float(v), 3) for v in values]
+
+
+def intro_outro_lengths(
+    envelope: Sequence[float],
+    duration: float,
+    beats: Sequence[float] = (),
+    hop_sec: float = ENVELOPE_HOP_SEC,
+    ratio: float = FULL_ENERGY_RATIO,
+) -> Tuple[float, float]:
+    """Seconds of intro and outro: where the envelope is below ``ratio`` of its median.
+
+    Boundaries are snapped to the nearest beat when a beat grid is given.
+    """
+    values = np.asarray(envelope, dtype=float)
+    if not len(values):
+        return 0.0, 0.0
+    loud = np.nonzero(values >= ratio * np.median(values))[0]
+    if not len(loud):
+        return 0.0, 0.0
+    intro_end = loud[0] * hop_sec
+    outro_start = min(duration, (loud[-1] + 1) * hop_sec)
+
+    if len(beats):
+        grid = np.asarray(beats, dtype=float)
+        intro_end = float(grid[np.argmin(np.abs(grid - intro_end))]) if intro_end > 0 else 0.0
+        if outro_start < duration:
+            outro_start = float(grid[np.argmin(np.abs(grid - outro_start))])
+    return round(max(0.0, intro_end), 3), round(max(0.0, duration - outro_start), 3)
+
+
+def energy_score(loudness: Optional[float], onset_rate: float) -> float:
+    """Perceived energy (0-1) from loudness and onset density.
+
+    -30 LUFS and 8 onsets per second map to the ends of each half of the
+    scale, so scores are comparable across tracks analyzed separately.
+    """
+    loud = 0.0 if loudness is None else min(max((loudness + 30.0) / 24.0, 0.0), 1.0)
+    busy = min(max(onset_rate / 8.0, 0.0), 1.0)
+    return round(0.5 * loud + 0.5 * busy, 3)
+
+
+def analyze_track(path: str) -> Dict[str, Any]:
+    """Analyze one audio file; returns the library index entry minus its hash.
+
+    Runs in a worker process, so it imports librosa itself.
+    """
+    import librosa
+
+    samples, sr = librosa.load(path, sr=SAMPLE_RATE, mono=True)
+    duration = len(samples) / sr
+    frame_rate = sr / HOP_LENGTH
+
+    tempo, beat_frames = librosa.beat.beat_track(y=samples, sr=sr, hop_length=HOP_LENGTH)
+    tempo = float(np.atleast_1d(tempo)[0])
+    beats = librosa.frames_to_time(beat_frames, sr=sr, hop_length=HOP_LENGTH)
+
+    rms = librosa.feature.rms(y=samples, hop_length=HOP_LENGTH)[0]
+    centroid = float(np.mean(librosa.feature.spectral_centroid(y=samples, sr=sr, hop_length=HOP_LENGTH)))
+    chroma = librosa.feature.chroma_cqt(y=samples, sr=sr, hop_length=HOP_LENGTH).mean(axis=1)
+    onsets = librosa.onset.onset_detect(y=samples, sr=sr, hop_length=HOP_LENGTH)
+
+    try:
+        import pyloudnorm
+
+        loudness = float(pyloudnorm.Meter(sr).integrated_loudness(samples))
+        if not np.isfinite(loudness):
+            loudness = None
+    except ImportError:
+        loudness = gated_loudness(samples, sr)
+
+    envelope = energy_envelope(rms, frame_rate)
+    intro, outro = intro_outro_lengths(envelope, duration, beats)
+
+    return {
+        "analyzer_version": ANALYZER_VERSION,
+        "analyzed_at": time.time(),
+        "duration": round(duration, 3),
+        "features": {
+            "tempo": round(tempo, 2),
+            "energy": energy_score(loudness, len(onsets) / duration if duration else 0.0),
+            "key": estimate_key(chroma),
+            "loudness": round(loudness, 2) if loudness is not None else None,
+            "spectral_centroid": round(centroid, 1),
+            "intro_length": intro,
+            "outro_length": outro,
+        },
+        "beat_grid": [round(float(b), 3) for b in beats],
+        "energy_envelope": {"hop_sec": ENVELOPE_HOP_SEC, "values": envelope},
+    }
+
+
+def find_audio_files(music_dir: str) -> List[str]:
+    """Audio files directly in ``music_dir``, matching MusicController's library scan."""
+    files = []
+    for ext in AUDIO_EXTENSIONS:
+        files.extend(glob.glob(os.path.join(music_dir, f"*{ext}")))
+    return sorted(files)
+
+
+def analyze_library(
+    music_dir: str,
+    workers: Optional[int] = None,
+    force: bool = False,
+    analyze: Callable[[str], Dict[str, Any]] = analyze_track,
+    progress: Optional[Callable[[str, str], None]] = None,
+) -> Dict[str, int]:
+    """Analyze every track in ``music_dir`` that is not in the library index yet.
+
+    Args:
+        music_dir: Directory holding the music files and the library index
+        workers: Worker processes (default: CPU count); 1 or less runs inline
+        force: Re-analyze tracks even if their content hash is in the index
+        analyze: Per-file analysis function (must be picklable for workers > 1)
+        progress: Called with (file name, status) as each track is handled
+
+    Returns:
+        Counts of analyzed, skipped, reused and failed tracks
+    """
+    index = read_library_index(music_dir)
+    index["version"] = LIBRARY_INDEX_VERSION
+    entries: Dict[str, Dict[str, Any]] = index["tracks"]
+    by_hash = {
+        entry.get("content_hash"): entry for entry in entries.values()
+        if isinstance(entry, dict) and entry.get("analyzer_version") == ANALYZER_VERSION
+    }
+    stats = {"analyzed": 0, "skipped": 0, "reused": 0, "failed": 0}
+    report = progress or (lambda name, status: None)
+
+    files = find_audio_files(music_dir)
+    pending: Dict[str, str] = {}  # path -> content hash
+    for path in files:
+        name = os.path.basename(path)
+        try:
+            digest = content_hash(path)
+        except OSError as e:
+            logger.warning(f"Could not read {path}: {e}")
+            stats["failed"] += 1
+            report(name, "failed")
+            continue
+        if not force and digest in by_hash:
+            current = entries.get(name)
+            if isinstance(current, dict) and current.get("content_hash") == digest \
+                    and current.get("analyzer_version") == ANALYZER_VERSION:
+                stats["skipped"] += 1
+                report(name, "skipped")
+            else:
+                # Same audio under a new name
+                entries[name] = dict(by_hash[digest])
+                stats["reused"] += 1
+                report(name, "reused")
+            continue
+        pending[path] = digest
+
+    # Drop entries for files that were removed or renamed
+    present = {os.path.basename(path) for path in files}
+    stale = [name for name in entries if name not in present]
+    for name in stale:
+        del entries[name]
+
+    if stats["reused"] or stale:
+        write_library_index(music_dir, index)
+
+    def finish(path: str, entry: Dict[str, Any]) -> None:
+        entry["content_hash"] = pending[path]
+        entries[os.path.basename(path)] = entry
+        write_library_index(music_dir, index)  # Checkpoint so an interrupted run resumes here
+        stats["analyzed"] += 1
+        report(os.path.basename(path), "analyzed")
+
+    def fail(path: str, error: BaseException) -> None:
+        logger.warning(f"Analysis failed for {path}: {error}")
+        stats["failed"] += 1
+        report(os.path.basename(path), "failed")
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(pending) <= 1:
+        for path in pending:
+            try:
+                finish(path, analyze(path))
+            except Exception as e:
+                fail(path, e)
+        return stats
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(pending))) as pool:
+        futures = {pool.submit(analyze, path): path for path in pending}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                finish(path, future.result())
+            except Exception as e:
+                fail(path, e)
+    return stats
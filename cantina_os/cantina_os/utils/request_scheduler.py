@@ -0,0 +1,345 @@
+"""
+Priority request scheduler for CantinaOS.
+
+Provides a small asyncio scheduler used to order outbound API work (e.g. OpenAI
+calls made by GPTService) by priority class. Interactive work always runs ahead
+of background work, background work can be preempted, cancelled and resumed,
+and each class has its own concurrency cap.
+"""
+
+import asyncio
+import logging
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class RequestPriority(IntEnum):
+    """Priority classes, lower value runs first."""
+
+    INTERACTIVE = 0  # A user is waiting on the result (voice replies, verbal feedback)
+    BACKGROUND = 1  # Pre-generated work (DJ commentary caching)
+
+    @classmethod
+    def from_value(cls, value: Any) -> "RequestPriority":
+        """Resolve a priority from an enum, name string or int, defaulting to BACKGROUND."""
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, str):
+            try:
+                return cls[value.upper()]
+            except KeyError:
+                return cls.BACKGROUND
+        try:
+            return cls(int(value))
+        except (TypeError, ValueError):
+            return cls.BACKGROUND
+
+
+@dataclass(eq=False)
+class _ScheduledRequest:
+    """Book-keeping for a single scheduled request."""
+
+    request_id: str
+    priority: RequestPriority
+    factory: Callable[[], Awaitable[Any]]
+    future: asyncio.Future
+    task: Optional[asyncio.Task] = None
+    preemptions: int = 0
+    requeue_on_cancel: bool = False
+
+
+@dataclass
+class SchedulerStats:
+    """Counters exposed for dashboards and debugging."""
+
+    submitted: Dict[str, int] = field(default_factory=dict)
+    completed: Dict[str, int] = field(default_factory=dict)
+    failed: Dict[str, int] = field(default_factory=dict)
+    cancelled: Dict[str, int] = field(default_factory=dict)
+    preempted: Dict[str, int] = field(default_factory=dict)
+
+
+class PriorityRequestScheduler:
+    """
+    Strict-priority scheduler with per-class concurrency caps.
+
+    Requests are submitted as zero-argument coroutine factories so that a
+    preempted request can be re-run from the start when it is resumed.
+
+    Rules:
+    - A class only dispatches when every higher priority class is idle.
+    - When an INTERACTIVE request is submitted and ``preempt_background`` is set,
+      in-flight BACKGROUND requests are cancelled and put back at the head of
+      their queue. A request is preempted at most ``max_preemptions`` times so
+      background work cannot starve forever.
+    - ``pause(priority)`` stops a class from dispatching until ``resume(priority)``.
+    """
+
+    def __init__(
+        self,
+        concurrency: Optional[Dict[RequestPriority, int]] = None,
+        preempt_background: bool = True,
+        max_preemptions: int = 3,
+        on_change: Optional[Callable[[], None]] = None,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            concurrency: Max in-flight requests per priority class
+            preempt_background: Cancel in-flight background work when interactive work arrives
+            max_preemptions: Max times a single request may be preempted
+            on_change: Optional callback invoked whenever queue/active counts change
+        """
+        caps = {RequestPriority.INTERACTIVE: 2, RequestPriority.BACKGROUND: 1}
+        caps.update(concurrency or {})
+        self._concurrency: Dict[RequestPriority, int] = {
+            priority: max(1, int(cap)) for priority, cap in caps.items()
+        }
+        self._preempt_background = preempt_background
+        self._max_preemptions = max_preemptions
+        self._on_change = on_change
+
+        self._queues: Dict[RequestPriority, Deque[_ScheduledRequest]] = {
+            priority: deque() for priority in RequestPriority
+        }
+        self._active: Dict[RequestPriority, Set[_ScheduledRequest]] = {
+            priority: set() for priority in RequestPriority
+        }
+        self._requests: Dict[str, _ScheduledRequest] = {}
+        self._paused: Set[RequestPriority] = set()
+        self._stats = SchedulerStats()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def submit(
+        self,
+        priority: RequestPriority,
+        factory: Callable[[], Awaitable[Any]],
+        request_id: Optional[str] = None,
+    ) -> asyncio.Future:
+        """Queue a request and return a future resolving to its result.
+
+        Args:
+            priority: Priority class for the request
+            factory: Zero-argument callable returning a fresh coroutine
+            request_id: Optional identifier used for cancellation
+
+        Returns:
+            Future that resolves with the coroutine result
+        """
+        priority = RequestPriority.from_value(priority)
+        request_id = request_id or str(uuid.uuid4())
+        if request_id in self._requests:
+            raise ValueError(f"Request {request_id} is already scheduled")
+
+        loop = asyncio.get_running_loop()
+        request = _ScheduledRequest(
+            request_id=request_id,
+            priority=priority,
+            factory=factory,
+            future=loop.create_future(),
+        )
+        self._requests[request_id] = request
+        self._queues[priority].append(request)
+        self._bump(self._stats.submitted, priority)
+
+        if priority == RequestPriority.INTERACTIVE and self._preempt_background:
+            self._preempt(RequestPriority.BACKGROUND)
+
+        self._dispatch()
+        return request.future
+
+    async def run(
+        self,
+        priority: RequestPriority,
+        factory: Callable[[], Awaitable[Any]],
+        request_id: Optional[str] = None,
+    ) -> Any:
+        """Submit a request and wait for its result.
+
+        Cancelling the awaiting task cancels the scheduled request as well.
+        """
+        request_id = request_id or str(uuid.uuid4())
+        future = self.submit(priority, factory, request_id)
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            self.cancel(request_id)
+            raise
+
+    def cancel(self, request_id: str) -> bool:
+        """Cancel a queued or in-flight request.
+
+        Returns:
+            True if a request with this ID was found and cancelled
+        """
+        request = self._requests.get(request_id)
+        if request is None:
+            return False
+
+        if request.task is not None and not request.task.done():
+            request.requeue_on_cancel = False
+            request.task.cancel()
+        else:
+            try:
+                self._queues[request.priority].remove(request)
+            except ValueError:
+                pass
+            self._finish(request)
+            if not request.future.done():
+                request.future.cancel()
+            self._bump(self._stats.cancelled, request.priority)
+            self._dispatch()
+        return True
+
+    def cancel_all(self, priority: RequestPriority) -> int:
+        """Cancel every queued and in-flight request of a priority class.
+
+        Returns:
+            Number of requests cancelled
+        """
+        priority = RequestPriority.from_value(priority)
+        request_ids = [r.request_id for r in self._queues[priority]]
+        request_ids.extend(r.request_id for r in self._active[priority])
+        return sum(1 for request_id in request_ids if self.cancel(request_id))
+
+    def pause(self, priority: RequestPriority) -> None:
+        """Stop dispatching a priority class, preempting its in-flight work."""
+        priority = RequestPriority.from_value(priority)
+        self._paused.add(priority)
+        self._preempt(priority, force=True)
+        self._notify()
+
+    def resume(self, priority: RequestPriority) -> None:
+        """Resume dispatching a paused priority class."""
+        priority = RequestPriority.from_value(priority)
+        self._paused.discard(priority)
+        self._dispatch()
+        self._notify()
+
+    def queue_depth(self, priority: RequestPriority) -> int:
+        """Number of requests waiting to run in a priority class."""
+        return len(self._queues[RequestPriority.from_value(priority)])
+
+    def active_count(self, priority: RequestPriority) -> int:
+        """Number of requests currently running in a priority class."""
+        return len(self._active[RequestPriority.from_value(priority)])
+
+    def get_status(self) -> Dict[str, Any]:
+        """Snapshot of queue depth, in-flight counts and counters per priority."""
+        classes = {}
+        for priority in RequestPriority:
+            name = priority.name.lower()
+            classes[name] = {
+                "queued": len(self._queues[priority]),
+                "active": len(self._active[priority]),
+                "concurrency": self._concurrency.get(priority, 1),
+                "paused": priority in self._paused,
+                "submitted": self._stats.submitted.get(name, 0),
+                "completed": self._stats.completed.get(name, 0),
+                "failed": self._stats.failed.get(name, 0),
+                "cancelled": self._stats.cancelled.get(name, 0),
+                "preempted": self._stats.preempted.get(name, 0),
+            }
+        return {"priorities": classes}
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _dispatch(self) -> None:
+        """Start as many queued requests as priorities and caps allow."""
+        for priority in RequestPriority:
+            if self._higher_priority_waiting(priority):
+                break
+            if priority in self._paused:
+                continue
+            queue = self._queues[priority]
+            cap = self._concurrency.get(priority, 1)
+            while queue and len(self._active[priority]) < cap:
+                request = queue.popleft()
+                self._active[priority].add(request)
+                request.task = asyncio.create_task(self._execute(request))
+        self._notify()
+
+    def _higher_priority_waiting(self, priority: RequestPriority) -> bool:
+        """Check whether any strictly higher class still has queued or in-flight work."""
+        return any(
+            (self._queues[other] and other not in self._paused) or self._active[other]
+            for other in RequestPriority
+            if other < priority
+        )
+
+    def _preempt(self, priority: RequestPriority, force: bool = False) -> None:
+        """Cancel in-flight requests of a class and requeue them."""
+        for request in list(self._active[priority]):
+            if not force and request.preemptions >= self._max_preemptions:
+                continue
+            if request.task is None or request.task.done():
+                continue
+            request.preemptions += 1
+            request.requeue_on_cancel = True
+            request.task.cancel()
+            self._bump(self._stats.preempted, priority)
+            logger.debug(
+                f"Preempted {priority.name.lower()} request {request.request_id} "
+                f"({request.preemptions}/{self._max_preemptions})"
+            )
+
+    async def _execute(self, request: _ScheduledRequest) -> None:
+        """Run a request and settle its future."""
+        try:
+            result = await request.factory()
+        except asyncio.CancelledError:
+            self._active[request.priority].discard(request)
+            request.task = None
+            if request.requeue_on_cancel:
+                # Resume later from the start of the request
+                request.requeue_on_cancel = False
+                self._queues[request.priority].appendleft(request)
+            else:
+                self._finish(request)
+                if not request.future.done():
+                    request.future.cancel()
+                self._bump(self._stats.cancelled, request.priority)
+            self._dispatch()
+            return
+        except Exception as e:
+            self._active[request.priority].discard(request)
+            self._finish(request)
+            if not request.future.done():
+                request.future.set_exception(e)
+            self._bump(self._stats.failed, request.priority)
+            self._dispatch()
+            return
+
+        self._active[request.priority].discard(request)
+        self._finish(request)
+        if not request.future.done():
+            request.future.set_result(result)
+        self._bump(self._stats.completed, request.priority)
+        self._dispatch()
+
+    def _finish(self, request: _ScheduledRequest) -> None:
+        """Forget a request that will not run again."""
+        self._requests.pop(request.request_id, None)
+        request.task = None
+
+    def _bump(self, counter: Dict[str, int], priority: RequestPriority) -> None:
+        name = priority.name.lower()
+        counter[name] = counter.get(name, 0) + 1
+
+    def _notify(self) -> None:
+        if self._on_change is None:
+            return
+        try:
+            self._on_change()
+        except Exception as e:
+            logger.error(f"Error in scheduler change callback: {e}")
@@ -0,0 +1,110 @@
+"""
+Versioned dashboard state with JSON-patch style deltas.
+
+The web bridge keeps the state the dashboard renders (service status, music,
+DJ, voice and system mode) in a StateStore. Every change bumps a sequence
+number and produces the RFC 6902 style operations that turn the previous
+state into the new one, so connected clients receive only what changed.
+
+A client starts from a snapshot and applies deltas in sequence order. If it
+sees a gap (or the bridge restarted, which changes the epoch) it asks for a
+resync and gets the missed deltas from a bounded history, or a fresh
+snapshot when it is too far behind.
+"""
+
+import copy
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_HISTORY = 256
+
+
+def _escape(key: Any) -> str:
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def json_diff(old: Any, new: Any, path: str = "") -> List[Dict[str, Any]]:
+    """Patch operations turning ``old`` into ``new``.
+
+    Dicts are compared key by key; lists and scalars are replaced whole.
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops: List[Dict[str, Any]] = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            else:
+                ops.extend(json_diff(old[key], value, child))
+        return ops
+    if old == new and type(old) is type(new):
+        return []
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def apply_patch(doc: Any, ops: Iterable[Dict[str, Any]]) -> Any:
+    """Apply operations from :func:`json_diff` to ``doc`` in place; returns the new document."""
+    for op in ops:
+        tokens = [_unescape(t) for t in op["path"].split("/")[1:]]
+        if not tokens:
+            doc = copy.deepcopy(op.get("value"))
+            continue
+        parent = doc
+        for token in tokens[:-1]:
+            parent = parent[token]
+        if op["op"] == "remove":
+            parent.pop(tokens[-1], None)
+        else:
+            parent[tokens[-1]] = copy.deepcopy(op["value"])
+    return doc
+
+
+class StateStore:
+    """Sectioned dashboard state with sequence-numbered deltas.
+
+    Args:
+        sections: Top-level state keys (e.g. services, music, dj, voice, mode)
+        history: How many recent deltas are kept for resync
+    """
+
+    def __init__(self, sections: Iterable[str], history: int = DEFAULT_HISTORY):
+        self.epoch = f"{int(time.time() * 1000):x}"  # Changes when the bridge restarts
+        self.seq = 0
+        self.state: Dict[str, Any] = {section: {} for section in sections}
+        self._history: Deque[Tuple[int, List[Dict[str, Any]]]] = deque(maxlen=history)
+
+    def update(self, section: str, value: Any) -> Optional[Dict[str, Any]]:
+        """Replace a section; returns the delta, or None when nothing changed."""
+        value = copy.deepcopy(value)  # Ops and history must not alias the caller's objects
+        ops = json_diff(self.state.get(section), value, f"/{_escape(section)}")
+        if not ops:
+            return None
+        self.state[section] = value
+        self.seq += 1
+        self._history.append((self.seq, ops))
+        return self._delta(self.seq, ops)
+
+    def _delta(self, seq: int, ops: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {"epoch": self.epoch, "seq": seq, "ops": ops}
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Full state at the current sequence number."""
+        return {"epoch": self.epoch, "seq": self.seq, "state": copy.deepcopy(self.state)}
+
+    def deltas_since(self, epoch: Optional[str], seq: int) -> Optional[List[Dict[str, Any]]]:
+        """Deltas a client at (epoch, seq) missed, or None if it needs a snapshot."""
+        if epoch != self.epoch or seq > self.seq:
+            return None
+        if seq == self.seq:
+            return []
+        if not self._history or self._history[0][0] > seq + 1:
+            return None  # Older deltas have been evicted
+        return [self._delta(s, ops) for s, ops in self._history if s > seq]
@@ -0,0 +1,166 @@
+"""
+Per-topic rate limiting for dashboard broadcasts.
+
+Each limited key (usually an event topic) gets a token bucket. Streams where
+only the newest value matters - audio levels, interim transcripts - are
+coalesced: while the bucket is empty the latest item replaces any older one
+still waiting, and it goes out as soon as the next token is available. So
+the dashboard gets the newest value at a bounded rate instead of a backlog
+or a gap. Keys that must not be coalesced (log lines) can use ``allow()``,
+which simply drops what exceeds the rate.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Token bucket refilled at ``rate`` tokens per second, holding at most ``burst``."""
+
+    def __init__(self, rate: float, burst: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.burst = max(1.0, burst if burst is not None else 1.0)
+        self._clock = clock
+        self._tokens = self.burst
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_take(self) -> bool:
+        """Take a token if one is available."""
+        self._refill()
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        return False
+
+    def wait_time(self) -> float:
+        """Seconds until the next token is available."""
+        self._refill()
+        return max(0.0, (1.0 - self._tokens) / self.rate) if self.rate > 0 else float("inf")
+
+
+@dataclass
+class ThrottleStats:
+    sent: int = 0
+    coalesced: int = 0  # Replaced by a newer item before it could be sent
+    dropped: int = 0  # Discarded outright
+
+
+class TopicThrottle:
+    """Token buckets per key with "latest value wins" coalescing.
+
+    Args:
+        send: Coroutine called with (key, item) for every item that goes out
+        clock: Monotonic clock, replaceable in tests
+    """
+
+    def __init__(self, send: Callable[[str, Any], Awaitable[None]], clock: Callable[[], float] = time.monotonic):
+        self._send = send
+        self._clock = clock
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._coalesce: Dict[str, bool] = {}
+        self._pending: Dict[str, Any] = {}
+        self._flush_tasks: Dict[str, asyncio.Task] = {}
+        self.stats: Dict[str, ThrottleStats] = {}
+
+    def configure(self, key: str, max_per_second: float, burst: Optional[float] = None, coalesce: bool = True) -> None:
+        """Limit ``key`` to ``max_per_second``; 0 or less removes the limit."""
+        if max_per_second <= 0:
+            self._buckets.pop(key, None)
+            return
+        self._buckets[key] = TokenBucket(max_per_second, burst, self._clock)
+        self._coalesce[key] = coalesce
+
+    def is_limited(self, key: str) -> bool:
+        return key in self._buckets
+
+    def _stats(self, key: str) -> ThrottleStats:
+        stats = self.stats.get(key)
+        if stats is None:
+            stats = self.stats[key] = ThrottleStats()
+        return stats
+
+    def allow(self, key: str) -> bool:
+        """Take a token for ``key`` without coalescing; counts a drop when there is none."""
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            return True
+        if bucket.try_take():
+            self._stats(key).sent += 1
+            return True
+        self._stats(key).dropped += 1
+        return False
+
+    async def submit(self, key: str, item: Any) -> bool:
+        """Send ``item`` now if the bucket allows it, otherwise hold it as the latest value.
+
+        Returns True if the item was sent immediately.
+        """
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            await self._send(key, item)
+            return True
+
+        stats = self._stats(key)
+        if key not in self._pending and bucket.try_take():
+            await self._send(key, item)
+            stats.sent += 1
+            return True
+
+        if not self._coalesce.get(key, True):
+            stats.dropped += 1
+            return False
+
+        if key in self._pending:
+            stats.coalesced += 1
+        self._pending[key] = item
+        if key not in self._flush_tasks:
+            self._flush_tasks[key] = asyncio.create_task(self._flush_when_ready(key, bucket))
+        return False
+
+    async def _flush_when_ready(self, key: str, bucket: TokenBucket) -> None:
+        try:
+            while key in self._pending:
+                await asyncio.sleep(bucket.wait_time())
+                if key in self._pending and bucket.try_take():
+                    item = self._pending.pop(key)
+                    await self._send(key, item)
+                    self._stats(key).sent += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error flushing throttled {key}: {e}")
+        finally:
+            self._flush_tasks.pop(key, None)
+
+    def discard(self, key: str) -> None:
+        """Drop the item waiting for ``key``, e.g. an interim transcript made stale by the final one."""
+        if self._pending.pop(key, None) is not None:
+            self._stats(key).dropped += 1
+
+    async def close(self) -> None:
+        """Cancel pending flushes; anything still waiting counts as dropped."""
+        for task in list(self._flush_tasks.values()):
+            task.cancel()
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks.values(), return_exceptions=True)
+        for key in list(self._pending):
+            self.discard(key)
+
+    def totals(self) -> Dict[str, Any]:
+        """Counters summed over all keys, plus per-key detail."""
+        return {
+            "sent": sum(s.sent for s in self.stats.values()),
+            "coalesced": sum(s.coalesced for s in self.stats.values()),
+            "dropped": sum(s.dropped for s in self.stats.values()),
+            "topics": {key: asdict(s) for key, s in self.stats.items()},
+        }
@@ -0,0 +1,317 @@
+"""
+Feature-based next-track selection for DJ mode.
+
+Tracks with precomputed audio features (see ``utils.library_index``) are
+placed in a small KD-tree over tempo, energy, loudness and spectral centroid.
+The next track is the one with the lowest transition cost from the current
+track: BPM delta (half/double time counts as a match), energy distance from
+a slowly rising and falling energy curve, loudness and timbre jumps, plus a
+penalty for harmonically incompatible keys on the Camelot wheel.
+
+The continuous part of the cost is the squared distance in the tree's scaled
+space and the key penalty is never negative, so the tree can prune
+branch-and-bound style and the search stays around O(log n) per pick
+instead of scoring the whole library.
+
+Recently played tracks are kept out by a no-repeat window that is relaxed
+oldest-first when the library runs out. When the current track has no
+features, or no analyzed track is left to pick, selection falls back to a
+random choice like before.
+"""
+
+import math
+import random
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from ..models.music_models import MusicTrack, TrackFeatures
+
+# Tempos are folded into one octave so half/double time transitions match
+TEMPO_FOLD_LOW = 70.0
+TEMPO_FOLD_HIGH = 140.0
+
+# Difference in each feature that costs 1.0 (before weighting)
+TEMPO_SCALE = 8.0  # BPM
+ENERGY_SCALE = 0.2
+LOUDNESS_SCALE = 4.0  # LU
+CENTROID_SCALE = 800.0  # Hz
+
+# Penalty by Camelot wheel distance: same key, neighbour/relative, two steps, clash
+KEY_PENALTIES = (0.0, 0.15, 0.5, 1.0)
+UNKNOWN_KEY_PENALTY = 0.5
+
+LEAF_SIZE = 8
+
+_PITCH_CLASSES = {"C": 0, "D": 2, "E": 4, "F": 5, "G": 7, "A": 9, "B": 11}
+_CAMELOT_RE = re.compile(r"^(1[0-2]|[1-9])\s*([AB])$", re.IGNORECASE)
+
+
+def camelot_key(key: Optional[str]) -> Optional[Tuple[int, str]]:
+    """Convert a key ('8A', 'A minor', 'F#m', 'Bb major', ...) to a Camelot (number, letter) pair."""
+    if not key:
+        return None
+    text = key.strip()
+    match = _CAMELOT_RE.match(text)
+    if match:
+        return int(match.group(1)), match.group(2).upper()
+
+    note = text[:1].upper()
+    if note not in _PITCH_CLASSES:
+        return None
+    pitch = _PITCH_CLASSES[note]
+    rest = text[1:].strip()
+    if rest[:1] in ("#", "♯"):
+        pitch, rest = pitch + 1, rest[1:].strip()
+    elif rest[:1] in ("b", "♭"):
+        pitch, rest = pitch - 1, rest[1:].strip()
+
+    mode = rest.lower()
+    if mode in ("m", "min", "minor"):
+        minor = True
+    elif mode in ("", "maj", "major"):
+        minor = False
+    else:
+        return None
+
+    # Minor keys sit on the same number as their relative major
+    major_pitch = (pitch + 3) % 12 if minor else pitch % 12
+    number = (major_pitch * 7 + 7) % 12 + 1
+    return number, "A" if minor else "B"
+
+
+def key_penalty(a: Optional[str], b: Optional[str]) -> float:
+    """Harmonic mixing penalty (0-1) for moving from key ``a`` to key ``b``."""
+    ka, kb = camelot_key(a), camelot_key(b)
+    if ka is None or kb is None:
+        return UNKNOWN_KEY_PENALTY
+    steps = abs(ka[0] - kb[0])
+    distance = min(steps, 12 - steps) + (ka[1] != kb[1])
+    return KEY_PENALTIES[min(distance, len(KEY_PENALTIES) - 1)]
+
+
+def fold_tempo(bpm: float) -> float:
+    """Fold a tempo into [TEMPO_FOLD_LOW, TEMPO_FOLD_HIGH) by halving or doubling."""
+    if bpm <= 0:
+        return bpm
+    while bpm >= TEMPO_FOLD_HIGH:
+        bpm /= 2.0
+    while bpm < TEMPO_FOLD_LOW:
+        bpm *= 2.0
+    return bpm
+
+
+@dataclass
+class TransitionWeights:
+    """Relative weight of each term in the transition cost."""
+
+    tempo: float = 1.0
+    energy: float = 1.0
+    key: float = 1.0
+    loudness: float = 0.5
+    timbre: float = 0.25
+
+
+class _KDTree:
+    """Static KD-tree for branch-and-bound searches with a caller-supplied cost."""
+
+    def __init__(self, points: Sequence[Tuple[Tuple[float, ...], str]]):
+        self._root = self._build(list(points), 0) if points else None
+
+    def _build(self, points: List[Tuple[Tuple[float, ...], str]], depth: int) -> Any:
+        if len(points) <= LEAF_SIZE:
+            return ("leaf", points)
+        axis = depth % len(points[0][0])
+        points.sort(key=lambda p: p[0][axis])
+        mid = len(points) // 2
+        return ("node", axis, points[mid][0][axis],
+                self._build(points[:mid], depth + 1), self._build(points[mid:], depth + 1))
+
+    def search(
+        self,
+        target: Tuple[float, ...],
+        cost: Callable[[str, float], float],
+        skip: Callable[[str], bool],
+    ) -> Tuple[Optional[str], float]:
+        """Find the point with the lowest ``cost(name, squared_distance)``.
+
+        ``cost`` must be at least the squared distance to ``target``; that is
+        what lets far branches be pruned.
+        """
+        best: List[Any] = [None, math.inf]
+
+        def visit(node: Any) -> None:
+            if node[0] == "leaf":
+                for point, name in node[1]:
+                    if skip(name):
+                        continue
+                    dist = sum((p - t) ** 2 for p, t in zip(point, target))
+                    if dist >= best[1]:
+                        continue
+                    value = cost(name, dist)
+                    if value < best[1]:
+                        best[0], best[1] = name, value
+                return
+            _, axis, split, left, right = node
+            diff = target[axis] - split
+            near, far = (left, right) if diff < 0 else (right, left)
+            visit(near)
+            if diff * diff < best[1]:
+                visit(far)
+
+        if self._root is not None:
+            visit(self._root)
+        return best[0], best[1]
+
+
+class TrackSelector:
+    """Picks the next track by minimizing transition cost over analyzed tracks."""
+
+    def __init__(
+        self,
+        weights: Optional[TransitionWeights] = None,
+        energy_step: float = 0.05,
+        energy_range: Tuple[float, float] = (0.3, 0.9),
+        rng: Optional[random.Random] = None,
+    ):
+        """Initialize the selector.
+
+        Args:
+            weights: Weights of the transition cost terms
+            energy_step: Energy change per transition the energy curve aims for
+            energy_range: Energy bounds at which the curve turns around
+            rng: Random source for the feature-less fallback
+        """
+        self.weights = weights or TransitionWeights()
+        self.energy_step = energy_step
+        self.energy_low, self.energy_high = energy_range
+        self._energy_direction = 1
+        self._rng = rng or random.Random()
+        self._library: Optional[Dict[str, MusicTrack]] = None
+        self._library_size = 0
+        self._names: List[str] = []
+        self._features: Dict[str, TrackFeatures] = {}
+        self._points: Dict[str, Tuple[float, ...]] = {}
+        self._defaults: Tuple[float, float] = (-14.0, 2000.0)  # Loudness, centroid
+        self._tree = _KDTree([])
+        self.stats: Dict[str, int] = {"feature_picks": 0, "random_picks": 0, "window_relaxed": 0}
+
+    def __len__(self) -> int:
+        """Number of tracks with features in the index."""
+        return len(self._points)
+
+    def update_library(self, library: Dict[str, MusicTrack]) -> None:
+        """Rebuild the index if the library changed since the last call."""
+        if library is self._library and len(library) == self._library_size:
+            return
+        self._library = library
+        self._library_size = len(library)
+        self._names = list(library.keys())
+        self._features = {
+            name: track.features for name, track in library.items()
+            if track.features is not None and track.features.tempo and track.features.energy is not None
+        }
+
+        # Loudness and centroid are optional; analyzed tracks without them get the library median
+        self._defaults = (
+            self._median([f.loudness for f in self._features.values()], -14.0),
+            self._median([f.spectral_centroid for f in self._features.values()], 2000.0),
+        )
+        self._points = {name: self._point(f) for name, f in self._features.items()}
+        self._tree = _KDTree([(point, name) for name, point in self._points.items()])
+
+    def _point(self, features: TrackFeatures, energy: Optional[float] = None) -> Tuple[float, ...]:
+        """Map features into the tree's space, where squared distance is the continuous cost."""
+        w = self.weights
+        loudness = features.loudness if features.loudness is not None else self._defaults[0]
+        centroid = features.spectral_centroid if features.spectral_centroid is not None else self._defaults[1]
+        return (
+            math.sqrt(w.tempo) * fold_tempo(features.tempo) / TEMPO_SCALE,
+            math.sqrt(w.energy) * (features.energy if energy is None else energy) / ENERGY_SCALE,
+            math.sqrt(w.loudness) * loudness / LOUDNESS_SCALE,
+            math.sqrt(w.timbre) * centroid / CENTROID_SCALE,
+        )
+
+    @staticmethod
+    def _median(values: Iterable[Optional[float]], default: float) -> float:
+        present = sorted(v for v in values if v is not None)
+        return present[len(present) // 2] if present else default
+
+    def target_energy(self, current: TrackFeatures) -> float:
+        """Energy the next track should have, following a rising and falling curve.
+
+        Asking does not move along the curve; it only turns around once
+        ``select`` has picked a track.
+        """
+        return self._energy_target(current)[0]
+
+    def _energy_target(self, current: TrackFeatures) -> Tuple[float, int]:
+        """Target energy and the curve direction it implies."""
+        direction = self._energy_direction
+        target = current.energy + direction * self.energy_step
+        if not self.energy_low <= target <= self.energy_high:
+            direction = -direction
+            target = current.energy + direction * self.energy_step
+        return min(max(target, 0.0), 1.0), direction
+
+    def transition_cost(self, current: TrackFeatures, candidate: TrackFeatures, target_energy: Optional[float] = None) -> float:
+        """Cost of moving from ``current`` to ``candidate``; lower is a smoother transition."""
+        origin = self._point(current, target_energy)
+        point = self._point(candidate)
+        distance = sum((p - o) ** 2 for p, o in zip(point, origin))
+        return distance + self.weights.key * key_penalty(current.key, candidate.key)
+
+    def select(
+        self,
+        current: Optional[str] = None,
+        exclude: Iterable[str] = (),
+        recent: Sequence[str] = (),
+    ) -> Optional[str]:
+        """Pick the next track.
+
+        Args:
+            current: Name of the playing track, if any
+            exclude: Names that must never be picked
+            recent: Recently played names, oldest first, kept out while possible
+
+        Returns:
+            Track name, or None if every track is excluded
+        """
+        excluded = set(exclude)
+        history = list(recent)
+        if current and current not in history:
+            history.append(current)
+
+        # One energy target per selection, however often the window is relaxed
+        features = self._features.get(current) if current else None
+        target, direction = self._energy_target(features) if features is not None else (None, self._energy_direction)
+
+        # Relax the no-repeat window oldest-first until something is playable
+        for cut in range(len(history) + 1):
+            blocked = excluded | set(history[cut:])
+            name = self._pick(features, target, blocked)
+            if name:
+                if cut:
+                    self.stats["window_relaxed"] += 1
+                self._energy_direction = direction
+                return name
+        return None
+
+    def _pick(self, features: Optional[TrackFeatures], target: Optional[float], blocked: Set[str]) -> Optional[str]:
+        if features is not None:
+            origin = self._point(features, target)
+            key_weight = self.weights.key
+            name, _ = self._tree.search(
+                origin,
+                lambda n, dist: dist + key_weight * key_penalty(features.key, self._features[n].key),
+                lambda n: n in blocked,
+            )
+            if name:
+                self.stats["feature_picks"] += 1
+                return name
+
+        available = [n for n in self._names if n not in blocked]
+        if not available:
+            return None
+        self.stats["random_picks"] += 1
+        return self._rng.choice(available)
@@ -0,0 +1,141 @@
+"""
+Voice activity detection for CantinaOS.
+
+Lightweight on-device VAD combining frame energy against an adaptive noise
+floor with spectral flatness (speech is tonal/peaky, background noise is
+flat). Cheap enough to run inside the audio callback on a Raspberry Pi.
+"""
+
+import math
+from typing import Union
+
+import numpy as np
+
+
+class VoiceActivityDetector:
+    """
+    Frame-by-frame speech/silence classifier with hangover.
+
+    A frame counts as speech when its energy is at least ``energy_margin_db``
+    above the tracked noise floor (and above ``min_energy_db``) and its
+    spectral flatness is below ``flatness_threshold``. Once speech is seen,
+    frames stay classified as speech for ``hangover_ms`` so word endings and
+    short pauses are not clipped.
+
+    The noise floor follows non-speech frames quickly. It also rises slowly
+    (time constant ``sustained_floor_tau_ms``) once frames have been speech
+    for longer than ``sustained_speech_ms`` without a break. People pause
+    between phrases; steady music does not. So music playing near the mic
+    stops counting as speech after a few seconds.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        energy_margin_db: float = 10.0,
+        min_energy_db: float = -55.0,
+        flatness_threshold: float = 0.5,
+        hangover_ms: float = 300.0,
+        noise_adapt_rate: float = 0.05,
+        initial_noise_db: float = -60.0,
+        sustained_speech_ms: float = 3000.0,
+        sustained_floor_tau_ms: float = 4000.0,
+    ):
+        """Initialize the detector.
+
+        Args:
+            sample_rate: Sample rate of the incoming frames in Hz
+            energy_margin_db: Required energy above the noise floor
+            min_energy_db: Absolute energy gate in dBFS
+            flatness_threshold: Max spectral flatness (0..1) for speech
+            hangover_ms: Time frames stay "speech" after the last speech frame
+            noise_adapt_rate: EMA rate for the noise floor during silence
+            initial_noise_db: Starting noise floor estimate in dBFS
+            sustained_speech_ms: Unbroken speech after which the floor starts rising
+            sustained_floor_tau_ms: Time constant of that rise
+        """
+        self._sample_rate = sample_rate
+        self._energy_margin_db = energy_margin_db
+        self._min_energy_db = min_energy_db
+        self._flatness_threshold = flatness_threshold
+        self._hangover_ms = hangover_ms
+        self._noise_adapt_rate = noise_adapt_rate
+        self._initial_noise_db = initial_noise_db
+        self._sustained_speech_ms = sustained_speech_ms
+        self._sustained_floor_tau_ms = sustained_floor_tau_ms
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset per-utterance state (noise floor is kept)."""
+        if not hasattr(self, "noise_floor_db"):
+            self.noise_floor_db = self._initial_noise_db
+        self.speech_detected = False  # Any speech since reset
+        self.trailing_silence_ms = 0.0  # Silence since the last raw speech frame
+        self.continuous_speech_ms = 0.0  # Unbroken raw speech up to the last frame
+        self.last_energy_db = -120.0
+        self.last_flatness = 1.0
+        self._hangover_left_ms = 0.0
+
+    def process(self, frame: Union[bytes, np.ndarray]) -> bool:
+        """Classify one frame.
+
+        Args:
+            frame: int16 PCM as bytes, or an int16/float array
+
+        Returns:
+            True if the frame should be treated as speech (including hangover)
+        """
+        if isinstance(frame, (bytes, bytearray, memoryview)):
+            samples = np.frombuffer(frame, dtype=np.int16).astype(np.float32) / 32768.0
+        elif np.issubdtype(frame.dtype, np.integer):
+            samples = frame.astype(np.float32).ravel() / 32768.0
+        else:
+            samples = frame.astype(np.float32, copy=False).ravel()
+
+        if samples.size == 0:
+            return self._hangover_left_ms > 0
+
+        frame_ms = samples.size * 1000.0 / self._sample_rate
+        energy_db = self._energy_db(samples)
+        flatness = self._spectral_flatness(samples)
+        self.last_energy_db = energy_db
+        self.last_flatness = flatness
+
+        raw_speech = (
+            energy_db >= self._min_energy_db
+            and energy_db >= self.noise_floor_db + self._energy_margin_db
+            and flatness <= self._flatness_threshold
+        )
+
+        if raw_speech:
+            self.speech_detected = True
+            self.trailing_silence_ms = 0.0
+            self._hangover_left_ms = self._hangover_ms
+            self.continuous_speech_ms += frame_ms
+            if self.continuous_speech_ms > self._sustained_speech_ms:
+                # Too steady for speech (music, a fan): let the floor creep up to it
+                rate = 1.0 - math.exp(-frame_ms / self._sustained_floor_tau_ms)
+                self.noise_floor_db += rate * (energy_db - self.noise_floor_db)
+            return True
+
+        # Learn the noise floor from non-speech frames
+        self.noise_floor_db += self._noise_adapt_rate * (energy_db - self.noise_floor_db)
+        self.trailing_silence_ms += frame_ms
+        self.continuous_speech_ms = 0.0
+
+        if self._hangover_left_ms > 0:
+            self._hangover_left_ms -= frame_ms
+            return True
+        return False
+
+    @staticmethod
+    def _energy_db(samples: np.ndarray) -> float:
+        """RMS energy in dBFS."""
+        mean_square = float(np.dot(samples, samples)) / samples.size
+        return 10.0 * math.log10(mean_square) if mean_square > 1e-12 else -120.0
+
+    @staticmethod
+    def _spectral_flatness(samples: np.ndarray) -> float:
+        """Geometric over arithmetic mean of the power spectrum (0 tonal .. 1 white noise)."""
+        power = np.abs(np.fft.rfft(samples)) ** 2 + 1e-12
+        return float(np.exp(np.mean(np.log(power))) / np.mean(power))
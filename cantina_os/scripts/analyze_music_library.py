@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Music Library Analyzer for DJ R3X CantinaOS
+
+Computes tempo, beat grid, loudness (LUFS), key, spectral centroid,
+intro/outro lengths and energy envelopes for every track in the music
+directory and stores them in library_index.json next to the files, where
+MusicControllerService picks them up on library load.
+
+Re-running only analyzes new or changed files (matched by content hash), so
+an interrupted run can simply be started again.
+
+Usage:
+    python scripts/analyze_music_library.py [music_dir] [--workers N] [--force]
+
+Requires:
+    librosa (and optionally pyloudnorm for K-weighted loudness)
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add cantina_os to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from cantina_os.utils.library_index import library_index_path
+from cantina_os.utils.music_analysis import analyze_library, find_audio_files
+
+DEFAULT_MUSIC_DIR = Path(__file__).parent.parent.parent / "audio" / "music"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Analyze the music library and update its feature index")
+    parser.add_argument("music_dir", nargs="?", default=str(DEFAULT_MUSIC_DIR), help="Directory with music files")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="Re-analyze tracks that are already in the index")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Log per-track failures in detail")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING, format="%(levelname)s %(message)s")
+
+    music_dir = os.path.abspath(args.music_dir)
+    if not os.path.isdir(music_dir):
+        print(f"❌ Music directory not found: {music_dir}")
+        return 1
+
+    try:
+        import librosa  # noqa: F401
+    except ImportError:
+        print("❌ librosa is required for analysis: pip install librosa pyloudnorm")
+        return 1
+
+    total = len(find_audio_files(music_dir))
+    print(f"DJ R3X Music Library Analyzer")
+    print(f"Library: {music_dir} ({total} tracks)")
+    print(f"Index:   {library_index_path(music_dir)}")
+    print()
+
+    done = 0
+
+    def progress(name: str, status: str) -> None:
+        nonlocal done
+        done += 1
+        print(f"[{done}/{total}] {status:<8} {name}")
+
+    start = time.time()
+    stats = analyze_library(music_dir, workers=args.workers, force=args.force, progress=progress)
+
+    print()
+    print(f"✅ Finished in {time.time() - start:.1f}s")
+    print(f"   - {stats['analyzed']} analyzed")
+    print(f"   - {stats['skipped']} already up to date")
+    print(f"   - {stats['reused']} reused from renamed files")
+    if stats["failed"]:
+        print(f"   - {stats['failed']} failed (re-run to retry)")
+    return 1 if stats["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
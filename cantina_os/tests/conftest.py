@@ -17,6 +17,7 @@ from .mocks.elevenlabs_mock import ElevenLabsMock
 import json
 import os
 import sys
+from collections import defaultdict
 
 # Add the project root to the Python path
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
@@ -243,6 +244,63 @@ async def configured_elevenlabs_mock(
     elevenlabs_mock.set_response('audio_data', sample_audio_data)
     yield elevenlabs_mock 
 
+class RecordingSocketIO:
+    """socketio.AsyncServer stand-in that records handlers, room membership and emits.
+
+    Emits are kept as ``(event, data, room)``, with pre-encoded payloads decoded
+    back to JSON; ``received`` lists the events each sid got, directly or
+    through a room.
+    """
+
+    def __init__(self):
+        self.handlers = {}
+        self.rooms = defaultdict(set)
+        self.emits = []
+        self.received = defaultdict(list)
+
+    def event(self, handler):
+        self.handlers[handler.__name__] = handler
+        return handler
+
+    def on(self, name, handler):
+        self.handlers[name] = handler
+
+    async def enter_room(self, sid, room):
+        self.rooms[room].add(sid)
+
+    async def leave_room(self, sid, room):
+        self.rooms[room].discard(sid)
+
+    async def emit(self, event, data=None, room=None):
+        text = getattr(data, "text", None)
+        self.emits.append((event, json.loads(text) if text is not None else data, room))
+        for sid in (self.rooms[room] if room in self.rooms else [room]):
+            self.received[sid].append(event)
+
+
+@pytest.fixture
+def make_bridge():
+    """Factory for a WebBridgeService on its own bus, wired to a RecordingSocketIO.
+
+    Keyword arguments override the service config.
+    """
+    from cantina_os.services.web_bridge_service import WebBridgeService
+
+    def make(**config):
+        bridge = WebBridgeService(AsyncIOEventEmitter(), config)
+        bridge._sio = RecordingSocketIO()
+        bridge._add_socketio_handlers()
+        return bridge
+
+    return make
+
+
+@pytest.fixture
+def bridge(make_bridge):
+    """WebBridgeService with the default config and a RecordingSocketIO."""
+    return make_bridge()
+
+
 # Configure pytest-asyncio to use function scope by default
 def pytest_configure(config):
     """Configure pytest-asyncio defaults."""
@@ -0,0 +1,96 @@
+"""Benchmark of cross-process event latency over the event bus socket."""
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from pyee.asyncio import AsyncIOEventEmitter
+
+from cantina_os.bridge.ipc import SUPPORTED_CODECS, EventBusIPCServer
+
+EVENTS = 500
+
+PAYLOADS = {
+    "progress": {"progress_percent": 41.7, "position_sec": 75.6, "duration_sec": 181.2,
+                 "track_title": "Cantina Band", "timestamp": "2025-01-01T12:00:00"},
+    "tts_audio": {"audio_data": bytes(range(256)) * 128, "sample_rate": 16000, "success": True},
+}
+
+# Remote process that answers every ping with a pong carrying the same payload
+ECHO_PEER = """
+import asyncio, sys
+from cantina_os.bridge.ipc import RemoteEventBus
+
+async def main(path, codec):
+    bus = RemoteEventBus(path, reconnect_delay=0.01, codecs=[codec])
+    bus.on("bench.ping", lambda payload: bus.emit("bench.pong", payload))
+    bus.start()
+    await asyncio.Event().wait()
+
+asyncio.run(main(sys.argv[1], sys.argv[2]))
+"""
+
+CODECS = [
+    pytest.param(codec, marks=pytest.mark.skipif(codec not in SUPPORTED_CODECS, reason="msgpack not installed"))
+    for codec in ("json", "msgpack")
+]
+
+
+async def in_process_round_trip_us(payload) -> list:
+    """The same ping/pong through one in-process bus, for comparison."""
+    bus = AsyncIOEventEmitter()
+    samples = []
+    bus.on("bench.ping", lambda data: bus.emit("bench.pong", data))
+    for _ in range(EVENTS):
+        done = asyncio.get_running_loop().create_future()
+        bus.once("bench.pong", lambda data: done.set_result(time.perf_counter()))
+        start = time.perf_counter()
+        bus.emit("bench.ping", payload)
+        samples.append((await done - start) * 1e6)
+    return samples
+
+
+@pytest.mark.performance
+class TestEventBusIPCLatency:
+    """Round trip of an event to another process and back."""
+
+    @pytest.mark.parametrize("codec", CODECS)
+    @pytest.mark.parametrize("payload_name", sorted(PAYLOADS))
+    async def test_cross_process_round_trip(self, tmp_path, codec, payload_name):
+        bus = AsyncIOEventEmitter()
+        server = EventBusIPCServer(bus, str(tmp_path / "bus.sock"))
+        await server.start()
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(Path(__file__).parents[2]), os.environ.get("PYTHONPATH", "")]))
+        peer = await asyncio.create_subprocess_exec(sys.executable, "-c", ECHO_PEER, server.path, codec, env=env)
+        try:
+            deadline = time.monotonic() + 20
+            while "bench.ping" not in server.topics:
+                assert time.monotonic() < deadline, "echo process never subscribed"
+                await asyncio.sleep(0.01)
+
+            payload = PAYLOADS[payload_name]
+            samples = []
+            for i in range(EVENTS + 50):
+                done = asyncio.get_running_loop().create_future()
+                bus.once("bench.pong", lambda data: done.set_result(time.perf_counter()))
+                start = time.perf_counter()
+                bus.emit("bench.ping", payload)
+                received = await asyncio.wait_for(done, 5)
+                if i >= 50:  # Warm-up
+                    samples.append((received - start) * 1e6)
+        finally:
+            peer.kill()
+            await peer.wait()
+            await server.stop()
+
+        baseline = await in_process_round_trip_us(payload)
+        p50, p99 = statistics.median(samples), statistics.quantiles(samples, n=100)[98]
+        print(
+            f"\n{payload_name} via {codec}: round trip p50 {p50:.0f} us, p99 {p99:.0f} us "
+            f"(~{p50 / 2:.0f} us one way); in-process p50 {statistics.median(baseline):.0f} us"
+        )
+        assert server.stats["forwarded"] == EVENTS + 50
+        assert p50 < 20000
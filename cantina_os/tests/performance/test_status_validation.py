@@ -0,0 +1,57 @@
+"""Benchmark of the per-event cost of StatusPayloadValidationMixin."""
+import time
+
+import pytest
+
+from cantina_os.schemas.validation import STATUS_MODEL_MAP, StatusPayloadValidationMixin, status_validation_stats
+
+EVENTS = 5000
+
+PAYLOADS = {
+    "progress": {"operation": "music_playback", "progress": 0.42, "status": "playing",
+                 "details": "Position: 75.6s / 180.0s", "timestamp": "2025-01-01T12:00:00"},
+    "music": {"action": "started", "source": "music_controller", "mode": "INTERACTIVE",
+              "track": {"title": "Cantina Band", "artist": "Figrin D'an", "duration": 180.0,
+                        "path": "/audio/music/cantina_band.mp3", "track_id": "cantina_band"},
+              "start_timestamp": 1735732800.0, "duration": 180.0},
+    "service": {"service_name": "music_controller", "status": "running"},
+}
+
+
+def per_event_us(fn, data) -> float:
+    """Best-of-three mean cost of ``fn(data)`` in microseconds."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(EVENTS):
+            fn(data)
+        best = min(best, (time.perf_counter() - start) / EVENTS * 1e6)
+    return best
+
+
+def pydantic_per_event(status_type):
+    """Validation as every event used to pay for it: build and dump the model."""
+    model = STATUS_MODEL_MAP[status_type]
+    return lambda data: model(**data).model_dump(mode="json", exclude_none=False)
+
+
+@pytest.mark.performance
+class TestStatusValidationCost:
+    """Per-event cost of validating dashboard status payloads."""
+
+    @pytest.mark.parametrize("status_type", sorted(PAYLOADS))
+    def test_known_shapes_take_fast_path(self, status_type):
+        """Repeat payload shapes skip Pydantic and stay well under the dashboard's event budget."""
+        mixin = StatusPayloadValidationMixin()
+        data = PAYLOADS[status_type]
+        validate = lambda d: mixin.validate_and_serialize_status(status_type, d)
+        before = status_validation_stats()[status_type]
+
+        baseline_us = per_event_us(pydantic_per_event(status_type), data)
+        mixin_us = per_event_us(validate, data)
+        print(f"{status_type}: pydantic {baseline_us:.2f} us/event, mixin {mixin_us:.2f} us/event")
+
+        after = status_validation_stats()[status_type]
+        assert after["misses"] - before["misses"] <= 1  # Only the first payload of the shape
+        assert after["hits"] - before["hits"] >= 3 * EVENTS - 1
+        assert mixin_us < 50.0
@@ -0,0 +1,61 @@
+"""Performance tests replaying recorded timeline plans against stub services."""
+from pathlib import Path
+
+import pytest
+
+from .timeline_replay import StubLatencies, load_plans, replay_plan, scale_plan_timings
+
+PLANS_DIR = Path(__file__).parent / "plans"
+TIME_SCALE = 0.02
+
+
+@pytest.mark.performance
+class TestTimelineReplay:
+    """Replay sample plans and check executor overhead stays small."""
+
+    @pytest.mark.parametrize("plan_file", sorted(p.name for p in PLANS_DIR.glob("*.json")))
+    async def test_sample_plans_complete(self, plan_file):
+        """Every sample plan completes with one STEP_EXECUTED per top-level step."""
+        for plan in load_plans(PLANS_DIR / plan_file):
+            report = await replay_plan(plan, StubLatencies(), time_scale=TIME_SCALE)
+
+            assert report.status == "completed"
+            assert report.event_counts["plan.ended"] == 1
+            assert report.event_counts["step.executed"] == report.steps
+            assert report.step_overhead_ms is not None
+            assert report.step_overhead_max_ms < 20.0
+            assert report.start_latency_ms < 20.0
+            assert report.layer_ops["pause_lower_priority_layers"]["count"] == 1
+
+    async def test_wall_time_tracks_stub_latencies(self):
+        """Slower stub services show up in wall time, not in executor overhead."""
+        plan = load_plans(PLANS_DIR / "dj_commentary_transition.json")[0]
+        fast = await replay_plan(plan, StubLatencies(cache_playback=0.0), time_scale=TIME_SCALE)
+        slow = await replay_plan(plan, StubLatencies(cache_playback=30.0), time_scale=TIME_SCALE)
+
+        assert slow.wall_ms - fast.wall_ms > 300.0
+        assert slow.step_overhead_max_ms < 20.0
+
+    async def test_latency_distributions_are_seeded(self):
+        """The same seed reproduces the same run shape."""
+        plan = load_plans(PLANS_DIR / "scripted_show.json")[0]
+        latencies = StubLatencies.from_dict({"cache_playback": {"dist": "lognormal", "median": 0.5, "sigma": 0.4}})
+        first = await replay_plan(plan, latencies, time_scale=TIME_SCALE, seed=7)
+        second = await replay_plan(plan, latencies, time_scale=TIME_SCALE, seed=7)
+
+        assert first.event_counts == second.event_counts
+        assert first.eye_commands == 3
+        assert abs(first.wall_ms - second.wall_ms) < 50.0
+
+    def test_scale_plan_timings(self):
+        """Durations, fades and offsets inside nested steps are scaled."""
+        scaled = scale_plan_timings([
+            {"step_type": "music_duck", "fade_duration_ms": 1500},
+            {"step_type": "parallel_steps", "steps": [
+                {"step_type": "music_crossfade", "next_track_id": "x", "crossfade_duration": 8.0, "offset": 1.0},
+            ]},
+        ], 0.5)
+
+        assert scaled[0]["fade_duration_ms"] == 750
+        assert scaled[1]["steps"][0]["crossfade_duration"] == 4.0
+        assert scaled[1]["steps"][0]["offset"] == 0.5
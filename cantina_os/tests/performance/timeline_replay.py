@@ -0,0 +1,363 @@
+"""Replay and benchmark harness for timeline plans.
+
+Loads recorded ``DjTransitionPlanPayload`` JSON, runs each plan through a real
+``TimelineExecutorService`` on an in-process bus, and answers the service's
+requests with stub music/speech/eye services whose response latencies are drawn
+from configurable distributions. No audio hardware or network is needed, so it
+runs headless in CI.
+
+Usage:
+    python -m tests.performance.timeline_replay tests/performance/plans/*.json \\
+        [--latencies latencies.json] [--time-scale 0.05] [--runs 3] [--json]
+"""
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from pyee.asyncio import AsyncIOEventEmitter
+
+from cantina_os.core.event_schemas import DjTransitionPlanPayload
+from cantina_os.core.event_topics import EventTopics
+from cantina_os.services.timeline_executor_service.timeline_executor_service import TimelineExecutorService
+
+# Step fields holding durations (seconds or milliseconds) scaled by --time-scale
+_TIMING_FIELDS = ("duration", "delay", "offset", "crossfade_duration", "timeout", "fade_duration_ms")
+
+LatencySpec = Union[float, int, Dict[str, Any]]
+
+
+class LatencyDistribution:
+    """Seconds drawn from a fixed value or a uniform/normal/lognormal distribution.
+
+    Specs: ``0.05``, ``{"dist": "uniform", "low": 0.01, "high": 0.1}``,
+    ``{"dist": "normal", "mean": 0.05, "std": 0.01}`` or
+    ``{"dist": "lognormal", "median": 0.05, "sigma": 0.5}``.
+    """
+
+    def __init__(self, spec: LatencySpec, rng: random.Random):
+        self._spec = spec
+        self._rng = rng
+
+    def sample(self) -> float:
+        spec = self._spec
+        if isinstance(spec, (int, float)):
+            return max(0.0, float(spec))
+        dist = spec.get("dist", "fixed")
+        if dist == "fixed":
+            value = spec["value"]
+        elif dist == "uniform":
+            value = self._rng.uniform(spec["low"], spec["high"])
+        elif dist == "normal":
+            value = self._rng.gauss(spec["mean"], spec["std"])
+        elif dist == "lognormal":
+            value = self._rng.lognormvariate(0.0, spec["sigma"]) * spec["median"]
+        else:
+            raise ValueError(f"Unknown latency distribution: {dist}")
+        return max(0.0, float(value))
+
+
+@dataclass
+class StubLatencies:
+    """Latency specs (seconds) for the stub services."""
+    ducking_ack: LatencySpec = 0.005
+    tts_synthesis: LatencySpec = 0.3  # Request to end of live TTS playback
+    cache_render: LatencySpec = 0.4
+    cache_playback: LatencySpec = 0.5
+    crossfade_overhead: LatencySpec = 0.02  # Added to the requested crossfade duration
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "StubLatencies":
+        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+
+
+class CountingEventEmitter(AsyncIOEventEmitter):
+    """Event bus that counts emissions per topic."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.counts: Counter = Counter()
+
+    def emit(self, event, *args, **kwargs):
+        if isinstance(event, EventTopics):
+            self.counts[event.value] += 1
+        return super().emit(event, *args, **kwargs)
+
+
+class StubServices:
+    """Stands in for MusicController, ElevenLabs, CachedSpeech and eye services."""
+
+    def __init__(self, bus: AsyncIOEventEmitter, latencies: StubLatencies, time_scale: float, seed: int) -> None:
+        self._bus = bus
+        self._time_scale = time_scale
+        rng = random.Random(seed)
+        self._latency = {name: LatencyDistribution(getattr(latencies, name), rng) for name in latencies.__dataclass_fields__}
+        self._pending: set = set()
+        self.eye_commands = 0
+
+        bus.on(EventTopics.AUDIO_DUCKING_START, self._on_ducking)
+        bus.on(EventTopics.AUDIO_DUCKING_STOP, self._on_ducking)
+        bus.on(EventTopics.TTS_GENERATE_REQUEST, self._on_tts)
+        bus.on(EventTopics.SPEECH_CACHE_REQUEST, self._on_cache_request)
+        bus.on(EventTopics.SPEECH_CACHE_PLAYBACK_REQUEST, self._on_cache_playback)
+        bus.on(EventTopics.MUSIC_COMMAND, self._on_music_command)
+        bus.on(EventTopics.CLI_COMMAND, self._on_cli_command)
+
+    def _later(self, latency: str, topic: EventTopics, payload: Dict[str, Any], extra: float = 0.0) -> None:
+        delay = self._latency[latency].sample() * self._time_scale + extra
+
+        async def respond():
+            await asyncio.sleep(delay)
+            self._bus.emit(topic, payload)
+
+        task = asyncio.create_task(respond())
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    def _on_ducking(self, payload: Dict[str, Any]) -> None:
+        if payload.get("duck_id"):
+            self._later("ducking_ack", EventTopics.AUDIO_DUCKING_APPLIED, {"duck_id": payload["duck_id"], "applied": True})
+
+    def _on_tts(self, payload: Dict[str, Any]) -> None:
+        self._later("tts_synthesis", EventTopics.SPEECH_GENERATION_COMPLETE, {
+            "text": payload.get("text", ""),
+            "success": True,
+            "audio_length_seconds": 0.0,
+            "clip_id": payload.get("clip_id"),
+            "step_id": payload.get("step_id"),
+            "plan_id": payload.get("plan_id"),
+        })
+
+    def _on_cache_request(self, payload: Dict[str, Any]) -> None:
+        self._later("cache_render", EventTopics.SPEECH_CACHE_READY, {
+            "cache_key": payload["cache_key"],
+            "duration_ms": 1000,
+            "size_bytes": 0,
+            "metadata": payload.get("metadata") or {},
+        })
+
+    def _on_cache_playback(self, payload: Dict[str, Any]) -> None:
+        self._later("cache_playback", EventTopics.SPEECH_CACHE_PLAYBACK_COMPLETED, {
+            "cache_key": payload["cache_key"],
+            "playback_id": payload["playback_id"],
+        })
+
+    def _on_music_command(self, payload: Dict[str, Any]) -> None:
+        if payload.get("action") == "crossfade":
+            self._later(
+                "crossfade_overhead",
+                EventTopics.CROSSFADE_COMPLETE,
+                {"crossfade_id": payload.get("crossfade_id")},
+                extra=float(payload.get("fade_duration") or 0.0),
+            )
+
+    def _on_cli_command(self, payload: Dict[str, Any]) -> None:
+        if payload.get("command") == "eye":
+            self.eye_commands += 1
+
+    async def close(self) -> None:
+        for task in list(self._pending):
+            task.cancel()
+        if self._pending:
+            await asyncio.wait(self._pending, timeout=1.0)
+
+
+@dataclass
+class ReplayReport:
+    """Result of replaying one plan."""
+    plan_id: str
+    status: str
+    steps: int
+    wall_ms: float
+    start_latency_ms: Optional[float] = None
+    step_overhead_ms: Optional[float] = None
+    step_overhead_max_ms: Optional[float] = None
+    schedule_error_ms: Optional[float] = None
+    schedule_error_max_ms: Optional[float] = None
+    layer_ops: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    event_counts: Dict[str, int] = field(default_factory=dict)
+    eye_commands: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def load_plans(path: Union[str, Path]) -> List[DjTransitionPlanPayload]:
+    """Load plans from JSON: a plan, a PLAN_READY payload, or a list of either."""
+    data = json.loads(Path(path).read_text())
+    items = data if isinstance(data, list) else [data]
+    plans = []
+    for item in items:
+        if "plan" in item and "steps" not in item:
+            item = item["plan"]
+        plans.append(DjTransitionPlanPayload(**item))
+    return plans
+
+
+def scale_plan_timings(steps: List[Any], factor: float) -> List[Any]:
+    """Return a copy of the steps with durations, fades and offsets scaled by ``factor``."""
+    scaled = []
+    for step in steps:
+        step = dict(step) if isinstance(step, dict) else step.model_dump()
+        for name in _TIMING_FIELDS:
+            value = step.get(name)
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                step[name] = value * factor
+        if isinstance(step.get("steps"), list):
+            step["steps"] = scale_plan_timings(step["steps"], factor)
+        scaled.append(step)
+    return scaled
+
+
+async def replay_plan(
+    plan: DjTransitionPlanPayload,
+    latencies: Optional[StubLatencies] = None,
+    time_scale: float = 1.0,
+    seed: int = 0,
+    music_playing: bool = True,
+    executor_config: Optional[Dict[str, Any]] = None,
+    timeout: float = 60.0,
+) -> ReplayReport:
+    """Run one plan through a fresh TimelineExecutorService and measure it."""
+    bus = CountingEventEmitter()
+    stubs = StubServices(bus, latencies or StubLatencies(), time_scale, seed)
+    service = TimelineExecutorService(bus, executor_config)
+
+    layer_ops: Dict[str, List[float]] = {}
+    for name in ("_pause_lower_priority_layers", "_cancel_lower_priority_layers", "_resume_layer"):
+        _time_method(service, name, layer_ops.setdefault(name.strip("_"), []))
+
+    metrics: Dict[str, Dict[str, Any]] = {}
+    bus.on(EventTopics.DEBUG_PERFORMANCE, lambda p: metrics.__setitem__(p["metric_name"], p))
+    ended: asyncio.Future = asyncio.get_running_loop().create_future()
+    bus.on(EventTopics.PLAN_ENDED, lambda p: ended.done() or ended.set_result(p["status"]))
+
+    await service.start()
+    try:
+        if music_playing:
+            bus.emit(EventTopics.TRACK_PLAYING, {})
+            await asyncio.sleep(0)
+        bus.counts.clear()
+
+        steps = scale_plan_timings(plan.steps, time_scale)
+        start = time.perf_counter()
+        bus.emit(EventTopics.PLAN_READY, {"plan_id": plan.plan_id, "plan": {"plan_id": plan.plan_id, "steps": steps}})
+        try:
+            status = await asyncio.wait_for(ended, timeout)
+        except asyncio.TimeoutError:
+            status = "timeout"
+        wall_ms = (time.perf_counter() - start) * 1000.0
+        # Overhead/schedule metrics are published just after PLAN_ENDED
+        for _ in range(10):
+            await asyncio.sleep(0)
+        event_counts = dict(bus.counts)
+    finally:
+        await service.stop()
+        await stubs.close()
+
+    overhead = metrics.get("plan_step_overhead", {})
+    schedule = metrics.get("plan_schedule_error", {})
+    return ReplayReport(
+        plan_id=plan.plan_id,
+        status=status,
+        steps=len(plan.steps),
+        wall_ms=wall_ms,
+        start_latency_ms=metrics.get("plan_start_latency", {}).get("value"),
+        step_overhead_ms=overhead.get("value"),
+        step_overhead_max_ms=(overhead.get("details") or {}).get("max_ms"),
+        schedule_error_ms=schedule.get("value"),
+        schedule_error_max_ms=(schedule.get("details") or {}).get("max_ms"),
+        layer_ops={
+            name: {"count": len(times), "total_ms": sum(times) * 1000.0, "max_ms": max(times, default=0.0) * 1000.0}
+            for name, times in layer_ops.items()
+        },
+        event_counts=event_counts,
+        eye_commands=stubs.eye_commands,
+    )
+
+
+def _time_method(service: TimelineExecutorService, name: str, sink: List[float]) -> None:
+    """Wrap an async service method so each call's duration lands in ``sink``."""
+    original = getattr(service, name)
+
+    async def timed(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return await original(*args, **kwargs)
+        finally:
+            sink.append(time.perf_counter() - start)
+
+    setattr(service, name, timed)
+
+
+def summarize(reports: List[ReplayReport]) -> Dict[str, Any]:
+    """Aggregate repeated runs of the same plan."""
+    def stats(values):
+        values = [v for v in values if v is not None]
+        if not values:
+            return None
+        return {"mean": statistics.fmean(values), "max": max(values)}
+
+    return {
+        "plan_id": reports[0].plan_id,
+        "runs": len(reports),
+        "statuses": dict(Counter(r.status for r in reports)),
+        "wall_ms": stats([r.wall_ms for r in reports]),
+        "start_latency_ms": stats([r.start_latency_ms for r in reports]),
+        "step_overhead_ms": stats([r.step_overhead_ms for r in reports]),
+        "schedule_error_ms": stats([r.schedule_error_ms for r in reports]),
+    }
+
+
+async def _main(args: argparse.Namespace) -> int:
+    latencies = StubLatencies()
+    if args.latencies:
+        latencies = StubLatencies.from_dict(json.loads(Path(args.latencies).read_text()))
+
+    results = []
+    failed = False
+    for path in args.plans:
+        for plan in load_plans(path):
+            reports = [
+                await replay_plan(plan, latencies, args.time_scale, seed=args.seed + run)
+                for run in range(args.runs)
+            ]
+            failed |= any(r.status != "completed" for r in reports)
+            results.append({"file": str(path), "summary": summarize(reports), "last_run": reports[-1].to_dict()})
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for result in results:
+            summary = result["summary"]
+            print(f"{result['file']} :: {summary['plan_id']} ({summary['runs']} runs) {summary['statuses']}")
+            for key in ("wall_ms", "start_latency_ms", "step_overhead_ms", "schedule_error_ms"):
+                if summary[key]:
+                    print(f"  {key:<18} mean {summary[key]['mean']:9.2f}  max {summary[key]['max']:9.2f}")
+            for name, op in result["last_run"]["layer_ops"].items():
+                if op["count"]:
+                    print(f"  {name:<18} count {op['count']:8d}  total {op['total_ms']:7.2f}  max {op['max_ms']:7.2f}")
+            print(f"  events             {result['last_run']['event_counts']}")
+    return 1 if failed else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Replay timeline plans against stub services and report timings")
+    parser.add_argument("plans", nargs="+", help="Plan JSON files")
+    parser.add_argument("--latencies", help="JSON file of StubLatencies specs")
+    parser.add_argument("--time-scale", type=float, default=1.0, help="Scale plan timings and stub latencies")
+    parser.add_argument("--runs", type=int, default=1, help="Runs per plan")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for latency sampling")
+    parser.add_argument("--json", action="store_true", help="Print JSON instead of a table")
+    return asyncio.run(_main(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
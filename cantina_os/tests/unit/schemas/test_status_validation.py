@@ -0,0 +1,94 @@
+"""
+Unit tests for status payload validation
+
+Covers the precompiled per-status-type converters: payload shapes already
+validated by Pydantic take the fast path with identical output, while
+invalid values still go through Pydantic and its fallbacks.
+"""
+
+from datetime import datetime
+
+import pytest
+from pydantic import ValidationError
+
+from cantina_os.core.event_payloads import ServiceStatus
+from cantina_os.schemas.validation import (
+    STATUS_MODEL_MAP,
+    StatusPayloadValidationMixin,
+    _StatusConverter,
+)
+
+TRACK = {"title": "Cantina Band", "artist": "Figrin D'an", "duration": 180.0, "tags": ["jizz", 1]}
+
+
+def pydantic_dump(status_type, data):
+    return STATUS_MODEL_MAP[status_type](**data).model_dump(mode="json", exclude_none=False)
+
+
+class TestStatusConverter:
+    """Tests for _StatusConverter."""
+
+    def test_fast_path_matches_pydantic(self):
+        """Second and later payloads of a shape skip Pydantic and serialize identically."""
+        cases = [
+            ("music", {"action": "started", "track": TRACK, "source": "cli", "mode": "AMBIENT",
+                       "start_timestamp": 12, "duration": 180.0, "timestamp": "t"}),
+            ("progress", {"operation": "music_playback", "progress": 0.5, "status": "playing", "timestamp": "t"}),
+            ("service", {"service_name": "brain", "status": ServiceStatus.RUNNING, "details": {"a": 1}, "timestamp": "t"}),
+            ("service", {"service_name": "brain", "status": "error", "error": "boom", "timestamp": "t"}),
+            ("voice", {"status": "idle", "confidence": 1, "timestamp": "t"}),
+            ("system", {"cantina_os_connected": True, "current_mode": "IDLE", "services": {}, "timestamp": "t"}),
+        ]
+        for status_type, data in cases:
+            converter = _StatusConverter(STATUS_MODEL_MAP[status_type])
+            expected = pydantic_dump(status_type, data)
+            assert converter.validate(data) == expected
+            result = converter.validate(data)
+            assert result == expected
+            assert [type(v) for v in result.values()] == [type(v) for v in expected.values()]
+            assert (converter.hits, converter.misses) == (1, 1), status_type
+
+    def test_defaults_generated_per_payload(self):
+        """Missing optional fields get their defaults, including a fresh timestamp."""
+        converter = _StatusConverter(STATUS_MODEL_MAP["dj"])
+        converter.validate({"mode": "active"})
+        result = converter.validate({"mode": "idle"})
+        assert converter.hits == 1
+        assert result["current_track"] is None and result["mode"] == "idle"
+        datetime.fromisoformat(result["timestamp"])
+
+    def test_values_pydantic_rejects_are_not_fast_pathed(self):
+        """A known shape with a bad literal or non-JSON nested data still goes to Pydantic."""
+        converter = _StatusConverter(STATUS_MODEL_MAP["music"])
+        converter.validate({"action": "started", "track": TRACK, "source": "cli", "mode": "IDLE"})
+
+        bad = {"action": "rewinding", "track": TRACK, "source": "cli", "mode": "IDLE"}
+        with pytest.raises(ValidationError):
+            converter.validate(bad)
+
+        when = datetime(2025, 1, 1)
+        result = converter.validate({"action": "started", "track": {"at": when}, "source": "cli", "mode": "IDLE"})
+        assert result["track"] == {"at": when.isoformat()}
+        assert converter.hits == 0
+
+
+class TestStatusPayloadValidationMixin:
+    """Tests for validate_and_serialize_status on the fast path."""
+
+    def test_invalid_payload_uses_fallback(self):
+        """Fallback and minimal payloads still apply once a shape is cached."""
+        mixin = StatusPayloadValidationMixin()
+        mixin.validate_and_serialize_status("voice", {"status": "speaking"})
+
+        fallback = mixin.validate_and_serialize_status("voice", {"status": "shouting"}, {"status": "idle"})
+        assert fallback["status"] == "idle"
+        minimal = mixin.validate_and_serialize_status("voice", {"status": "shouting"})
+        assert minimal["status"] == "shouting" and set(minimal) == {"status", "timestamp"}
+
+    def test_progress_mapping_unchanged(self):
+        """Percentages are still normalized before validation."""
+        mixin = StatusPayloadValidationMixin()
+        for _ in range(2):
+            result = mixin.validate_and_serialize_status("progress", {"progress_percent": 40, "position_sec": 4.0, "duration_sec": 10.0})
+        assert result["progress"] == 0.4
+        assert result["details"] == "Position: 4.0s / 10.0s"
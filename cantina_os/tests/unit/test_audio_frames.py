@@ -0,0 +1,148 @@
+"""
+Unit tests for binary audio frames
+
+Covers packing level and waveform frames, peak decimation, and
+WebBridgeService sending rate-limited binary frames only to dashboard
+clients that opted in.
+"""
+
+import asyncio
+import json
+import math
+
+import numpy as np
+from socketio import packet
+
+from cantina_os.utils import dashboard_json
+from cantina_os.utils.audio_frames import (
+    HEADER,
+    KIND_LEVELS,
+    KIND_WAVEFORM,
+    LEVEL_CHANNELS,
+    SOURCE_MUSIC,
+    SOURCE_SPEECH,
+    AudioFrameState,
+    decimate_peaks,
+    pack_levels,
+    pack_waveform,
+    unpack_frame,
+)
+
+
+class TestAudioFrames:
+    """Tests for frame packing."""
+
+    def test_levels_round_trip(self):
+        """Level frames are a 12-byte header plus one float16 per channel."""
+        frame = pack_levels(70000, [0.25, 0.5, math.nan, 1.0], 12.5)
+        assert len(frame) == HEADER.size + 2 * len(LEVEL_CHANNELS)
+
+        header, values = unpack_frame(frame)
+        assert (header["kind"], header["seq"], header["count"], header["time"]) == (KIND_LEVELS, 70000 & 0xFFFF, 4, 12.5)
+        assert values[0] == 0.25 and values[3] == 1.0 and math.isnan(values[2])
+
+    def test_waveform_keeps_peaks(self):
+        """Waveforms are decimated by bucket peak and scaled to uint8."""
+        samples = np.zeros(1000, dtype=np.float32)
+        samples[10] = -0.8  # Negative peak counts by magnitude
+        samples[990] = 0.4
+        assert len(decimate_peaks(samples, 100)) == 100
+        assert len(decimate_peaks([0.1, 0.2], 100)) == 2
+
+        header, values = unpack_frame(pack_waveform(3, SOURCE_SPEECH, samples, 2.0, points=100))
+        assert (header["kind"], header["source"], header["count"], header["time"]) == (KIND_WAVEFORM, SOURCE_SPEECH, 100, 2.0)
+        assert values[1] == 255 and values[99] == 128 and values[50] == 0
+
+        _, silent = unpack_frame(pack_waveform(4, SOURCE_SPEECH, np.zeros(10), 1.0))
+        assert not silent.any()
+
+    def test_binary_frame_in_socketio_packet(self):
+        """Frames go out as Socket.IO binary attachments, not JSON."""
+        frame = pack_levels(1, [0.1, 0.2, 0.3, 0.4], 1.0)
+        pkt = packet.Packet(packet.EVENT, data=["audio_frame", frame], namespace="/")
+        pkt.json = dashboard_json
+        encoded = pkt.encode()
+        assert encoded[1:] == [frame]
+        assert json.loads(encoded[0][encoded[0].index("["):])[1] == {"_placeholder": True, "num": 0}
+
+
+def audio_frames(sio):
+    return [(unpack_frame(data), room) for event, data, room in sio.emits if event == "audio_frame"]
+
+
+class TestWebBridgeAudioFrames:
+    """Tests for the bridge's binary audio frame channel."""
+
+    async def test_opt_in_and_rate_limit(self, make_bridge):
+        """Only opted-in clients get frames, coalesced to the newest levels."""
+        bridge = make_bridge(audio_frame_fps=1000)
+        sio = bridge._sio
+        await sio.handlers["connect"]("sid", {})
+
+        await bridge._handle_voice_audio_level({"rms": 0.5, "peak": 0.9})
+        assert audio_frames(sio) == []  # Not subscribed yet
+
+        await sio.handlers["subscribe_audio_frames"]("sid", {"enabled": True})
+        for rms in (0.1, 0.2, 0.3):
+            await bridge._handle_voice_audio_level({"rms": rms, "peak": 0.9})
+        await bridge._handle_music_progress({"progress_percent": 25.0, "position_sec": 1.0, "duration_sec": 4.0})
+
+        frames = audio_frames(sio)
+        assert frames[0][1] == "audio_frames"
+        (header, values), _ = frames[0]
+        assert header["kind"] == KIND_LEVELS and abs(values[0] - 0.1) < 1e-3 and math.isnan(values[2])
+
+        await asyncio.sleep(0.05)
+        (_, latest), _ = audio_frames(sio)[-1]
+        assert abs(latest[0] - 0.3) < 1e-3 and latest[3] == 0.25
+        assert bridge._audio_frame_throttle.totals()["coalesced"] >= 1
+
+        await sio.handlers["subscribe_audio_frames"]("sid", {"enabled": False})
+        count = len(sio.emits)
+        await bridge._handle_speech_amplitude({"amplitude": 0.7})
+        assert len(sio.emits) == count
+        await bridge._audio_frame_throttle.close()
+
+    async def test_track_and_speech_waveforms(self, tmp_path, bridge):
+        """Track previews come from the library index; late subscribers get the current ones."""
+        (tmp_path / "library_index.json").write_text(json.dumps({
+            "version": 1,
+            "tracks": {"Cantina.mp3": {"energy_envelope": {"hop_sec": 1.0, "values": [0.1, 0.4, 0.2]}}},
+        }))
+        sio = bridge._sio
+
+        await bridge._handle_music_playback_started({
+            "track": {"title": "Cantina", "filepath": str(tmp_path / "Cantina.mp3")}, "duration": 3.0,
+        })
+        speech = np.sin(np.linspace(0, 20, 8000)).astype(np.float32)
+        await bridge._handle_tts_audio_data({"audio_data": speech.tobytes(), "sample_rate": 16000, "success": True})
+
+        await sio.handlers["connect"]("late", {})
+        await sio.handlers["subscribe_audio_frames"]("late", {})
+        previews = {header["source"]: (header, values) for (header, values), room in audio_frames(sio) if room == "late"}
+        assert list(previews[SOURCE_MUSIC][1]) == [64, 255, 128]
+        assert previews[SOURCE_MUSIC][0]["time"] == 3.0
+        assert previews[SOURCE_SPEECH][0]["time"] == 0.5
+
+        await bridge._handle_music_playback_stopped({})
+        assert SOURCE_MUSIC not in bridge._waveform_frames
+
+        # Crossfades do not emit MUSIC_PLAYBACK_STARTED; CROSSFADE_COMPLETE refreshes the preview
+        await bridge._handle_crossfade_complete({
+            "status": "success", "current_track": {"title": "Cantina", "filepath": str(tmp_path / "Cantina.mp3"), "duration": 3.0},
+        })
+        assert unpack_frame(bridge._waveform_frames[SOURCE_MUSIC])[0]["time"] == 3.0
+        await bridge._audio_frame_throttle.close()
+
+
+class TestAudioFrameState:
+    """Tests for AudioFrameState."""
+
+    def test_shared_sequence(self):
+        """Level and waveform frames share one wrapping sequence counter."""
+        state = AudioFrameState(clock_start=100.0)
+        state.seq = 0xFFFF
+        state.set_level("mic_rms", 0.5)
+        header, values = unpack_frame(state.levels_frame(101.5))
+        assert header["seq"] == 0 and header["time"] == 1.5 and values[0] == 0.5
+        assert unpack_frame(state.waveform_frame(SOURCE_MUSIC, [1.0], 1.0))[0]["seq"] == 1
@@ -0,0 +1,97 @@
+"""
+Unit tests for audio level metering
+
+Covers the vectorised per-block computation, short-block masking, window
+decimation and the RMS envelope replayed during speech playback.
+"""
+
+import numpy as np
+import pytest
+
+from cantina_os.utils.audio_metering import AudioLevelMeter, block_levels, rms_envelope
+from cantina_os.utils.audio_ring_buffer import AudioRingBuffer
+
+
+class TestBlockLevels:
+    """Tests for block_levels."""
+
+    def test_matches_per_block_numpy(self):
+        """Vectorised results match a straightforward per-block computation."""
+        rng = np.random.default_rng(0)
+        data = rng.integers(-32768, 32767, size=(5, 256, 1), dtype=np.int16)
+
+        sum_squares, peak, samples = block_levels(data)
+
+        for i in range(5):
+            block = data[i].astype(np.float64)
+            assert sum_squares[i] == pytest.approx(np.sum(block ** 2), rel=1e-6)
+            assert peak[i] == np.max(np.abs(block))
+        assert list(samples) == [256] * 5
+
+    def test_short_blocks_ignore_stale_samples(self):
+        """Samples past a block's length do not count."""
+        data = np.full((2, 4, 1), 100, dtype=np.int16)
+        data[1, 2:] = 30000  # stale
+        sum_squares, peak, samples = block_levels(data, np.array([4, 2]))
+
+        assert sum_squares[1] == pytest.approx(2 * 100 ** 2)
+        assert peak[1] == 100
+        assert list(samples) == [4, 2]
+
+
+class TestAudioLevelMeter:
+    """Tests for AudioLevelMeter."""
+
+    def test_decimates_to_update_rate(self):
+        """One level is produced per window, not per block."""
+        meter = AudioLevelMeter(sample_rate=16000, update_rate_hz=10.0)
+        data = np.full((20, 160, 1), 16384, dtype=np.int16)  # 20 x 10 ms
+
+        levels = meter.process(data, timestamps=np.arange(20, dtype=np.float64))
+
+        assert len(levels) == 2
+        assert levels[0].rms == pytest.approx(0.5)
+        assert levels[0].peak == pytest.approx(0.5)
+        assert levels[0].window_ms == pytest.approx(100.0)
+        assert levels[1].timestamp == 19.0
+
+    def test_partial_window_carries_over(self):
+        """A partial window is completed by the next batch."""
+        meter = AudioLevelMeter(sample_rate=1000, update_rate_hz=1.0)
+        block = np.zeros((1, 600, 1), dtype=np.int16)
+
+        assert meter.process(block) == []
+        levels = meter.process(block)
+        assert len(levels) == 1
+        assert levels[0].rms_db == -120.0
+
+    def test_meters_ring_buffer_segments(self):
+        """Segments from the ring buffer can be metered directly, including wraparound."""
+        ring = AudioRingBuffer(capacity=3, frames_per_block=100)
+        meter = AudioLevelMeter(sample_rate=1000, update_rate_hz=5.0)
+
+        for _ in range(2):
+            ring.write(np.full((100, 1), 1000, dtype=np.int16), 0.0)
+        ring.release(2)
+        for i in range(3):
+            ring.write(np.full((100, 1), 1000, dtype=np.int16), float(i))
+
+        segments = ring.peek_segments()
+        assert len(segments) == 2
+
+        levels = []
+        for data, lengths, timestamps in segments:
+            levels.extend(meter.process(data, lengths, timestamps))
+        assert len(levels) == 1
+        assert levels[0].peak == pytest.approx(1000 / 32768)
+
+
+class TestRmsEnvelope:
+    """Tests for rms_envelope."""
+
+    def test_one_value_per_window(self):
+        """Each window's RMS is reported, including a partial last window."""
+        clip = np.concatenate([np.full(100, 0.5), np.zeros(100), np.full(50, -1.0)]).astype(np.float32)
+        envelope = rms_envelope(clip, sample_rate=1000, update_rate_hz=10.0)
+        assert envelope.tolist() == pytest.approx([0.5, 0.0, 1.0])
+        assert rms_envelope(np.zeros((0,), dtype=np.float32), 1000).size == 0
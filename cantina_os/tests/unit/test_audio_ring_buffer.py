@@ -0,0 +1,110 @@
+"""
+Unit tests for the audio ring buffer
+
+Covers block ordering, wraparound, overrun accounting and the
+peek/release zero-copy read path.
+"""
+
+import threading
+
+import numpy as np
+import pytest
+
+from cantina_os.utils.audio_ring_buffer import AudioRingBuffer
+
+
+def block(value, frames=4, channels=1):
+    """Create a constant audio block."""
+    return np.full((frames, channels), value, dtype=np.int16)
+
+
+class TestAudioRingBuffer:
+    """Tests for AudioRingBuffer."""
+
+    def test_write_and_read_in_order(self):
+        """Blocks come back in capture order with their timestamps."""
+        ring = AudioRingBuffer(capacity=4, frames_per_block=4)
+        for i in range(3):
+            assert ring.write(block(i), timestamp=float(i))
+
+        blocks = ring.read()
+        assert [int(data[0, 0]) for data, _ in blocks] == [0, 1, 2]
+        assert [ts for _, ts in blocks] == [0.0, 1.0, 2.0]
+        assert len(ring) == 0
+
+    def test_wraparound(self):
+        """Slots are reused once released."""
+        ring = AudioRingBuffer(capacity=2, frames_per_block=4)
+        for i in range(6):
+            assert ring.write(block(i), timestamp=float(i))
+            data, _ = ring.read()[0]
+            assert int(data[0, 0]) == i
+        assert ring.stats.blocks_written == 6
+        assert ring.stats.overruns == 0
+
+    def test_overrun_drops_newest_block(self):
+        """A full buffer drops incoming blocks and counts them."""
+        ring = AudioRingBuffer(capacity=2, frames_per_block=4)
+        assert ring.write(block(1), 0.0)
+        assert ring.write(block(2), 0.1)
+        assert not ring.write(block(3), 0.2)
+
+        assert ring.stats.overruns == 1
+        assert ring.stats.dropped_frames == 4
+        assert ring.stats.max_fill == 2
+        assert [int(data[0, 0]) for data, _ in ring.read()] == [1, 2]
+
+    def test_short_block_length_is_kept(self):
+        """Blocks shorter than the slot keep their own frame count."""
+        ring = AudioRingBuffer(capacity=2, frames_per_block=8)
+        ring.write(block(5, frames=3), 0.0)
+        data, _ = ring.read()[0]
+        assert data.shape == (3, 1)
+
+    def test_peek_returns_views_until_release(self):
+        """peek does not consume, release hands slots back."""
+        ring = AudioRingBuffer(capacity=2, frames_per_block=4)
+        ring.write(block(7), 0.0)
+
+        views = ring.peek()
+        assert len(views) == 1
+        assert np.shares_memory(views[0][0], ring._data)
+        assert len(ring) == 1
+
+        ring.release(1)
+        assert len(ring) == 0
+        assert ring.stats.blocks_read == 1
+
+    def test_clear(self):
+        """clear drops everything readable."""
+        ring = AudioRingBuffer(capacity=4, frames_per_block=4)
+        ring.write(block(1), 0.0)
+        ring.write(block(2), 0.0)
+        ring.clear()
+        assert len(ring) == 0
+        assert ring.read() == []
+
+    def test_threaded_producer(self):
+        """A producer thread and a consumer see every block exactly once."""
+        ring = AudioRingBuffer(capacity=8, frames_per_block=4)
+        total = 2000
+        received = []
+
+        def produce():
+            i = 0
+            while i < total:
+                if ring.write(block(i % 30000), float(i)):
+                    i += 1
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        while len(received) < total:
+            received.extend(ts for _, ts in ring.read())
+        producer.join()
+
+        assert received == [float(i) for i in range(total)]
+
+    def test_invalid_capacity(self):
+        """Capacity must be positive."""
+        with pytest.raises(ValueError):
+            AudioRingBuffer(capacity=0, frames_per_block=4)
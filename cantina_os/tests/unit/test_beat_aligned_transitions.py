@@ -0,0 +1,151 @@
+"""
+Unit tests for beat-aligned DJ transitions
+
+Covers the beat grid helpers that plan a crossfade on a downbeat for a
+whole number of bars, and BrainService placing commentary over the outgoing
+track's outro using the timing carried by TRACK_ENDING_SOON.
+"""
+
+import time
+
+import pytest
+from pyee.asyncio import AsyncIOEventEmitter
+
+from cantina_os.core.event_topics import EventTopics
+from cantina_os.models.music_models import MusicTrack
+from cantina_os.services.brain_service import BrainService
+from cantina_os.utils.beat_grid import BeatGrid, plan_crossfade
+
+# 120 BPM: 0.5s beats, 2s bars, first beat 0.25s in
+BEATS = [0.25 + 0.5 * i for i in range(400)]
+
+
+def make_track(name):
+    return MusicTrack(name=name, path=f"/music/{name}.mp3", track_id=name, title=name, duration=200.0)
+
+
+class TestBeatGrid:
+    """Tests for BeatGrid and plan_crossfade."""
+
+    def test_bars_and_downbeats(self):
+        """Bar length comes from the median beat interval; every 4th beat is a downbeat."""
+        grid = BeatGrid(BEATS)
+        assert grid.beat_length == pytest.approx(0.5)
+        assert grid.bar_length == pytest.approx(2.0)
+        assert grid.downbeats[:3] == [0.25, 2.25, 4.25]
+        assert grid.whole_bars(7.1) == pytest.approx(8.0)
+        assert grid.whole_bars(0.4) == pytest.approx(2.0)
+        assert grid.next_downbeat(2.3) == pytest.approx(4.25)
+        assert grid.next_downbeat(250.0) == pytest.approx(250.25)
+        assert grid.last_downbeat_before(5.0) == pytest.approx(4.25)
+        assert not BeatGrid([1.0])
+
+    def test_arriving_just_after_downbeat(self):
+        """A planned crossfade a few ms late starts at once instead of waiting a bar."""
+        # 150 BPM: 0.4s beats, 1.6s bars
+        grid = BeatGrid([0.4 * i for i in range(400)])
+        assert grid.next_downbeat(16.005) == pytest.approx(17.6)
+        assert grid.next_downbeat(16.005, tolerance=0.08) == pytest.approx(16.0)
+        assert grid.downbeat_wait(16.005, max_wait=2.0) == 0.0
+        assert grid.downbeat_wait(16.2, max_wait=2.0) == pytest.approx(1.4)
+        assert grid.downbeat_wait(15.9, max_wait=2.0) == pytest.approx(0.1)
+        assert grid.downbeat_wait(16.2, max_wait=1.0) == 0.0
+
+    def test_crossfade_covers_outro_on_downbeat(self):
+        """The fade starts on the downbeat before the outro and lasts whole bars."""
+        timing = plan_crossfade(200.0, BeatGrid(BEATS), outro_length=8.3)
+        assert timing.beat_aligned
+        assert timing.duration == pytest.approx(8.0)
+        assert timing.outro_start == pytest.approx(191.7)
+        assert timing.start == pytest.approx(190.25)
+
+        # Rounded up to whole bars, the fade must still finish before the track ends
+        timing = plan_crossfade(200.0, BeatGrid(BEATS), outro_length=11.0)
+        assert timing.duration == pytest.approx(12.0)
+        assert timing.start == pytest.approx(186.25)
+
+    def test_long_outro_is_capped(self):
+        """Long outros get at most max_duration of crossfade, still on a downbeat."""
+        timing = plan_crossfade(200.0, BeatGrid(BEATS), outro_length=40.0, max_duration=16.0)
+        assert timing.duration == pytest.approx(16.0)
+        assert (timing.start - 0.25) % 2.0 == pytest.approx(0.0)
+        assert timing.start == pytest.approx(182.25)
+
+    def test_without_grid_fade_ends_with_track(self):
+        """Without a beat grid the default fade simply ends at the end of the track."""
+        timing = plan_crossfade(200.0, None, default_duration=3.0)
+        assert not timing.beat_aligned
+        assert (timing.start, timing.duration) == (197.0, 3.0)
+
+
+class TestBrainBeatAlignedPlan:
+    """Tests for BrainService building transitions from TRACK_ENDING_SOON timing."""
+
+    @pytest.fixture
+    async def brain(self):
+        brain = BrainService(AsyncIOEventEmitter(), {"commentary_ready_grace": 0.0})
+        await brain._setup_subscriptions()
+        brain._music_library = {name: make_track(name) for name in ("a", "b")}
+        brain._dj_mode_active = True
+        brain._current_track = brain._music_library["a"]
+        return brain
+
+    async def ending_soon(self, brain, **timing):
+        plans = []
+        brain._event_bus.on(EventTopics.PLAN_READY, plans.append)
+        await brain._handle_track_ending_soon({
+            "timestamp": time.time(),
+            "current_track": brain._create_track_data_payload(brain._current_track).model_dump(),
+            "time_remaining": 42.0,
+            **timing,
+        })
+        return plans[-1]["plan"]["steps"]
+
+    def ready_commentary(self, brain, duration=4.0):
+        candidate = brain._commentary_pool.add(brain._music_library["b"], "r1")
+        brain._commentary_pool.mark_commentary("r1", "k1")
+        brain._commentary_pool.mark_ready("k1", duration)
+        brain._commentary_cache_keys["r1"] = "k1"
+        brain._cached_commentary_ready["k1"] = True
+        brain._commentary_request_next_track["r1"] = candidate.track
+
+    async def test_commentary_over_outro_and_crossfade_on_downbeat(self, brain):
+        """Commentary ends with the crossfade; the crossfade waits for the planned downbeat."""
+        self.ready_commentary(brain, duration=12.0)
+        steps = await self.ending_soon(brain, crossfade_start_in=12.0, crossfade_duration=8.0, outro_start_in=12.0)
+
+        parallel, unduck = steps
+        assert unduck["step_type"] == "music_unduck"
+        duck, speech, crossfade = parallel["steps"]
+        assert speech["cache_key"] == "k1"
+        assert speech["offset"] == pytest.approx(8.0, abs=0.05)  # Starting at the outro would overrun the fade
+        assert duck["offset"] == pytest.approx(speech["offset"] - 2.0, abs=0.01)
+        assert crossfade["offset"] == pytest.approx(12.0, abs=0.05)
+        assert crossfade["crossfade_duration"] == 8.0
+
+    async def test_short_commentary_starts_at_outro(self, brain):
+        """Short commentary starts exactly where the outro does."""
+        self.ready_commentary(brain, duration=4.0)
+        steps = await self.ending_soon(brain, crossfade_start_in=12.0, crossfade_duration=8.0, outro_start_in=12.0)
+
+        speech = steps[0]["steps"][1]
+        assert speech["offset"] == pytest.approx(12.0, abs=0.05)
+
+    async def test_without_commentary_crossfade_still_aligned(self, brain):
+        """A crossfade-only transition keeps the planned offset and length."""
+        brain._commentary_pool.add(brain._music_library["b"])
+        steps = await self.ending_soon(brain, crossfade_start_in=6.0, crossfade_duration=4.0)
+
+        (parallel,) = steps
+        (crossfade,) = parallel["steps"]
+        assert crossfade["offset"] == pytest.approx(6.0, abs=0.05)
+        assert crossfade["crossfade_duration"] == 4.0
+        assert brain._transition_timing is None
+
+    async def test_unanalyzed_track_keeps_immediate_transition(self, brain):
+        """Without timing the transition starts right away with the configured crossfade."""
+        self.ready_commentary(brain)
+        steps = await self.ending_soon(brain)
+
+        assert [s["step_type"] for s in steps] == ["music_duck", "parallel_steps", "music_unduck"]
+        assert all("offset" not in s for s in steps[1]["steps"])
@@ -0,0 +1,317 @@
+"""
+Unit tests for the shared bridge core
+
+Covers the dashboard music library listing and the Unix socket transport
+that lets bridge, logging and debug processes use the CantinaOS event bus.
+"""
+
+import asyncio
+import gzip
+import json
+import logging
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from pyee.asyncio import AsyncIOEventEmitter
+
+from cantina_os.bridge.ipc import (
+    CODEC_JSON,
+    CODEC_MSGPACK,
+    CONNECTED_EVENT,
+    FRAME_HEADER,
+    SUPPORTED_CODECS,
+    EventBusIPCServer,
+    RemoteEventBus,
+    decode_body,
+    encode_message,
+)
+from cantina_os.bridge.music_library import (
+    LibraryResponse,
+    etag_matches,
+    format_duration,
+    format_library_tracks,
+    parse_library_fields,
+    scan_music_dir,
+)
+from cantina_os.bridge.remote_service import REMOTE_SERVICE_FACTORIES, replay_log_record
+from cantina_os.core.event_topics import EventTopics
+from cantina_os.event_payloads import ServiceStatus
+from cantina_os.services.web_bridge_service import WebBridgeService
+
+LIBRARY = {
+    f"Track {i}": {"title": f"Track {i}", "artist": "Figrin D'an", "duration": 120 + i, "path": f"/m/Track {i}.mp3"}
+    for i in range(60)
+}
+
+
+class TestMusicLibrary:
+    """Tests for the dashboard track list."""
+
+    def test_library_tracks(self):
+        """Controller tracks keep their metadata; missing fields get defaults."""
+        tracks = format_library_tracks({
+            "Cantina Song": {"title": "Cantina Song", "artist": "Figrin D'an", "duration": 185.4, "path": "/m/Cantina Song.mp3"},
+            "Mystery": {"duration": None, "path": "/m/Mystery.wav"},
+        })
+        assert tracks[0] == {
+            "id": "1", "title": "Cantina Song", "artist": "Figrin D'an", "duration": "3:05",
+            "file": "Cantina Song.mp3", "path": "/m/Cantina Song.mp3",
+        }
+        assert (tracks[1]["title"], tracks[1]["artist"], tracks[1]["duration"]) == ("Mystery", "Cantina Band", "Unknown")
+        assert format_duration(0) == "Unknown"
+
+    def test_scan_music_dir(self, tmp_path):
+        """The filesystem fallback lists audio files only and has no mock data."""
+        for name in ("Mus Kerez - Doolstan.mp3", "Moulee-rah.WAV", "cover.jpg"):
+            (tmp_path / name).write_bytes(b"")
+        tracks = scan_music_dir(str(tmp_path))
+        assert [(t["id"], t["artist"], t["title"]) for t in tracks] == [
+            ("1", "Cantina Band", "Moulee-rah"),
+            ("2", "Mus Kerez", "Doolstan"),
+        ]
+        assert scan_music_dir(str(tmp_path / "missing")) == []
+
+
+class TestLibraryResponse:
+    """Tests for the cached /api/music/library responses."""
+
+    def test_encoded_once_per_version(self):
+        """Republishing the same library keeps the ETag; pages are cached per version."""
+        response = LibraryResponse(gzip_min_bytes=1024)
+        assert response.set_tracks(format_library_tracks(LIBRARY))
+        etag = response.etag()
+        full = response.body()
+        assert json.loads(full.content)["total"] == 60
+        assert gzip.decompress(full.gzipped) == full.content
+
+        assert not response.set_tracks(format_library_tracks(dict(LIBRARY)))
+        assert response.etag() == etag and response.body() is full
+
+        page = response.body(10, 5, ("id", "title"))
+        assert response.body(10, 5, ("id", "title")) is page
+        assert json.loads(page.content) == {
+            "tracks": [{"id": str(i + 1), "title": f"Track {i}"} for i in range(10, 15)],
+            "total": 60, "offset": 10, "limit": 5,
+        }
+        assert page.gzipped is None and page.etag != etag
+
+        response.set_tracks(format_library_tracks({"Solo": {"duration": 60}}))
+        assert response.etag() != etag and response.body(10, 5, ("id", "title")) is not page
+
+    def test_request_parsing(self):
+        """Field selections are validated and If-None-Match accepts lists and weak tags."""
+        assert parse_library_fields("title, id,title") == ("title", "id")
+        assert parse_library_fields("") is None
+        with pytest.raises(ValueError):
+            parse_library_fields("title,lyrics")
+        assert etag_matches('"a", W/"b"', '"b"') and etag_matches("*", '"c"')
+        assert not etag_matches(None, '"a"') and not etag_matches('"a"', '"b"')
+
+
+class TestWebBridgeMusicLibrary:
+    """Tests for the WebBridgeService library endpoint."""
+
+    async def test_etag_pagination_and_gzip(self, tmp_path):
+        """Unchanged libraries answer 304; pages, fields and gzip come from the cached response."""
+        (tmp_path / "Mus Kerez - Doolstan.mp3").write_bytes(b"")
+        bridge = WebBridgeService(AsyncIOEventEmitter(), {"music_dir": str(tmp_path), "library_gzip_min_bytes": 1024})
+        bridge._create_fastapi_app()
+        client = TestClient(bridge._app)
+
+        fallback = client.get("/api/music/library")
+        assert [t["title"] for t in fallback.json()["tracks"]] == ["Doolstan"]
+
+        await bridge._handle_music_library_updated({"track_count": 60, "tracks": LIBRARY})
+        first = client.get("/api/music/library", headers={"Accept-Encoding": "gzip"})
+        assert first.headers["content-encoding"] == "gzip" and len(first.json()["tracks"]) == 60
+        etag = first.headers["etag"]
+
+        await bridge._handle_music_library_updated({"track_count": 60, "tracks": dict(LIBRARY)})
+        unchanged = client.get("/api/music/library", headers={"If-None-Match": etag})
+        assert unchanged.status_code == 304 and unchanged.content == b""
+
+        page = client.get("/api/music/library", params={"offset": 58, "limit": 5, "fields": "title,duration"})
+        assert page.json() == {
+            "tracks": [{"title": "Track 58", "duration": "2:58"}, {"title": "Track 59", "duration": "2:59"}],
+            "total": 60, "offset": 58, "limit": 5,
+        }
+        assert "content-encoding" not in page.headers
+        assert client.get("/api/music/library", params={"fields": "lyrics"}).status_code == 400
+        assert client.get("/api/music/library", params={"limit": 0}).status_code == 422
+
+
+class TestEventBusIPC:
+    """Tests for EventBusIPCServer and RemoteEventBus."""
+
+    @pytest.mark.parametrize("codec", [CODEC_JSON, CODEC_MSGPACK])
+    def test_codecs(self, codec):
+        """Both framings carry bytes natively and send enums and datetimes as JSON values."""
+        if codec == CODEC_MSGPACK and "msgpack" not in SUPPORTED_CODECS:
+            pytest.skip("msgpack not installed")
+        message = {"op": "event", "topic": "t", "args": [
+            {"audio": b"\x00\x01", "status": ServiceStatus.RUNNING, "at": datetime(2025, 1, 1)},
+        ]}
+        frame = encode_message(message, codec)
+        size, frame_codec = FRAME_HEADER.unpack_from(frame)
+        assert (size, frame_codec) == (len(frame) - FRAME_HEADER.size, codec)
+        assert decode_body(frame[FRAME_HEADER.size:], codec)["args"] == [
+            {"audio": b"\x00\x01", "status": "RUNNING", "at": "2025-01-01T00:00:00"},
+        ]
+
+    async def test_round_trip(self, tmp_path):
+        """Subscribed topics reach the bridge; bridge events reach CantinaOS without echoing back."""
+        bus = AsyncIOEventEmitter()
+        server = EventBusIPCServer(bus, str(tmp_path / "bus.sock"))
+        await server.start()
+        remote = RemoteEventBus(server.path, reconnect_delay=0.01)
+
+        received, commands, echoes = [], [], []
+        remote.on(EventTopics.MUSIC_PROGRESS, lambda payload: received.append(payload))
+        remote.on(EventTopics.MUSIC_COMMAND, lambda payload: echoes.append(payload))
+        bus.on(EventTopics.MUSIC_COMMAND, lambda payload: commands.append(payload))
+        remote.start()
+        await asyncio.wait_for(remote.connected.wait(), 1)
+        while len(server.topics) < 2:
+            await asyncio.sleep(0.01)
+
+        bus.emit(EventTopics.MUSIC_PROGRESS, {"progress_percent": 50.0, "audio": b"\x00\xff"})
+        bus.emit(EventTopics.TRANSCRIPTION_FINAL, {"text": "not subscribed"})
+        remote.emit(EventTopics.MUSIC_COMMAND, {"command": "stop"})
+        while not (received and commands):
+            await asyncio.sleep(0.01)
+
+        assert received == [{"progress_percent": 50.0, "audio": b"\x00\xff"}]
+        assert commands == [{"command": "stop"}]
+        assert echoes == [{"command": "stop"}]  # Local delivery only, not bounced back by the server
+        assert server.stats["forwarded"] == 1
+
+        await remote.close()
+        while server.peer_count:
+            await asyncio.sleep(0.01)
+        assert server.topics == []
+        assert not bus.listeners(EventTopics.MUSIC_PROGRESS)
+        await server.stop()
+
+    async def test_reconnect_resubscribes(self, tmp_path):
+        """A bridge started before CantinaOS attaches once the socket appears."""
+        path = str(tmp_path / "bus.sock")
+        remote = RemoteEventBus(path, reconnect_delay=0.01)
+        received = []
+        remote.on(EventTopics.DJ_MODE_CHANGED, lambda payload: received.append(payload))
+        remote.start()
+        await asyncio.sleep(0.05)
+
+        bus = AsyncIOEventEmitter()
+        server = EventBusIPCServer(bus, path)
+        await server.start()
+        await asyncio.wait_for(remote.connected.wait(), 1)
+        while not server.topics:
+            await asyncio.sleep(0.01)
+        bus.emit(EventTopics.DJ_MODE_CHANGED, {"is_active": True})
+        while not received:
+            await asyncio.sleep(0.01)
+        assert received == [{"is_active": True}]
+
+        await remote.close()
+        await server.stop()
+
+    async def test_last_listener_unsubscribes(self, tmp_path):
+        """CantinaOS stops forwarding a topic once the bridge has no listeners left for it."""
+        bus = AsyncIOEventEmitter()
+        server = EventBusIPCServer(bus, str(tmp_path / "bus.sock"))
+        await server.start()
+        remote = RemoteEventBus(server.path, reconnect_delay=0.01)
+        progress = EventTopics.MUSIC_PROGRESS.value
+
+        def by_member(payload):
+            pass
+
+        def by_value(payload):
+            pass
+
+        remote.on(EventTopics.MUSIC_PROGRESS, by_member)
+        remote.on(progress, by_value)
+        remote.once(EventTopics.DJ_MODE_CHANGED, lambda payload: None)
+        remote.start()
+        await asyncio.wait_for(remote.connected.wait(), 1)
+        while len(server.topics) < 2:
+            await asyncio.sleep(0.01)
+
+        remote.remove_listener(EventTopics.MUSIC_PROGRESS, by_member)
+        bus.emit(EventTopics.DJ_MODE_CHANGED, {"is_active": True})  # Fires and drops the once() listener
+        while EventTopics.DJ_MODE_CHANGED.value in server.topics:
+            await asyncio.sleep(0.01)
+        assert server.topics == [progress]
+
+        remote.remove_listener(progress, by_value)
+        while server.topics:
+            await asyncio.sleep(0.01)
+
+        remote.on(EventTopics.MUSIC_PROGRESS, by_member)
+        remote.remove_all_listeners()
+        remote.on(EventTopics.MUSIC_COMMAND, by_member)  # Still subscribes after a full clear
+        while server.topics != [EventTopics.MUSIC_COMMAND.value]:
+            await asyncio.sleep(0.01)
+
+        await remote.close()
+        await server.stop()
+
+    async def test_web_bridge_requests_state_on_each_connect(self, tmp_path):
+        """The standalone bridge asks for service status again after CantinaOS restarts."""
+        path = str(tmp_path / "bus.sock")
+        remote = RemoteEventBus(path, reconnect_delay=0.01)
+        connects = []
+        remote.on(CONNECTED_EVENT, lambda: connects.append(True))
+        REMOTE_SERVICE_FACTORIES["web_bridge"](remote, {})
+        remote.start()
+
+        for _ in range(2):
+            bus = AsyncIOEventEmitter()
+            requests = []
+            bus.on(EventTopics.SERVICE_STATUS_REQUEST, requests.append)
+            server = EventBusIPCServer(bus, path)
+            await server.start()
+            while not requests:
+                await asyncio.sleep(0.01)
+            assert requests[0]["source"] == "web_bridge"
+            await server.stop()
+            while remote.connected.is_set():
+                await asyncio.sleep(0.01)
+
+        assert len(connects) == 2
+        await remote.close()
+
+    async def test_json_only_peer_and_log_forwarding(self, tmp_path):
+        """A peer offering only JSON gets JSON frames; log records reach a remote LoggingService."""
+        bus = AsyncIOEventEmitter()
+        server = EventBusIPCServer(bus, str(tmp_path / "bus.sock"))
+        await server.start()
+        server.forward_logs(logging.INFO)
+        remote = RemoteEventBus(server.path, reconnect_delay=0.01, codecs=["json"])
+        records = []
+        remote.on(EventTopics.LOG_RECORD, records.append)
+        remote.start()
+        await asyncio.wait_for(remote.connected.wait(), 1)
+        while not server.topics:
+            await asyncio.sleep(0.01)
+        assert [peer.codec for peer in server._peers] == [CODEC_JSON]
+
+        logging.getLogger("cantina_os.music_controller").warning("Track %s ended", "Cantina Band")
+        while not records:
+            await asyncio.sleep(0.01)
+        assert records[0]["msg"] == "Track Cantina Band ended" and records[0]["levelname"] == "WARNING"
+
+        replayed = []
+        handler = logging.Handler()
+        handler.emit = replayed.append
+        logging.getLogger("cantina_os.music_controller").addHandler(handler)
+        try:
+            replay_log_record(records[0])
+        finally:
+            logging.getLogger("cantina_os.music_controller").removeHandler(handler)
+        assert replayed[0].getMessage() == "Track Cantina Band ended" and replayed[0].levelno == logging.WARNING
+
+        await remote.close()
+        await server.stop()
+        assert server._log_handler is None
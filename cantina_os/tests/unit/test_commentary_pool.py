@@ -0,0 +1,292 @@
+"""
+Unit tests for the DJ next-track candidate pool
+
+Covers the pool's book-keeping, the latency estimate used to schedule
+commentary, and BrainService promoting the first ready candidate at
+TRACK_ENDING_SOON, retrying failures and recycling the rest.
+"""
+
+import asyncio
+import time
+
+import pytest
+from pyee.asyncio import AsyncIOEventEmitter
+
+from cantina_os.core.event_topics import EventTopics
+from cantina_os.models.music_models import MusicTrack
+from cantina_os.services.brain_service import BrainService
+from cantina_os.utils.commentary_pool import CandidateState, CommentaryCandidatePool, CommentaryLatencyEstimator
+
+
+def make_track(name):
+    return MusicTrack(name=name, path=f"/music/{name}.mp3", track_id=name, title=name, duration=180.0)
+
+
+class TestCommentaryCandidatePool:
+    """Tests for CommentaryCandidatePool."""
+
+    def test_first_ready_wins_over_selection_order(self):
+        """The candidate whose commentary cached first is promoted."""
+        pool = CommentaryCandidatePool(size=3)
+        a = pool.add(make_track("a"), "r1")
+        b = pool.add(make_track("b"), "r2")
+        pool.mark_commentary("r1", "k1")
+        pool.mark_commentary("r2", "k2")
+        pool.mark_ready("k2", 4.0)
+
+        assert pool.front_runner() is b
+        assert pool.promote() is b
+        assert pool.stats["promoted_ready"] == 1
+        assert pool.track_names == ["a"]
+        assert a.state == CandidateState.PENDING_SPEECH
+
+    def test_pending_front_runner_when_nothing_ready(self):
+        """Without ready commentary the oldest non-failed candidate is promoted."""
+        pool = CommentaryCandidatePool(size=2)
+        a = pool.add(make_track("a"), "r1")
+        pool.add(make_track("b"), "r2")
+        pool.mark_failed(request_id="r1")
+
+        promoted = pool.promote()
+        assert promoted is not a
+        assert promoted.name == "b"
+        assert pool.stats["promoted_pending"] == 1
+
+    def test_retry_and_recycle_reset_commentary(self):
+        """Retries count attempts; recycling keeps the track with fresh commentary state."""
+        pool = CommentaryCandidatePool(size=1, max_attempts=2)
+        candidate = pool.add(make_track("a"), "r1")
+        pool.mark_commentary("r1", "k1")
+        pool.mark_failed(cache_key="k1")
+
+        pool.retry(candidate, "r2")
+        assert candidate.attempts == 2
+        assert candidate.cache_key is None
+        assert pool.by_request("r2") is candidate
+
+        pool.mark_commentary("r2", "k2")
+        pool.mark_ready("k2")
+        pool.recycle(candidate)
+        assert candidate.attempts == 1
+        assert candidate.state == CandidateState.SELECTED
+        assert pool.selected() == [candidate]
+        assert pool.stats["recycled"] == 1
+
+    def test_consecutive_failures_suspend_until_success(self):
+        """Failures in a row across candidates suspend requests; a success lifts it."""
+        pool = CommentaryCandidatePool(size=2, max_consecutive_failures=2, failure_backoff=60.0)
+        a = pool.add(make_track("a"), "r1")
+        pool.add(make_track("b"), "r2")
+        pool.mark_failed("r1")
+        assert pool.suspended_for == 0
+        pool.mark_failed("r2")
+        assert 59 < pool.suspended_for <= 60
+
+        pool.retry(a, "r3")
+        pool.mark_commentary("r3", "k3")
+        pool.mark_ready("k3")
+        assert pool.suspended_for == 0 and pool.consecutive_failures == 0
+
+    def test_ready_records_latency(self):
+        """Request-to-ready time feeds the latency estimator."""
+        pool = CommentaryCandidatePool(size=1)
+        candidate = pool.add(make_track("a"))
+        assert candidate.state == CandidateState.SELECTED
+
+        pool.request(candidate, "r1")
+        pool.mark_commentary("r1", "k1")
+        pool.mark_ready("k1")
+        assert len(pool.latency) == 1
+
+    def test_latency_estimator_quantile(self):
+        """The prior is used until enough samples exist, then the quantile."""
+        estimator = CommentaryLatencyEstimator(window=10, quantile=0.9, prior=15.0, min_samples=3)
+        estimator.record(1.0)
+        assert estimator.estimate() == 15.0
+
+        for value in range(2, 11):
+            estimator.record(float(value))
+        assert estimator.estimate() == 9.0
+
+    async def test_wait_for_ready(self):
+        """Waiting returns as soon as a pending candidate becomes ready."""
+        pool = CommentaryCandidatePool(size=1)
+        pool.add(make_track("a"), "r1")
+        pool.mark_commentary("r1", "k1")
+
+        asyncio.get_running_loop().call_later(0.02, pool.mark_ready, "k1")
+        start = time.monotonic()
+        ready = await pool.wait_for_ready(1.0)
+
+        assert ready is not None and ready.name == "a"
+        assert time.monotonic() - start < 0.5
+
+
+class StubCommentaryServices:
+    """Answers commentary and speech cache requests like GPTService/CachedSpeechService."""
+
+    def __init__(self, bus, fail_tracks=()):
+        self.bus = bus
+        self.fail_tracks = set(fail_tracks)
+        self.requests = []
+        self.cleaned = []
+        self.plans = []
+        bus.on(EventTopics.DJ_COMMENTARY_REQUEST, self._commentary)
+        bus.on(EventTopics.SPEECH_CACHE_REQUEST, self._cache)
+        bus.on(EventTopics.SPEECH_CACHE_CLEANUP, lambda p: self.cleaned.extend(p["keys"]))
+        bus.on(EventTopics.PLAN_READY, self.plans.append)
+
+    def _commentary(self, payload):
+        self.requests.append(payload)
+        track = payload["next_track"]["track_id"]
+        self.bus.emit(EventTopics.GPT_COMMENTARY_RESPONSE, {
+            "request_id": payload["request_id"],
+            "commentary_text": "" if track in self.fail_tracks else f"Up next, {track}!",
+            "context": "transition",
+        })
+
+    def _cache(self, payload):
+        self.bus.emit(EventTopics.SPEECH_CACHE_READY, {
+            "cache_key": payload["cache_key"], "duration_ms": 3000, "size_bytes": 10, "metadata": payload["metadata"],
+        })
+
+
+class TestBrainCandidatePool:
+    """Tests for the candidate pool in BrainService."""
+
+    @pytest.fixture
+    async def brain(self):
+        brain = BrainService(AsyncIOEventEmitter(), {
+            "commentary_pool_size": 3, "commentary_ready_grace": 0.5, "commentary_safety_margin": 0.0,
+        })
+        await brain._setup_subscriptions()
+        brain._music_library = {name: make_track(name) for name in ("a", "b", "c", "d", "e")}
+        brain._dj_mode_active = True
+        brain._current_track = brain._music_library["a"]
+        return brain
+
+    async def settle(self):
+        for _ in range(20):
+            await asyncio.sleep(0)
+
+    async def ending_soon(self, brain):
+        await brain._handle_track_ending_soon({
+            "timestamp": time.time(),
+            "current_track": brain._create_track_data_payload(brain._current_track).model_dump(),
+            "time_remaining": 30.0,
+        })
+
+    async def generate_now(self, brain):
+        await brain._run_commentary_job(0)
+        await self.settle()
+
+    async def test_pool_fills_with_distinct_tracks(self, brain):
+        """The pool requests commentary for K distinct tracks other than the current one."""
+        stubs = StubCommentaryServices(brain._event_bus)
+        await self.generate_now(brain)
+
+        names = brain._commentary_pool.track_names
+        assert len(names) == 3 and len(set(names)) == 3 and "a" not in names
+        assert len(stubs.requests) == 3
+        assert all(c.is_ready for c in brain._commentary_pool)
+        assert brain._next_track_commentary_cached
+
+    async def test_track_ending_soon_promotes_ready_candidate_and_recycles(self, brain):
+        """The transition plays cached commentary; the other candidates get fresh commentary."""
+        stubs = StubCommentaryServices(brain._event_bus)
+        await self.generate_now(brain)
+        leftovers = [c.name for c in brain._commentary_pool][1:]
+
+        await self.ending_soon(brain)
+        await self.settle()
+
+        steps = stubs.plans[-1]["plan"]["steps"]
+        assert any(
+            sub.get("step_type") == "play_cached_speech"
+            for step in steps for sub in step.get("steps", [step])
+        )
+        assert brain._current_track.name not in brain._commentary_pool.track_names
+        assert set(leftovers) <= set(brain._commentary_pool.track_names)
+        assert len(brain._commentary_pool) == 3
+        assert brain._commentary_pool.stats["recycled"] == 2
+        assert len(stubs.cleaned) == 2  # Stale commentary for the recycled candidates
+
+        # Fresh commentary waits for the new track's scheduled job
+        assert len(brain._commentary_pool.selected()) == 3
+        assert len(stubs.requests) == 3
+
+    async def test_failed_commentary_is_replaced(self, brain):
+        """A candidate whose commentary keeps failing is dropped and replaced."""
+        StubCommentaryServices(brain._event_bus, fail_tracks={"b"})
+        brain._music_library["f"] = make_track("f")
+        brain._commentary_pool.size = 1
+
+        brain._smart_track_selection = self._pick_in_order(["b", "f"])
+        await self.generate_now(brain)
+
+        assert brain._commentary_pool.track_names == ["f"]
+        assert brain._next_track.name == "f"
+        assert brain._next_track_commentary_cached
+
+    async def test_repeated_failures_pause_requests(self, brain):
+        """An outage pauses commentary requests instead of cycling through the library."""
+        stubs = StubCommentaryServices(brain._event_bus, fail_tracks=set(brain._music_library))
+        pool = brain._commentary_pool
+        pool.max_consecutive_failures = 4
+        pool.failure_backoff = 0.2
+
+        await self.generate_now(brain)
+        for _ in range(5):
+            await brain._fill_commentary_pool()
+            await self.settle()
+
+        requested = len(stubs.requests)
+        assert requested <= 4 + pool.size
+        assert pool.suspended_for > 0 and pool.stats["suspended"] == 1
+        assert len(pool) == 3 and not pool.failed()  # Tracks kept, commentary abandoned
+        assert brain._next_track is not None
+
+        # Once the backoff runs out, requests resume
+        stubs.fail_tracks.clear()
+        await asyncio.sleep(0.3)
+        await self.settle()
+        assert len(stubs.requests) > requested
+        assert pool.suspended_for == 0 and pool.consecutive_failures == 0
+        assert brain._next_track_commentary_cached
+
+    async def test_track_playing_schedules_generation_before_ending_soon(self, brain):
+        """Generation starts estimated latency before TRACK_ENDING_SOON, not before."""
+        stubs = StubCommentaryServices(brain._event_bus)
+        brain._commentary_pool.latency.prior = 0.05
+
+        # TRACK_ENDING_SOON is due 0.15s in, so generation should start at ~0.10s
+        brain._event_bus.emit(EventTopics.TRACK_PLAYING, {
+            "track_id": "a", "duration": 0.2, "start_timestamp": time.time(), "track_ending_threshold_sec": 0.05,
+        })
+        await asyncio.sleep(0.05)
+        assert stubs.requests == []
+        assert len(brain._commentary_pool) == 0
+
+        await asyncio.sleep(0.1)
+        await self.settle()
+        assert len(stubs.requests) == 3
+        assert all(c.is_ready for c in brain._commentary_pool)
+
+    async def test_dj_mode_off_cancels_scheduled_generation(self, brain):
+        """Leaving DJ mode cancels the pending job."""
+        await brain._schedule_commentary_generation(duration=600.0, ending_threshold=30.0)
+        job = brain._commentary_job
+        assert job is not None and not job.done()
+
+        await brain._handle_dj_mode_changed({"is_active": False})
+        await self.settle()
+        assert job.cancelled()
+
+    @staticmethod
+    def _pick_in_order(order):
+        async def pick(query=None, exclude=None):
+            for name in order:
+                if not exclude or name not in exclude:
+                    return name
+            return None
+        return pick
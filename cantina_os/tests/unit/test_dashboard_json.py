@@ -0,0 +1,54 @@
+"""
+Unit tests for dashboard JSON encoding
+
+Covers pre-encoded payloads being spliced into Socket.IO packets unchanged,
+and WebBridgeService reusing its encoded state snapshot until the state
+changes.
+"""
+
+import json
+
+from pyee.asyncio import AsyncIOEventEmitter
+from socketio import packet
+
+from cantina_os.services.web_bridge_service import WebBridgeService
+from cantina_os.utils import dashboard_json
+
+
+class DashboardPacket(packet.Packet):
+    json = dashboard_json
+
+
+class TestDashboardJson:
+    """Tests for the Socket.IO json module replacement."""
+
+    def test_encoded_payload_spliced_into_packet(self):
+        """A pre-encoded payload decodes to the same event as the plain dict."""
+        payload = {"topic": "music.progress", "data": {"progress": 0.25, "title": "Cantina Band"}}
+        encoded = dashboard_json.encode(payload)
+
+        pkt = DashboardPacket(packet.EVENT, data=["music_progress", encoded], namespace="/")
+        wire = pkt.encode()
+        assert wire.startswith("2")
+        assert json.loads(wire[1:]) == ["music_progress", payload]
+
+    def test_plain_values_round_trip(self):
+        """Regular packets and non-string keys still encode like the stdlib."""
+        assert json.loads(dashboard_json.dumps({"a": [1, 2.5, None], 3: "x"})) == {"a": [1, 2.5, None], "3": "x"}
+        assert dashboard_json.loads('{"sid":"abc"}') == {"sid": "abc"}
+        assert dashboard_json.dumps(10**30) == str(10**30)
+
+
+class TestStateSnapshotEncoding:
+    """Tests for the cached state snapshot encoding."""
+
+    async def test_snapshot_reused_until_status_changes(self):
+        """The encoded snapshot is shared until a service reports a new status."""
+        bridge = WebBridgeService(AsyncIOEventEmitter())
+        first = bridge._state_snapshot_payload()
+        assert bridge._state_snapshot_payload() is first
+
+        await bridge._handle_service_status_update({"service_name": "brain_service", "status": "RUNNING"})
+        second = bridge._state_snapshot_payload()
+        assert second is not first
+        assert json.loads(second.text)["state"]["services"]["brain_service"]["status"] == "online"
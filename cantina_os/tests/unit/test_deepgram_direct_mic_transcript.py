@@ -0,0 +1,99 @@
+"""
+Unit tests for the DeepgramDirectMicService transcript fast path
+
+Covers the transcript parser and interim coalescing. Deepgram results are
+simulated with simple namespaces shaped like the SDK's LiveResultResponse.
+"""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+from pyee.asyncio import AsyncIOEventEmitter
+
+from cantina_os.core.event_topics import EventTopics
+from cantina_os.services.deepgram_direct_mic_service import (
+    DeepgramDirectMicService,
+    parse_transcript_result,
+)
+
+
+def live_result(text, is_final):
+    """Build an object shaped like a Deepgram LiveResultResponse."""
+    word = SimpleNamespace(word="hello", start=0.0, end=0.4, confidence=0.9, punctuated_word="Hello")
+    alternative = SimpleNamespace(transcript=text, confidence=0.95, words=[word])
+    return SimpleNamespace(
+        channel=SimpleNamespace(alternatives=[alternative]),
+        is_final=is_final,
+        duration=0.5,
+    )
+
+
+class TestParseTranscriptResult:
+    """Tests for parse_transcript_result."""
+
+    def test_live_result_without_words(self):
+        """Word data is skipped unless requested."""
+        parsed = parse_transcript_result(live_result("hello there", False))
+        assert parsed.text == "hello there"
+        assert parsed.is_final is False
+        assert parsed.confidence == 0.95
+        assert parsed.words is None
+
+    def test_live_result_with_words(self):
+        """Word data is built when requested."""
+        parsed = parse_transcript_result(live_result("hello", True), include_words=True)
+        assert parsed.words == [
+            {"word": "hello", "start": 0.0, "end": 0.4, "confidence": 0.9, "punctuated_word": "Hello"}
+        ]
+
+    def test_dict_and_string_results(self):
+        """Dict and plain string results are supported."""
+        parsed = parse_transcript_result(
+            {"channel": {"alternatives": [{"transcript": "hi", "confidence": 0.5}]}, "is_final": True}
+        )
+        assert (parsed.text, parsed.is_final) == ("hi", True)
+        assert parse_transcript_result("plain").is_final is True
+        assert parse_transcript_result({"channel": {"alternatives": []}}) is None
+
+
+class TestTranscriptCoalescing:
+    """Tests for interim coalescing in _on_transcript."""
+
+    @pytest.fixture
+    async def service(self, monkeypatch):
+        monkeypatch.setenv("DEEPGRAM_API_KEY", "test-key")
+        return DeepgramDirectMicService(AsyncIOEventEmitter(), {})
+
+    async def test_interims_coalesce_to_latest(self, service):
+        """A burst of interims from the SDK thread emits only the newest one."""
+        service._event_loop = asyncio.get_running_loop()
+        received = []
+        service._event_bus.on(EventTopics.TRANSCRIPTION_INTERIM, lambda p: received.append(p["text"]))
+
+        def burst():
+            for i in range(20):
+                service._on_transcript(None, live_result(f"partial {i}", False))
+
+        thread = threading.Thread(target=burst)
+        thread.start()
+        thread.join()
+        await asyncio.sleep(0.01)
+
+        assert received == ["partial 19"]
+
+    async def test_final_supersedes_pending_interim(self, service):
+        """A final result drops the unsent interim and is accumulated."""
+        service._event_loop = asyncio.get_running_loop()
+        interims, finals = [], []
+        service._event_bus.on(EventTopics.TRANSCRIPTION_INTERIM, lambda p: interims.append(p["text"]))
+        service._event_bus.on(EventTopics.TRANSCRIPTION_FINAL, lambda p: finals.append(p["text"]))
+
+        service._on_transcript(None, live_result("play some", False))
+        service._on_transcript(None, live_result("play some music", True))
+        await asyncio.sleep(0.01)
+
+        assert interims == []
+        assert finals == ["play some music"]
+        assert service._current_transcription == "play some music"
@@ -0,0 +1,90 @@
+"""
+Unit tests for dashboard event replay
+
+Covers the per-topic ring buffer with sequence numbers and WebBridgeService
+replaying missed events to a reconnecting client, or sending a snapshot when
+the client is too far behind.
+"""
+
+from cantina_os.core.event_topics import EventTopics
+from cantina_os.utils.event_replay import EventReplayBuffer
+
+
+def fill(buffer, *topics):
+    for topic in topics:
+        seq = buffer.next_seq()
+        buffer.append(seq, topic, "cantina_event", f"{topic}-{seq}")
+
+
+class TestEventReplayBuffer:
+    """Tests for EventReplayBuffer."""
+
+    def test_missed_events_in_order(self):
+        """Events after the client's sequence come back oldest first, filtered by topic."""
+        buffer = EventReplayBuffer("e1", capacity_per_topic=5)
+        fill(buffer, "log", "music", "log", "music", "log")
+
+        assert [e.payload for e in buffer.since("e1", 2)] == ["log-3", "music-4", "log-5"]
+        assert [e.seq for e in buffer.since("e1", 2, accepts=lambda t: t == "log")] == [3, 5]
+        assert [e.seq for e in buffer.since("e1", 1, until=3)] == [2, 3]
+        assert buffer.since("e1", 5) == []
+
+    def test_capacity_is_per_topic(self):
+        """A busy topic overwrites only its own ring; clients behind an overwrite need a snapshot."""
+        buffer = EventReplayBuffer("e1", capacity_per_topic=2)
+        fill(buffer, "log", "progress", "progress", "progress", "progress")
+        assert len(buffer) == 3
+
+        assert buffer.since("e1", 0) is None  # progress 2 and 3 are gone
+        assert [e.seq for e in buffer.since("e1", 0, accepts=lambda t: t == "log")] == [1]
+        assert [e.seq for e in buffer.since("e1", 3)] == [4, 5]
+
+    def test_unknown_position_needs_snapshot(self):
+        """Another epoch or a sequence number from the future cannot be replayed."""
+        buffer = EventReplayBuffer("e1")
+        fill(buffer, "log")
+        assert buffer.since("e0", 0) is None
+        assert buffer.since("e1", 5) is None
+        assert buffer.since("e1", -1) is None
+
+
+class TestWebBridgeReplay:
+    """Tests for replay_events on reconnect."""
+
+    async def test_reconnect_replays_only_missed_events(self, make_bridge):
+        """Events broadcast while the dashboard was away are replayed once, in order."""
+        bridge = make_bridge(replay_capacity_per_topic=5)
+        sio = bridge._sio
+
+        await bridge._sio.handlers["connect"]("old", {})
+        await bridge._handle_llm_response({"text": "seen"})
+        seen = sio.emits[-1][1]["event_seq"]
+        await bridge._sio.handlers["disconnect"]("old")
+
+        # Broadcast with nobody connected: buffered, not emitted
+        await bridge._handle_llm_response({"text": "missed 1"})
+        await bridge._handle_system_error({"error": "missed 2"})
+        assert sio.emits[-1][0] != "system_error"
+
+        await bridge._sio.handlers["connect"]("new", {})
+        await bridge._handle_llm_response({"text": "live"})  # Delivered live, not replayed
+        await bridge._sio.handlers["replay_events"]("new", {"epoch": bridge._state_store.epoch, "seq": seen})
+
+        replayed = [(e, d) for e, d, r in sio.emits if r == "new" and e != "state_snapshot"]
+        assert [e for e, _ in replayed] == ["llm_response", "system_error", "replay_complete"]
+        assert replayed[0][1]["data"]["text"] == "missed 1"
+        assert replayed[-1][1]["replayed"] == 2 and not replayed[-1][1]["snapshot"]
+
+    async def test_too_far_behind_gets_snapshot(self, make_bridge):
+        """When missed events were overwritten the client is resynced from a snapshot."""
+        bridge = make_bridge(replay_capacity_per_topic=1)
+        sio = bridge._sio
+
+        for text in ("a", "b", "c"):
+            await bridge._broadcast_event_to_dashboard(EventTopics.LLM_RESPONSE, {"text": text}, "llm_response")
+        await bridge._sio.handlers["connect"]("sid", {})
+        sio.emits.clear()
+
+        await bridge._sio.handlers["replay_events"]("sid", {"epoch": bridge._state_store.epoch, "seq": 0})
+        assert [e for e, _, _ in sio.emits] == ["state_snapshot", "replay_complete"]
+        assert sio.emits[-1][1]["snapshot"]
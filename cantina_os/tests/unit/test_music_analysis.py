@@ -0,0 +1,149 @@
+"""
+Unit tests for the offline music library analyzer
+
+Covers the numpy feature helpers and the resumable batch run over a music
+directory, with the librosa-backed per-file analysis swapped for a stub.
+"""
+
+import json
+import os
+
+import numpy as np
+import pytest
+
+from cantina_os.utils.library_index import LIBRARY_INDEX_FILENAME, load_track_features, read_library_index
+from cantina_os.utils.music_analysis import (
+    ANALYZER_VERSION,
+    analyze_library,
+    energy_envelope,
+    energy_score,
+    estimate_key,
+    gated_loudness,
+    intro_outro_lengths,
+)
+
+
+def stub_analyze(path):
+    """Stand-in for analyze_track: features derived from the file size."""
+    size = os.path.getsize(path)
+    return {
+        "analyzer_version": ANALYZER_VERSION,
+        "duration": 10.0,
+        "features": {"tempo": 100.0 + size, "energy": 0.5, "key": "A minor"},
+        "beat_grid": [0.0, 0.6],
+    }
+
+
+def failing_analyze(path):
+    if path.endswith("bad.mp3"):
+        raise ValueError("cannot decode")
+    return stub_analyze(path)
+
+
+class TestFeatureHelpers:
+    """Tests for the numpy feature helpers."""
+
+    def test_estimate_key(self):
+        """A C major triad profile reads as C major; A minor as A minor."""
+        c_major = np.zeros(12)
+        c_major[[0, 4, 7]] = 1.0
+        assert estimate_key(c_major) == "C major"
+
+        a_minor = np.zeros(12)
+        a_minor[[9, 0, 4]] = [1.0, 0.8, 0.8]
+        assert estimate_key(a_minor) == "A minor"
+        assert estimate_key(np.zeros(12)) is None
+
+    def test_gated_loudness(self):
+        """A full-scale sine measures about -3.7 LUFS; silence is gated out."""
+        sr = 8000
+        t = np.arange(sr * 4) / sr
+        sine = np.sin(2 * np.pi * 440 * t)
+        assert gated_loudness(sine, sr) == pytest.approx(-3.70, abs=0.05)
+
+        padded = np.concatenate([np.zeros(sr * 4), sine * 0.5])
+        assert gated_loudness(padded, sr) == pytest.approx(-3.70 - 6.02, abs=0.25)
+        assert gated_loudness(np.zeros(sr), sr) is None
+
+    def test_envelope_and_intro_outro(self):
+        """A quiet intro and fade-out are measured and snapped to the beat grid."""
+        rms = np.concatenate([np.full(40, 0.1), np.full(200, 1.0), np.full(60, 0.2)])
+        envelope = energy_envelope(rms, frame_rate=20.0)
+        assert len(envelope) == 15
+        assert envelope[0] == pytest.approx(0.1) and max(envelope) == 1.0
+
+        intro, outro = intro_outro_lengths(envelope, duration=15.0)
+        assert (intro, outro) == (2.0, 3.0)
+
+        beats = np.arange(0.0, 15.0, 0.45)
+        intro, outro = intro_outro_lengths(envelope, duration=15.0, beats=beats)
+        assert intro == pytest.approx(1.8)
+        assert outro == pytest.approx(15.0 - 12.15)
+
+    def test_energy_score(self):
+        """Loud, busy tracks score higher than quiet, sparse ones."""
+        assert energy_score(-8.0, 6.0) > energy_score(-20.0, 1.0)
+        assert energy_score(None, 0.0) == 0.0
+        assert energy_score(0.0, 20.0) == 1.0
+
+
+class TestAnalyzeLibrary:
+    """Tests for the resumable batch run."""
+
+    @pytest.fixture
+    def music_dir(self, tmp_path):
+        for name, size in (("a.mp3", 1), ("b.wav", 2), ("notes.txt", 3)):
+            (tmp_path / name).write_bytes(b"x" * size)
+        return tmp_path
+
+    def test_analyzes_and_stores_features(self, music_dir):
+        """Every audio file gets an entry with its content hash; features load back."""
+        stats = analyze_library(str(music_dir), workers=1, analyze=stub_analyze)
+
+        assert stats == {"analyzed": 2, "skipped": 0, "reused": 0, "failed": 0}
+        entries = read_library_index(str(music_dir))["tracks"]
+        assert sorted(entries) == ["a.mp3", "b.wav"]
+        assert len(entries["a.mp3"]["content_hash"]) == 64
+        assert load_track_features(str(music_dir))["b.wav"].tempo == 102.0
+
+    def test_skips_unchanged_and_reanalyzes_changed(self, music_dir):
+        """A second run only analyzes new or modified files; renames reuse the entry."""
+        analyze_library(str(music_dir), workers=1, analyze=stub_analyze)
+        (music_dir / "b.wav").write_bytes(b"y" * 5)
+        (music_dir / "a.mp3").rename(music_dir / "a2.mp3")
+        (music_dir / "c.m4a").write_bytes(b"z" * 4)
+
+        seen = []
+        stats = analyze_library(str(music_dir), workers=1, analyze=stub_analyze, progress=lambda n, s: seen.append((n, s)))
+
+        assert stats == {"analyzed": 2, "skipped": 0, "reused": 1, "failed": 0}
+        assert ("a2.mp3", "reused") in seen
+        features = load_track_features(str(music_dir))
+        assert features["b.wav"].tempo == 105.0
+        assert sorted(features) == ["a2.mp3", "b.wav", "c.m4a"]
+
+        stats = analyze_library(str(music_dir), workers=1, analyze=stub_analyze)
+        assert stats["skipped"] == 3 and stats["analyzed"] == 0
+
+    def test_failures_are_retried_on_next_run(self, music_dir):
+        """A failed file gets no entry, so the next run tries it again."""
+        (music_dir / "bad.mp3").write_bytes(b"bad")
+        stats = analyze_library(str(music_dir), workers=1, analyze=failing_analyze)
+        assert stats["failed"] == 1
+        assert "bad.mp3" not in read_library_index(str(music_dir))["tracks"]
+
+        (music_dir / "bad.mp3").unlink()
+        (music_dir / "good.mp3").write_bytes(b"bad")
+        stats = analyze_library(str(music_dir), workers=1, analyze=failing_analyze)
+        assert stats == {"analyzed": 1, "skipped": 2, "reused": 0, "failed": 0}
+
+    def test_process_pool(self, music_dir):
+        """Tracks are analyzed in worker processes and the index stays valid JSON."""
+        for i in range(4):
+            (music_dir / f"extra{i}.mp3").write_bytes(b"e" * (10 + i))
+        stats = analyze_library(str(music_dir), workers=2, analyze=stub_analyze)
+
+        assert stats["analyzed"] == 6
+        index = json.loads((music_dir / LIBRARY_INDEX_FILENAME).read_text())
+        assert len(index["tracks"]) == 6
+        assert not [p for p in os.listdir(music_dir) if p.endswith(".tmp")]
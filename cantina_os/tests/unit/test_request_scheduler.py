@@ -0,0 +1,142 @@
+"""
+Unit tests for the priority request scheduler
+
+Covers priority ordering, per-class concurrency caps, preemption/resume of
+background work and cancellation.
+"""
+
+import asyncio
+import pytest
+
+from cantina_os.utils.request_scheduler import PriorityRequestScheduler, RequestPriority
+
+
+def make_job(log, name, delay=0.01, result=None):
+    """Create a coroutine factory that records start/finish order."""
+    async def job():
+        log.append(f"start:{name}")
+        await asyncio.sleep(delay)
+        log.append(f"end:{name}")
+        return result if result is not None else name
+    return job
+
+
+class TestPriorityRequestScheduler:
+    """Tests for PriorityRequestScheduler."""
+
+    async def test_interactive_runs_before_queued_background(self):
+        """Queued background work waits for interactive work to drain."""
+        scheduler = PriorityRequestScheduler(
+            concurrency={RequestPriority.INTERACTIVE: 1, RequestPriority.BACKGROUND: 1},
+            preempt_background=False,
+        )
+        log = []
+
+        first = scheduler.submit(RequestPriority.INTERACTIVE, make_job(log, "i1"))
+        background = scheduler.submit(RequestPriority.BACKGROUND, make_job(log, "b1"))
+        second = scheduler.submit(RequestPriority.INTERACTIVE, make_job(log, "i2"))
+
+        await asyncio.gather(first, background, second)
+
+        assert log.index("start:b1") > log.index("end:i2")
+
+    async def test_concurrency_cap_per_class(self):
+        """No more than the configured number of requests run at once."""
+        scheduler = PriorityRequestScheduler(concurrency={RequestPriority.BACKGROUND: 2})
+        running = 0
+        peak = 0
+
+        async def job():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        futures = [scheduler.submit(RequestPriority.BACKGROUND, job) for _ in range(5)]
+        await asyncio.gather(*futures)
+
+        assert peak == 2
+        assert scheduler.get_status()["priorities"]["background"]["completed"] == 5
+
+    async def test_interactive_preempts_and_resumes_background(self):
+        """In-flight background work is cancelled, then re-run to completion."""
+        scheduler = PriorityRequestScheduler()
+        log = []
+
+        background = scheduler.submit(RequestPriority.BACKGROUND, make_job(log, "b1", delay=0.05))
+        await asyncio.sleep(0.01)
+        interactive = scheduler.submit(RequestPriority.INTERACTIVE, make_job(log, "i1"))
+
+        assert await interactive == "i1"
+        assert await background == "b1"
+        assert log == ["start:b1", "start:i1", "end:i1", "start:b1", "end:b1"]
+        assert scheduler.get_status()["priorities"]["background"]["preempted"] == 1
+
+    async def test_preemption_is_bounded(self):
+        """A background request stops being preempted after max_preemptions."""
+        scheduler = PriorityRequestScheduler(max_preemptions=0)
+        log = []
+
+        background = scheduler.submit(RequestPriority.BACKGROUND, make_job(log, "b1", delay=0.03))
+        await asyncio.sleep(0.005)
+        interactive = scheduler.submit(RequestPriority.INTERACTIVE, make_job(log, "i1"))
+
+        await asyncio.gather(background, interactive)
+        assert log.count("start:b1") == 1
+
+    async def test_cancel_queued_and_running(self):
+        """cancel() resolves the future as cancelled whether queued or running."""
+        scheduler = PriorityRequestScheduler(concurrency={RequestPriority.BACKGROUND: 1})
+        log = []
+
+        running = scheduler.submit(RequestPriority.BACKGROUND, make_job(log, "b1", delay=0.05), "b1")
+        queued = scheduler.submit(RequestPriority.BACKGROUND, make_job(log, "b2"), "b2")
+        await asyncio.sleep(0.01)
+
+        assert scheduler.cancel_all(RequestPriority.BACKGROUND) == 2
+        await asyncio.sleep(0)
+
+        assert running.cancelled()
+        assert queued.cancelled()
+        assert "start:b2" not in log
+        assert scheduler.queue_depth(RequestPriority.BACKGROUND) == 0
+        assert scheduler.active_count(RequestPriority.BACKGROUND) == 0
+
+    async def test_run_propagates_errors(self):
+        """Exceptions raised by a request reach the caller."""
+        scheduler = PriorityRequestScheduler()
+
+        async def failing():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await scheduler.run(RequestPriority.INTERACTIVE, failing)
+        assert scheduler.get_status()["priorities"]["interactive"]["failed"] == 1
+
+    async def test_on_change_reports_queue_depth(self):
+        """The change callback fires with up-to-date queue depth."""
+        depths = []
+        scheduler = None
+
+        def on_change():
+            depths.append(scheduler.queue_depth(RequestPriority.BACKGROUND))
+
+        scheduler = PriorityRequestScheduler(
+            concurrency={RequestPriority.BACKGROUND: 1}, on_change=on_change
+        )
+        log = []
+        futures = [
+            scheduler.submit(RequestPriority.BACKGROUND, make_job(log, f"b{i}"))
+            for i in range(3)
+        ]
+        await asyncio.gather(*futures)
+
+        assert max(depths) == 2
+        assert depths[-1] == 0
+
+    def test_priority_from_value(self):
+        """Priorities resolve from names, ints and unknown values."""
+        assert RequestPriority.from_value("interactive") is RequestPriority.INTERACTIVE
+        assert RequestPriority.from_value(1) is RequestPriority.BACKGROUND
+        assert RequestPriority.from_value("unknown") is RequestPriority.BACKGROUND
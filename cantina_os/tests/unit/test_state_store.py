@@ -0,0 +1,92 @@
+"""
+Unit tests for the dashboard state store
+
+Covers JSON-patch style diffs, sequence-numbered deltas with resync from a
+bounded history, and WebBridgeService sending snapshots on connect and
+deltas as state changes.
+"""
+
+import copy
+
+from cantina_os.utils.state_store import StateStore, apply_patch, json_diff
+
+
+class TestJsonDiff:
+    """Tests for json_diff and apply_patch."""
+
+    def test_nested_changes(self):
+        """Only changed leaves appear; applying the ops reproduces the new document."""
+        old = {"brain": {"status": "offline", "uptime": "0:00:00"}, "gpt": {"status": "online"}, "gone": 1}
+        new = {"brain": {"status": "online", "uptime": "0:00:00"}, "gpt": {"status": "online"}, "cli/x": [1, 2]}
+
+        ops = json_diff(old, new)
+        assert ops == [
+            {"op": "remove", "path": "/gone"},
+            {"op": "replace", "path": "/brain/status", "value": "online"},
+            {"op": "add", "path": "/cli~1x", "value": [1, 2]},
+        ]
+        assert apply_patch(copy.deepcopy(old), ops) == new
+        assert json_diff(new, copy.deepcopy(new)) == []
+
+
+class TestStateStore:
+    """Tests for StateStore deltas and resync."""
+
+    def test_deltas_and_resync(self):
+        """Each change bumps the sequence; clients catch up from history or need a snapshot."""
+        store = StateStore(("music", "mode"), history=2)
+        assert store.update("mode", {}) is None
+
+        first = store.update("mode", {"current_mode": "IDLE"})
+        assert first["seq"] == 1 and first["ops"] == [{"op": "add", "path": "/mode/current_mode", "value": "IDLE"}]
+        store.update("music", {"action": "started"})
+        store.update("mode", {"current_mode": "AMBIENT"})
+
+        assert [d["seq"] for d in store.deltas_since(store.epoch, 1)] == [2, 3]
+        assert store.deltas_since(store.epoch, 3) == []
+        assert store.deltas_since(store.epoch, 0) is None  # Delta 1 was evicted
+        assert store.deltas_since("old-epoch", 2) is None
+        assert store.deltas_since(store.epoch, 7) is None
+
+        snapshot = store.snapshot()
+        state = {"music": {}, "mode": {}}
+        for delta in [first] + store.deltas_since(store.epoch, 1):
+            apply_patch(state, delta["ops"])
+        assert state == snapshot["state"]
+
+
+class TestWebBridgeStateSync:
+    """Tests for the bridge's snapshot/delta protocol."""
+
+    async def test_snapshot_on_connect_then_deltas(self, bridge):
+        """New clients get a snapshot; changes go out as deltas without timestamps."""
+
+        await bridge._sio.handlers["connect"]("a", {})
+        event, snapshot, room = bridge._sio.emits[0]
+        assert (event, room) == ("state_snapshot", "a")
+        assert snapshot["state"]["services"]["brain_service"]["status"] == "offline"
+
+        await bridge._handle_dj_mode_changed({"is_active": True})
+        deltas = [data for event, data, _ in bridge._sio.emits if event == "state_delta"]
+        assert deltas[-1]["seq"] == snapshot["seq"] + 1
+        assert {op["path"] for op in deltas[-1]["ops"]} == {"/dj/mode", "/dj/is_active", "/dj/auto_transition"}
+
+        # Same DJ state again: no delta
+        await bridge._handle_dj_mode_changed({"is_active": True})
+        assert len([e for e, _, _ in bridge._sio.emits if e == "state_delta"]) == len(deltas)
+
+    async def test_resync(self, bridge):
+        """A client reports its position and gets the missed deltas, or a snapshot."""
+        epoch, seq = bridge._state_store.epoch, bridge._state_store.seq
+
+        await bridge._handle_system_mode_change({"new_mode": "AMBIENT", "old_mode": "IDLE"})
+        await bridge._handle_dj_mode_changed({"is_active": True})
+
+        await bridge._sio.handlers["state_resync"]("a", {"epoch": epoch, "seq": seq})
+        assert [(e, d["seq"]) for e, d, r in bridge._sio.emits if r == "a"] == [
+            ("state_delta", seq + 1),
+            ("state_delta", seq + 2),
+        ]
+
+        await bridge._sio.handlers["state_resync"]("b", {"epoch": "stale", "seq": 99})
+        assert [e for e, _, r in bridge._sio.emits if r == "b"] == ["state_snapshot"]
@@ -0,0 +1,123 @@
+"""
+Unit tests for dashboard topic throttling
+
+Covers the token bucket, "latest value wins" coalescing with its counters,
+and WebBridgeService holding back interim transcripts while letting the
+final transcript through.
+"""
+
+import asyncio
+
+import pytest
+from pyee.asyncio import AsyncIOEventEmitter
+
+from cantina_os.core.event_topics import EventTopics
+from cantina_os.services.web_bridge_service import WebBridgeService
+from cantina_os.utils.topic_throttle import TokenBucket, TopicThrottle
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def sent():
+    return []
+
+
+@pytest.fixture
+def throttle(sent):
+    async def send(key, item):
+        sent.append((key, item))
+
+    return TopicThrottle(send)
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_refill_and_burst(self):
+        """Tokens refill at the configured rate up to the burst size."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10.0, burst=2, clock=clock)
+        assert bucket.try_take() and bucket.try_take()
+        assert not bucket.try_take()
+        assert bucket.wait_time() == pytest.approx(0.1)
+
+        clock.now = 1.0
+        assert bucket.try_take() and bucket.try_take()
+        assert not bucket.try_take()
+
+
+class TestTopicThrottle:
+    """Tests for TopicThrottle."""
+
+    async def test_unlimited_topics_pass_through(self, throttle, sent):
+        """Topics without a limit are sent immediately and not counted."""
+        for i in range(3):
+            assert await throttle.submit("music.progress", i)
+        assert sent == [("music.progress", 0), ("music.progress", 1), ("music.progress", 2)]
+        assert throttle.totals()["sent"] == 0
+
+    async def test_latest_value_wins(self, throttle, sent):
+        """A burst sends the first item now and only the newest one when a token frees up."""
+        throttle.configure("voice.audio.level", max_per_second=20)
+        results = [await throttle.submit("voice.audio.level", level) for level in range(5)]
+        assert results == [True, False, False, False, False]
+        assert sent == [("voice.audio.level", 0)]
+
+        await asyncio.sleep(0.12)
+        assert sent == [("voice.audio.level", 0), ("voice.audio.level", 4)]
+        assert throttle.stats["voice.audio.level"].sent == 2
+        assert throttle.stats["voice.audio.level"].coalesced == 3
+
+    async def test_allow_drops_without_coalescing(self, throttle):
+        """allow() drops what exceeds the rate and counts it."""
+        throttle.configure("dashboard_log:brain", max_per_second=0.1, coalesce=False)
+        assert throttle.allow("dashboard_log:brain")
+        assert not throttle.allow("dashboard_log:brain")
+        assert throttle.allow("dashboard_log:other")  # Not limited
+        assert throttle.totals()["dropped"] == 1
+
+    async def test_discard_and_close(self, throttle, sent):
+        """Discarded and still-pending items are dropped, never sent."""
+        throttle.configure("a", max_per_second=1)
+        throttle.configure("b", max_per_second=1)
+        for key in ("a", "a", "b", "b"):
+            await throttle.submit(key, key)
+        throttle.discard("a")
+        await throttle.close()
+
+        await asyncio.sleep(0)
+        assert sent == [("a", "a"), ("b", "b")]
+        assert throttle.totals()["dropped"] == 2
+
+
+class TestWebBridgeThrottling:
+    """Tests for throttling in the dashboard broadcast path."""
+
+    async def test_final_transcript_supersedes_pending_interim(self):
+        """Interim transcripts are coalesced; the final one drops the stale interim."""
+        bridge = WebBridgeService(AsyncIOEventEmitter())
+        emitted = []
+
+        async def send(topic, item):
+            emitted.append((topic, item[0]["text"]))
+
+        bridge._event_throttle._send = send
+        bridge._dashboard_clients["sid"] = {"subscriptions": [], "filter_level": "all"}
+        bridge._topic_rooms = {t.value: {"sid"} for t in (EventTopics.TRANSCRIPTION_INTERIM, EventTopics.TRANSCRIPTION_FINAL)}
+        bridge._sio = object()
+
+        for text in ("he", "hel", "hell"):
+            await bridge._handle_transcription_interim({"text": text})
+        await bridge._handle_transcription_final({"text": "hello"})
+        await asyncio.sleep(0.05)
+
+        assert emitted == [("transcription.interim", "he"), ("transcription.final", "hello")]
+        stats = bridge._event_throttle.stats["transcription.interim"]
+        assert (stats.coalesced, stats.dropped) == (1, 1)
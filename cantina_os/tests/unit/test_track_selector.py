@@ -0,0 +1,177 @@
+"""
+Unit tests for feature-based DJ track selection
+
+Covers key and tempo handling, the KD-tree search matching a brute-force
+scan, the no-repeat window, the random fallback for tracks without features,
+loading features from the library index and BrainService using the selector.
+"""
+
+import json
+import random
+
+import pytest
+from pyee.asyncio import AsyncIOEventEmitter
+
+from cantina_os.models.music_models import MusicTrack, TrackFeatures
+from cantina_os.services.brain_service import BrainService
+from cantina_os.utils.library_index import LIBRARY_INDEX_FILENAME, load_track_features
+from cantina_os.utils.track_selector import TrackSelector, camelot_key, fold_tempo, key_penalty
+
+
+def make_track(name, **features):
+    return MusicTrack(
+        name=name, path=f"/music/{name}.mp3", track_id=name, title=name,
+        features=TrackFeatures(**features) if features else None,
+    )
+
+
+def random_library(size, seed=3):
+    rng = random.Random(seed)
+    keys = [f"{n}{l}" for n in range(1, 13) for l in "AB"]
+    return {
+        f"t{i}": make_track(
+            f"t{i}",
+            tempo=rng.uniform(80, 170),
+            energy=rng.uniform(0, 1),
+            key=rng.choice(keys),
+            loudness=rng.uniform(-20, -6),
+            spectral_centroid=rng.uniform(800, 4000),
+        )
+        for i in range(size)
+    }
+
+
+class TestTrackSelector:
+    """Tests for TrackSelector and its helpers."""
+
+    def test_camelot_key_parsing(self):
+        """Camelot codes and key names map to the same wheel position."""
+        assert camelot_key("8A") == (8, "A")
+        assert camelot_key("A minor") == (8, "A")
+        assert camelot_key("Am") == (8, "A")
+        assert camelot_key("C") == (8, "B")
+        assert camelot_key("F# major") == (2, "B")
+        assert camelot_key("Bbm") == (3, "A")
+        assert camelot_key("12b") == (12, "B")
+        assert camelot_key("H dorian") is None
+
+    def test_key_penalty_and_tempo_folding(self):
+        """Neighbouring and relative keys are cheap; half/double time folds together."""
+        assert key_penalty("8A", "8A") == 0.0
+        assert key_penalty("8A", "9A") == key_penalty("8A", "8B") == 0.15
+        assert key_penalty("12A", "1A") == 0.15
+        assert key_penalty("8A", "2B") == 1.0
+        assert key_penalty(None, "8A") == 0.5
+        assert fold_tempo(160.0) == 80.0
+        assert fold_tempo(60.0) == 120.0
+
+    def test_picks_smoothest_transition(self):
+        """A compatible, close-tempo track beats a clashing or far-tempo one."""
+        library = {
+            "now": make_track("now", tempo=120, energy=0.5, key="8A"),
+            "close": make_track("close", tempo=122, energy=0.55, key="9A"),
+            "clash": make_track("clash", tempo=121, energy=0.55, key="2B"),
+            "fast": make_track("fast", tempo=150, energy=0.55, key="8A"),
+            "half": make_track("half", tempo=61, energy=0.55, key="8A"),
+        }
+        selector = TrackSelector()
+        selector.update_library(library)
+
+        assert selector.select("now") == "half"
+        assert selector.select("now", exclude={"half"}) == "close"
+        assert selector.stats["feature_picks"] == 2
+
+    @pytest.mark.parametrize("size", [5, 200])
+    def test_tree_search_matches_brute_force(self, size):
+        """The KD-tree finds the same track as scoring every candidate."""
+        library = random_library(size)
+        selector = TrackSelector()
+        selector.update_library(library)
+
+        for current in list(library)[:20]:
+            features = library[current].features
+            target = selector.target_energy(features)
+            expected = min(
+                (name for name in library if name != current),
+                key=lambda name: selector.transition_cost(features, library[name].features, target),
+            )
+            assert selector.select(current) == expected
+
+    def test_no_repeat_window_relaxes_oldest_first(self):
+        """Recently played tracks are skipped, and the oldest one comes back first."""
+        library = {name: make_track(name, tempo=120, energy=0.5, key="8A") for name in "abcd"}
+        selector = TrackSelector()
+        selector.update_library(library)
+
+        assert selector.select("d", recent=["b", "c"]) == "a"
+        assert selector.select("d", recent=["a", "b", "c"]) == "a"
+        assert selector.select("d", recent=["b", "a", "c"]) == "b"
+        assert selector.stats["window_relaxed"] == 2
+        assert selector.select("d", exclude={"a", "b", "c", "d"}) is None
+
+    def test_random_fallback_without_features(self):
+        """Without features selection is random over the unblocked tracks."""
+        library = {name: make_track(name) for name in "abc"}
+        library["x"] = make_track("x", tempo=120, energy=0.5)
+        selector = TrackSelector(rng=random.Random(1))
+        selector.update_library(library)
+
+        assert len(selector) == 1
+        picks = {selector.select("a", recent=["b"]) for _ in range(20)}
+        assert picks == {"c", "x"}
+        assert selector.stats["random_picks"] == 20
+
+    def test_energy_curve_turns_around(self):
+        """The target energy rises to the upper bound, then heads back down once a track is picked."""
+        selector = TrackSelector(energy_step=0.1, energy_range=(0.3, 0.9))
+        mid = TrackFeatures(tempo=120, energy=0.6)
+        assert selector.target_energy(TrackFeatures(tempo=120, energy=0.5)) == pytest.approx(0.6)
+        assert selector.target_energy(TrackFeatures(tempo=120, energy=0.85)) == pytest.approx(0.75)
+        assert selector.target_energy(mid) == pytest.approx(0.7)  # Asking does not turn the curve
+
+        # Relaxing the no-repeat window runs several searches but turns the curve once
+        library = {"top": make_track("top", tempo=120, energy=0.85), "a": make_track("a", tempo=120, energy=0.75)}
+        selector.update_library(library)
+        assert selector.select("top", recent=["a"]) == "a"
+        assert selector.stats["window_relaxed"] == 1
+        assert selector.target_energy(mid) == pytest.approx(0.5)
+
+    def test_load_track_features(self, tmp_path):
+        """Features are read from the library index; bad entries are skipped."""
+        (tmp_path / LIBRARY_INDEX_FILENAME).write_text(json.dumps({
+            "version": 1,
+            "tracks": {
+                "Doolstan.mp3": {"content_hash": "abc", "features": {"tempo": 118.0, "energy": 0.6, "key": "8A"}},
+                "Broken.mp3": {"features": {"tempo": "fast"}},
+                "Pending.mp3": {},
+            },
+        }))
+
+        features = load_track_features(str(tmp_path))
+        assert list(features) == ["Doolstan.mp3"]
+        assert features["Doolstan.mp3"].tempo == 118.0
+        assert load_track_features(str(tmp_path / "missing")) == {}
+
+
+class TestBrainTrackSelection:
+    """Tests for BrainService using the feature-based selector."""
+
+    async def test_dj_selection_uses_features_and_history(self):
+        """DJ mode picks by transition cost and keeps played tracks out."""
+        brain = BrainService(AsyncIOEventEmitter())
+        library = {
+            "now": make_track("now", tempo=120, energy=0.5, key="8A"),
+            "close": make_track("close", tempo=121, energy=0.55, key="8A"),
+            "ok": make_track("ok", tempo=126, energy=0.6, key="9A"),
+            "far": make_track("far", tempo=95, energy=0.2, key="3B"),
+        }
+        await brain._handle_music_library_updated({"tracks": {n: t.model_dump() for n, t in library.items()}})
+        brain._dj_mode_active = True
+        brain._current_track = brain._music_library["now"]
+
+        assert await brain._smart_track_selection() == "close"
+
+        await brain._handle_track_playing({"track_id": "close"})
+        assert brain._recently_played_tracks == ["close"]
+        assert await brain._smart_track_selection() == "ok"
+        assert await brain._smart_track_selection(exclude={"ok"}) == "far"
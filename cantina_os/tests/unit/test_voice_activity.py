@@ -0,0 +1,116 @@
+"""
+Unit tests for the local voice activity detector
+
+Uses synthetic voiced (harmonic) and noise frames to check speech gating,
+hangover, trailing-silence tracking and the noise floor rising under
+steady background music.
+"""
+
+import numpy as np
+
+from cantina_os.utils.voice_activity import VoiceActivityDetector
+
+SAMPLE_RATE = 16000
+FRAME = 1600  # 100ms
+
+
+def noise_frame(rng, amplitude=0.002):
+    """Low-level broadband noise as int16."""
+    return (rng.normal(0, amplitude, FRAME) * 32767).astype(np.int16)
+
+
+def voiced_frame(rng):
+    """Harmonic signal resembling a voiced vowel as int16."""
+    t = np.arange(FRAME) / SAMPLE_RATE
+    signal = sum(
+        (0.2 / k) * np.sin(2 * np.pi * 150 * k * t) for k in range(1, 5)
+    )
+    return (signal * 32767).astype(np.int16) + noise_frame(rng)
+
+
+class TestVoiceActivityDetector:
+    """Tests for VoiceActivityDetector."""
+
+    def test_silence_is_not_speech(self):
+        """Quiet background noise never triggers speech."""
+        rng = np.random.default_rng(0)
+        vad = VoiceActivityDetector(sample_rate=SAMPLE_RATE)
+        assert not any(vad.process(noise_frame(rng)) for _ in range(10))
+        assert not vad.speech_detected
+
+    def test_voiced_frames_are_speech(self):
+        """Harmonic frames well above the noise floor are speech."""
+        rng = np.random.default_rng(1)
+        vad = VoiceActivityDetector(sample_rate=SAMPLE_RATE)
+        for _ in range(5):
+            vad.process(noise_frame(rng))
+
+        assert vad.process(voiced_frame(rng))
+        assert vad.speech_detected
+        assert vad.last_flatness < 0.1
+
+    def test_loud_noise_is_rejected_by_flatness(self):
+        """Broadband noise fails the spectral flatness check even when loud."""
+        rng = np.random.default_rng(2)
+        vad = VoiceActivityDetector(sample_rate=SAMPLE_RATE)
+        assert not vad.process(noise_frame(rng, amplitude=0.1))
+
+    def test_hangover_and_trailing_silence(self):
+        """Speech is held for the hangover, trailing silence keeps counting."""
+        rng = np.random.default_rng(3)
+        vad = VoiceActivityDetector(sample_rate=SAMPLE_RATE, hangover_ms=200)
+        vad.process(voiced_frame(rng))
+
+        decisions = [vad.process(noise_frame(rng)) for _ in range(4)]
+
+        assert decisions == [True, True, False, False]
+        assert vad.trailing_silence_ms == 400
+
+    def test_accepts_bytes(self):
+        """Raw int16 PCM bytes from the microphone are accepted."""
+        rng = np.random.default_rng(4)
+        vad = VoiceActivityDetector(sample_rate=SAMPLE_RATE)
+        assert vad.process(voiced_frame(rng).tobytes())
+
+    def test_reset_keeps_noise_floor(self):
+        """reset clears utterance state but keeps the learned noise floor."""
+        rng = np.random.default_rng(5)
+        vad = VoiceActivityDetector(sample_rate=SAMPLE_RATE)
+        for _ in range(20):
+            vad.process(noise_frame(rng, amplitude=0.01))
+        floor = vad.noise_floor_db
+        vad.process(voiced_frame(rng))
+
+        vad.reset()
+
+        assert not vad.speech_detected
+        assert vad.trailing_silence_ms == 0
+        assert vad.noise_floor_db == floor
+
+    def test_steady_music_stops_counting_as_speech(self):
+        """Unbroken tonal sound raises the floor until it is no longer speech."""
+        rng = np.random.default_rng(6)
+        vad = VoiceActivityDetector(sample_rate=SAMPLE_RATE)
+        for _ in range(5):
+            vad.process(noise_frame(rng))
+        quiet_floor = vad.noise_floor_db
+
+        decisions = [vad.process(voiced_frame(rng)) for _ in range(200)]  # 20s of "music"
+
+        assert all(decisions[:30])  # Treated as speech for sustained_speech_ms
+        assert not any(decisions[-20:])
+        assert vad.noise_floor_db > quiet_floor + 20
+
+    def test_normal_utterance_keeps_floor(self):
+        """Phrases with pauses never reach the sustained-speech threshold."""
+        rng = np.random.default_rng(7)
+        vad = VoiceActivityDetector(sample_rate=SAMPLE_RATE)
+        for _ in range(5):
+            vad.process(noise_frame(rng))
+        floor = vad.noise_floor_db
+
+        for _ in range(5):
+            assert all(vad.process(voiced_frame(rng)) for _ in range(20))  # 2s phrase
+            vad.process(noise_frame(rng))
+
+        assert abs(vad.noise_floor_db - floor) < 3
@@ -0,0 +1,81 @@
+"""
+Unit tests for WebBridgeService topic rooms
+
+Covers dashboard clients joining per-topic Socket.IO rooms according to
+their subscriptions and filter level, and broadcasts going out as a single
+emit per topic room.
+"""
+
+from cantina_os.core.event_topics import EventTopics
+from cantina_os.services.web_bridge_service import client_accepts_topic, topic_category
+
+
+async def connect(bridge, sid, **subscription):
+    await bridge._sio.handlers["connect"](sid, {})
+    if subscription:
+        await bridge._sio.handlers["subscribe_events"](sid, subscription)
+    bridge._sio.received[sid].clear()
+    bridge._sio.emits.clear()
+
+
+class TestTopicFiltering:
+    """Tests for the subscription and filter level rules."""
+
+    def test_categories(self):
+        """Topics map to the dashboard's voice/music/dj/leds/system categories."""
+        assert topic_category(EventTopics.TRANSCRIPTION_FINAL) == "voice"
+        assert topic_category(EventTopics.CROSSFADE_STARTED) == "music"
+        assert topic_category(EventTopics.GPT_COMMENTARY_RESPONSE) == "dj"
+        assert topic_category(EventTopics.LED_COMMAND) == "leds"
+        assert topic_category(EventTopics.DASHBOARD_LOG) == "system"
+        assert topic_category("MODE_TRANSITION") == "system"
+
+    def test_subscriptions_and_filter_level(self):
+        """Subscriptions may name topics or categories; filter levels narrow them further."""
+        assert client_accepts_topic({}, EventTopics.MUSIC_PROGRESS)
+        assert client_accepts_topic({"subscriptions": ["music"]}, EventTopics.MUSIC_PROGRESS)
+        assert not client_accepts_topic({"subscriptions": ["voice"]}, EventTopics.MUSIC_PROGRESS)
+        assert client_accepts_topic({"subscriptions": ["music.progress"]}, "music.progress")
+        assert not client_accepts_topic({"filter_level": "minimal"}, EventTopics.TRANSCRIPTION_INTERIM)
+        assert client_accepts_topic({"filter_level": "critical"}, EventTopics.TRANSCRIPTION_INTERIM)
+
+
+class TestTopicRooms:
+    """Tests for room membership and broadcasting."""
+
+    async def test_single_emit_reaches_only_subscribers(self, bridge):
+        """One emit per broadcast; each client only gets the topics it asked for."""
+        await connect(bridge, "everything")
+        await connect(bridge, "music_fan", events=["music"])
+        await connect(bridge, "minimal", events=["music", "voice"], filter_level="minimal")
+
+        await bridge._broadcast_event_to_dashboard(EventTopics.MUSIC_PROGRESS, {"progress": 0.5}, "music_progress")
+        await bridge._broadcast_event_to_dashboard(EventTopics.TRANSCRIPTION_FINAL, {"text": "hi"}, "transcription_update")
+
+        assert [(event, room) for event, _, room in bridge._sio.emits] == [
+            ("music_progress", "topic:music.progress"),
+            ("transcription_update", "topic:transcription.final"),
+        ]
+        received = bridge._sio.received
+        assert received["everything"] == ["music_progress", "transcription_update"]
+        assert received["music_fan"] == ["music_progress"]
+        assert received["minimal"] == ["transcription_update"]
+
+    async def test_resubscribe_moves_client_between_rooms(self, bridge):
+        """Changing subscriptions leaves rooms that no longer match and joins new ones."""
+        await connect(bridge, "a", events=["voice"])
+        await bridge._broadcast_event_to_dashboard(EventTopics.MUSIC_PROGRESS, {}, "music_progress")
+        assert not bridge._sio.emits  # Nobody wants music yet
+
+        await bridge._sio.handlers["subscribe_events"]("a", {"events": ["music"]})
+        await bridge._broadcast_event_to_dashboard(EventTopics.MUSIC_PROGRESS, {}, "music_progress")
+        await bridge._broadcast_event_to_dashboard(EventTopics.TRANSCRIPTION_FINAL, {}, "transcription_update")
+        assert bridge._sio.received["a"] == ["music_progress"]
+
+    async def test_disconnect_leaves_rooms(self, bridge):
+        """Disconnected clients drop out of every topic room."""
+        await connect(bridge, "a")
+        await bridge._broadcast_event_to_dashboard(EventTopics.MUSIC_PROGRESS, {}, "music_progress")
+        await bridge._sio.handlers["disconnect"]("a")
+
+        assert bridge._topic_rooms["music.progress"] == set()
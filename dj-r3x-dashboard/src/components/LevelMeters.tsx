@@ -0,0 +1,86 @@
+'use client'
+
+import { useEffect, useRef } from 'react'
+import { useSocketContext } from '@/contexts/SocketContext'
+import { AudioFrame, AUDIO_FRAME_KIND, AUDIO_FRAME_SOURCE } from '@/hooks/useSocket'
+
+interface LevelMetersProps {
+  width?: number
+  height?: number
+  className?: string
+}
+
+const METERS = [
+  { label: 'MIC', index: 0, peakIndex: 1, color: '#38bdf8' },
+  { label: 'R3X', index: 2, peakIndex: -1, color: '#f59e0b' },
+]
+
+// Live meters and the current track's waveform, drawn from the bridge's binary audio frames
+export default function LevelMeters({ width = 400, height = 96, className = '' }: LevelMetersProps) {
+  const { subscribeAudioFrames } = useSocketContext()
+  const canvasRef = useRef<HTMLCanvasElement>(null)
+  const levelsRef = useRef<number[]>([])
+  const waveformsRef = useRef<Record<number, number[]>>({})
+  const dirtyRef = useRef(false)
+
+  useEffect(() => {
+    const unsubscribe = subscribeAudioFrames((frame: AudioFrame) => {
+      if (frame.kind === AUDIO_FRAME_KIND.levels) {
+        levelsRef.current = frame.values
+      } else if (frame.kind === AUDIO_FRAME_KIND.waveform) {
+        waveformsRef.current[frame.source] = frame.values
+      }
+      dirtyRef.current = true
+    })
+
+    let animationFrame = 0
+    const draw = () => {
+      animationFrame = requestAnimationFrame(draw)
+      const canvas = canvasRef.current
+      const ctx = canvas?.getContext('2d')
+      if (!canvas || !ctx || !dirtyRef.current) return
+      dirtyRef.current = false
+
+      const levels = levelsRef.current
+      const level = (i: number) => (i >= 0 && !isNaN(levels[i]) ? Math.min(1, Math.max(0, levels[i])) : 0)
+      ctx.fillStyle = 'rgba(10, 14, 22, 0.8)'
+      ctx.fillRect(0, 0, width, height)
+
+      // Waveform preview of the current track, with a playhead from music progress
+      const waveform = waveformsRef.current[AUDIO_FRAME_SOURCE.music]
+      const waveHeight = height * 0.55
+      if (waveform && waveform.length) {
+        const barWidth = width / waveform.length
+        const playhead = level(3) * width
+        waveform.forEach((value, i) => {
+          const barHeight = (value / 255) * waveHeight
+          ctx.fillStyle = i * barWidth < playhead ? '#60a5fa' : 'rgba(96, 165, 250, 0.35)'
+          ctx.fillRect(i * barWidth, (waveHeight - barHeight) / 2, Math.max(1, barWidth - 1), barHeight)
+        })
+      }
+
+      // Horizontal meters: bar is RMS, tick is peak
+      const meterHeight = (height - waveHeight - 12) / METERS.length
+      METERS.forEach((meter, row) => {
+        const y = waveHeight + 8 + row * meterHeight
+        ctx.fillStyle = meter.color
+        ctx.fillRect(32, y, level(meter.index) * (width - 32), meterHeight - 4)
+        if (meter.peakIndex >= 0) {
+          ctx.fillRect(32 + level(meter.peakIndex) * (width - 34), y, 2, meterHeight - 4)
+        }
+        ctx.fillStyle = 'rgba(191, 219, 254, 0.7)'
+        ctx.font = '10px monospace'
+        ctx.fillText(meter.label, 0, y + meterHeight - 6)
+      })
+    }
+    draw()
+
+    return () => {
+      cancelAnimationFrame(animationFrame)
+      unsubscribe()
+    }
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [width, height])
+
+  return <canvas ref={canvasRef} width={width} height={height} className={`w-full ${className}`} />
+}
@@ -3,6 +3,7 @@
 import { useEffect, useState } from 'react'
 import { useSocketContext } from '@/contexts/SocketContext'
 import AudioSpectrum from '@/components/AudioSpectrum'
+import LevelMeters from '@/components/LevelMeters'
 
 export default function MonitorTab() {
   const { 
@@ -89,6 +90,9 @@ export default function MonitorTab() {
               : 'Connect to CantinaOS to enable audio visualization'
             }
           </div>
+          {isClient && connected && (
+            <LevelMeters height={96} className="mt-4 h-24" />
+          )}
         </div>
 
         {/* Live Transcription */}
@@ -30,6 +30,13 @@ interface SystemMetrics {
   totalServices: number
 }
 
+interface LlmQueueClassStatus {
+  queued: number
+  active: number
+  concurrency: number
+  preempted: number
+}
+
 interface AlertNotification {
   id: string
   type: 'error' | 'warning' | 'info' | 'success'
@@ -78,7 +85,7 @@ const calculateHealthScore = (services: ServiceData[], metrics: SystemMetrics):
 }
 
 export default function SystemTab() {
-  const { socket, systemMode, sendSystemCommand, logs } = useSocketContext()
+  const { socket, systemMode, systemStatus, sendSystemCommand, logs } = useSocketContext()
   const [services, setServices] = useState<ServiceData[]>([
     { name: 'web_bridge', status: 'offline', uptime: '--', memory: '--', cpu: '--', lastActivity: '--', errorCount: 0, successRate: 0 },
     { name: 'debug', status: 'offline', uptime: '--', memory: '--', cpu: '--', lastActivity: '--', errorCount: 0, successRate: 0 },
@@ -105,6 +112,7 @@ export default function SystemTab() {
     activeServices: 0,
     totalServices: 12
   })
+  const [llmQueue, setLlmQueue] = useState<Record<string, LlmQueueClassStatus>>({})
   const [alerts, setAlerts] = useState<AlertNotification[]>([])
   const [showFullLog, setShowFullLog] = useState(false)
   const [logLevel, setLogLevel] = useState<'DEBUG' | 'INFO' | 'WARNING' | 'ERROR'>('INFO')
@@ -179,47 +187,57 @@ export default function SystemTab() {
       }))
     }
 
-    const handleSystemStatus = (data: any) => {
-      if (data.services) {
-        const updatedServices = services.map(service => {
-          const backendService = data.services[service.name]
-          if (backendService) {
-            return {
-              ...service,
-              status: backendService.status || service.status,
-              uptime: backendService.uptime || service.uptime,
-              memory: backendService.memory || service.memory,
-              cpu: backendService.cpu || service.cpu,
-              lastActivity: new Date().toLocaleTimeString(),
-              errorCount: backendService.error_count || service.errorCount,
-              successRate: backendService.success_rate || service.successRate
-            }
-          }
-          return service
-        })
-        
-        setServices(updatedServices)
-        
-        const activeServices = updatedServices.filter(s => s.status === 'online').length
-        setSystemMetrics(prev => ({
-          ...prev,
-          activeServices: activeServices
-        }))
+    const handleLlmQueueStatus = (event: any) => {
+      const data = event.data || event
+      if (data.priorities) {
+        setLlmQueue(data.priorities)
       }
     }
 
     // Subscribe to events (log events now handled globally)
-    socket.on('system_status', handleSystemStatus)
     socket.on('service_status_update', handleServiceStatus)
     socket.on('system_metrics', handleSystemMetrics)
+    socket.on('llm_queue_status', handleLlmQueueStatus)
 
     return () => {
-      socket.off('system_status', handleSystemStatus)
       socket.off('service_status_update', handleServiceStatus)
       socket.off('system_metrics', handleSystemMetrics)
+      socket.off('llm_queue_status', handleLlmQueueStatus)
     }
   }, [socket, services])
 
+  // Bulk service status comes from the bridge state (snapshot + deltas) kept by the global hook
+  useEffect(() => {
+    const backendServices = systemStatus?.services
+    if (!backendServices) return
+
+    setServices(prev => {
+      const updatedServices = prev.map(service => {
+        const backendService = backendServices[service.name]
+        if (backendService) {
+          return {
+            ...service,
+            status: backendService.status || service.status,
+            uptime: backendService.uptime || service.uptime,
+            memory: backendService.memory || service.memory,
+            cpu: backendService.cpu || service.cpu,
+            lastActivity: new Date().toLocaleTimeString(),
+            errorCount: backendService.error_count || service.errorCount,
+            successRate: backendService.success_rate || service.successRate
+          }
+        }
+        return service
+      })
+
+      const activeServices = updatedServices.filter(s => s.status === 'online').length
+      setSystemMetrics(metrics => ({
+        ...metrics,
+        activeServices: activeServices
+      }))
+      return updatedServices
+    })
+  }, [systemStatus])
+
   // Filter logs based on level
   useEffect(() => {
     const levelPriority = { DEBUG: 0, INFO: 1, WARNING: 2, ERROR: 3 }
@@ -413,6 +431,36 @@ export default function SystemTab() {
         </div>
       </div>
 
+      {/* GPT Request Queue */}
+      <div className="sw-panel">
+        <h3 className="text-lg font-semibold text-sw-blue-100 mb-4 sw-text-glow">
+          AI REQUEST QUEUE
+        </h3>
+        
+        <div className="grid grid-cols-2 md:grid-cols-4 gap-4">
+          {['interactive', 'background'].map(priority => {
+            const queue = llmQueue[priority]
+            return (
+              <MetricCard 
+                key={priority}
+                label={`${priority.charAt(0).toUpperCase()}${priority.slice(1)} (queued / active)`}
+                value={queue ? `${queue.queued} / ${queue.active}` : "--"}
+                status={
+                  !queue ? 'good' :
+                  queue.queued > 3 ? 'critical' :
+                  queue.queued > 0 ? 'warning' : 'good'
+                }
+              />
+            )
+          })}
+          <MetricCard 
+            label="Background Preempted" 
+            value={llmQueue.background ? `${llmQueue.background.preempted}` : "--"}
+            status="good"
+          />
+        </div>
+      </div>
+
       {/* Recent Activity */}
       <div className="sw-panel">
         <div className="flex items-center justify-between mb-4">
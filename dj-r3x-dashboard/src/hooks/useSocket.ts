@@ -84,8 +84,93 @@ export interface ConversationMessage {
   confidence?: number
 }
 
+// Bridge state sync: a snapshot on connect, then JSON-patch style deltas in sequence order
+export interface StatePatchOp {
+  op: 'add' | 'replace' | 'remove'
+  path: string
+  value?: any
+}
+
+export interface StateSnapshot {
+  epoch: string
+  seq: number
+  state: Record<string, any>
+  cantina_os_connected: boolean
+  timestamp: string
+}
+
+export interface StateDelta {
+  epoch: string
+  seq: number
+  ops: StatePatchOp[]
+}
+
+// Applies delta operations in place; returns the top-level sections they touched
+export const applyStatePatch = (state: Record<string, any>, ops: StatePatchOp[]): string[] => {
+  const touched: string[] = []
+  for (const op of ops) {
+    const tokens = op.path.split('/').slice(1).map(t => t.replace(/~1/g, '/').replace(/~0/g, '~'))
+    if (tokens.length === 0) continue
+    if (touched.indexOf(tokens[0]) === -1) touched.push(tokens[0])
+    let parent = state
+    for (const token of tokens.slice(0, -1)) {
+      parent = parent[token]
+    }
+    const key = tokens[tokens.length - 1]
+    if (op.op === 'remove') {
+      delete parent[key]
+    } else {
+      parent[key] = op.value
+    }
+  }
+  return touched
+}
+
+// Binary level meter / waveform frames (cantina_os/utils/audio_frames.py):
+// 12-byte little-endian header, then float16 levels or uint8 waveform points
+export const AUDIO_FRAME_KIND = { levels: 1, waveform: 2 } as const
+export const AUDIO_FRAME_SOURCE = { levels: 0, music: 1, speech: 2 } as const
+export const LEVEL_CHANNELS = ['mic_rms', 'mic_peak', 'speech_amplitude', 'music_progress'] as const
+
+export interface AudioFrame {
+  kind: number
+  source: number
+  seq: number
+  time: number  // Levels: seconds since the bridge started; waveform: seconds covered
+  values: number[]  // Levels 0..1 (NaN = no data yet); waveform 0..255
+}
+
+const float16ToNumber = (bits: number): number => {
+  const sign = bits & 0x8000 ? -1 : 1
+  const exponent = (bits >> 10) & 0x1f
+  const fraction = bits & 0x3ff
+  if (exponent === 0) return sign * Math.pow(2, -14) * (fraction / 1024)
+  if (exponent === 0x1f) return fraction ? NaN : sign * Infinity
+  return sign * Math.pow(2, exponent - 15) * (1 + fraction / 1024)
+}
+
+export const decodeAudioFrame = (buffer: ArrayBuffer): AudioFrame | null => {
+  if (buffer.byteLength < 12) return null
+  const view = new DataView(buffer)
+  const encoding = view.getUint8(3)
+  const count = view.getUint16(6, true)
+  const values: number[] = []
+  for (let i = 0; i < count; i++) {
+    values.push(encoding === 1 ? float16ToNumber(view.getUint16(12 + i * 2, true)) : view.getUint8(12 + i))
+  }
+  return {
+    kind: view.getUint8(1),
+    source: view.getUint8(2),
+    seq: view.getUint16(4, true),
+    time: view.getFloat32(8, true),
+    values
+  }
+}
+
 interface SocketEvents {
-  system_status: (data: SystemStatus) => void
+  state_snapshot: (data: StateSnapshot) => void
+  state_delta: (data: StateDelta) => void
+  state_heartbeat: (data: { epoch: string; seq: number }) => void
   voice_status: (data: VoiceStatus) => void
   transcription_update: (data: TranscriptionUpdate) => void
   music_status: (data: MusicStatus) => void
@@ -97,7 +182,8 @@ interface SocketEvents {
   cantina_event: (data: any) => void
   system_log: (data: any) => void
   error: (data: any) => void
-  event_replay: (data: any) => void
+  replay_complete: (data: { epoch: string; event_seq: number; replayed: number; snapshot: boolean }) => void
+  audio_frame: (data: ArrayBuffer) => void
 }
 
 export const useSocket = () => {
@@ -122,6 +208,11 @@ export const useSocket = () => {
   const [conversationHistory, setConversationHistory] = useState<ConversationMessage[]>([])
   
   const socketRef = useRef<Socket | null>(null)
+  const stateRef = useRef<{ epoch: string; seq: number; state: Record<string, any> } | null>(null)
+  // Last broadcast event seen, so a reconnect can ask the bridge for what it missed
+  const lastEventRef = useRef<{ epoch: string; seq: number } | null>(null)
+  // Binary audio frames bypass React state (30 fps); components subscribe directly
+  const audioFrameListenersRef = useRef<Array<(frame: AudioFrame) => void>>([])
   const maxLogs = 100
 
   useEffect(() => {
@@ -142,6 +233,15 @@ export const useSocket = () => {
       newSocket.emit('subscribe_events', {
         events: ['voice', 'music', 'system', 'dj', 'leds']
       })
+
+      if (audioFrameListenersRef.current.length > 0) {
+        newSocket.emit('subscribe_audio_frames', { enabled: true })
+      }
+
+      // After a reconnect, replay the events broadcast while we were away
+      if (lastEventRef.current) {
+        newSocket.emit('replay_events', lastEventRef.current)
+      }
     })
 
     newSocket.on('disconnect', () => {
@@ -151,7 +251,20 @@ export const useSocket = () => {
 
     // Add generic event listener to see all events
     newSocket.onAny((eventName, ...args) => {
+      if (eventName === 'audio_frame') return  // 30 fps binary frames, too chatty to log
       console.log(`🔌 Socket event received: ${eventName}`, args)
+      const eventSeq = args[0]?.event_seq
+      const epoch = stateRef.current?.epoch
+      const last = lastEventRef.current
+      if (typeof eventSeq === 'number' && epoch && (!last || last.epoch !== epoch || eventSeq > last.seq)) {
+        lastEventRef.current = { epoch, seq: eventSeq }
+      }
+    })
+
+    newSocket.on('audio_frame', (data: ArrayBuffer) => {
+      const frame = decodeAudioFrame(data)
+      if (!frame) return
+      audioFrameListenersRef.current.forEach(listener => listener(frame))
     })
 
     newSocket.on('connect_error', (error) => {
@@ -159,9 +272,76 @@ export const useSocket = () => {
       setConnected(false)
     })
 
-    // System events
-    newSocket.on('system_status', (data: SystemStatus) => {
-      setSystemStatus(data)
+    // Bridge state: snapshot on connect, deltas after that, resync on a gap
+    const publishState = (sections: string[]) => {
+      const state = stateRef.current?.state
+      if (!state) return
+      for (const section of sections) {
+        const value = state[section]
+        if (section === 'services') {
+          setSystemStatus({
+            cantina_os_connected: true,
+            services: { ...value },
+            timestamp: new Date().toISOString()
+          })
+        } else if (value && Object.keys(value).length > 0) {
+          if (section === 'voice') setVoiceStatus({ ...value })
+          else if (section === 'music') setMusicStatus({ ...value })
+          else if (section === 'dj') setDJStatus({ ...value })
+          else if (section === 'mode') setSystemMode({ ...value })
+        }
+      }
+    }
+
+    // One resync at a time: deltas after a gap are dropped until the bridge's
+    // reply (missed deltas or a snapshot) has caught us up to the newest seq seen
+    let resyncPending = false
+    let resyncTimer: ReturnType<typeof setTimeout> | null = null
+    let newestSeq = -1
+
+    const endResync = () => {
+      resyncPending = false
+      if (resyncTimer) clearTimeout(resyncTimer)
+      resyncTimer = null
+    }
+
+    const requestResync = () => {
+      if (resyncPending) return
+      resyncPending = true
+      resyncTimer = setTimeout(endResync, 5000)  // No reply: allow another request
+      newSocket.emit('state_resync', {
+        epoch: stateRef.current?.epoch,
+        seq: stateRef.current?.seq ?? -1
+      })
+    }
+
+    newSocket.on('state_snapshot', (data: StateSnapshot) => {
+      stateRef.current = { epoch: data.epoch, seq: data.seq, state: data.state }
+      newestSeq = data.seq
+      endResync()
+      publishState(Object.keys(data.state))
+    })
+
+    newSocket.on('state_delta', (data: StateDelta) => {
+      const current = stateRef.current
+      if (!current || data.epoch !== current.epoch || data.seq > current.seq + 1) {
+        if (current && data.epoch === current.epoch) newestSeq = Math.max(newestSeq, data.seq)
+        requestResync()
+        return
+      }
+      if (data.seq <= current.seq) return  // Already applied (e.g. resync overlap)
+      const touched = applyStatePatch(current.state, data.ops)
+      current.seq = data.seq
+      if (resyncPending && current.seq >= newestSeq) endResync()
+      publishState(touched)
+    })
+
+    newSocket.on('state_heartbeat', (data: { epoch: string; seq: number }) => {
+      const current = stateRef.current
+      if (!current || data.epoch !== current.epoch || data.seq > current.seq) {
+        if (current && data.epoch === current.epoch) newestSeq = Math.max(newestSeq, data.seq)
+        requestResync()
+      }
     })
 
     // Voice events
@@ -299,15 +479,35 @@ export const useSocket = () => {
     })
 
     // Event replay for reconnections
-    newSocket.on('event_replay', (data: any) => {
-      console.log('Replayed event:', data)
+    newSocket.on('replay_complete', (data: any) => {
+      console.log(`Replayed ${data.replayed} missed events${data.snapshot ? ' (resynced from snapshot)' : ''}`)
+      const last = lastEventRef.current
+      const seenLive = last && last.epoch === data.epoch ? last.seq : 0
+      lastEventRef.current = { epoch: data.epoch, seq: Math.max(data.event_seq, seenLive) }
     })
 
     return () => {
+      endResync()
       newSocket.close()
     }
   }, [])
 
+  // Register for binary level/waveform frames; the bridge only sends them while someone listens
+  const subscribeAudioFrames = (listener: (frame: AudioFrame) => void) => {
+    const listeners = audioFrameListenersRef.current
+    listeners.push(listener)
+    if (listeners.length === 1) {
+      socketRef.current?.emit('subscribe_audio_frames', { enabled: true })
+    }
+    return () => {
+      const index = listeners.indexOf(listener)
+      if (index !== -1) listeners.splice(index, 1)
+      if (listeners.length === 0) {
+        socketRef.current?.emit('subscribe_audio_frames', { enabled: false })
+      }
+    }
+  }
+
   // Type-safe Socket command functions with generated schemas
   const sendVoiceCommand = (
     action: VoiceActionEnum, 
@@ -513,6 +713,7 @@ export const useSocket = () => {
     logs,
     conversationHistory,
     clearConversationHistory: () => setConversationHistory([]),
+    subscribeAudioFrames,
     // Type-safe command functions (without response handling)
     sendVoiceCommand,
     sendMusicCommand,